@@ -0,0 +1,555 @@
+#!/usr/bin/env python3
+# pytui.benchmark.headless - Headless, reproducible benchmark suite (no TTY; MockTerminal renderer).
+# Micro scenarios time one hot path (buffer fill, text wrap, Select, Textarea, Diff, layout, post filters,
+# reconciler); macro scenarios render full frames and count the ANSI bytes emitted. Results report frame
+# time percentiles, bytes per iteration and peak traced allocations, and can be compared against a stored
+# baseline JSON with a regression threshold:
+#
+#   python -m pytui.benchmark.headless --save-baseline bench-baseline.json
+#   python -m pytui.benchmark.headless --baseline bench-baseline.json --threshold 0.25
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import difflib
+import gc
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+Step = Callable[[], None]
+
+
+@dataclass
+class Scenario:
+    """A benchmark: setup() builds the fixture and returns the step timed once per iteration."""
+
+    name: str
+    kind: str  # "micro" | "macro"
+    setup: Callable[[], Step]
+    iterations: int
+    description: str = ""
+
+
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str, kind: str = "micro", iterations: int = 100) -> Callable[[Callable[[], Step]], Callable[[], Step]]:
+    """Register setup as a scenario; its docstring becomes the description."""
+
+    def register(setup: Callable[[], Step]) -> Callable[[], Step]:
+        SCENARIOS[name] = Scenario(name, kind, setup, iterations, (setup.__doc__ or "").strip())
+        return setup
+
+    return register
+
+
+class _ByteCounter:
+    """stdout stand-in that only counts what the renderer writes."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def write(self, data: str) -> int:
+        self.count += len(data.encode("utf-8", errors="replace"))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile (p in 0..100) of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+def run_scenario(sc: Scenario, iterations: int | None = None, warmup: int = 3, trace_allocations: bool = True) -> dict:
+    """Run sc and return its result: timing percentiles (ms), bytes emitted and peak allocations per iteration."""
+    n = max(1, iterations if iterations is not None else sc.iterations)
+    counter = _ByteCounter()
+    with contextlib.redirect_stdout(counter):  # type: ignore[type-var]
+        step = sc.setup()
+        for _ in range(warmup):
+            step()
+        counter.count = 0
+        times: list[float] = []
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(n):
+                t0 = time.perf_counter_ns()
+                step()
+                times.append((time.perf_counter_ns() - t0) / 1e6)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        bytes_emitted = counter.count
+        alloc_peak = 0
+        if trace_allocations:
+            tracemalloc.start()
+            try:
+                for _ in range(min(n, 10)):
+                    base = tracemalloc.get_traced_memory()[0]
+                    tracemalloc.reset_peak()
+                    step()
+                    alloc_peak = max(alloc_peak, tracemalloc.get_traced_memory()[1] - base)
+            finally:
+                tracemalloc.stop()
+    times.sort()
+    return {
+        "name": sc.name,
+        "kind": sc.kind,
+        "iterations": n,
+        "mean_ms": sum(times) / n,
+        "min_ms": times[0],
+        "p50_ms": percentile(times, 50),
+        "p90_ms": percentile(times, 90),
+        "p99_ms": percentile(times, 99),
+        "max_ms": times[-1],
+        "bytes_per_iter": bytes_emitted / n,
+        "alloc_peak_kb": alloc_peak / 1024,
+    }
+
+
+def run_suite(
+    names: list[str] | None = None,
+    kind: str | None = None,
+    scale: float = 1.0,
+    trace_allocations: bool = True,
+) -> list[dict]:
+    """Run the selected scenarios (all by default); scale multiplies each scenario's iteration count."""
+    results = []
+    for sc in SCENARIOS.values():
+        if names and not any(n in sc.name for n in names):
+            continue
+        if kind and sc.kind != kind:
+            continue
+        iterations = max(1, int(sc.iterations * scale))
+        results.append(run_scenario(sc, iterations, trace_allocations=trace_allocations))
+    return results
+
+
+def compare(
+    results: list[dict],
+    baseline: dict | list[dict],
+    threshold: float = 0.25,
+    metrics: tuple[str, ...] = ("p50_ms", "p90_ms", "bytes_per_iter"),
+) -> list[dict]:
+    """Regressions of results against baseline (a saved suite JSON or its "results" list).
+
+    A metric regresses when current > baseline * (1 + threshold); scenarios missing from the baseline
+    are ignored. Returns [{name, metric, baseline, current, ratio}].
+    """
+    base_results = baseline.get("results", []) if isinstance(baseline, dict) else baseline
+    by_name = {r["name"]: r for r in base_results}
+    regressions = []
+    for r in results:
+        b = by_name.get(r["name"])
+        if b is None:
+            continue
+        for metric in metrics:
+            old, new = b.get(metric), r.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1.0 + threshold) and new - old > 1e-9:
+                ratio = new / old if old else float("inf")
+                regressions.append({"name": r["name"], "metric": metric, "baseline": old, "current": new, "ratio": ratio})
+    return regressions
+
+
+def format_results(results: list[dict]) -> str:
+    header = f"{'scenario':<28} {'kind':<5} {'iters':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'bytes/it':>10} {'alloc kb':>9}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['name']:<28} {r['kind']:<5} {r['iterations']:>6} {r['p50_ms']:>9.3f} {r['p90_ms']:>9.3f} "
+            f"{r['p99_ms']:>9.3f} {r['bytes_per_iter']:>10.0f} {r['alloc_peak_kb']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+# --- Fixtures ---
+
+def _renderer(width: int = 120, height: int = 40) -> Any:
+    from pytui.testing.test_renderer import create_test_renderer
+
+    return create_test_renderer(width, height)
+
+
+def _render(renderable: Any, buffer: Any) -> Callable[[], None]:
+    def draw() -> None:
+        buffer.clear()
+        renderable.render(buffer)
+
+    return draw
+
+
+_WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore".split()
+
+
+def _prose(words: int, seed: int = 1) -> str:
+    rnd = random.Random(seed)
+    return " ".join(rnd.choice(_WORDS) for _ in range(words))
+
+
+# --- Scenarios: buffer ---
+
+@scenario("buffer.fill_rect", iterations=50)
+def _buffer_fill() -> Step:
+    """fill_rect over a 120x40 buffer."""
+    from pytui.core.buffer import Cell, OptimizedBuffer
+
+    buf = OptimizedBuffer(120, 40)
+    cell = Cell(char=" ", bg=(20, 20, 40, 255))
+    return lambda: buf.fill_rect(0, 0, 120, 40, cell)
+
+
+@scenario("buffer.draw_text", iterations=200)
+def _buffer_text() -> Step:
+    """draw_text of 40 full-width lines."""
+    from pytui.core.buffer import OptimizedBuffer
+
+    buf = OptimizedBuffer(120, 40)
+    lines = [_prose(30, seed=i)[:120] for i in range(40)]
+    fg = (220, 220, 220, 255)
+
+    def step() -> None:
+        for y, line in enumerate(lines):
+            buf.draw_text(line, 0, y, fg)
+
+    return step
+
+
+@scenario("frame.diff_sparse", kind="macro", iterations=100)
+def _frame_diff_sparse() -> Step:
+    """Full frame where one status line changes per frame (diff emits only the changed cells)."""
+    from pytui.components.box import Box
+    from pytui.components.text import Text
+
+    r = _renderer()
+    panel = Box(r.context, {"width": 120, "height": 40, "border": True, "flex_direction": "column"})
+    r.root.add(panel)
+    for i in range(30):
+        panel.add(Text(r.context, {"content": _prose(12, seed=i), "height": 1}))
+    status = Text(r.context, {"content": "tick 0", "height": 1})
+    panel.add(status)
+    counter = [0]
+    r._render_frame()
+
+    def step() -> None:
+        counter[0] += 1
+        status.content = f"tick {counter[0]}"
+        r._render_frame()
+
+    return step
+
+
+@scenario("frame.full_change", kind="macro", iterations=20)
+def _frame_full_change() -> Step:
+    """Full frame where every row changes each frame (worst-case diff output)."""
+    from pytui.components.text import Text
+
+    r = _renderer()
+    texts = [Text(r.context, {"content": "", "height": 1, "width": 120}) for _ in range(40)]
+    for t in texts:
+        r.root.add(t)
+    counter = [0]
+
+    def step() -> None:
+        counter[0] += 1
+        for i, t in enumerate(texts):
+            t.content = _prose(20, seed=counter[0] * 41 + i)
+        r._render_frame()
+
+    return step
+
+
+# --- Scenarios: text ---
+
+@scenario("text.wrap", iterations=50)
+def _text_wrap() -> Step:
+    """Word-wrap line counting of a 5k-word paragraph at width 80."""
+    from pytui.components.text import _compute_line_counts
+
+    content = _prose(5000)
+    return lambda: _compute_line_counts(content, 80, "word")
+
+
+@scenario("text.styled", iterations=100)
+def _text_styled() -> Step:
+    """Render a Text of 400 styled spans."""
+    from pytui.components.text import Text
+    from pytui.components.text_node import Span
+    from pytui.core.buffer import OptimizedBuffer
+
+    r = _renderer()
+    spans = [
+        Span(text=w + " ", fg=(200, 100 + i % 100, 50, 255), bold=i % 3 == 0, underline=i % 7 == 0)
+        for i, w in enumerate(_prose(400).split())
+    ]
+    text = Text(r.context, {"content": spans, "width": 120, "height": 40, "wrap_mode": "word"})
+    r.root.add(text)
+    r.root.calculate_layout()
+    return _render(text, OptimizedBuffer(120, 40))
+
+
+@scenario("markdown.stream", iterations=100)
+def _markdown_stream() -> Step:
+    """Append a token to a 200-block streaming markdown document."""
+    from pytui.components.markdown import MarkdownRenderable
+
+    r = _renderer()
+    doc = "\n\n".join(f"## Section {i}\n\n{_prose(40, seed=i)}" for i in range(100))
+    md = MarkdownRenderable(r.context, {"content": doc, "streaming": True, "width": 120})
+    r.root.add(md)
+    return lambda: md.append(" token")
+
+
+# --- Scenarios: components ---
+
+@scenario("select.100k", iterations=200)
+def _select_100k() -> Step:
+    """Move and render a Select with 100k options."""
+    from pytui.components.select import Select
+    from pytui.core.buffer import OptimizedBuffer
+
+    r = _renderer()
+    sel = Select(r.context, {"options": [f"option {i}" for i in range(100_000)], "width": 60, "height": 30})
+    r.root.add(sel)
+    r.root.calculate_layout()
+    draw = _render(sel, OptimizedBuffer(120, 40))
+
+    def step() -> None:
+        sel.move_down(37)
+        draw()
+
+    return step
+
+
+@scenario("textarea.edit", iterations=20)
+def _textarea_edit() -> Step:
+    """Insert a character into a 2k-line Textarea and render it."""
+    from pytui.components.textarea import Textarea
+    from pytui.core.buffer import OptimizedBuffer
+    from pytui.core.edit_buffer import EditBuffer
+    from pytui.core.editor_view import EditorView
+
+    r = _renderer()
+    eb = EditBuffer()
+    eb.set_text("\n".join(_prose(12, seed=i) for i in range(2000)))
+    ev = EditorView(eb, view_width=100, view_height=30)
+    ev.set_cursor_line_col(1000, 5)
+    ta = Textarea(r.context, {"editor_view": ev, "width": 100, "height": 30})
+    r.root.add(ta)
+    r.root.calculate_layout()
+    draw = _render(ta, OptimizedBuffer(120, 40))
+
+    def step() -> None:
+        ev.insert("x")
+        draw()
+
+    return step
+
+
+@scenario("diff.render", iterations=50)
+def _diff_render() -> Step:
+    """Scroll and render a 3k-line unified Diff."""
+    from pytui.components.diff import Diff
+    from pytui.core.buffer import OptimizedBuffer
+
+    old = [f"line {i} {_WORDS[i % len(_WORDS)]}" for i in range(3000)]
+    new = [line + " changed" if i % 11 == 0 else line for i, line in enumerate(old)]
+    patch = "".join(difflib.unified_diff([s + "\n" for s in old], [s + "\n" for s in new], "a/f.txt", "b/f.txt"))
+    r = _renderer()
+    diff = Diff(r.context, {"diff": patch, "width": 120, "height": 40})
+    r.root.add(diff)
+    r.root.calculate_layout()
+    draw = _render(diff, OptimizedBuffer(120, 40))
+    pos = [0]
+
+    def step() -> None:
+        pos[0] = (pos[0] + 17) % 2000
+        diff.scroll_top = pos[0]
+        draw()
+
+    return step
+
+
+@scenario("code.highlight", iterations=20)
+def _code_highlight() -> Step:
+    """Append a line to a 1k-line Code block and render it."""
+    from pytui.components.code import Code
+    from pytui.core.buffer import OptimizedBuffer
+
+    src = "\n".join(f"def f{i}(x):\n    return x * {i}  # {_WORDS[i % len(_WORDS)]}" for i in range(500))
+    r = _renderer()
+    code = Code(r.context, {"content": src, "filetype": "python", "width": 120, "height": 40})
+    r.root.add(code)
+    r.root.calculate_layout()
+    draw = _render(code, OptimizedBuffer(120, 40))
+    n = [0]
+
+    def step() -> None:
+        n[0] += 1
+        code.content = code.content + f"\nx{n[0]} = {n[0]}"
+        draw()
+
+    return step
+
+
+# --- Scenarios: layout ---
+
+def _layout_step(r: Any, leaf: Any) -> Step:
+    flip = [False]
+
+    def step() -> None:
+        flip[0] = not flip[0]
+        leaf.layout_node.set_width(10 if flip[0] else 11)
+        r.root.calculate_layout()
+
+    return step
+
+
+@scenario("layout.deep", iterations=50)
+def _layout_deep() -> Step:
+    """Relayout a 150-level nested Box chain after a leaf resize."""
+    from pytui.components.box import Box
+
+    r = _renderer()
+    node = r.root
+    for _ in range(150):
+        child = Box(r.context, {"flex_direction": "column", "padding_left": 0})
+        node.add(child)
+        node = child
+    return _layout_step(r, node)
+
+
+@scenario("layout.wide", iterations=20)
+def _layout_wide() -> Step:
+    """Relayout 2000 sibling rows in wrapping rows of Boxes after a resize."""
+    from pytui.components.box import Box
+
+    r = _renderer()
+    grid = Box(r.context, {"flex_direction": "row", "flex_wrap": "wrap", "width": 120})
+    r.root.add(grid)
+    cells = [Box(r.context, {"width": 10, "height": 1}) for _ in range(2000)]
+    for c in cells:
+        grid.add(c)
+    return _layout_step(r, cells[0])
+
+
+# --- Scenarios: post filters ---
+
+@scenario("post.pipeline", iterations=30)
+def _post_pipeline() -> Step:
+    """grayscale + dim + blur FilterPipeline over a filled 120x40 buffer."""
+    from pytui.core.buffer import Cell, OptimizedBuffer
+    from pytui.post.filters import FilterPipeline
+
+    buf = OptimizedBuffer(120, 40)
+    for y in range(40):
+        buf.fill_rect(0, y, 120, 1, Cell(char="#", fg=(200, 3 * y, 90, 255), bg=(10, 20, 6 * y, 255)))
+    pipeline = FilterPipeline().add("grayscale").add("dim", alpha=0.8).add("blur", radius=1)
+    return lambda: pipeline(buf, 0.016)
+
+
+# --- Scenarios: react ---
+
+@scenario("react.update", kind="macro", iterations=50)
+def _react_update() -> Step:
+    """State update of a 200-row list component (memoised rows) plus one frame."""
+    from pytui.react import Component, flush_sync, h, memo, reconcile, useState
+
+    class Row(Component):
+        def render(self):  # noqa: ANN201
+            return h("text", {"content": f"{self.props['i']}: {self.props['label']}", "height": 1})
+
+    row = memo(Row)
+
+    class App(Component):
+        def render(self):  # noqa: ANN201
+            sel, set_sel = useState(0)
+            self._set_sel = set_sel
+            return h(
+                "box",
+                {"flex_direction": "column", "width": 120},
+                [h(row, {"key": i, "i": i, "label": ">" if i == sel else " "}) for i in range(200)],
+            )
+
+    r = _renderer()
+    reconcile(h(App, {}), r.root)
+    app = r.root._react_children[0][1][1]
+    sel = [0]
+    r._render_frame()
+
+    def step() -> None:
+        sel[0] = (sel[0] + 1) % 200
+        flush_sync(lambda: app._set_sel(sel[0]))
+        r._render_frame()
+
+    return step
+
+
+# --- CLI ---
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pytui-bench", description="Headless pytui benchmark suite.")
+    parser.add_argument("-k", "--filter", action="append", default=None, help="Only scenarios whose name contains this")
+    parser.add_argument("--kind", choices=("micro", "macro"), default=None)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply iteration counts (e.g. 0.1 for a smoke run)")
+    parser.add_argument("--no-alloc", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("-o", "--output", default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", default=None, help="Compare against this results JSON")
+    parser.add_argument("--save-baseline", default=None, help="Write results as a new baseline JSON")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown (default 0.25)")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite; returns 1 when a baseline comparison finds regressions."""
+    args = parse_args(argv)
+    if args.list:
+        for sc in SCENARIOS.values():
+            print(f"{sc.name:<28} {sc.kind:<5} {sc.description}")
+        return 0
+    results = run_suite(args.filter, args.kind, args.scale, not args.no_alloc)
+    print(format_results(results))
+    payload = {
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime()),
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(payload, indent=2))
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.threshold)
+        for reg in regressions:
+            print(
+                f"REGRESSION {reg['name']} {reg['metric']}: {reg['baseline']:.3f} -> {reg['current']:.3f} "
+                f"(x{reg['ratio']:.2f})"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} of baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
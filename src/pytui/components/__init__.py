@@ -14,6 +14,7 @@ except ImportError:
 from pytui.components.code import Code
 from pytui.components.diff import Diff
 from pytui.components.edit_buffer_renderable import EditBufferRenderable
+from pytui.components.file_viewer import FileViewer
 from pytui.components.frame_buffer import FrameBuffer
 from pytui.components.input import Input
 from pytui.components.line_number import LineNumber, LineColorConfig, LineSign
@@ -72,6 +73,7 @@ __all__ = [
     "Code",
     "Diff",
     "EditBufferRenderable",
+    "FileViewer",
     "TabSelect",
     "TabSelectOption",
     "ScrollUnit",
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import codecs
 from typing import Optional
 
 from pytui.core.buffer import Cell, OptimizedBuffer
@@ -12,12 +13,19 @@ from pytui.lib import parse_color_to_tuple
 from pytui.core.syntax_style import get_theme_scope_colors
 from pytui.lib.tree_sitter import highlight as syntax_highlight
 from pytui.utils.diff import (
+    DiffRow,
+    DiffRowModel,
     ParsedPatch,
+    StreamingPatchParser,
     build_split_logical_lines,
+    build_split_row_model,
+    build_unified_row_model,
     diff_lines,
     flattened_unified_lines,
     parse_patch,
     parse_unified_diff,
+    unified_line_number_width,
+    wrap_text,
 )
 
 
@@ -27,6 +35,10 @@ class Diff(Renderable):
     OpenTUI Diff.ts: diff, view (unified|split), parse error view, hunks with line numbers,
     split view (left removed / right added), syntax highlight (filetype/syntax_style),
     wrap_mode (word|char|none), all styling options and property setters, destroy_recursively.
+
+    Visual rows are kept in a DiffRowModel built once per patch / width / wrap mode / view, so a
+    frame only draws the rows between scroll_top and scroll_top + height.
+    append_diff()/end_diff() stream a patch in chunks: completed hunks are shown as they arrive.
     """
 
     def __init__(self, ctx, options: dict | None = None):
@@ -57,11 +69,17 @@ class Diff(Renderable):
         super().__init__(ctx, opts)
 
         self._diff_raw: str = opts.get("diff", "")
-        self.old_text = opts.get("old_text", "")
-        self.new_text = opts.get("new_text", "")
+        self._old_text: str = opts.get("old_text", "")
+        self._new_text: str = opts.get("new_text", "")
         self._view: str = opts.get("view", "unified")
         self._parse_error: Optional[str] = None
         self._parsed_patch: Optional[ParsedPatch] = None
+        self._row_model: Optional[DiffRowModel] = None
+        self._row_model_key: Optional[tuple] = None
+        self._scroll_top: int = max(0, int(opts.get("scroll_top", opts.get("scrollTop", 0))))
+        self._stream_parser: Optional[StreamingPatchParser] = None
+        self._stream_decoder = None
+        self._diff_chunks: list[str] = []
         self._ensure_parsed()
 
         # Line backgrounds (OpenTUI defaults)
@@ -95,6 +113,7 @@ class Diff(Renderable):
         self._theme = get_theme_scope_colors(self._syntax_style)
 
     def _ensure_parsed(self) -> None:
+        self._invalidate_rows()
         if not self._diff_raw:
             self._parse_error = None
             self._parsed_patch = None
@@ -104,14 +123,91 @@ class Diff(Renderable):
         # Fallback: no @@ hunks (e.g. simple "+a\n-b") -> use line-by-line, no error view
         self._parse_error = None if (err == "No valid hunks found") else err
 
+    # --- Streaming input ---
+    def _flush_diff_chunks(self) -> None:
+        if self._diff_chunks:
+            self._diff_raw += "".join(self._diff_chunks)
+            self._diff_chunks = []
+
+    def _reset_stream(self) -> None:
+        self._stream_parser = None
+        self._stream_decoder = None
+        self._diff_chunks = []
+
+    def append_diff(self, chunk: str | bytes) -> None:
+        """Feed the next chunk of a unified diff (e.g. from a subprocess pipe).
+
+        Earlier hunks are never re-parsed; each completed hunk is appended to the patch and its rows
+        to the row model, so the first screen renders before the rest of the patch arrives.
+        """
+        if self._stream_parser is None:
+            self._stream_parser = StreamingPatchParser()
+            self._stream_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            self._parse_error = None
+            self._parsed_patch = ParsedPatch()
+            self._invalidate_rows()
+            if self._diff_raw:
+                self._on_stream_hunks(self._stream_parser.feed(self._diff_raw))
+        text = self._stream_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if text:
+            self._diff_chunks.append(text)
+        self._on_stream_hunks(self._stream_parser.feed(chunk))
+
+    def end_diff(self) -> None:
+        """Finish a streamed diff: flush the last hunk; fall back to the plain parser if none was found."""
+        parser = self._stream_parser
+        if parser is None:
+            return
+        tail = self._stream_decoder.decode(b"", final=True) if self._stream_decoder else ""
+        if tail:
+            self._diff_chunks.append(tail)
+        self._on_stream_hunks(parser.close())
+        self._flush_diff_chunks()
+        self._reset_stream()
+        if not self._parsed_patch or not self._parsed_patch.hunks:
+            self._ensure_parsed()
+        self.request_render()
+
+    @property
+    def is_streaming(self) -> bool:
+        return self._stream_parser is not None
+
+    def _on_stream_hunks(self, done: list) -> None:
+        if not done or self._parsed_patch is None:
+            return
+        new_hunks = [hunk for _, hunk in done]
+        self._parsed_patch.hunks.extend(new_hunks)
+        model = self._row_model
+        if model is None:
+            pass  # built on the next render
+        elif model.is_split:
+            left_lines, right_lines = build_split_logical_lines(ParsedPatch(hunks=new_hunks))
+            model.extend_split(left_lines, right_lines, self._wrap_mode)
+        else:
+            lines = flattened_unified_lines(ParsedPatch(hunks=new_hunks))
+            line_w = unified_line_number_width(lines, self.width) if self._show_line_numbers else 0
+            if line_w > model.line_number_width:
+                if self._wrap_mode != "none":
+                    # Narrower content column re-wraps every row; happens once per extra digit.
+                    self._invalidate_rows()
+                    self.request_render()
+                    return
+                # Unwrapped rows do not depend on the content width: just widen the gutter.
+                model.content_width = max(1, model.content_width - (line_w - model.line_number_width))
+                model.line_number_width = line_w
+            model.extend_unified(lines, self._wrap_mode)
+        self.request_render()
+
     # --- Property getters/setters (all trigger request_render where OpenTUI rebuildView) ---
     @property
     def diff(self) -> str:
+        self._flush_diff_chunks()
         return self._diff_raw
 
     @diff.setter
     def diff(self, value: str) -> None:
-        if self._diff_raw != value:
+        if self.diff != value or self._stream_parser is not None:
+            self._reset_stream()
             self._diff_raw = value
             self._ensure_parsed()
             self.request_render()
@@ -124,12 +220,36 @@ class Diff(Renderable):
     def view(self, value: str) -> None:
         if self._view != value and value in ("unified", "split"):
             self._view = value
+            self._invalidate_rows()
+            self.request_render()
+
+    @property
+    def old_text(self) -> str:
+        return self._old_text
+
+    @old_text.setter
+    def old_text(self, value: str) -> None:
+        if self._old_text != value:
+            self._old_text = value
+            self._invalidate_rows()
+            self.request_render()
+
+    @property
+    def new_text(self) -> str:
+        return self._new_text
+
+    @new_text.setter
+    def new_text(self, value: str) -> None:
+        if self._new_text != value:
+            self._new_text = value
+            self._invalidate_rows()
             self.request_render()
 
     def set_texts(self, old_text: str, new_text: str) -> None:
-        if self.old_text != old_text or self.new_text != new_text:
-            self.old_text = old_text
-            self.new_text = new_text
+        if self._old_text != old_text or self._new_text != new_text:
+            self._old_text = old_text
+            self._new_text = new_text
+            self._reset_stream()
             self._diff_raw = ""
             self._ensure_parsed()
             self.request_render()
@@ -197,6 +317,7 @@ class Diff(Renderable):
     def show_line_numbers(self, value: bool) -> None:
         if self._show_line_numbers != value:
             self._show_line_numbers = value
+            self._invalidate_rows()
             self.request_render()
 
     @property
@@ -229,6 +350,7 @@ class Diff(Renderable):
     def filetype(self, value: str) -> None:
         if self._filetype != value:
             self._filetype = value
+            self._invalidate_rows()
             self.request_render()
 
     @property
@@ -250,6 +372,7 @@ class Diff(Renderable):
     def wrap_mode(self, value: str) -> None:
         if self._wrap_mode != value and value in ("word", "char", "none"):
             self._wrap_mode = value
+            self._invalidate_rows()
             self.request_render()
 
     @property
@@ -332,6 +455,8 @@ class Diff(Renderable):
         """Aligns with OpenTUI destroyRecursively: clear state; remove children if any."""
         self._parse_error = None
         self._parsed_patch = None
+        self._reset_stream()
+        self._invalidate_rows()
         self.remove_all()
 
     def _line_bg(self, tag: str):
@@ -350,16 +475,72 @@ class Diff(Renderable):
 
     def _wrap_line(self, text: str, width: int) -> list[str]:
         """Break line into visual rows. wrap_mode: none -> one row; word/char -> break at width."""
-        if width <= 0 or self._wrap_mode == "none":
-            return [text] if text else [""]
-        out: list[str] = []
-        while text:
-            if len(text) <= width:
-                out.append(text)
-                break
-            out.append(text[:width])
-            text = text[width:]
-        return out if out else [""]
+        return wrap_text(text, width, self._wrap_mode)
+
+    # --- Row model / scrolling ---
+    def _invalidate_rows(self) -> None:
+        self._row_model = None
+        self._row_model_key = None
+
+    def _split_widths(self) -> tuple[int, int, int]:
+        """(half, left content width, right content width) for split view; line number column is 3."""
+        half = max(1, self.width // 2)
+        return half, max(0, half - 2 - 3), max(0, self.width - half - 1 - 2 - 3)
+
+    def _get_row_model(self) -> DiffRowModel:
+        """Return the cached row model, rebuilding it only when patch, width, wrap or view changed."""
+        split = self._view == "split" and self._parsed_patch is not None
+        key = (split, self.width, self._wrap_mode, self._show_line_numbers, self._filetype)
+        if self._row_model is not None and self._row_model_key == key:
+            return self._row_model
+        if split:
+            left_lines, right_lines = build_split_logical_lines(self._parsed_patch)
+            _, left_w, right_w = self._split_widths()
+            model = build_split_row_model(left_lines, right_lines, left_w, right_w, self._wrap_mode)
+        else:
+            if self._parsed_patch:
+                lines_with_nums = flattened_unified_lines(self._parsed_patch)
+            else:
+                if self._diff_raw:
+                    raw_list = parse_unified_diff(self._diff_raw)
+                else:
+                    raw_list = diff_lines(self.old_text, self.new_text)
+                lines_with_nums = [(tag, content, None, None) for tag, content in raw_list]
+            filetype = self._filetype
+            highlight = (lambda text: syntax_highlight(text, filetype)) if filetype else None
+            model = build_unified_row_model(
+                lines_with_nums, self.width, self._wrap_mode, self._show_line_numbers, highlight
+            )
+        self._row_model = model
+        self._row_model_key = key
+        return model
+
+    @property
+    def visual_row_count(self) -> int:
+        """Number of wrapped rows at the current width (0 in error view)."""
+        if self._parse_error:
+            return 0
+        return len(self._get_row_model())
+
+    @property
+    def scroll_top(self) -> int:
+        return self._scroll_top
+
+    @scroll_top.setter
+    def scroll_top(self, value: int) -> None:
+        value = max(0, int(value))
+        if self.height > 0 and not self._parse_error:
+            value = min(value, max(0, self.visual_row_count - self.height))
+        if value != self._scroll_top:
+            self._scroll_top = value
+            self.request_render()
+
+    def scroll_by(self, delta: int) -> None:
+        self.scroll_top = self._scroll_top + int(delta)
+
+    def scroll_to_line(self, line_index: int) -> None:
+        """Scroll so logical line line_index (0-based, unified or split pair) is the top row."""
+        self.scroll_top = self._get_row_model().row_for_line(line_index)
 
     def render_self(self, buffer: OptimizedBuffer) -> None:
         if self._parse_error:
@@ -373,7 +554,7 @@ class Diff(Renderable):
     def _render_error_view(self, buffer: OptimizedBuffer) -> None:
         """Error message on first line(s), then raw diff. Aligns with OpenTUI buildErrorView."""
         err_msg = f"Error parsing diff: {self._parse_error}\n"
-        content_lines = (err_msg + self._diff_raw).splitlines()
+        content_lines = (err_msg + self.diff).splitlines()
         row = 0
         for line in content_lines:
             if row >= self.height:
@@ -389,159 +570,82 @@ class Diff(Renderable):
                 buffer.set_cell(self.x + x_off, self.y + row, Cell(char=" ", fg=self._fg, bg=self._context_bg))
             row += 1
 
-    def _render_unified_view(self, buffer: OptimizedBuffer) -> None:
-        # Build lines with optional line numbers from hunks
-        if self._parsed_patch:
-            flat = flattened_unified_lines(self._parsed_patch)
-            lines_with_nums: list[tuple[str, str, Optional[int], Optional[int]]] = flat
-        else:
-            raw_list = diff_lines(self.old_text, self.new_text) if not self._diff_raw else parse_unified_diff(self._diff_raw)
-            lines_with_nums = [(tag, content, None, None) for tag, content in raw_list]
-
-        line_w = 0
-        if self._show_line_numbers and lines_with_nums:
-            max_num = max(
-                (ln or 0 for _, _, old_n, new_n in lines_with_nums for ln in (old_n, new_n) if ln is not None),
-                default=len(lines_with_nums),
-            )
-            line_w = min(len(str(max_num)) + 1, max(0, (self.width - 3) // 4))
-        content_width = self.width - 2 - line_w  # "+ " or "  " then line numbers
-        if content_width <= 0:
-            content_width = max(1, self.width - 2 - line_w)
+    def _visible_rows(self, model: DiffRowModel) -> range:
+        """Clamp scroll_top against the model (width may have changed) and return the visible slice."""
+        max_top = max(0, len(model) - self.height)
+        if self._scroll_top > max_top:
+            self._scroll_top = max_top
+        return model.visible_range(self._scroll_top, self.height)
 
-        row = 0
-        for tag, line, old_num, new_num in lines_with_nums:
-            if row >= self.height:
+    def _draw_text(self, buffer: OptimizedBuffer, x_off: int, y: int, text: str, fg, bg, limit: int) -> int:
+        for ch in text:
+            if x_off >= limit:
                 break
+            buffer.set_cell(self.x + x_off, y, Cell(char=ch, fg=fg, bg=bg))
+            x_off += 1
+        return x_off
+
+    def _render_unified_view(self, buffer: OptimizedBuffer) -> None:
+        model = self._get_row_model()
+        line_w = model.line_number_width
+        theme = self._theme
+        width = self.width
+        for screen_row, idx in enumerate(self._visible_rows(model)):
+            row = model.rows[idx]
+            y = self.y + screen_row
+            tag = row.tag
             bg = self._line_bg(tag)
             fg = self._line_fg(tag)
             prefix = "+ " if tag == "+" else "- " if tag == "-" else "  "
-            wrapped = self._wrap_line(line, content_width)
-            display_num = new_num if new_num is not None else old_num
-            for wi, part in enumerate(wrapped):
-                if row >= self.height:
-                    break
-                x_off = 0
-                for ch in prefix:
-                    if x_off >= self.width:
-                        break
-                    buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=fg, bg=bg))
-                    x_off += 1
-                if self._show_line_numbers and line_w > 0:
-                    num_str = (str(display_num) if (display_num is not None and wi == 0) else "").rjust(line_w)[:line_w]
-                    ln_bg = self._added_line_number_bg if tag == "+" else self._removed_line_number_bg if tag == "-" else self._line_number_bg
-                    for ch in num_str:
-                        if x_off >= self.width:
-                            break
-                        buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=self._line_number_fg, bg=ln_bg))
-                        x_off += 1
-                # Content: syntax highlight if filetype else plain
-                if self._filetype and part:
-                    spans = syntax_highlight(part, self._filetype)
-                    for text, token_type in spans:
-                        color = self._theme.get(token_type, self._theme["plain"])
-                        for ch in text:
-                            if x_off >= self.width:
-                                break
-                            buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=color, bg=bg))
-                            x_off += 1
+            x_off = self._draw_text(buffer, 0, y, prefix, fg, bg, width)
+            if self._show_line_numbers and line_w > 0:
+                num_str = (str(row.line_num) if row.line_num is not None else "").rjust(line_w)[:line_w]
+                if tag == "+":
+                    ln_bg = self._added_line_number_bg
                 else:
-                    for ch in part:
-                        if x_off >= self.width:
-                            break
-                        buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=fg, bg=bg))
-                        x_off += 1
-                while x_off < self.width:
-                    buffer.set_cell(self.x + x_off, self.y + row, Cell(char=" ", fg=fg, bg=bg))
-                    x_off += 1
-                row += 1
+                    ln_bg = self._removed_line_number_bg if tag == "-" else self._line_number_bg
+                x_off = self._draw_text(buffer, x_off, y, num_str, self._line_number_fg, ln_bg, width)
+            # Content: syntax highlight if filetype else plain
+            runs = model.style_runs(row)
+            if runs is not None:
+                for text, token_type in runs:
+                    x_off = self._draw_text(buffer, x_off, y, text, theme.get(token_type, theme["plain"]), bg, width)
+            else:
+                x_off = self._draw_text(buffer, x_off, y, row.text, fg, bg, width)
+            while x_off < width:
+                buffer.set_cell(self.x + x_off, y, Cell(char=" ", fg=fg, bg=bg))
+                x_off += 1
+
+    def _draw_split_half(
+        self, buffer: OptimizedBuffer, row: DiffRow, x_off: int, y: int, limit: int, line_w: int, added: bool
+    ) -> None:
+        changed = row.tag == ("add" if added else "remove")
+        if added:
+            bg = self._added_bg if changed else self._context_bg
+            fg = self._added_sign_color if changed else self._ctx_fg
+            sign = "+ " if changed else "  "
+        else:
+            bg = self._removed_bg if changed else self._context_bg
+            fg = self._removed_sign_color if changed else self._ctx_fg
+            sign = "- " if changed else "  "
+        x_off = self._draw_text(buffer, x_off, y, sign, fg, bg, limit)
+        if self._show_line_numbers and line_w > 0 and row.line_num is not None:
+            num_str = str(row.line_num).rjust(line_w)[:line_w]
+            x_off = self._draw_text(buffer, x_off, y, num_str, self._line_number_fg, self._line_number_bg, limit)
+        x_off = self._draw_text(buffer, x_off, y, row.text, fg, bg, limit)
+        while x_off < limit:
+            buffer.set_cell(self.x + x_off, y, Cell(char=" ", fg=fg, bg=bg))
+            x_off += 1
 
     def _render_split_view(self, buffer: OptimizedBuffer) -> None:
         """Left column = removed/context, right column = added/context. Aligns with OpenTUI buildSplitView."""
-        left_lines, right_lines = build_split_logical_lines(self._parsed_patch)
-        half = max(1, self.width // 2)
-        line_w = 3
-        left_w = max(0, half - 2 - line_w)  # sign + line number + content
-        right_w = max(0, self.width - half - 1 - 2 - line_w)
-        max_rows = max(
-            sum(len(self._wrap_line(ll.content, left_w)) for ll in left_lines),
-            sum(len(self._wrap_line(rl.content, right_w)) for rl in right_lines),
-        )
-        left_visual: list[tuple[str, Optional[int], str]] = []  # (content, line_num, type)
-        right_visual: list[tuple[str, Optional[int], str]] = []
-        idx_l, idx_r = 0, 0
-        for ll, rl in zip(left_lines, right_lines):
-            l_parts = self._wrap_line(ll.content, left_w)
-            r_parts = self._wrap_line(rl.content, right_w)
-            n = max(len(l_parts), len(r_parts))
-            for i in range(n):
-                lc = l_parts[i] if i < len(l_parts) else ""
-                rc = r_parts[i] if i < len(r_parts) else ""
-                ln = ll.line_num if i == 0 else None
-                rn = rl.line_num if i == 0 else None
-                left_visual.append((lc, ln if not ll.hide_line_number else None, ll.type))
-                right_visual.append((rc, rn if not rl.hide_line_number else None, rl.type))
-        # Pad to same length
-        while len(left_visual) < len(right_visual):
-            left_visual.append(("", None, "empty"))
-        while len(right_visual) < len(left_visual):
-            right_visual.append(("", None, "empty"))
-
-        row = 0
-        for (lc, ln, lt), (rc, rn, rt) in zip(left_visual, right_visual):
-            if row >= self.height:
-                break
-            # Left column
-            x_off = 0
-            bg_l = self._removed_bg if lt == "remove" else self._context_bg
-            fg_l = self._removed_sign_color if lt == "remove" else self._ctx_fg
-            sign_l = "- " if lt == "remove" else "  "
-            for ch in sign_l:
-                if x_off >= half:
-                    break
-                buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=fg_l, bg=bg_l))
-                x_off += 1
-            if self._show_line_numbers and line_w > 0 and ln is not None:
-                num_str = str(ln).rjust(line_w)[:line_w]
-                for ch in num_str:
-                    if x_off >= half:
-                        break
-                    buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=self._line_number_fg, bg=self._line_number_bg))
-                    x_off += 1
-            for ch in lc[: left_w - x_off]:
-                if x_off >= half:
-                    break
-                buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=fg_l, bg=bg_l))
-                x_off += 1
-            while x_off < half:
-                buffer.set_cell(self.x + x_off, self.y + row, Cell(char=" ", fg=fg_l, bg=bg_l))
-                x_off += 1
+        model = self._get_row_model()
+        half, _, _ = self._split_widths()
+        right_rows = model.right_rows or []
+        for screen_row, idx in enumerate(self._visible_rows(model)):
+            y = self.y + screen_row
+            self._draw_split_half(buffer, model.rows[idx], 0, y, half, model.line_number_width, added=False)
             # Gap
             if half < self.width:
-                buffer.set_cell(self.x + half, self.y + row, Cell(char=" ", fg=self._fg, bg=self._context_bg))
-            # Right column
-            x_off = half + 1
-            bg_r = self._added_bg if rt == "add" else self._context_bg
-            fg_r = self._added_sign_color if rt == "add" else self._ctx_fg
-            sign_r = "+ " if rt == "add" else "  "
-            for ch in sign_r:
-                if x_off >= self.width:
-                    break
-                buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=fg_r, bg=bg_r))
-                x_off += 1
-            if self._show_line_numbers and line_w > 0 and rn is not None:
-                num_str = str(rn).rjust(line_w)[:line_w]
-                for ch in num_str:
-                    if x_off >= self.width:
-                        break
-                    buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=self._line_number_fg, bg=self._line_number_bg))
-                    x_off += 1
-            for ch in rc[:right_w]:
-                if x_off >= self.width:
-                    break
-                buffer.set_cell(self.x + x_off, self.y + row, Cell(char=ch, fg=fg_r, bg=bg_r))
-                x_off += 1
-            while x_off < self.width:
-                buffer.set_cell(self.x + x_off, self.y + row, Cell(char=" ", fg=fg_r, bg=bg_r))
-                x_off += 1
-            row += 1
+                buffer.set_cell(self.x + half, y, Cell(char=" ", fg=self._fg, bg=self._context_bg))
+            self._draw_split_half(buffer, right_rows[idx], half + 1, y, self.width, model.line_number_width, added=True)
@@ -0,0 +1,402 @@
+# pytui.components.file_viewer - Read-only viewer for files larger than memory (PyTUI extension).
+# Backed by lib.mapped_file.MappedFile: the line index is built on a background thread and the viewer is usable
+# before it finishes; each frame decodes only the visible lines. goto_line, incremental search (search / next /
+# prev) with match highlighting, and optional per-line syntax colouring through the Code token theme.
+# Jumping to the end before the index is complete never waits for it: the last screen is found by scanning
+# backward from EOF and tracked by byte offset until its line number is known.
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+from pytui.core.buffer import Cell, OptimizedBuffer
+from pytui.core.renderable import Renderable
+from pytui.core.syntax_style import get_theme_scope_colors
+from pytui.lib import parse_color_to_tuple
+from pytui.lib.keymapping import KeyBinding
+from pytui.lib.mapped_file import DEFAULT_STRIDE, MappedFile
+from pytui.lib.tree_sitter import highlight as syntax_highlight
+
+FILE_VIEWER_KEY_BINDINGS: list[KeyBinding] = [
+    {"name": "up", "action": "line-up"},
+    {"name": "k", "action": "line-up"},
+    {"name": "down", "action": "line-down"},
+    {"name": "j", "action": "line-down"},
+    {"name": "pageup", "action": "page-up"},
+    {"name": "pagedown", "action": "page-down"},
+    {"name": "home", "action": "first-line"},
+    {"name": "end", "action": "last-line"},
+    {"name": "left", "action": "scroll-left"},
+    {"name": "right", "action": "scroll-right"},
+    {"name": "n", "action": "search-next"},
+    {"name": "n", "shift": True, "action": "search-prev"},
+]
+
+# Decoded lines are cached for a few screens around the viewport.
+_LINE_CACHE_SCREENS = 4
+
+
+class FileViewer(Renderable):
+    """Memory-mapped, read-only file viewer.
+
+    options: path, filetype (alias language; enables per-line highlighting), syntax_style (alias theme),
+    highlighter (callable line -> [(text, token_type)], overrides filetype), fg, bg, search_bg, search_fg,
+    tab_width (default 4), encoding (default utf-8), stride (line index density), background_index (default
+    True; with False the file is only indexed on demand). goto_end() / "end" and goto_line past the known lines
+    show the last screen without waiting for the index.
+    """
+
+    def __init__(self, ctx: Any, options: dict[str, Any] | None = None) -> None:
+        options = options or {}
+        super().__init__(ctx, options)
+        self._filetype: str | None = options.get("filetype", options.get("language"))
+        self._theme = get_theme_scope_colors(options.get("syntax_style", options.get("theme", "default")))
+        self._highlighter: Callable[[str], list[tuple[str, str]]] | None = options.get("highlighter")
+        self._fg = parse_color_to_tuple(options.get("fg", "#cccccc"))
+        self._bg = parse_color_to_tuple(options.get("bg", "transparent"))
+        self._search_bg = parse_color_to_tuple(options.get("search_bg", options.get("searchBg", "#806000")))
+        self._search_fg = parse_color_to_tuple(options.get("search_fg", options.get("searchFg", "#ffffff")))
+        self._tab_width = max(1, int(options.get("tab_width", options.get("tabWidth", 4))))
+        self._encoding = options.get("encoding", "utf-8")
+        self._stride = options.get("stride", DEFAULT_STRIDE)
+        self._background_index = options.get("background_index", True)
+        self._file: MappedFile | None = None
+        self._top = 0
+        self._tail: int | None = None  # byte offset of the top line while its number is not known yet
+        self._left = 0
+        self._lines: dict[int, str] = {}
+        self._highlights: dict[int, list[tuple[str, str]]] = {}
+        self._query: str | None = None
+        self._query_str: re.Pattern[str] | None = None
+        self._query_bytes: re.Pattern[bytes] | None = None
+        self._match: tuple[int, int] | None = None  # byte range of the current match
+        if options.get("path"):
+            self.open(options["path"])
+
+    # --- file ---
+
+    def open(self, path: str) -> None:
+        """Map path (closing any previous file) and start indexing it."""
+        self.close()
+        self._file = MappedFile(path, self._stride, self._encoding, on_progress=self.request_render)
+        if self._background_index:
+            self._file.start_indexing()
+        self._top = self._left = 0
+        self._tail = None
+        self._match = None
+        self.request_render()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._tail = None
+        self._lines.clear()
+        self._highlights.clear()
+
+    @property
+    def file(self) -> MappedFile | None:
+        return self._file
+
+    @property
+    def line_count(self) -> int:
+        """Lines known so far (grows while the background index runs)."""
+        return self._file.line_count if self._file is not None else 0
+
+    @property
+    def indexing_done(self) -> bool:
+        return self._file is None or self._file.indexed
+
+    # --- scrolling ---
+
+    @property
+    def top_line(self) -> int:
+        """First visible line; while the end is shown before indexing finishes, a lower bound."""
+        self._resolve_tail()
+        if self._tail is not None and self._file is not None:
+            return max(self._top, self._file.line_count - max(1, self.height))
+        return self._top
+
+    @top_line.setter
+    def top_line(self, value: int) -> None:
+        self.goto_line(value, align="top")
+
+    @property
+    def scroll_x(self) -> int:
+        return self._left
+
+    @scroll_x.setter
+    def scroll_x(self, value: int) -> None:
+        value = max(0, value)
+        if value != self._left:
+            self._left = value
+            self.request_render()
+
+    def _max_top(self) -> int | None:
+        f = self._file
+        if f is None:
+            return 0
+        if not f.indexed:
+            return None  # unknown yet; clamped by reads past EOF
+        return max(0, f.line_count - max(1, self.height))
+
+    def _resolve_tail(self) -> None:
+        f = self._file
+        if self._tail is not None and f is not None and f.indexed:
+            self._top = min(f.line_of_offset(self._tail), self._max_top() or 0)
+            self._tail = None
+            self._trim_caches()
+
+    def goto_end(self) -> None:
+        """Show the last screen; before the index is complete it is located from EOF instead of waiting."""
+        f = self._file
+        if f is None:
+            return
+        if f.indexed:
+            self.goto_line(f.line_count)
+            return
+        tail = f.tail_start(max(1, self.height))
+        if tail != self._tail:
+            self._tail = tail
+            self.request_render()
+
+    def goto_line(self, line: int, align: str = "top") -> None:
+        """Scroll so line (0-based) is visible: at the top, or with align="center" in the middle."""
+        self._resolve_tail()
+        h = max(1, self.height)
+        top = line - h // 2 if align == "center" else line
+        top = max(0, top)
+        max_top = self._max_top()
+        if max_top is not None:
+            top = min(top, max_top)
+        elif self._file is not None and self._file.line_start(top) is None:
+            # Past EOF while still indexing.
+            self.goto_end()
+            return
+        if top != self._top or self._tail is not None:
+            self._top = top
+            self._tail = None
+            self._trim_caches()
+            self.request_render()
+
+    def scroll_by(self, delta: int) -> None:
+        self._resolve_tail()
+        f = self._file
+        if self._tail is None or f is None:
+            self.goto_line(self._top + delta)
+            return
+        # Showing the end by byte offset: step whole lines, never past the last screen.
+        pos = self._tail
+        step = f.prev_line_start if delta < 0 else f.next_line_start
+        for _ in range(abs(delta)):
+            nxt = step(pos)
+            if nxt is None:
+                break
+            pos = nxt
+        if delta > 0:
+            pos = min(pos, f.tail_start(max(1, self.height)))
+        if pos != self._tail:
+            self._tail = pos
+            self.request_render()
+
+    # --- search ---
+
+    def search(self, query: str, regex: bool = False, case_sensitive: bool = True, backward: bool = False) -> int | None:
+        """Incremental search: find query from the current match (or the top line) and scroll to it.
+
+        Refining the query while typing keeps the position; returns the matching line or None.
+        """
+        if not query:
+            self.clear_search()
+            return None
+        flags = re.MULTILINE | (0 if case_sensitive else re.IGNORECASE)
+        source = query if regex else re.escape(query)
+        self._query_str = re.compile(source, flags)
+        self._query_bytes = re.compile(source.encode(self._encoding, errors="replace"), flags)
+        self._query = query
+        start = self._match[0] if self._match else self._start_offset()
+        return self._find_from(start, backward)
+
+    def search_next(self) -> int | None:
+        if self._query_bytes is None:
+            return None
+        start = self._match[0] + 1 if self._match else self._start_offset()
+        return self._find_from(start, backward=False)
+
+    def search_prev(self) -> int | None:
+        if self._query_bytes is None:
+            return None
+        start = self._match[0] if self._match else self._start_offset()
+        return self._find_from(start, backward=True)
+
+    def clear_search(self) -> None:
+        self._query = self._query_str = self._query_bytes = None
+        self._match = None
+        self.request_render()
+
+    @property
+    def search_query(self) -> str | None:
+        return self._query
+
+    def _start_offset(self) -> int:
+        if self._file is None:
+            return 0
+        if self._tail is not None:
+            return self._tail
+        pos = self._file.line_start(self._top)
+        return pos if pos is not None else self._file.size
+
+    def _find_from(self, start: int, backward: bool) -> int | None:
+        f = self._file
+        if f is None or self._query_bytes is None:
+            return None
+        found = f.find(self._query_bytes, start, backward=backward)
+        if found is None:
+            self.request_render()
+            return None
+        self._match = found
+        line = f.line_of_offset(found[0])
+        h = max(1, self.height)
+        self._resolve_tail()
+        if self._tail is not None:
+            end: int | None = self._tail
+            for _ in range(h):
+                end = f.next_line_start(end) if end is not None else None
+            if not self._tail <= found[0] < (end if end is not None else f.size):
+                self.goto_line(line, align="center")
+        elif not self._top <= line < self._top + h:
+            self.goto_line(line, align="center")
+        self.request_render()
+        return line
+
+    # --- input ---
+
+    def focus(self) -> None:
+        super().focus()
+        if hasattr(self.ctx, "renderer") and self.ctx.renderer:
+            self.ctx.renderer.keyboard.keymaps.bind(self, FILE_VIEWER_KEY_BINDINGS, self._on_key_action)
+
+    def blur(self) -> None:
+        if hasattr(self.ctx, "renderer") and self.ctx.renderer:
+            self.ctx.renderer.keyboard.keymaps.unbind(self)
+        super().blur()
+
+    def _on_key_action(self, action: str, key: Any) -> bool:
+        if not self.focused:
+            return False
+        h = max(1, self.height)
+        if action == "line-up":
+            self.scroll_by(-1)
+        elif action == "line-down":
+            self.scroll_by(1)
+        elif action == "page-up":
+            self.scroll_by(-h)
+        elif action == "page-down":
+            self.scroll_by(h)
+        elif action == "first-line":
+            self.goto_line(0)
+        elif action == "last-line":
+            self.goto_end()
+        elif action == "scroll-left":
+            self.scroll_x = self._left - 1
+        elif action == "scroll-right":
+            self.scroll_x = self._left + 1
+        elif action == "search-next":
+            self.search_next()
+        elif action == "search-prev":
+            self.search_prev()
+        return True
+
+    def on_mouse(self, event: dict) -> None:
+        if event.get("type") != "scroll":
+            return
+        direction = (event.get("scroll") or {}).get("direction")
+        if direction == "up":
+            self.scroll_by(-3)
+        elif direction == "down":
+            self.scroll_by(3)
+        elif direction == "left":
+            self.scroll_x = self._left - 4
+        elif direction == "right":
+            self.scroll_x = self._left + 4
+
+    # --- render ---
+
+    def _trim_caches(self) -> None:
+        keep = max(1, self.height) * _LINE_CACHE_SCREENS
+        if len(self._lines) > keep:
+            lo, hi = self._top - keep // 2, self._top + keep
+            self._lines = {n: s for n, s in self._lines.items() if lo <= n < hi}
+            self._highlights = {n: s for n, s in self._highlights.items() if lo <= n < hi}
+
+    def _visible_lines(self, h: int) -> list[str]:
+        f = self._file
+        if f is None:
+            return []
+        if self._tail is not None:
+            tab = " " * self._tab_width
+            return [line.replace("\t", tab) for line in f.read_lines_at(self._tail, h)]
+        top = self._top
+        cached = self._lines
+        if all(n in cached for n in range(top, top + h)):
+            return [cached[n] for n in range(top, top + h)]
+        lines = f.read_lines(top, h)
+        tab = " " * self._tab_width
+        for i, line in enumerate(lines):
+            cached[top + i] = line.replace("\t", tab)
+        return [cached[top + i] for i in range(len(lines))]
+
+    def _spans(self, n: int | None, line: str) -> list[tuple[str, str]]:
+        """Highlight spans of line n (n None: a line whose number is not known yet, not cached)."""
+        if self._highlighter is None and not self._filetype:
+            return [(line, "plain")]
+        spans = self._highlights.get(n) if n is not None else None
+        if spans is None:
+            try:
+                if self._highlighter is not None:
+                    spans = self._highlighter(line)
+                else:
+                    spans = syntax_highlight(line, self._filetype or "plain")
+            except Exception:  # noqa: BLE001
+                spans = [(line, "plain")]
+            if n is not None:
+                self._highlights[n] = spans
+        return spans
+
+    def render_self(self, buffer: OptimizedBuffer) -> None:
+        w = max(1, self.width)
+        h = max(1, self.height)
+        theme = self._theme
+        fg_default, bg_default = self._fg, self._bg
+        left = self._left
+        highlighting = self._highlighter is not None or bool(self._filetype)
+        self._resolve_tail()
+        for dy, line in enumerate(self._visible_lines(h)):
+            n = self._top + dy if self._tail is None else None
+            marks: set[int] = set()
+            if self._query_str is not None:
+                for m in self._query_str.finditer(line):
+                    marks.update(range(m.start(), m.end()))
+            col = 0
+            for text, token_type in self._spans(n, line):
+                color = theme.get(token_type, theme.get("plain", fg_default)) if highlighting else fg_default
+                for ch in text:
+                    x = col - left
+                    col += 1
+                    if x < 0:
+                        continue
+                    if x >= w:
+                        break
+                    if col - 1 in marks:
+                        cell = Cell(char=ch, fg=self._search_fg, bg=self._search_bg)
+                    else:
+                        cell = Cell(char=ch, fg=color, bg=bg_default)
+                    buffer.set_cell(self.x + x, self.y + dy, cell)
+                if col - left >= w:
+                    break
+
+    def destroy(self) -> None:
+        """Stop indexing and unmap the file."""
+        self.close()
@@ -1,27 +1,56 @@
 # pytui.components.markdown - Aligns with OpenTUI packages/core/src/renderables/Markdown.ts
 # MarkdownRenderable: content, syntaxStyle, conceal, streaming, clearCache, renderSelf.
-# PyTUI: minimal stub - renders content as single Text block (full markdown parsing 待后续).
+# Block-level rendering: each markdown block (heading, paragraph, list, quote, table, hr) is a Text
+# child and fenced code is delegated to Code. Content changes re-parse only from the first changed
+# block (see pytui.lib.markdown_blocks) and unchanged blocks keep their child renderables.
 
 from __future__ import annotations
 
 from typing import Any
 
+from pytui.components.code import Code
+from pytui.components.text import Text, _compute_line_counts
+from pytui.components.text_node import Span
 from pytui.core.buffer import OptimizedBuffer
 from pytui.core.renderable import Renderable
-from pytui.components.text import Text
+from pytui.lib import parse_color_to_tuple
+from pytui.lib.markdown_blocks import MarkdownBlock, parse_inline, parse_markdown_blocks, reparse_markdown_blocks
+
+_HEADING_FG = [
+    parse_color_to_tuple(c) for c in ("#7aa2f7", "#7dcfff", "#9ece6a", "#e0af68", "#bb9af7", "#bb9af7")
+]
+_TEXT_FG = parse_color_to_tuple("#c0caf5")
+_CODE_FG = parse_color_to_tuple("#ff9e64")
+_CODE_BG = parse_color_to_tuple("#1f2335")
+_LINK_FG = parse_color_to_tuple("#73daca")
+_QUOTE_FG = parse_color_to_tuple("#9aa5ce")
+_MARKER_FG = parse_color_to_tuple("#565f89")
+_HR_WIDTH = 512  # Text clips to its width
 
 
 class MarkdownRenderable(Renderable):
-    """Markdown renderable. API aligns OpenTUI MarkdownRenderable; content rendered as single Text block."""
+    """Markdown renderable. API aligns OpenTUI MarkdownRenderable.
+
+    Blocks are laid out in a column with one row between them; each block child is sized to its
+    wrapped row count at the current width. Setting content re-parses from the first changed block
+    and reuses (or updates in place) the children of unchanged blocks, so appending streamed tokens
+    only touches the last block.
+    """
 
     def __init__(self, ctx: Any, options: dict[str, Any] | None = None) -> None:
         options = options or {}
-        super().__init__(ctx, {**options, "flex_direction": "column"})
+        super().__init__(ctx, {"gap": 1, **options, "flex_direction": "column"})
         self._content = options.get("content", "")
         self._syntax_style = options.get("syntax_style", options.get("syntaxStyle"))
         self._conceal = options.get("conceal", True)
         self._streaming = options.get("streaming", False)
+        self._auto_height = "height" not in options
+        self._blocks: list[MarkdownBlock] = []
         self._block_children: list[Renderable] = []
+        self._block_heights: list[int] = []  # cached wrapped rows per block child
+        self._rows_total = 0  # sum of _block_heights
+        self._parsed_content = ""
+        self._measured_width = 0
         self._update_blocks()
 
     @property
@@ -35,6 +64,15 @@ class MarkdownRenderable(Renderable):
             self._update_blocks()
             self.request_render()
 
+    def append(self, text: str) -> None:
+        """Append streamed text (e.g. LLM tokens); only the last block is re-parsed."""
+        if text:
+            self.content = self._content + text
+
+    @property
+    def blocks(self) -> list[MarkdownBlock]:
+        return list(self._blocks)
+
     @property
     def syntax_style(self) -> Any:
         return self._syntax_style
@@ -43,6 +81,9 @@ class MarkdownRenderable(Renderable):
     def syntax_style(self, value: Any) -> None:
         if self._syntax_style != value:
             self._syntax_style = value
+            for child in self._block_children:
+                if isinstance(child, Code):
+                    child.syntax_style = value or "default"
             self.request_render()
 
     @property
@@ -53,7 +94,7 @@ class MarkdownRenderable(Renderable):
     def conceal(self, value: bool) -> None:
         if self._conceal != value:
             self._conceal = value
-            self.request_render()
+            self.clear_cache()
 
     @property
     def streaming(self) -> bool:
@@ -63,23 +104,212 @@ class MarkdownRenderable(Renderable):
     def streaming(self, value: bool) -> None:
         if self._streaming != value:
             self._streaming = value
-            self._update_blocks()
+            for child in self._block_children:
+                if isinstance(child, Code):
+                    child.streaming = value
             self.request_render()
 
-    def _update_blocks(self) -> None:
-        for child in self._block_children:
-            self.remove(child)
-        self._block_children.clear()
-        if not self._content.strip():
+    # --- Block -> child renderables ---
+    def _measure_width(self) -> int:
+        if self.width > 0:
+            return self.width
+        return max(1, int(getattr(getattr(self.ctx, "renderer", None), "width", 80) or 80))
+
+    def _inline_spans(self, text: str, fg: tuple, bold: bool = False, italic: bool = False) -> list[Span]:
+        spans: list[Span] = []
+        for run in parse_inline(text, self._conceal):
+            if run.code:
+                spans.append(Span(text=run.text, fg=_CODE_FG, bg=_CODE_BG, bold=bold or run.bold))
+                continue
+            spans.append(
+                Span(
+                    text=run.text,
+                    fg=_LINK_FG if run.href else fg,
+                    bold=bold or run.bold,
+                    italic=italic or run.italic,
+                    strikethrough=run.strikethrough,
+                    underline=run.href is not None,
+                    href=run.href,
+                )
+            )
+        return spans
+
+    def _block_content(self, block: MarkdownBlock) -> tuple[list[Span | str], str]:
+        """(Text content, wrap_mode) for a non-code block."""
+        kind = block.kind
+        if kind == "heading":
+            fg = _HEADING_FG[min(block.level, 6) - 1]
+            prefix: list[Span | str] = [] if self._conceal else [Span(text="#" * block.level + " ", fg=_MARKER_FG)]
+            return prefix + self._inline_spans(block.text, fg, bold=True), "word"
+        if kind == "paragraph":
+            return self._inline_spans(block.text, _TEXT_FG), "word"
+        if kind == "quote":
+            out: list[Span | str] = []
+            for i, line in enumerate(block.text.split("\n")):
+                if i:
+                    out.append(Span(text="\n"))
+                out.append(Span(text="│ ", fg=_MARKER_FG))
+                out.extend(self._inline_spans(line, _QUOTE_FG, italic=True))
+            return out, "word"
+        if kind == "list":
+            out = []
+            number = 0
+            for i, item in enumerate(block.items):
+                if i:
+                    out.append(Span(text="\n"))
+                if item.marker[:1].isdigit():
+                    number = number + 1 if number else int(item.marker[:-1])
+                    bullet = f"{number}{item.marker[-1]} "
+                else:
+                    bullet = "• " if self._conceal else item.marker + " "
+                out.append(Span(text="  " * item.level + bullet, fg=_MARKER_FG))
+                out.extend(self._inline_spans(item.text, _TEXT_FG))
+            return out, "word"
+        if kind == "table":
+            return self._table_spans(block), "none"
+        return [Span(text="─" * _HR_WIDTH, fg=_MARKER_FG)], "none"
+
+    def _table_spans(self, block: MarkdownBlock) -> list[Span | str]:
+        ncols = max(len(r) for r in block.rows)
+        widths = [0] * ncols
+        for row in block.rows:
+            for c, cell in enumerate(row):
+                widths[c] = max(widths[c], len("".join(s.text for s in parse_inline(cell, self._conceal))))
+        out: list[Span | str] = []
+        for r, row in enumerate(block.rows):
+            if r:
+                out.append(Span(text="\n"))
+            out.append(Span(text="│", fg=_MARKER_FG))
+            for c in range(ncols):
+                cell = row[c] if c < len(row) else ""
+                spans = self._inline_spans(cell, _TEXT_FG, bold=r == 0)
+                pad = widths[c] - sum(len(s.text) for s in spans)
+                align = block.align[c] if c < len(block.align) else "left"
+                left = pad // 2 if align == "center" else pad if align == "right" else 0
+                out.append(Span(text=" " + " " * left))
+                out.extend(spans)
+                out.append(Span(text=" " * (pad - left) + " "))
+                out.append(Span(text="│", fg=_MARKER_FG))
+            if r == 0:
+                out.append(Span(text="\n"))
+                out.append(Span(text="├" + "┼".join("─" * (w + 2) for w in widths) + "┤", fg=_MARKER_FG))
+        return out
+
+    def _block_rows(self, block: MarkdownBlock, child: Renderable, width: int) -> int:
+        if isinstance(child, Code):
+            return max(1, block.text.count("\n") + 1) if block.text or not block.closed else 1
+        assert isinstance(child, Text)
+        return max(1, _compute_line_counts(child.content, width, child.wrap_mode)[1])
+
+    def _create_child(self, block: MarkdownBlock) -> Renderable:
+        if block.kind == "code":
+            return Code(
+                self.ctx,
+                {
+                    "content": block.text,
+                    "filetype": block.lang or None,
+                    "syntax_style": self._syntax_style or "default",
+                    "streaming": self._streaming,
+                    "wrap_mode": "none",
+                    "width": "100%",
+                },
+            )
+        content, wrap_mode = self._block_content(block)
+        return Text(self.ctx, {"content": content, "wrap_mode": wrap_mode, "width": "100%"})
+
+    def _update_child(self, child: Renderable, block: MarkdownBlock) -> bool:
+        """Update child in place for a changed block of the same kind; False if it must be recreated."""
+        if isinstance(child, Code):
+            if block.kind != "code":
+                return False
+            child.content = block.text
+            child.filetype = block.lang or None
+            return True
+        if block.kind == "code" or not isinstance(child, Text):
+            return False
+        content, wrap_mode = self._block_content(block)
+        child.content = content
+        child.wrap_mode = wrap_mode
+        return True
+
+    def _size_child(self, child: Renderable, block: MarkdownBlock, width: int) -> int:
+        rows = self._block_rows(block, child, width)
+        child.layout_node.set_height(rows)
+        return rows
+
+    def _update_blocks(self, full: bool = False) -> None:
+        if full or not self._blocks:
+            new_blocks, first = parse_markdown_blocks(self._content), 0
+        else:
+            new_blocks, first = reparse_markdown_blocks(self._parsed_content, self._blocks, self._content)
+        old_blocks, old_children, old_heights = self._blocks, self._block_children, self._block_heights
+        children = old_children[:first]
+        width = self._measure_width()
+        if width != self._measured_width:
+            first = 0  # every cached height is for the old width
+            children = []
+        heights = old_heights[:first]
+        tail = list(zip(old_blocks[first:], old_children[first:], old_heights[first:]))
+        ti = 0
+        for block in new_blocks[first:]:
+            child: Renderable | None = None
+            rows = -1
+            if ti < len(tail):
+                old_block, old_child, old_rows = tail[ti]
+                if old_block.same_source(block):
+                    child, rows = old_child, old_rows
+                    ti += 1
+                elif old_block.kind == block.kind and self._update_child(old_child, block):
+                    child = old_child
+                    ti += 1
+            if child is None:
+                child = self._create_child(block)
+            if rows < 0 or width != self._measured_width:
+                rows = self._size_child(child, block, width)
+            children.append(child)
+            heights.append(rows)
+        reused = {id(c) for c in children}
+        for c in old_children[first:]:
+            if id(c) not in reused:
+                self.remove(c)
+        for index, child in enumerate(children):
+            if index >= len(self.children) or self.children[index] is not child:
+                self.add(child, index)
+        self._blocks = new_blocks
+        self._block_children = children
+        self._rows_total += sum(heights[first:]) - sum(old_heights[first:])
+        self._block_heights = heights
+        self._parsed_content = self._content
+        self._measured_width = width
+        self._update_auto_height()
+
+    def _update_auto_height(self) -> None:
+        if not self._auto_height:
             return
-        text_child = Text(self.ctx, {"content": self._content, "width": "100%"})
-        self.add(text_child)
-        self._block_children.append(text_child)
+        self.layout_node.set_height(self._rows_total + max(0, len(self._block_children) - 1))
+
+    def calculate_layout(self) -> None:
+        super().calculate_layout()
+        # Re-measure wrapped block heights when the width we sized for changed (applies next frame).
+        if self.width > 0 and self.width != self._measured_width:
+            self._measured_width = self.width
+            self._block_heights = [
+                self._size_child(child, block, self.width) for block, child in zip(self._blocks, self._block_children)
+            ]
+            self._rows_total = sum(self._block_heights)
+            self._update_auto_height()
+            self.request_render()
 
     def clear_cache(self) -> None:
-        self._update_blocks()
+        for child in self._block_children:
+            self.remove(child)
+        self._blocks = []
+        self._block_children = []
+        self._block_heights = []
+        self._rows_total = 0
+        self._update_blocks(full=True)
         self.request_render()
 
     def render_self(self, buffer: OptimizedBuffer, delta_time: float = 0.0) -> None:
-        # Children (Text block) rendered by Renderable.render()
+        # Block children (Text / Code) rendered by Renderable.render()
         pass
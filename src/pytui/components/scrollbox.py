@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Literal
 
 from pytui.core.buffer import OptimizedBuffer
 from pytui.core.renderable import Renderable
+from pytui.lib.keymapping import KeyBinding
 
 if TYPE_CHECKING:
     from pytui.lib.scroll_acceleration import ScrollAcceleration
@@ -15,6 +16,13 @@ if TYPE_CHECKING:
 ScrollUnit = Literal["absolute", "viewport", "content", "step"]
 StickyStart = Literal["top", "bottom", "left", "right"]
 
+SCROLLBOX_KEY_BINDINGS: list[KeyBinding] = [
+    {"name": "up", "action": "scroll-up"},
+    {"name": "k", "action": "scroll-up"},
+    {"name": "down", "action": "scroll-down"},
+    {"name": "j", "action": "scroll-down"},
+]
+
 
 class Scrollbox(Renderable):
     """Scroll container. Aligns with OpenTUI ScrollBoxRenderable: scroll_top, scroll_left,
@@ -171,13 +179,22 @@ class Scrollbox(Renderable):
     def focus(self) -> None:
         super().focus()
         if hasattr(self.ctx, "renderer") and self.ctx.renderer:
-            self.ctx.renderer.keyboard.on("keypress", self._on_keypress)
+            self.ctx.renderer.keyboard.keymaps.bind(self, SCROLLBOX_KEY_BINDINGS, self._on_key_action, self._on_keypress)
 
     def blur(self) -> None:
         if hasattr(self.ctx, "renderer") and self.ctx.renderer:
-            self.ctx.renderer.keyboard.remove_listener("keypress", self._on_keypress)
+            self.ctx.renderer.keyboard.keymaps.unbind(self)
         super().blur()
 
+    def _on_key_action(self, action: str, key: Any) -> bool:
+        if not self.focused:
+            return False
+        if action == "scroll-up":
+            self.scroll_up()
+        else:
+            self.scroll_down()
+        return True
+
     def _on_keypress(self, key: dict) -> None:
         if not self.focused:
             return
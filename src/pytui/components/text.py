@@ -3,6 +3,9 @@
 # wrap_mode (none|char|word), truncate, tabIndicator, tabIndicatorColor,
 # position, left/top/right/bottom. plainText, textLength, lineCount, virtualLineCount.
 # See OpenTUI renderables/Text.ts, TextBufferRenderable.ts.
+# Plain string content lives in a core TextBuffer (line-indexed, append-optimized). Wrapped visual lines are
+# cached per logical line; append() only invalidates the last line and adds the new ones, and follow_tail
+# renders the last screen by wrapping lines from the end, so streaming output never re-splits earlier text.
 
 from __future__ import annotations
 
@@ -12,6 +15,7 @@ from typing import Any, Literal
 from pytui.components.text_node import Span
 from pytui.core.buffer import Cell, OptimizedBuffer
 from pytui.core.renderable import ADDED, REMOVED, Renderable
+from pytui.core.text_buffer import TextBuffer
 from pytui.core.types import TextAttributes
 from pytui.lib import parse_color_to_tuple
 
@@ -136,8 +140,14 @@ class Text(Renderable):
     def __init__(self, ctx: Any, options: dict[str, Any] | None = None) -> None:
         options = options or {}
         super().__init__(ctx, options)
-        raw = options.get("content", "")
-        self._content: str | StyledText = raw
+        # Plain strings are kept in _text_buffer (_content is None); StyledText stays in _content.
+        self._text_buffer = TextBuffer()
+        self._wrap_cache: list[list[str] | None] = []
+        self._wrap_key: tuple | None = None
+        self._wrap_length = -1
+        self._content: str | StyledText | None = ""
+        self._assign_content(options.get("content", ""))
+        self._follow_tail: bool = bool(options.get("follow_tail", options.get("followTail", False)))
         self.fg = parse_color_to_tuple(options.get("fg", "#ffffff"))
         self.bg = parse_color_to_tuple(options.get("bg", "transparent"))
         attrs = options.get("attributes", options.get("attributes"))
@@ -253,70 +263,148 @@ class Text(Renderable):
     @property
     def line_count(self) -> int:
         """Number of logical lines. Align OpenTUI lineCount."""
+        if self._content is None:
+            return self._text_buffer.get_line_count() if self._text_buffer.length else 0
         return _compute_line_counts(self.content, max(1, self.width), self._wrap_mode)[0]
 
     @property
     def virtual_line_count(self) -> int:
         """Number of visual lines after wrapping. Align OpenTUI getVirtualLineCount / virtualLineCount."""
+        if self._content is None and self._tab_indicator is None:
+            if not self._text_buffer.length:
+                return 0
+            max_w = max(1, self.width)
+            if self._wrap_mode == "none":
+                return self._text_buffer.get_line_count()
+            cache = self._sync_wrap_cache(max_w)
+            return sum(len(self._visual_lines(i, max_w)) for i in range(len(cache)))
         return _compute_line_counts(self.content, max(1, self.width), self._wrap_mode)[1]
 
+    @property
+    def follow_tail(self) -> bool:
+        """Render the last screen of (wrapped) lines instead of the first; for streaming output."""
+        return self._follow_tail
+
+    @follow_tail.setter
+    def follow_tail(self, value: bool) -> None:
+        if self._follow_tail != value:
+            self._follow_tail = value
+            self.request_render()
+
+    def _assign_content(self, content: str | StyledText) -> None:
+        if isinstance(content, str):
+            self._content = None
+            self._text_buffer.set_text(content)
+        else:
+            self._content = content
+            self._text_buffer.clear()
+
     def set_content(self, content: str | StyledText) -> None:
         if self.content != content:
-            self._content = content
+            self._assign_content(content)
             self.request_render()
 
     @property
     def content(self) -> str | StyledText:
-        return getattr(self, "_content", "")
+        content = getattr(self, "_content", "")
+        if content is None:
+            return self._text_buffer.get_plain_text()
+        return content
 
     @content.setter
     def content(self, value: str | StyledText) -> None:
         self.set_content(value)
 
+    def append(self, text: str | Span) -> None:
+        """Append to the content (CRLF normalized to LF for plain text); only the tail is re-wrapped."""
+        if not text:
+            return
+        if self._content is None and isinstance(text, str):
+            self._text_buffer.append(text)
+        else:
+            self._content = [*_content_to_spans(self.content), text]
+            self._text_buffer.clear()
+        self.request_render()
+
     def clear(self) -> None:
         """Align OpenTUI clear()."""
-        self._content = ""
+        self._assign_content("")
         self.request_render()
 
+    def _sync_wrap_cache(self, max_w: int) -> list[list[str] | None]:
+        """Wrap cache for the current width/mode; after an append only the last known line is dropped."""
+        tb = self._text_buffer
+        cache = self._wrap_cache
+        key = (tb.epoch, max_w, self._wrap_mode, self._tab_indicator)
+        n = tb.get_line_count()
+        if key != self._wrap_key:
+            self._wrap_key = key
+            cache[:] = [None] * n
+        elif tb.length != self._wrap_length:
+            if cache:
+                cache[-1] = None
+            cache.extend([None] * (n - len(cache)))
+        self._wrap_length = tb.length
+        return cache
+
+    def _visual_lines(self, index: int, max_w: int) -> list[str]:
+        rows = self._wrap_cache[index]
+        if rows is None:
+            line = _expand_tab(self._text_buffer.get_line(index), self._tab_indicator)
+            rows = [line] if self._wrap_mode == "none" else _wrap_line(line, max_w, self._wrap_mode)
+            self._wrap_cache[index] = rows
+        return rows
+
+    def _draw_row(self, buffer: OptimizedBuffer, vis: str, dy: int, max_w: int) -> None:
+        if self._truncate and len(vis) > max_w:
+            vis = vis[: max_w - 1] + "…" if max_w > 0 else ""
+        for dx, char in enumerate(vis):
+            if dx >= max_w:
+                break
+            buffer.set_cell(
+                self.x + dx,
+                self.y + dy,
+                Cell(
+                    char=char,
+                    fg=self.fg,
+                    bg=self.bg,
+                    bold=self.bold,
+                    italic=self.italic,
+                    underline=self.underline,
+                    dim=self.dim,
+                    blink=self.blink,
+                    reverse=self.reverse,
+                    strikethrough=self.strikethrough,
+                ),
+            )
+
     def _render_plain(self, buffer: OptimizedBuffer) -> None:
         """Render plain string. Respect wrap_mode (none/char/word) and truncate. Align OpenTUI."""
-        content = self.content
-        assert isinstance(content, str)
         max_w = max(1, self.width)
         max_h = max(1, self.height)
+        cache = self._sync_wrap_cache(max_w)
+        if self._follow_tail:
+            # Wrap from the last line back until one screen is filled.
+            tail: list[list[str]] = []
+            count = 0
+            for i in range(len(cache) - 1, -1, -1):
+                rows = self._visual_lines(i, max_w)
+                tail.append(rows)
+                count += len(rows)
+                if count >= max_h:
+                    break
+            visible = [vis for rows in reversed(tail) for vis in rows][-max_h:]
+            for dy, vis in enumerate(visible):
+                self._draw_row(buffer, vis, dy, max_w)
+            return
         dy = 0
-        for logical_line in content.split("\n"):
+        for i in range(len(cache)):
             if dy >= max_h:
                 return
-            logical_line = _expand_tab(logical_line, self._tab_indicator)
-            if self._wrap_mode == "none":
-                visual_lines = [logical_line]
-            else:
-                visual_lines = _wrap_line(logical_line, max_w, self._wrap_mode)
-            for vis in visual_lines:
+            for vis in self._visual_lines(i, max_w):
                 if dy >= max_h:
                     return
-                if self._truncate and len(vis) > max_w:
-                    vis = vis[: max_w - 1] + "…" if max_w > 0 else ""
-                for dx, char in enumerate(vis):
-                    if dx >= max_w:
-                        break
-                    buffer.set_cell(
-                        self.x + dx,
-                        self.y + dy,
-                        Cell(
-                            char=char,
-                            fg=self.fg,
-                            bg=self.bg,
-                            bold=self.bold,
-                            italic=self.italic,
-                            underline=self.underline,
-                            dim=self.dim,
-                            blink=self.blink,
-                            reverse=self.reverse,
-                            strikethrough=self.strikethrough,
-                        ),
-                    )
+                self._draw_row(buffer, vis, dy, max_w)
                 dy += 1
 
     def _render_styled(self, buffer: OptimizedBuffer, spans: list[Span] | None = None) -> None:
@@ -422,8 +510,7 @@ class Text(Renderable):
             spans = [c.get_span() for c in self.children]
             self._render_styled(buffer, spans=spans)
             return
-        content = self.content
-        if isinstance(content, str):
+        if self._content is None:
             self._render_plain(buffer)
         else:
             self._render_styled(buffer)
@@ -1,6 +1,9 @@
 # pytui.components.text_buffer_renderable - Aligns with OpenTUI packages/core/src/renderables/TextBufferRenderable.ts
 # TextBufferRenderable base: TextBuffer + TextBufferView, LineInfoProvider, scrollY/scrollX, fg/bg, wrapMode,
 # selection, getSelectedText, hasSelection, getSelection, renderSelf (draw text buffer content).
+# append(text) streams into the TextBuffer; with follow_tail the view sticks to the last screen of lines while
+# scrolled to the bottom (scrolling up detaches it, scrolling back to the bottom re-attaches), and rendering only
+# reads the visible lines by index.
 
 from __future__ import annotations
 
@@ -41,6 +44,8 @@ class TextBufferRenderable(Renderable):
             else (parse_color_to_tuple(options["tabIndicatorColor"]) if options.get("tabIndicatorColor") is not None else None)
         )
         self._truncate = options.get("truncate", False)
+        self._follow_tail = bool(options.get("follow_tail", options.get("followTail", False)))
+        self._at_tail = True
         self._width_method = options.get("width_method", "unicode")
 
         self.text_buffer = TextBuffer.create(self._width_method)
@@ -75,6 +80,7 @@ class TextBufferRenderable(Renderable):
     def scroll_y(self, value: int) -> None:
         max_sy = max(0, self.scroll_height - self.height)
         clamped = max(0, min(value, max_sy))
+        self._at_tail = clamped >= max_sy
         if self._scroll_y != clamped:
             self._scroll_y = clamped
             self._update_viewport()
@@ -95,11 +101,30 @@ class TextBufferRenderable(Renderable):
 
     @property
     def scroll_width(self) -> int:
-        return self.line_info.get("max_line_width", 0)
+        return self.text_buffer_view.max_line_width
 
     @property
     def scroll_height(self) -> int:
-        return len(self.line_info.get("line_starts", []))
+        return self.text_buffer.get_line_count()
+
+    @property
+    def follow_tail(self) -> bool:
+        """Keep the last screen of lines in view while scrolled to the bottom."""
+        return self._follow_tail
+
+    @follow_tail.setter
+    def follow_tail(self, value: bool) -> None:
+        if self._follow_tail != value:
+            self._follow_tail = value
+            self._at_tail = True
+            self.request_render()
+
+    def append(self, text: str) -> None:
+        """Append text to the buffer (streaming logs / output); re-renders without re-reading earlier lines."""
+        if not text:
+            return
+        self.text_buffer.append(text)
+        self.request_render()
 
     @property
     def plain_text(self) -> str:
@@ -125,19 +150,13 @@ class TextBufferRenderable(Renderable):
 
     def render_self(self, buffer: OptimizedBuffer) -> None:
         """Draw text buffer content line by line (no native drawTextBuffer in Python)."""
-        lines = self.text_buffer.get_plain_text().split("\n")
-        if not lines:
-            return
-        info = self.line_info
-        starts = info.get("line_starts", [])
-        fg = self._default_fg
+        tb = self.text_buffer
         h = max(1, self.height)
+        if self._follow_tail and self._at_tail:
+            self._scroll_y = max(0, tb.get_line_count() - h)
         start_row = self._scroll_y
-        for i in range(min(h, len(lines) - start_row)):
-            row = start_row + i
-            if row >= len(lines):
-                break
-            line = lines[row]
+        fg = self._default_fg
+        for i, line in enumerate(tb.get_lines(start_row, start_row + h)):
             if self._scroll_x > 0:
                 line = line[self._scroll_x : self._scroll_x + self.width]
             else:
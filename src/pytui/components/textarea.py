@@ -114,11 +114,11 @@ class Textarea(Renderable):
     def focus(self) -> None:
         super().focus()
         if hasattr(self.ctx, "renderer") and self.ctx.renderer:
-            self.ctx.renderer.keyboard.on("keypress", self._on_keypress)
+            self.ctx.renderer.keyboard.keymaps.bind(self, fallback=self._on_keypress)
 
     def blur(self) -> None:
         if hasattr(self.ctx, "renderer") and self.ctx.renderer:
-            self.ctx.renderer.keyboard.remove_listener("keypress", self._on_keypress)
+            self.ctx.renderer.keyboard.keymaps.unbind(self)
         super().blur()
 
     def _on_keypress(self, key: dict) -> None:
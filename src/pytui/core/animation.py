@@ -1,7 +1,7 @@
 # pytui.core.animation - fully aligned with OpenTUI animation/Timeline.ts:
 # TimelineOptions, AnimationOptions, JSAnimation, EasingFunctions, Timeline (add, once, call, sync,
 # play, pause, restart, resetItems, update), TimelineEngine (register, unregister, clear, update),
-# createTimeline.
+# createTimeline. Animation items are compiled into slot-based tracks and applied in one render batch.
 
 from __future__ import annotations
 
@@ -10,6 +10,8 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Literal
 
+from pytui.core.renderable import batch_render_requests
+
 # Align with OpenTUI EasingFunctions
 EasingFunctions = Literal[
     "linear", "inQuad", "outQuad", "inOutQuad", "inExpo", "outExpo", "inOutSine",
@@ -153,129 +155,149 @@ def _get_prop(target: Any, key: str) -> Any:
     return getattr(target, key, None)
 
 
-def _set_prop(target: Any, key: str, value: float) -> None:
-    if isinstance(target, dict):
-        target[key] = value
-    else:
-        setattr(target, key, value)
+class _AnimationTrack:
+    """Compiled animation item: easing, loop limit and property keys/end values resolved once in add().
+
+    starts holds one row per target aligned with keys (captured when the track starts), so a tick is
+    a straight interpolation loop with no dict lookups.
+    """
+
+    __slots__ = (
+        "start_time", "targets", "target_is_dict", "keys", "end_values", "starts", "duration",
+        "ease", "ease_fn", "loop", "max_loops", "loop_delay", "alternate", "on_update",
+        "on_complete", "on_start", "on_loop", "completed", "started", "current_loop", "once",
+    )
+
+    type = "animation"
+
+    def __init__(self, targets: list[Any], properties: dict[str, float], options: AnimationOptions, start_time: float) -> None:
+        self.start_time = start_time
+        self.targets = targets
+        self.target_is_dict = [isinstance(t, dict) for t in targets]
+        self.keys = list(properties)
+        self.end_values = list(properties.values())
+        self.starts: list[list[float]] = []
+        self.duration = float(options.get("duration", 1000))
+        self.ease = options.get("ease", "linear")
+        self.ease_fn = EASING_FUNCTIONS.get(self.ease, _ease_linear)
+        self.loop = options.get("loop")
+        if self.loop:
+            self.max_loops = float(self.loop) if isinstance(self.loop, (int, float)) else float("inf")
+        else:
+            self.max_loops = 1.0
+        self.loop_delay = float(options.get("loop_delay", options.get("loopDelay", 0)))
+        self.alternate = bool(options.get("alternate", False))
+        self.on_update = options.get("on_update", options.get("onUpdate"))
+        self.on_complete = options.get("on_complete", options.get("onComplete"))
+        self.on_start = options.get("on_start", options.get("onStart"))
+        self.on_loop = options.get("on_loop", options.get("onLoop"))
+        self.once = options.get("once", False)
+        self.reset()
+
+    def reset(self) -> None:
+        self.completed = False
+        self.started = False
+        self.current_loop = 0
+
+    @property
+    def done(self) -> bool:
+        return self.completed
+
+    def capture_initial_values(self) -> None:
+        if not self.keys or self.starts:
+            return
+        for target in self.targets:
+            row = []
+            for key, end_value in zip(self.keys, self.end_values):
+                val = _get_prop(target, key)
+                row.append(float(val) if isinstance(val, (int, float)) else end_value)
+            self.starts.append(row)
+
+    def apply(self, progress: float, reversed: bool, timeline_time: float, delta_time: float = 0.0) -> None:
+        if not self.keys or not self.starts:
+            return
+        eased = self.ease_fn(max(0.0, min(1.0, progress)))
+        p = 1 - eased if reversed else eased
+        keys, ends = self.keys, self.end_values
+        for target, starts, is_dict in zip(self.targets, self.starts, self.target_is_dict):
+            if is_dict:
+                for key, s, e in zip(keys, starts, ends):
+                    target[key] = s + (e - s) * p
+            else:
+                for key, s, e in zip(keys, starts, ends):
+                    setattr(target, key, s + (e - s) * p)
+        if self.on_update:
+            self.on_update(
+                JSAnimation(targets=self.targets, delta_time=delta_time, progress=eased, current_time=timeline_time)
+            )
+
+    def _finish(self, reversed: bool, timeline_time: float, delta_time: float) -> None:
+        self.apply(1.0, reversed, timeline_time, delta_time)
+        if self.on_complete:
+            self.on_complete()
+        self.completed = True
+
+    def evaluate(self, timeline_time: float, delta_time: float = 0.0) -> None:
+        if timeline_time < self.start_time:
+            return
+        animation_time = timeline_time - self.start_time
+        duration = self.duration
+        if not self.started:
+            self.capture_initial_values()
+            if self.on_start:
+                self.on_start()
+            self.started = True
+        if duration == 0:
+            if not self.completed:
+                self._finish(False, timeline_time, delta_time)
+            return
+        max_loops = self.max_loops
+        cycle_time = duration + self.loop_delay
+        current_cycle = int(animation_time // cycle_time)
+        time_in_cycle = animation_time % cycle_time
+        if self.on_loop and current_cycle > self.current_loop and current_cycle < max_loops:
+            self.on_loop()
+        self.current_loop = current_cycle
+        if self.on_complete and not self.completed and current_cycle == max_loops - 1 and time_in_cycle >= duration:
+            self._finish(self.alternate and current_cycle % 2 == 1, timeline_time, delta_time)
+            return
+        if current_cycle >= max_loops:
+            if not self.completed:
+                self._finish(self.alternate and (max_loops - 1) % 2 == 1, timeline_time, delta_time)
+            return
+        if time_in_cycle == 0 and animation_time > 0:
+            current_cycle -= 1
+            time_in_cycle = cycle_time
+        is_reversed = self.alternate and current_cycle % 2 == 1
+        if time_in_cycle >= duration:
+            self.apply(1.0, is_reversed, timeline_time, delta_time)
+            return
+        self.apply(time_in_cycle / duration, is_reversed, timeline_time, delta_time)
 
 
-def _capture_initial_values(item: dict) -> None:
-    if not item.get("properties"):
-        return
-    if item.get("initial_values"):
-        return
-    initial_values: list[dict[str, float]] = []
-    target_list = item["target"]
-    props = item["properties"]
-    for i in range(len(target_list)):
-        target = target_list[i]
-        target_initial: dict[str, float] = {}
-        for key in props:
-            val = _get_prop(target, key)
-            if isinstance(val, (int, float)):
-                target_initial[key] = float(val)
-        initial_values.append(target_initial)
-    item["initial_values"] = initial_values
-
-
-def _apply_animation_at_progress(
-    item: dict,
-    progress: float,
-    reversed: bool,
-    timeline_time: float,
-    delta_time: float = 0.0,
-) -> None:
-    props = item.get("properties")
-    initial_values = item.get("initial_values")
-    if not props or not initial_values:
-        return
-    ease_name = item.get("ease", "linear")
-    easing_fn = EASING_FUNCTIONS.get(ease_name, _ease_linear)
-    eased = easing_fn(max(0.0, min(1.0, progress)))
-    final_progress = 1 - eased if reversed else eased
-    target_list = item["target"]
-    for i in range(len(target_list)):
-        target = target_list[i]
-        initial = initial_values[i] if i < len(initial_values) else {}
-        for key, end_value in props.items():
-            start_value = initial.get(key, end_value)
-            new_value = start_value + (end_value - start_value) * final_progress
-            _set_prop(target, key, new_value)
-    on_update = item.get("on_update")
-    if on_update:
-        anim = JSAnimation(
-            targets=target_list,
-            delta_time=delta_time,
-            progress=eased,
-            current_time=timeline_time,
-        )
-        on_update(anim)
-
-
-def _evaluate_animation(item: dict, timeline_time: float, delta_time: float = 0.0) -> None:
-    if timeline_time < item["start_time"]:
-        return
-    animation_time = timeline_time - item["start_time"]
-    duration = item.get("duration", 0) or 0
-    if timeline_time >= item["start_time"] and not item.get("started"):
-        _capture_initial_values(item)
-        on_start = item.get("on_start")
-        if on_start:
-            on_start()
-        item["started"] = True
-    if duration == 0:
-        if not item.get("completed"):
-            _apply_animation_at_progress(item, 1.0, False, timeline_time, delta_time)
-            on_complete = item.get("on_complete")
-            if on_complete:
-                on_complete()
-            item["completed"] = True
-        return
-    max_loops: float = 1
-    if item.get("loop"):
-        loop_val = item["loop"]
-        max_loops = float(loop_val) if isinstance(loop_val, (int, float)) else float("inf")
-    loop_delay = item.get("loop_delay", 0) or 0
-    cycle_time = duration + loop_delay
-    current_cycle = int(animation_time // cycle_time)
-    time_in_cycle = animation_time % cycle_time
-    on_loop = item.get("on_loop")
-    prev_loop = item.get("current_loop", 0)
-    if on_loop and prev_loop is not None and current_cycle > prev_loop and current_cycle < max_loops:
-        on_loop()
-    item["current_loop"] = current_cycle
-    if item.get("on_complete") and not item.get("completed") and current_cycle == max_loops - 1 and time_in_cycle >= duration:
-        final_reversed = (item.get("alternate") or False) and current_cycle % 2 == 1
-        _apply_animation_at_progress(item, 1.0, final_reversed, timeline_time, delta_time)
-        item["on_complete"]()
-        item["completed"] = True
-        return
-    if current_cycle >= max_loops:
-        if not item.get("completed"):
-            final_reversed = (item.get("alternate") or False) and (max_loops - 1) % 2 == 1
-            _apply_animation_at_progress(item, 1.0, final_reversed, timeline_time, delta_time)
-            on_complete = item.get("on_complete")
-            if on_complete:
-                on_complete()
-            item["completed"] = True
-        return
-    if time_in_cycle == 0 and animation_time > 0 and current_cycle < max_loops:
-        current_cycle -= 1
-        time_in_cycle = cycle_time
-    if time_in_cycle >= duration:
-        is_reversed = (item.get("alternate") or False) and current_cycle % 2 == 1
-        _apply_animation_at_progress(item, 1.0, is_reversed, timeline_time, delta_time)
-        return
-    progress = time_in_cycle / duration
-    is_reversed = (item.get("alternate") or False) and current_cycle % 2 == 1
-    _apply_animation_at_progress(item, progress, is_reversed, timeline_time, delta_time)
+class _CallbackItem:
+    """Callback fired once when the timeline reaches start_time."""
+
+    __slots__ = ("start_time", "callback", "executed")
+
+    type = "callback"
+
+    def __init__(self, callback: Callable[[], None], start_time: float) -> None:
+        self.start_time = start_time
+        self.callback = callback
+        self.executed = False
+
+    def reset(self) -> None:
+        self.executed = False
 
+    @property
+    def done(self) -> bool:
+        return self.executed
 
-def _evaluate_callback(item: dict, timeline_time: float) -> None:
-    if not item.get("executed") and timeline_time >= item["start_time"] and item.get("callback"):
-        item["callback"]()
-        item["executed"] = True
+    def evaluate(self, timeline_time: float, delta_time: float = 0.0) -> None:
+        if not self.executed and timeline_time >= self.start_time and self.callback:
+            self.callback()
+            self.executed = True
 
 
 def _evaluate_timeline_sync(item: dict, timeline_time: float, delta_time: float = 0.0) -> None:
@@ -293,16 +315,14 @@ def _evaluate_timeline_sync(item: dict, timeline_time: float, delta_time: float
     sub.update(delta_time)
 
 
-def _evaluate_item(item: dict, timeline_time: float, delta_time: float = 0.0) -> None:
-    if item.get("type") == "animation":
-        _evaluate_animation(item, timeline_time, delta_time)
-    elif item.get("type") == "callback":
-        _evaluate_callback(item, timeline_time)
-
-
 class Timeline:
     """Fully aligned with OpenTUI Timeline: items, sub_timelines, add, once, call, sync,
-    play, pause, restart, reset_items, update, state change listeners."""
+    play, pause, restart, reset_items, update, state change listeners.
+
+    Items are compiled tracks (_AnimationTrack / _CallbackItem). update() only visits items that
+    have not finished yet and applies all of them inside one batch_render_requests(), so animating
+    many renderables costs one render request per frame.
+    """
 
     RESERVED_KEYS = frozenset({
         "duration", "ease", "onUpdate", "onComplete", "onStart", "onLoop",
@@ -330,7 +350,8 @@ class Timeline:
         self.is_complete: bool = False
         self.synced: bool = False
         self._state_listeners: list[Callable[[Timeline], None]] = []
-        self.items: list[dict] = []
+        self.items: list[_AnimationTrack | _CallbackItem] = []
+        self._pending: list[_AnimationTrack | _CallbackItem] = []  # items not finished, in add order
         self.sub_timelines: list[dict] = []
         if self.autoplay:
             self.play()
@@ -346,6 +367,10 @@ class Timeline:
         for cb in self._state_listeners:
             cb(self)
 
+    def _append(self, item: _AnimationTrack | _CallbackItem) -> None:
+        self.items.append(item)
+        self._pending.append(item)
+
     def add(
         self,
         target: Any,
@@ -358,27 +383,7 @@ class Timeline:
             if key not in self.RESERVED_KEYS and isinstance(value, (int, float)):
                 animation_props[key] = float(value)
         targets = target if isinstance(target, list) else [target]
-        item: dict = {
-            "type": "animation",
-            "start_time": resolved_start,
-            "target": targets,
-            "properties": animation_props,
-            "initial_values": [],
-            "duration": float(properties.get("duration", 1000)),
-            "ease": properties.get("ease", "linear"),
-            "loop": properties.get("loop"),
-            "loop_delay": float(properties.get("loop_delay", properties.get("loopDelay", 0))),
-            "alternate": properties.get("alternate", False),
-            "on_update": properties.get("on_update", properties.get("onUpdate")),
-            "on_complete": properties.get("on_complete", properties.get("onComplete")),
-            "on_start": properties.get("on_start", properties.get("onStart")),
-            "on_loop": properties.get("on_loop", properties.get("onLoop")),
-            "completed": False,
-            "started": False,
-            "current_loop": 0,
-            "once": properties.get("once", False),
-        }
-        self.items.append(item)
+        self._append(_AnimationTrack(targets, animation_props, properties, resolved_start))
         return self
 
     def once(self, target: Any, properties: AnimationOptions) -> Timeline:
@@ -387,12 +392,7 @@ class Timeline:
 
     def call(self, callback: Callable[[], None], start_time: float | int | str = 0) -> Timeline:
         resolved_start = 0.0 if isinstance(start_time, str) else float(start_time)
-        self.items.append({
-            "type": "callback",
-            "start_time": resolved_start,
-            "callback": callback,
-            "executed": False,
-        })
+        self._append(_CallbackItem(callback, resolved_start))
         return self
 
     def sync(self, timeline: Timeline, start_time: float = 0) -> Timeline:
@@ -404,6 +404,7 @@ class Timeline:
             "timeline": timeline,
         })
         timeline.synced = True
+        self._notify_state_change()  # an engine now has sub-timelines to drive even while paused
         return self
 
     def play(self) -> Timeline:
@@ -429,12 +430,8 @@ class Timeline:
 
     def reset_items(self) -> None:
         for item in self.items:
-            if item.get("type") == "callback":
-                item["executed"] = False
-            elif item.get("type") == "animation":
-                item["completed"] = False
-                item["started"] = False
-                item["current_loop"] = 0
+            item.reset()
+        self._pending = list(self.items)
         for sub_item in self.sub_timelines:
             sub_item["timeline_started"] = False
             sub = sub_item.get("timeline")
@@ -451,25 +448,29 @@ class Timeline:
         return self
 
     def update(self, delta_time: float) -> None:
+        with batch_render_requests():
+            self._update(delta_time)
+
+    def _update(self, delta_time: float) -> None:
         for sub_item in self.sub_timelines:
             _evaluate_timeline_sync(sub_item, self.current_time + delta_time, delta_time)
         if not self.is_playing:
             return
         self.current_time += delta_time
-        for item in self.items:
-            _evaluate_item(item, self.current_time, delta_time)
-        i = len(self.items) - 1
-        while i >= 0:
-            item = self.items[i]
-            if item.get("type") == "animation" and item.get("once") and item.get("completed"):
-                self.items.pop(i)
-            i -= 1
+        finished = False
+        for item in self._pending:
+            item.evaluate(self.current_time, delta_time)
+            finished = finished or item.done
+        if finished:
+            self._pending = [item for item in self._pending if not item.done]
+            if any(getattr(item, "once", False) and item.done for item in self.items):
+                self.items = [item for item in self.items if not (getattr(item, "once", False) and item.done)]
         if self.loop and self.current_time >= self.duration:
             overshoot = self.current_time % self.duration
             self.reset_items()
             self.current_time = 0.0
             if overshoot > 0:
-                self.update(overshoot)
+                self._update(overshoot)
         elif not self.loop and self.current_time >= self.duration:
             self.current_time = self.duration
             self.is_playing = False
@@ -480,34 +481,53 @@ class Timeline:
 
 
 class TimelineEngine:
-    """Align with OpenTUI TimelineEngine: register, unregister, clear, update."""
+    """Align with OpenTUI TimelineEngine: register, unregister, clear, update.
+
+    Tracks the registered timelines that can advance (playing, or driving synced sub-timelines) via
+    their state change notifications, so update() is O(active timelines) and runs inside a single
+    render-request batch.
+    """
 
     def __init__(self) -> None:
         self._timelines: set[Timeline] = set()
+        self._active: dict[Timeline, None] = {}
         self.defaults = {"frame_rate": 60}
 
     def register(self, timeline: Timeline) -> None:
         if timeline not in self._timelines:
             self._timelines.add(timeline)
             timeline.add_state_change_listener(self._on_timeline_state_change)
+            self._on_timeline_state_change(timeline)
 
     def unregister(self, timeline: Timeline) -> None:
         if timeline in self._timelines:
             self._timelines.discard(timeline)
+            self._active.pop(timeline, None)
             timeline.remove_state_change_listener(self._on_timeline_state_change)
 
-    def _on_timeline_state_change(self, _timeline: Timeline) -> None:
-        pass
+    def _on_timeline_state_change(self, timeline: Timeline) -> None:
+        if timeline.is_playing or timeline.sub_timelines:
+            self._active[timeline] = None
+        else:
+            self._active.pop(timeline, None)
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
 
     def clear(self) -> None:
         for t in list(self._timelines):
             t.remove_state_change_listener(self._on_timeline_state_change)
         self._timelines.clear()
+        self._active.clear()
 
     def update(self, delta_time: float) -> None:
-        for t in self._timelines:
-            if not t.synced:
-                t.update(delta_time)
+        if not self._active:
+            return
+        with batch_render_requests():
+            for t in list(self._active):
+                if not t.synced:
+                    t._update(delta_time)
 
 
 engine = TimelineEngine()
@@ -10,6 +10,8 @@ from typing import Any
 
 import numpy as np
 
+from pytui.core.memory import track_buffer
+
 try:
     from pytui_native import Buffer as NativeBuffer
     from pytui_native import Cell as NativeCell
@@ -104,6 +106,7 @@ class OptimizedBuffer:
                 self.clear()
         self._destroyed = False
         self._opacity_stack: list[float] = []  # Align OpenTUI opacity_stack; product = current opacity
+        track_buffer(self)
 
     def get_current_opacity(self) -> float:
         """Effective opacity (product of stack). Aligns OpenTUI getCurrentOpacity()."""
@@ -3,6 +3,8 @@
 
 import os
 import sys
+import threading
+from bisect import bisect_left
 from typing import Any, Literal, TypedDict
 
 from pytui.core.buffer import Cell, OptimizedBuffer
@@ -70,36 +72,178 @@ class ConsoleOptions(TypedDict, total=False):
     selectionColor: str
     copy_button_color: str
     copyButtonColor: str
+    levels: list[str]
+
+
+class _LevelIndex:
+    """Sequence numbers of the retained lines whose level is in levels (oldest first).
+
+    seqs[head:] are the live entries: eviction only advances head (O(1) offset access, unlike a deque)
+    and the dead prefix is dropped once it is at least half of the list.
+    """
+
+    __slots__ = ("levels", "seqs", "head", "scanned")
+
+    def __init__(self, levels: frozenset[str], start: int) -> None:
+        self.levels = levels
+        self.seqs: list[int] = []
+        self.head = 0
+        self.scanned = start
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.head
+
+    def evict_before(self, start: int) -> None:
+        seqs = self.seqs
+        if self.head < len(seqs) and seqs[self.head] < start:
+            self.head = bisect_left(seqs, start, self.head)
+            if self.head * 2 >= len(seqs):
+                del seqs[: self.head]
+                self.head = 0
 
 
 class ConsoleBuffer:
-    """Output buffer for ConsoleOverlay; capture_stdout/capture_stderr write here. Lines are (text, level)."""
+    """Output buffer for ConsoleOverlay; capture_stdout/capture_stderr write here. Lines are (text, level).
+
+    Fixed-capacity ring: appending evicts the oldest line in O(1) and lines are addressed by a
+    monotonically increasing sequence number, so get_lines(start, count) is O(count). All methods are
+    guarded by a lock, so capture_stdout may write from any thread while the overlay reads on the render
+    thread. write() is stream-oriented: text without a trailing newline stays an open last line that the
+    next write of the same level continues.
+    """
 
     def __init__(self, max_lines: int = 500, max_stored_logs: int | None = None) -> None:
-        self._lines: list[tuple[str, ConsoleLevel]] = []
-        self.max_lines = max_stored_logs if max_stored_logs is not None else max_lines
+        self._lock = threading.Lock()
+        self._max_lines = max(1, max_stored_logs if max_stored_logs is not None else max_lines)
+        self._ring: list[tuple[str, ConsoleLevel] | None] = [None] * self._max_lines
+        self._start = 0  # seq of the oldest retained line
+        self._end = 0  # seq one past the newest line
+        self._tail_open = False  # last line was written without a trailing newline
+        self._indexes: dict[frozenset[str], _LevelIndex] = {}
         self._collect_caller_info = False
 
+    @property
+    def max_lines(self) -> int:
+        return self._max_lines
+
+    @max_lines.setter
+    def max_lines(self, value: int) -> None:
+        with self._lock:
+            kept = self._snapshot(self._start, self._end)[-max(1, value) :]
+            self._max_lines = max(1, value)
+            self._ring = [None] * self._max_lines
+            self._start = self._end - len(kept)
+            for i, line in enumerate(kept):
+                self._ring[(self._start + i) % self._max_lines] = line
+            self._indexes.clear()
+
     @property
     def lines(self) -> list[tuple[str, ConsoleLevel]]:
-        return self._lines
+        """Snapshot of all retained lines, oldest first."""
+        with self._lock:
+            return self._snapshot(self._start, self._end)
+
+    def __len__(self) -> int:
+        return self._end - self._start
 
     def set_collect_caller_info(self, enabled: bool) -> None:
         """Align with OpenTUI TerminalConsoleCache.setCollectCallerInfo."""
         self._collect_caller_info = enabled
 
+    def _snapshot(self, lo: int, hi: int) -> list[tuple[str, ConsoleLevel]]:
+        ring, cap = self._ring, self._max_lines
+        return [ring[seq % cap] for seq in range(lo, hi)]  # type: ignore[misc]
+
+    def _push(self, text: str, level: ConsoleLevel) -> None:
+        if self._end - self._start == self._max_lines:
+            self._start += 1
+        self._ring[self._end % self._max_lines] = (text, level)
+        self._end += 1
+
     def append(self, text: str, level: ConsoleLevel = "log") -> None:
-        for line in text.splitlines():
-            self._lines.append((line, level))
-            if len(self._lines) > self.max_lines:
-                self._lines.pop(0)
+        """Append each line of text as a complete line (closes an open line left by write)."""
+        parts = text.splitlines()
+        with self._lock:
+            self._tail_open = False
+            for line in parts:
+                self._push(line, level)
+
+    def write(self, data: str, level: ConsoleLevel = "log") -> None:
+        """Stream write: continues the open last line (same level), newlines end lines."""
+        if not data:
+            return
+        parts = data.replace("\r\n", "\n").split("\n")
+        with self._lock:
+            first = parts[0]
+            if self._tail_open and self._end > self._start:
+                slot = (self._end - 1) % self._max_lines
+                prev_text, prev_level = self._ring[slot]  # type: ignore[misc]
+                if prev_level == level:
+                    self._ring[slot] = (prev_text + first, level)
+                else:
+                    self._push(first, level)
+            elif first or len(parts) > 1:
+                self._push(first, level)
+            for line in parts[1:-1]:
+                self._push(line, level)
+            if len(parts) > 1 and parts[-1]:
+                self._push(parts[-1], level)
+            self._tail_open = bool(parts[-1])
+
+    def _index(self, levels: frozenset[str]) -> _LevelIndex:
+        idx = self._indexes.get(levels)
+        if idx is None:
+            idx = self._indexes[levels] = _LevelIndex(levels, self._start)
+        idx.evict_before(self._start)
+        seqs, ring, cap = idx.seqs, self._ring, self._max_lines
+        for seq in range(max(idx.scanned, self._start), self._end):
+            if ring[seq % cap][1] in levels:  # type: ignore[index]
+                seqs.append(seq)
+        idx.scanned = self._end
+        return idx
+
+    def line_count(self, levels: Any = None) -> int:
+        """Number of retained lines, or of those whose level is in levels."""
+        if not levels:
+            return len(self)
+        with self._lock:
+            return len(self._index(frozenset(levels)))
+
+    def get_lines(self, start: int, count: int, levels: Any = None) -> list[tuple[str, ConsoleLevel]]:
+        """Lines [start, start + count) of the (optionally level-filtered) view, oldest first."""
+        start = max(0, start)
+        with self._lock:
+            if not levels:
+                lo = self._start + start
+                return self._snapshot(lo, min(self._end, lo + max(0, count)))
+            idx = self._index(frozenset(levels))
+            lo = idx.head + start
+            ring, cap = self._ring, self._max_lines
+            return [ring[seq % cap] for seq in idx.seqs[lo : lo + max(0, count)]]  # type: ignore[misc]
+
+    def seq_range(self) -> tuple[int, int]:
+        """(oldest, one past newest) sequence number of the retained lines."""
+        with self._lock:
+            return self._start, self._end
+
+    def get_lines_by_seq(self, lo: int, hi: int) -> list[tuple[str, ConsoleLevel] | None]:
+        """Lines with sequence numbers in [lo, hi), cut at the newest; evicted ones are None (keeps positions)."""
+        lo = max(0, lo)
+        with self._lock:
+            hi = min(hi, self._end)
+            evicted = max(0, min(hi, self._start) - lo)
+            return [None] * evicted + self._snapshot(lo + evicted, hi)
 
     def clear(self) -> None:
-        self._lines.clear()
+        with self._lock:
+            self._ring = [None] * self._max_lines
+            self._start = self._end
+            self._tail_open = False
+            self._indexes.clear()
 
     def get_cached_logs(self) -> str:
         """Return all buffered lines as a single string (align with OpenTUI getCachedLogs)."""
-        return "\n".join(line for line, _ in self._lines)
+        return "\n".join(line for line, _ in self.lines)
 
 
 class ConsoleOverlay(Renderable):
@@ -112,6 +256,8 @@ class ConsoleOverlay(Renderable):
             max_stored_logs=options.get("max_stored_logs", options.get("maxStoredLogs")) or 500
         )
         self.scroll_y = 0
+        levels = options.get("levels")
+        self.levels: frozenset[str] | None = frozenset(levels) if levels else None
         self.position = options.get("position", "bottom")  # ConsolePosition
         self._visible = True
         self._debug_mode_enabled = bool(
@@ -194,8 +340,16 @@ class ConsoleOverlay(Renderable):
         elif name == "down":
             self.scroll_down()
 
+    def set_levels(self, levels: Any) -> None:
+        """Show only lines whose level is in levels (None/empty shows all)."""
+        self.levels = frozenset(levels) if levels else None
+        self.set_scroll(self.scroll_y)
+
+    def scroll_to_bottom(self) -> None:
+        self.set_scroll(self.buffer.line_count(self.levels))
+
     def set_scroll(self, y: int) -> None:
-        max_scroll = max(0, len(self.buffer.lines) - self.height)
+        max_scroll = max(0, self.buffer.line_count(self.levels) - self.height)
         self.scroll_y = max(0, min(y, max_scroll))
         self.request_render()
 
@@ -219,12 +373,10 @@ class ConsoleOverlay(Renderable):
     def render_self(self, buffer: OptimizedBuffer) -> None:
         if not self._visible:
             return
-        lines = self.buffer.lines
-        start = self.scroll_y
+        lines = self.buffer.get_lines(self.scroll_y, self.height, self.levels)
         for dy in range(self.height):
-            line_idx = start + dy
-            if line_idx < len(lines):
-                text, level = lines[line_idx]
+            if dy < len(lines):
+                text, level = lines[dy]
                 line = (text[: self.width]).ljust(self.width)
                 fg = self._fg_for_level(level)
             else:
@@ -256,7 +408,7 @@ def capture_stdout(
 
         def write(self, data: str) -> int:
             if data:
-                self.buffer.append(data, level=self.level)
+                self.buffer.write(data, level=self.level)
             if self.also:
                 self.original.write(data)
             return len(data)
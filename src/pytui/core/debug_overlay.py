@@ -0,0 +1,114 @@
+# pytui.core.debug_overlay - Aligns with OpenTUI renderer debug overlay (toggleDebugOverlay / DebugOverlayCorner)
+# Live stats panel drawn by Renderer into the back buffer after post-processing: fps, frame-time sparkline,
+# per-phase timings from FrameProfiler, renderable / dirty-node counts, bytes per frame and memory.
+# It is drawn outside the profiled phases and reports the previous frame, so it does not skew its numbers;
+# the node count is cached and only re-walked when the tree changed or every RECOUNT_FRAMES frames.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pytui.core import renderable as renderable_module
+from pytui.core.buffer import Cell, OptimizedBuffer
+from pytui.core.types import DebugOverlayCorner
+
+if TYPE_CHECKING:
+    from pytui.core.renderable import Renderable
+    from pytui.core.renderer import Renderer
+
+_SPARK = "▁▂▃▄▅▆▇█"
+_PHASE_LABELS = (
+    ("input", "in"),
+    ("callbacks", "cb"),
+    ("layout", "lay"),
+    ("render", "ren"),
+    ("post", "post"),
+    ("diff", "diff"),
+    ("write", "wr"),
+)
+WIDTH = 36
+SPARK_SAMPLES = WIDTH - 2
+RECOUNT_FRAMES = 30  # dirty flags change without tree edits, so refresh the counts at least this often
+
+
+def sparkline(values: list[float], width: int) -> str:
+    """Last width values as block characters scaled to the max value."""
+    values = values[-width:]
+    if not values:
+        return ""
+    top = max(values) or 1.0
+    return "".join(_SPARK[min(len(_SPARK) - 1, int(v / top * (len(_SPARK) - 1) + 0.5))] for v in values)
+
+
+def _format_bytes(n: float) -> str:
+    if n >= 1024 * 1024:
+        return f"{n / 1024 / 1024:.1f}MB"
+    if n >= 1024:
+        return f"{n / 1024:.1f}KB"
+    return f"{n:.0f}B"
+
+
+class DebugOverlay:
+    """Stats panel for Renderer.debug_overlay; count_nodes() runs before a frame, draw() after post-processing."""
+
+    def __init__(
+        self,
+        fg: tuple[int, int, int, int] = (230, 230, 230, 255),
+        bg: tuple[int, int, int, int] = (20, 20, 60, 230),
+    ) -> None:
+        self.fg = fg
+        self.bg = bg
+        self.renderable_count = 0
+        self.dirty_count = 0
+        self._counted: tuple[int, int] | None = None  # (id(root), tree version) of the cached counts
+        self._frames_since_count = 0
+
+    def count_nodes(self, root: Renderable) -> None:
+        """Refresh renderable / dirty counts; walks the tree only when it changed or every RECOUNT_FRAMES."""
+        key = (id(root), renderable_module._tree_version)
+        self._frames_since_count += 1
+        if key == self._counted and self._frames_since_count < RECOUNT_FRAMES:
+            return
+        self._counted, self._frames_since_count = key, 0
+        total = dirty = 0
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            total += 1
+            if getattr(node, "_dirty", False):
+                dirty += 1
+            stack.extend(node.children)
+        self.renderable_count, self.dirty_count = total, dirty
+
+    def lines(self, renderer: Renderer) -> list[str]:
+        frames = renderer.profiler.frames
+        times = [f["total_ms"] for f in frames]
+        fps = renderer.stats.get("fps", 0)
+        if not fps and len(frames) >= 2:
+            span = frames[-1]["start_ms"] - frames[0]["start_ms"]
+            fps = round((len(frames) - 1) * 1000.0 / span) if span > 0 else 0
+        last = frames[-1] if frames else None
+        out = [f"FPS {fps:<4} frame {last['total_ms'] if last else 0.0:6.2f}ms", sparkline(times, SPARK_SAMPLES)]
+        phases = last["phases"] if last else {}
+        cells = [f"{short} {phases.get(name, 0.0):.2f}" for name, short in _PHASE_LABELS]
+        out.append(" ".join(cells[:4]))
+        out.append(" ".join(cells[4:]))
+        out.append(f"nodes {self.renderable_count}  dirty {self.dirty_count}")
+        snapshot: Any = getattr(renderer, "_last_memory_snapshot", None)
+        mem = _format_bytes(snapshot.get("rss", snapshot.get("heapUsed", 0))) if snapshot else "n/a"
+        out.append(f"out {_format_bytes(last['bytes'] if last else 0)}/frame  mem {mem}")
+        return out
+
+    def draw(self, buffer: OptimizedBuffer, renderer: Renderer) -> None:
+        lines = self.lines(renderer)
+        width = min(WIDTH, buffer.width)
+        height = min(len(lines), buffer.height)
+        corner = renderer.debug_overlay.get("corner", DebugOverlayCorner.bottom_right)
+        right = corner in (DebugOverlayCorner.top_right, DebugOverlayCorner.bottom_right)
+        bottom = corner in (DebugOverlayCorner.bottom_left, DebugOverlayCorner.bottom_right)
+        x0 = buffer.width - width if right else 0
+        y0 = buffer.height - height if bottom else 0
+        for dy in range(height):
+            text = (" " + lines[dy])[:width].ljust(width)
+            for dx, ch in enumerate(text):
+                buffer.set_cell(x0 + dx, y0 + dy, Cell(char=ch, fg=self.fg, bg=self.bg))
@@ -1,12 +1,17 @@
 # pytui.core.edit_buffer - Aligns with OpenTUI packages/core/src/edit-buffer.ts
 # EditBuffer.create(widthMethod), setText, getText, replaceText, getCursorPosition, setCursor, setCursorToLineCol,
 # gotoLine, moveCursorLeft/Right/Up/Down, insertChar, insertText, deleteChar, deleteCharBackward, undo, redo, destroy.
+# PyTUI: on_edit(listener) reports every text change as (start, removed, inserted) so incremental consumers
+# (lib.search.SearchIndex) can update only what changed.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any, TypedDict
 
 HighlightDict = dict[str, Any]
+# listener(start, removed, inserted): text[start:start + len(removed)] was replaced by inserted.
+EditListener = Callable[[int, str, str], None]
 
 
 class LogicalCursor(TypedDict):
@@ -26,6 +31,7 @@ class EditBuffer:
         self._redo_stack: list[tuple[str, Any, ...]] = []
         self._line_highlights: dict[int, list[HighlightDict]] = {}
         self._hl_ref_counter = 0
+        self._edit_listeners: list[EditListener] = []
         self._destroyed = False
 
     @classmethod
@@ -41,6 +47,18 @@ class EditBuffer:
     def text(self) -> str:
         return self._text
 
+    def on_edit(self, listener: EditListener) -> None:
+        """Call listener(start, removed, inserted) after every text change (insert, delete, undo, redo, set/replace)."""
+        self._edit_listeners.append(listener)
+
+    def off_edit(self, listener: EditListener) -> None:
+        if listener in self._edit_listeners:
+            self._edit_listeners.remove(listener)
+
+    def _notify_edit(self, start: int, removed: str, inserted: str) -> None:
+        for listener in list(self._edit_listeners):
+            listener(start, removed, inserted)
+
     def get_text(self) -> str:
         """Align OpenTUI getText()."""
         self._guard()
@@ -49,12 +67,14 @@ class EditBuffer:
     def set_text(self, text: str) -> None:
         """Set text and completely reset buffer state (clears history). Aligns OpenTUI setText()."""
         self._guard()
+        old = self._text
         self._text = text
         self._cursor_row = 0
         self._cursor_col = 0
         self._undo_stack.clear()
         self._redo_stack.clear()
         self._line_highlights.clear()
+        self._notify_edit(0, old, text)
 
     def replace_text(self, text: str) -> None:
         """Replace text while preserving undo history (one undo point). Aligns OpenTUI replaceText()."""
@@ -66,6 +86,7 @@ class EditBuffer:
         self._undo_stack.append(("replace", old, text))
         self._redo_stack.clear()
         self._line_highlights.clear()
+        self._notify_edit(0, old, text)
 
     def get_lines(self) -> list[str]:
         self._guard()
@@ -160,6 +181,7 @@ class EditBuffer:
         self._undo_stack.append(("insert", pos, text))
         self._redo_stack.clear()
         self._text = self._text[:pos] + text + self._text[pos:]
+        self._notify_edit(pos, "", text)
 
     def delete_char(self) -> None:
         """Delete char at cursor (align OpenTUI deleteChar)."""
@@ -204,6 +226,7 @@ class EditBuffer:
         self._undo_stack.append(("delete", start, deleted))
         self._redo_stack.clear()
         self._text = self._text[:start] + self._text[end:]
+        self._notify_edit(start, deleted, "")
         # Keep cursor in bounds
         new_row, new_col = self.pos_to_line_col(min(start, len(self._text)))
         self._cursor_row, self._cursor_col = new_row, new_col
@@ -218,14 +241,17 @@ class EditBuffer:
             _, pos, text = op
             self._text = self._text[:pos] + self._text[pos + len(text) :]
             self._redo_stack.append(("insert", pos, text))
+            self._notify_edit(pos, text, "")
         elif op[0] == "delete":
             _, start, deleted = op
             self._text = self._text[:start] + deleted + self._text[start:]
             self._redo_stack.append(("delete", start, deleted))
+            self._notify_edit(start, "", deleted)
         elif op[0] == "replace":
             _, old_text, new_text = op
             self._text = old_text
             self._redo_stack.append(("replace", new_text, old_text))
+            self._notify_edit(0, new_text, old_text)
         return True
 
     def redo(self) -> bool:
@@ -237,14 +263,17 @@ class EditBuffer:
             _, pos, text = op
             self._text = self._text[:pos] + text + self._text[pos:]
             self._undo_stack.append(("insert", pos, text))
+            self._notify_edit(pos, "", text)
         elif op[0] == "delete":
             _, start, deleted = op
             self._text = self._text[:start] + self._text[start + len(deleted) :]
             self._undo_stack.append(("delete", start, deleted))
+            self._notify_edit(start, deleted, "")
         elif op[0] == "replace":
             _, new_text, old_text = op
             self._text = new_text
             self._undo_stack.append(("replace", old_text, new_text))
+            self._notify_edit(0, old_text, new_text)
         return True
 
     def pos_to_line_col(self, pos: int) -> tuple[int, int]:
@@ -331,3 +360,4 @@ class EditBuffer:
         self._undo_stack.clear()
         self._redo_stack.clear()
         self._line_highlights.clear()
+        self._edit_listeners.clear()
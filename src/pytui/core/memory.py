@@ -0,0 +1,127 @@
+# pytui.core.memory - Memory telemetry for Renderer memory:snapshot (align OpenTUI heapUsed / heapTotal /
+# arrayBuffers). Current RSS from /proc/self/statm (peak RSS via getrusage elsewhere), GC generation stats,
+# optional tracemalloc top allocators, and live OptimizedBuffer / Renderable counts. Buffers and renderables
+# register themselves in weak sets on construction, so counting them never keeps anything alive.
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import tracemalloc
+import weakref
+from typing import Any
+
+_live_buffers: weakref.WeakSet = weakref.WeakSet()
+_live_renderables: weakref.WeakSet = weakref.WeakSet()
+
+# Approximate per-cell cost: native cells are a Rust String plus two RGBA tuples and flags; the numpy fallback
+# holds one pointer per cell to a Cell dataclass instance (with its __dict__).
+NATIVE_CELL_BYTES = 40
+_PY_CELL_BYTES: int | None = None
+
+
+def track_buffer(buffer: Any) -> None:
+    _live_buffers.add(buffer)
+
+
+def track_renderable(renderable: Any) -> None:
+    _live_renderables.add(renderable)
+
+
+def _py_cell_bytes() -> int:
+    global _PY_CELL_BYTES
+    if _PY_CELL_BYTES is None:
+        from pytui.core.buffer import Cell
+
+        cell = Cell()
+        _PY_CELL_BYTES = 8 + sys.getsizeof(cell) + sys.getsizeof(cell.__dict__)
+    return _PY_CELL_BYTES
+
+
+def current_rss() -> int:
+    """Resident set size in bytes now (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            resident = int(f.read().split()[1])
+        return resident * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def peak_rss() -> int:
+    """Peak resident set size in bytes (never decreases)."""
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return 0
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes, Linux KB
+
+
+def buffer_stats() -> dict[str, int]:
+    """Live (not destroyed) OptimizedBuffers: count, how many are native, estimated cell storage bytes."""
+    count = native = size = 0
+    for buf in list(_live_buffers):
+        if getattr(buf, "_destroyed", False):
+            continue
+        count += 1
+        cells = buf.width * buf.height
+        if getattr(buf, "_native_buffer", None) is not None:
+            native += 1
+            size += cells * NATIVE_CELL_BYTES
+        else:
+            size += cells * _py_cell_bytes()
+    return {"count": count, "native": native, "bytes": size}
+
+
+def gc_stats() -> dict[str, Any]:
+    """Pending allocations per generation, collections / collected / uncollectable per generation, gc.garbage size."""
+    stats = gc.get_stats()
+    return {
+        "counts": list(gc.get_count()),
+        "collections": [g["collections"] for g in stats],
+        "collected": [g["collected"] for g in stats],
+        "uncollectable": [g["uncollectable"] for g in stats],
+        "garbage": len(gc.garbage),
+    }
+
+
+def top_allocators(limit: int = 10) -> list[tuple[str, int, int]]:
+    """[(file:line, bytes, blocks)] of the largest tracemalloc sites; [] unless tracemalloc is tracing."""
+    if limit <= 0 or not tracemalloc.is_tracing():
+        return []
+    stats = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+    out = []
+    for stat in stats:
+        frame = stat.traceback[0]
+        out.append((f"{frame.filename}:{frame.lineno}", stat.size, stat.count))
+    return out
+
+
+def memory_snapshot(top_n: int = 0) -> dict[str, Any]:
+    """memory:snapshot payload.
+
+    heapUsed is the current RSS, heapTotal the peak RSS and arrayBuffers the estimated bytes held by live
+    OptimizedBuffers (keys kept for OpenTUI compatibility). pythonHeap is tracemalloc's traced size when
+    tracing, otherwise the number of allocated interpreter blocks (sys.getallocatedblocks).
+    """
+    buffers = buffer_stats()
+    rss = current_rss()
+    if tracemalloc.is_tracing():
+        traced, traced_peak = tracemalloc.get_traced_memory()
+        python_heap = {"traced": traced, "tracedPeak": traced_peak, "blocks": sys.getallocatedblocks()}
+    else:
+        python_heap = {"blocks": sys.getallocatedblocks()}
+    return {
+        "heapUsed": rss,
+        "heapTotal": peak_rss(),
+        "arrayBuffers": buffers["bytes"],
+        "rss": rss,
+        "pythonHeap": python_heap,
+        "gc": gc_stats(),
+        "buffers": buffers,
+        "renderables": len(_live_renderables),
+        "topAllocators": top_allocators(top_n),
+    }
@@ -1,7 +1,11 @@
 # pytui.core.mouse - MouseHandler uses lib.parse_mouse.MouseParser
+# feed() scans its input once with a compiled pattern (no per-offset copies) and, with coalesce=True,
+# collapses runs of move/drag reports to the latest position; down/up/scroll keep their order.
 
 from __future__ import annotations
 
+import re
+
 from pyee import EventEmitter
 
 from pytui.lib.parse_mouse import (
@@ -11,43 +15,82 @@ from pytui.lib.parse_mouse import (
     ScrollInfo,
 )
 
+# SGR 1006 report or X10 report (ESC [ M + 3 raw bytes).
+_MOUSE_REPORT = re.compile(rb"\x1b\[<(\d+);(\d+);(\d+)([Mm])|\x1b\[M([\x00-\xff]{3})")
+# Unfinished report at the end of the input; kept for the next feed. A bare ESC or ESC [ is passed through:
+# it is far more likely a key (Escape, CSI) than the first byte of a split report.
+_REPORT_PREFIX = re.compile(rb"\x1b\[(?:<\d*(?:;\d*(?:;\d*)?)?|M[\x00-\xff]{0,2})\Z")
+
+
+def _same_motion_run(last: RawMouseEvent, ev: RawMouseEvent) -> bool:
+    """ev continues last's motion run (same type, button and modifiers), so it may replace it."""
+    return (
+        bool(last.get("motion"))
+        and last["type"] == ev["type"]
+        and last["button"] == ev["button"]
+        and last["modifiers"] == ev["modifiers"]
+    )
+
 
 class MouseHandler(EventEmitter):
-    """Parse SGR 1006 and basic mouse; emit 'mouse' with RawMouseEvent. Uses lib.parse_mouse.MouseParser."""
+    """Parse SGR 1006 and basic mouse; emit 'mouse' with RawMouseEvent. Uses lib.parse_mouse.MouseParser.
+
+    With coalesce=True consecutive motion reports of one feed() (one renderer input tick) are collapsed
+    into the last one; dropped counts the reports collapsed away.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, coalesce: bool = False) -> None:
         super().__init__()
         self._buffer = bytearray()
         self._parser = MouseParser()
+        self.coalesce = coalesce
+        self.dropped = 0
 
     def reset(self) -> None:
         self._parser.reset()
         self._buffer.clear()
 
     def feed(self, data: bytes | str) -> bytes:
+        """Emit 'mouse' for every report in data; return the bytes that are not mouse reports."""
         if isinstance(data, str):
             data = data.encode("utf-8", errors="replace")
-        self._buffer.extend(data)
+        if self._buffer:
+            self._buffer.extend(data)
+            buf: bytes | bytearray = self._buffer
+        else:
+            buf = data
+        events: list[RawMouseEvent] = []
         unconsumed = bytearray()
-        i = 0
-        while i < len(self._buffer):
-            view = bytes(self._buffer[i:])
-            ev, consumed = self._parser._parse_sgr(view)
-            if ev is not None:
-                self.emit("mouse", ev)
-                i += consumed
-                continue
-            ev, consumed = self._parser._parse_basic(view)
-            if ev is not None:
-                self.emit("mouse", ev)
-                i += consumed
+        parser = self._parser
+        coalesce = self.coalesce
+        pos = 0
+        for m in _MOUSE_REPORT.finditer(buf):
+            start = m.start()
+            if start > pos:
+                unconsumed += memoryview(buf)[pos:start]
+            pos = m.end()
+            if m.group(4) is not None:
+                ev = parser._sgr_event(int(m.group(1)), int(m.group(2)) - 1, int(m.group(3)) - 1, m.group(4) == b"m")
+            else:
+                raw = m.group(5)
+                ev = parser._basic_event(raw[0], raw[1], raw[2])
+            if coalesce and ev.get("motion") and events and _same_motion_run(events[-1], ev):
+                events[-1] = ev
+                self.dropped += 1
                 continue
-            # Don't consume 0x1b: may be start of \x1b[<... (SGR) or \x1b[M (basic); keep for next feed
-            if self._buffer[i] == 0x1B:
-                break
-            unconsumed.append(self._buffer[i])
-            i += 1
-        del self._buffer[:i]
+            events.append(ev)
+        rest = b""
+        tail = buf.rfind(b"\x1b", pos)
+        if tail != -1 and _REPORT_PREFIX.match(buf, tail):
+            rest = bytes(memoryview(buf)[tail:])
+            end = tail
+        else:
+            end = len(buf)
+        if end > pos:
+            unconsumed += memoryview(buf)[pos:end]
+        self._buffer = bytearray(rest)
+        for ev in events:
+            self.emit("mouse", ev)
         return bytes(unconsumed)
 
     def clear(self) -> None:
@@ -0,0 +1,176 @@
+# pytui.core.profiler - Per-phase frame profiler for Renderer (input, callbacks, layout, render, post, diff,
+# write), per-renderable render_self cost attribution and bytes written per frame. Disabled by default:
+# the renderer only touches it behind an `enabled` check. Export as JSON or Chrome trace (chrome://tracing,
+# Perfetto).
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from typing import Any
+
+PHASES = ("input", "callbacks", "layout", "render", "post", "diff", "write")
+
+
+def renderable_label(renderable: Any) -> str:
+    """"Type#id" label used for render cost attribution."""
+    rid = getattr(renderable, "id", None)
+    name = type(renderable).__name__
+    return f"{name}#{rid}" if rid else name
+
+
+class FrameProfiler:
+    """Collects per-frame phase timings for the last max_frames frames.
+
+    Phases accumulate into the current frame until end_frame(); the renderer calls discard_frame() after
+    loop iterations that did not render, so idle input / callback time is not charged to the next frame.
+    Per-renderable costs keep only the top_n most expensive renderables of each frame.
+    """
+
+    def __init__(self, enabled: bool = False, max_frames: int = 300, top_n: int = 10) -> None:
+        self.enabled = enabled
+        self.top_n = top_n
+        self._frames: deque[dict[str, Any]] = deque(maxlen=max(1, max_frames))
+        self._frame_index = 0
+        self._epoch_ns = time.perf_counter_ns()
+        self._reset_current()
+
+    def _reset_current(self) -> None:
+        self._start_ns: int | None = None
+        self._spans: list[tuple[str, int, int]] = []  # (phase, start_ns, dur_ns)
+        self._renderables: dict[str, int] = {}
+        self._bytes = 0
+        self._excluded_ns = 0
+
+    @property
+    def max_frames(self) -> int:
+        return self._frames.maxlen or 0
+
+    @property
+    def frames(self) -> list[dict[str, Any]]:
+        return list(self._frames)
+
+    def add(self, phase: str, start_ns: int, end_ns: int | None = None) -> None:
+        """Record phase as running from start_ns to end_ns (default: now)."""
+        end = time.perf_counter_ns() if end_ns is None else end_ns
+        if self._start_ns is None:
+            self._start_ns = start_ns
+        self._spans.append((phase, start_ns, end - start_ns))
+
+    def exclude(self, start_ns: int, end_ns: int | None = None) -> None:
+        """Leave start_ns..end_ns (default: now) out of the frame total (e.g. the debug overlay's own drawing)."""
+        end = time.perf_counter_ns() if end_ns is None else end_ns
+        self._excluded_ns += end - start_ns
+
+    def add_renderable(self, renderable: Any, dur_ns: int) -> None:
+        label = renderable_label(renderable)
+        self._renderables[label] = self._renderables.get(label, 0) + dur_ns
+
+    def add_bytes(self, count: int) -> None:
+        self._bytes += count
+
+    def end_frame(self) -> dict[str, Any] | None:
+        """Close the current frame and return its record (None if nothing was recorded)."""
+        if self._start_ns is None:
+            return None
+        phases = dict.fromkeys(PHASES, 0.0)
+        end_ns = self._start_ns
+        for phase, start, dur in self._spans:
+            phases[phase] = phases.get(phase, 0.0) + dur / 1e6
+            end_ns = max(end_ns, start + dur)
+        top = sorted(self._renderables.items(), key=lambda kv: kv[1], reverse=True)[: self.top_n]
+        frame = {
+            "frame": self._frame_index,
+            "start_ms": (self._start_ns - self._epoch_ns) / 1e6,
+            "total_ms": max(0, end_ns - self._start_ns - self._excluded_ns) / 1e6,
+            "phases": phases,
+            "bytes": self._bytes,
+            "renderables": [(label, ns / 1e6) for label, ns in top],
+            "_spans": self._spans,
+        }
+        self._frames.append(frame)
+        self._frame_index += 1
+        self._reset_current()
+        return frame
+
+    def discard_frame(self) -> None:
+        """Drop everything recorded since the last end_frame()."""
+        self._reset_current()
+
+    def reset(self) -> None:
+        self._frames.clear()
+        self._reset_current()
+
+    def summary(self) -> dict[str, Any]:
+        """Averages over the retained frames: phases (ms), bytesPerFrame, topRenderables [(label, avg ms)]."""
+        frames = self._frames
+        n = len(frames)
+        if not n:
+            return {"frames": 0, "phases": dict.fromkeys(PHASES, 0.0), "bytesPerFrame": 0.0, "topRenderables": []}
+        phases = dict.fromkeys(PHASES, 0.0)
+        costs: dict[str, float] = {}
+        total_bytes = 0
+        for f in frames:
+            for phase, ms in f["phases"].items():
+                phases[phase] = phases.get(phase, 0.0) + ms
+            for label, ms in f["renderables"]:
+                costs[label] = costs.get(label, 0.0) + ms
+            total_bytes += f["bytes"]
+        top = sorted(costs.items(), key=lambda kv: kv[1], reverse=True)[: self.top_n]
+        return {
+            "frames": n,
+            "phases": {k: v / n for k, v in phases.items()},
+            "bytesPerFrame": total_bytes / n,
+            "topRenderables": [(label, ms / n) for label, ms in top],
+            "last": self._public(frames[-1]),
+        }
+
+    @staticmethod
+    def _public(frame: dict[str, Any]) -> dict[str, Any]:
+        return {k: v for k, v in frame.items() if not k.startswith("_")}
+
+    def to_json(self) -> str:
+        return json.dumps({"summary": self.summary(), "frames": [self._public(f) for f in self._frames]})
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Chrome trace event format: one complete ("X") event per frame and per phase span."""
+        events: list[dict[str, Any]] = []
+        for f in self._frames:
+            start_us = f["start_ms"] * 1000.0
+            events.append(
+                {
+                    "name": f"frame {f['frame']}",
+                    "cat": "frame",
+                    "ph": "X",
+                    "ts": start_us,
+                    "dur": f["total_ms"] * 1000.0,
+                    "pid": 1,
+                    "tid": 1,
+                    "args": {"bytes": f["bytes"], "renderables": dict(f["renderables"])},
+                }
+            )
+            for phase, span_start, dur in f["_spans"]:
+                events.append(
+                    {
+                        "name": phase,
+                        "cat": "phase",
+                        "ph": "X",
+                        "ts": (span_start - self._epoch_ns) / 1000.0,
+                        "dur": dur / 1000.0,
+                        "pid": 1,
+                        "tid": 1,
+                    }
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path: str, format: str = "json") -> None:
+        """Write the profile to path as "json" (summary + frames) or "chrome" (trace events)."""
+        if format == "chrome":
+            data = json.dumps(self.to_chrome_trace())
+        elif format == "json":
+            data = self.to_json()
+        else:
+            raise ValueError(f"Unknown profile format: {format!r}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data)
@@ -1,16 +1,21 @@
 # pytui.core.renderable - Aligns with OpenTUI packages/core/src/Renderable.ts
 # LayoutEvents, RenderableEvents, Renderable base, add/remove(id)/insertBefore, getChildren, findById,
-# requestRender, calculateLayout, render/renderSelf, focus/blur.
+# requestRender, calculateLayout, render/renderSelf, focus/blur. batch_render_requests coalesces
+# request_render calls made inside it (e.g. animation ticks) into one propagation per chain.
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Literal
 
 from pyee import EventEmitter
 
 from pytui.core.buffer import OptimizedBuffer
 from pytui.core.layout import LayoutNode
+from pytui.core.memory import track_renderable
 
 if TYPE_CHECKING:
     from pytui.core.renderer import RenderContext
@@ -27,6 +32,48 @@ RenderableEvents = Literal["focused", "blurred"]
 FOCUSED: RenderableEvents = "focused"
 BLURRED: RenderableEvents = "blurred"
 
+_batch_depth = 0
+_batched: dict[int, Renderable] = {}
+# Set by Renderer while a profiled frame renders: receives add_renderable(renderable, render_self ns).
+_render_profiler: Any = None
+# Bumped whenever a child is added or removed anywhere (lets the debug overlay cache its node count).
+_tree_version = 0
+
+
+@contextmanager
+def batch_render_requests() -> Iterator[None]:
+    """Defer request_render propagation until the outermost batch exits.
+
+    Inside the batch request_render only marks the renderable dirty; on exit each parent chain is
+    walked once and every renderer gets a single schedule_render.
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0 and _batched:
+            pending = list(_batched.values())
+            _batched.clear()
+            _flush_render_requests(pending)
+
+
+def _flush_render_requests(pending: list[Renderable]) -> None:
+    seen: set[int] = set()
+    renderers: dict[int, Any] = {}
+    for node in pending:
+        while node is not None and id(node) not in seen:
+            seen.add(id(node))
+            node._dirty = True
+            if node.parent is None:
+                renderer = getattr(node.ctx, "renderer", None)
+                if renderer is not None:
+                    renderers[id(renderer)] = renderer
+            node = node.parent
+    for renderer in renderers.values():
+        renderer.schedule_render()
+
 
 class Renderable(ABC, EventEmitter):
     """可渲染对象基类。"""
@@ -42,6 +89,7 @@ class Renderable(ABC, EventEmitter):
         else:
             Renderable._id_counter += 1
             self.id = f"renderable-{Renderable._id_counter}"
+        track_renderable(self)
         self.parent: Renderable | None = None
         self.children: list[Renderable] = []
         self.layout_node = LayoutNode()
@@ -102,8 +150,10 @@ class Renderable(ABC, EventEmitter):
                 self.layout_node.set_position(edge, options[edge])
 
     def add(self, child: Renderable, index: int | None = None) -> None:
+        global _tree_version
         if child.parent:
             child.parent.remove(child)
+        _tree_version += 1
         child.parent = self
         if index is None:
             self.children.append(child)
@@ -117,12 +167,14 @@ class Renderable(ABC, EventEmitter):
 
     def remove(self, child: Renderable | str) -> None:
         """Remove by child reference or by id (align with OpenTUI remove(id: string))."""
+        global _tree_version
         if isinstance(child, str):
             c = self.get_root().find_by_id(child)
             if c and c.parent:
                 c.parent.remove(c)
             return
         if child in self.children:
+            _tree_version += 1
             self.children.remove(child)
             self.layout_node.remove_child(child.layout_node)
             child.parent = None
@@ -136,8 +188,10 @@ class Renderable(ABC, EventEmitter):
 
     def insert_before(self, obj: Renderable, anchor: Renderable) -> int:
         """Insert obj before anchor (align with OpenTUI insertBefore). Returns index."""
+        global _tree_version
         if obj.parent:
             obj.parent.remove(obj)
+        _tree_version += 1
         idx = self.children.index(anchor) if anchor in self.children else len(self.children)
         obj.parent = self
         self.children.insert(idx, obj)
@@ -157,6 +211,9 @@ class Renderable(ABC, EventEmitter):
 
     def request_render(self) -> None:
         self._dirty = True
+        if _batch_depth:
+            _batched[id(self)] = self
+            return
         if self.parent:
             self.parent.request_render()
         elif hasattr(self.ctx, "renderer"):
@@ -193,7 +250,12 @@ class Renderable(ABC, EventEmitter):
             buffer.push_opacity(self.opacity)
         if self._render_before:
             self._render_before(buffer, delta_time)
-        self.render_self(buffer)
+        if _render_profiler is None:
+            self.render_self(buffer)
+        else:
+            t0 = time.perf_counter_ns()
+            self.render_self(buffer)
+            _render_profiler.add_renderable(self, time.perf_counter_ns() - t0)
         if self._render_after:
             self._render_after(buffer, delta_time)
         for child in sorted(self.children, key=lambda c: c.z_index):
@@ -207,12 +269,26 @@ class Renderable(ABC, EventEmitter):
         pass
 
     def focus(self) -> None:
+        # Always (re)claim the renderer focus: focused=True may have come from the options, and it is the
+        # root of the keymap scope chain that subclasses bind in their focus() overrides.
+        renderer = getattr(self.ctx, "renderer", None)
+        if (
+            renderer is not None
+            and hasattr(renderer, "focus_renderable")
+            and getattr(renderer, "current_focused_renderable", None) is not self
+        ):
+            renderer.focus_renderable(self)
         if not self.focused:
             self.focused = True
             self.emit(FOCUSED)
             self.request_render()
 
     def blur(self) -> None:
+        renderer = getattr(self.ctx, "renderer", None)
+        if renderer is not None and hasattr(renderer, "blur_renderable"):
+            # Hands focus back to the previous focused renderable; also drops self from the focus
+            # history when it is not focused (destroy() blurs).
+            renderer.blur_renderable(self)
         if self.focused:
             self.focused = False
             self.emit(BLURRED)
@@ -6,15 +6,20 @@ import os
 import select
 import sys
 import time
+import weakref
 from dataclasses import dataclass
 from typing import Any, Callable
 
 from pytui.core.buffer import OptimizedBuffer
+from pytui.core.debug_overlay import DebugOverlay
 from pytui.core.events import EventBus
 from pytui.core.renderable import Renderable
 from pytui.lib.key_handler import InternalKeyHandler
 from pytui.lib.stdin_buffer import StdinBuffer
+from pytui.core.memory import memory_snapshot
 from pytui.core.mouse import MouseHandler
+from pytui.core.profiler import FrameProfiler, renderable_label
+from pytui.core import renderable as renderable_module
 from pytui.core.terminal import Terminal
 from pytui.core.types import CursorStyle, DebugOverlayCorner
 
@@ -62,12 +67,12 @@ class Renderer:
     Config: target_fps, max_fps, use_alternate_screen, use_mouse, exit_on_ctrl_c, exit_signals,
     debounce_delay, use_kitty_keyboard, gather_stats, max_stat_samples, memory_snapshot_interval,
     use_console, experimental_split_height, enable_mouse_movement, backgroundColor,
-    open_console_on_error, on_destroy.
+    open_console_on_error, on_destroy, profile.
     Getters: control_state, is_destroyed, is_running, terminal_width, terminal_height, use_mouse,
     key_input, use_console, experimental_split_height, live_request_count, current_control_state,
     capabilities, resolution, current_focused_renderable, palette_detection_status.
     Methods: set_frame_callback, remove_frame_callback, clear_frame_callbacks, get_stats,
-    reset_stats, set_gather_stats, add_input_handler, prepend_input_handler, remove_input_handler,
+    reset_stats, set_gather_stats, set_profiling, export_profile, add_input_handler, prepend_input_handler, remove_input_handler,
     set_background_color, toggle_debug_overlay, configure_debug_overlay, set_terminal_title,
     dump_hit_grid, dump_buffers, dump_stdout_buffer, set_cursor_position, set_cursor_style,
     set_cursor_color, get_cursor_state, add_post_process_fn, remove_post_process_fn,
@@ -101,6 +106,7 @@ class Renderer:
         backgroundColor: Any = None,
         open_console_on_error: bool = True,
         on_destroy: Callable[[], None] | None = None,
+        profile: bool = False,
     ) -> None:
         self.terminal = terminal or Terminal()
         w, h = self.terminal.get_size()
@@ -137,6 +143,7 @@ class Renderer:
         self.post_process_fns: list[Callable[[OptimizedBuffer, float], None]] = []
         self.debug_overlay = {"enabled": False, "corner": DebugOverlayCorner.bottom_right}
         self._current_focused_renderable: Renderable | None = None
+        self._focus_history: list[weakref.ref[Renderable]] = []  # weak: never keeps a dropped widget alive
         self._lifecycle_passes: set = set()
         self._resolution: dict | None = None
         self._capabilities: Any = None
@@ -166,14 +173,17 @@ class Renderer:
         self.context = RenderContext(renderer=self)
         self.root = RootRenderable(self.context, {"id": "root"})
         self._key_handler = InternalKeyHandler(use_kitty_keyboard=use_kitty_keyboard)
-        self._stdin_buffer = StdinBuffer({"timeout": _STDIN_BUFFER_TIMEOUT_MS})
+        # Timeouts are checked by _run_loop (check_timeout), so key dispatch never leaves the UI thread.
+        self._stdin_buffer = StdinBuffer({"timeout": _STDIN_BUFFER_TIMEOUT_MS, "use_timer": False})
         self._stdin_buffer.on("data", self._on_stdin_sequence)
         self._stdin_buffer.on("paste", self._key_handler.process_paste)
         self.keyboard = self._key_handler
+        self._key_handler.focus_provider = lambda: self._current_focused_renderable
         self._key_handler.on("keypress", self._on_keypress)
         self._key_handler.on("keyrelease", self._on_keyrelease)
         self._key_handler.on("paste", self._on_paste)
-        self._mouse_handler = MouseHandler()
+        # Motion reports are collapsed per input tick; set renderer._mouse_handler.coalesce = False to get every one.
+        self._mouse_handler = MouseHandler(coalesce=True)
         self._mouse_captured: Renderable | None = None
         self._mouse_handler.on("mouse", self._dispatch_mouse)
         self.prepend_input_handler(self._debug_capture_input)
@@ -186,11 +196,22 @@ class Renderer:
         self._utf8_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         self.stats = {"fps": 0, "frame_time": 0.0, "render_time": 0.0}
         self._frame_times: list[float] = []
+        self._overlay_ms = 0.0  # debug overlay cost of the last frame, left out of _frame_times
         self._stats_frame_count = 0
         self._frame_callbacks: list = []
+        self.profiler = FrameProfiler(enabled=profile, max_frames=max_stat_samples)
+        self._debug_overlay_view: DebugOverlay | None = None
+        self._profiling_requested = profile
+        self._last_memory_snapshot: dict | None = None
+        self._last_output = ""
         self._memory_snapshot_last_emit = 0.0
+        self._memory_top_allocators = 0
+        self._memory_tracing_started = False
         self._input_stream = None
         self._input_saved_attrs = None
+        # InputRecorder (pytui.testing.input_trace) receiving raw stdin chunks; PYTUI_RECORD_INPUT=path records
+        # a started renderer's session to path.
+        self._input_recorder = None
         self._previous_control_state = RendererControlState.IDLE
         self._suspended_mouse_enabled = False
 
@@ -216,6 +237,10 @@ class Renderer:
                 self._input_saved_attrs = None
         if self._use_mouse:
             self.terminal.enable_mouse()
+        if os.environ.get("PYTUI_RECORD_INPUT") and self._input_recorder is None:
+            from pytui.testing.input_trace import record_input
+
+            record_input(self)
         try:
             self._run_loop()
         except KeyboardInterrupt:
@@ -234,26 +259,30 @@ class Renderer:
         while self.running:
             start = time.time()
             delta_ms = (start - self._last_frame_time) * 1000.0
-            self.events.emit("frame", start)
-            for cb in self._frame_callbacks:
-                try:
-                    cb(delta_ms)
-                except Exception:
-                    pass
+            prof = self.profiler if self.profiler.enabled else None
+            if prof is not None:
+                t0 = time.perf_counter_ns()
             self._process_input()
+            self._stdin_buffer.check_timeout()
             self._check_resize()
+            if prof is not None:
+                prof.add("input", t0)
+            # After input, so state changes made by key / mouse handlers (e.g. React updates) show this frame.
+            self._tick(start, delta_ms)
             if self._render_scheduled or self._should_render():
                 t0 = time.time()
                 self._render_frame()
-                self.stats["render_time"] = (time.time() - t0) * 1000
+                self.stats["render_time"] = (time.time() - t0) * 1000 - self._overlay_ms
                 self._render_scheduled = False
                 fps_count += 1
                 if self.gather_stats:
-                    frame_time_ms = (time.time() - start) * 1000.0
+                    frame_time_ms = (time.time() - start) * 1000.0 - self._overlay_ms
                     self._frame_times.append(frame_time_ms)
                     if len(self._frame_times) > self.max_stat_samples:
                         self._frame_times.pop(0)
                     self._stats_frame_count += 1
+            elif prof is not None:
+                prof.discard_frame()
             now = time.time()
             if now - last_fps >= 1.0:
                 self.stats["fps"] = fps_count
@@ -265,52 +294,113 @@ class Renderer:
                 self._memory_snapshot_last_emit = now
             self._last_frame_time = time.time()
             if self.frame_time > 0 and (time.time() - start) < self.frame_time:
-                time.sleep(self.frame_time - (time.time() - start))
+                pause = self.frame_time - (time.time() - start)
+                deadline = self._stdin_buffer.deadline
+                if deadline is not None:
+                    pause = max(0.0, min(pause, deadline - time.monotonic()))
+                time.sleep(pause)
+
+    def _tick(self, now: float, delta_ms: float) -> None:
+        """Per-frame step before rendering: the "frame" event, then frame callbacks (animations, React's
+        update queue). Shared by _run_loop and headless replay so both see the same frames."""
+        prof = self.profiler if self.profiler.enabled else None
+        if prof is not None:
+            t0 = time.perf_counter_ns()
+        self.events.emit("frame", now)
+        for cb in self._frame_callbacks:
+            try:
+                cb(delta_ms)
+            except Exception:
+                pass
+        if prof is not None:
+            prof.add("callbacks", t0)
 
     def _render_frame(self) -> None:
+        overlay = self._debug_overlay_view if self.debug_overlay["enabled"] else None
+        overlay_ns = 0
+        if overlay is not None:
+            t = time.perf_counter_ns()
+            overlay.count_nodes(self.root)
+            overlay_ns = time.perf_counter_ns() - t
+        prof = self.profiler if self.profiler.enabled else None
+        if prof is not None:
+            t0 = time.perf_counter_ns()
         self.back_buffer.clear()
         self.back_buffer._opacity_stack.clear()  # Align OpenTUI: fresh opacity stack per frame
         self.root.calculate_layout()
         delta_time = time.time() - self._last_render_time if self._frame_count else 0.0
-        self.root.render(self.back_buffer, delta_time)
+        if prof is None:
+            self.root.render(self.back_buffer, delta_time)
+        else:
+            t1 = time.perf_counter_ns()
+            prof.add("layout", t0, t1)
+            renderable_module._render_profiler = prof
+            try:
+                self.root.render(self.back_buffer, delta_time)
+            finally:
+                renderable_module._render_profiler = None
+            t2 = time.perf_counter_ns()
+            prof.add("render", t1, t2)
         for fn in self.post_process_fns:
             try:
                 fn(self.back_buffer, delta_time)
             except Exception:
                 pass
+        if prof is not None:
+            prof.add("post", t2)
+        if overlay is not None:
+            # Drawn between post and diff; its cost is excluded so the overlay does not skew what it shows.
+            t3 = time.perf_counter_ns()
+            overlay.draw(self.back_buffer, self)
+            t4 = time.perf_counter_ns()
+            if prof is not None:
+                prof.exclude(t3, t4)
+            overlay_ns += t4 - t3
+        self._overlay_ms = overlay_ns / 1_000_000
         self._diff_and_output()
         self.front_buffer, self.back_buffer = self.back_buffer, self.front_buffer
         self._frame_count += 1
         self._last_render_time = time.time()
+        if prof is not None:
+            prof.end_frame()
 
     def _diff_and_output(self) -> None:
+        prof = self.profiler if self.profiler.enabled else None
+        if prof is not None:
+            t0 = time.perf_counter_ns()
+        out = self._diff_output()
+        self._last_output = out
+        if prof is not None:
+            t1 = time.perf_counter_ns()
+            prof.add("diff", t0, t1)
+        if out:
+            sys.stdout.write(out)
+            sys.stdout.flush()
+            if prof is not None:
+                prof.add("write", t1)
+                prof.add_bytes(len(out.encode("utf-8", errors="replace")))
+
+    def _diff_output(self) -> str:
+        """ANSI output that turns the front buffer into the back buffer."""
         # 首帧全量重绘，确保终端显示完整内容
         full_repaint = self._frame_count == 0
-        # 方案 B 阶段二：native CliRenderer 时由 render() 做 diff + swap + 输出
+        # 方案 B 阶段二：native CliRenderer 时由 render() 做 diff + swap
         if self._native_renderer is not None:
             try:
-                out = self._native_renderer.render(full_repaint)
-                if out:
-                    sys.stdout.write(out)
-                    sys.stdout.flush()
+                return self._native_renderer.render(full_repaint) or ""
             except Exception:
-                self._diff_and_output_python(full_repaint)
-            return
+                return self._diff_output_python(full_repaint)
         # 阶段一回退：无 CliRenderer 时用 buffer.diff_and_output_ansi
         front_native = getattr(self.front_buffer, "_native_buffer", None)
         back_native = getattr(self.back_buffer, "_native_buffer", None)
         if back_native is not None and front_native is not None:
             try:
-                out = back_native.diff_and_output_ansi(front_native, full_repaint)
-                if out:
-                    sys.stdout.write(out)
-                    sys.stdout.flush()
+                return back_native.diff_and_output_ansi(front_native, full_repaint) or ""
             except Exception:
-                self._diff_and_output_python(full_repaint)
-            return
-        self._diff_and_output_python(full_repaint)
+                return self._diff_output_python(full_repaint)
+        return self._diff_output_python(full_repaint)
 
-    def _diff_and_output_python(self, full_repaint: bool) -> None:
+    def _diff_output_python(self, full_repaint: bool) -> str:
         from pytui.core.ansi import ANSI
 
         out = []
@@ -325,9 +415,7 @@ class Renderer:
                     if bc is not None:
                         out.append(ANSI.cursor_to(x, y))
                         out.append(self.back_buffer._cell_to_ansi(bc))
-        if out:
-            sys.stdout.write("".join(out))
-            sys.stdout.flush()
+        return "".join(out)
 
     def _process_input(self) -> None:
         # Align OpenTUI: mouse on raw bytes first; unconsumed goes to StdinBuffer.
@@ -359,6 +447,13 @@ class Renderer:
                 break
         if not chunk:
             return
+        if self._input_recorder is not None:
+            self._input_recorder.record(chunk)
+        self.feed_raw_input(chunk)
+
+    def feed_raw_input(self, chunk: bytes) -> None:
+        """Feed raw stdin bytes the way the terminal does: mouse reports first (when enabled), the rest to
+        StdinBuffer. Used to replay recorded input (pytui.testing.input_trace)."""
         if self._use_mouse:
             unconsumed = self._mouse_handler.feed(chunk)
             chunk = unconsumed if unconsumed else b""
@@ -481,23 +576,30 @@ class Renderer:
         self._frame_callbacks.append(callback)
 
     def get_stats(self) -> dict:
-        """Align with OpenTUI getStats(): fps, frameCount, frameTimes, averageFrameTime, minFrameTime, maxFrameTime."""
+        """Align with OpenTUI getStats(): fps, frameCount, frameTimes, averageFrameTime, minFrameTime, maxFrameTime;
+        droppedMouseEvents counts motion reports collapsed by the mouse decoder.
+        With profiling enabled also "profile": per-phase averages, bytesPerFrame, topRenderables, last frame."""
         frame_times = list(self._frame_times)
         n = len(frame_times)
         avg = sum(frame_times) / n if n else 0.0
-        return {
+        stats = {
             "fps": self.stats["fps"],
             "frameCount": self._stats_frame_count,
             "frameTimes": frame_times,
             "averageFrameTime": avg,
             "minFrameTime": min(frame_times) if n else 0.0,
             "maxFrameTime": max(frame_times) if n else 0.0,
+            "droppedMouseEvents": self._mouse_handler.dropped,
         }
+        if self.profiler.enabled:
+            stats["profile"] = self.profiler.summary()
+        return stats
 
     def reset_stats(self) -> None:
         """Align with OpenTUI resetStats(): clear frame times and stats frame count."""
         self._frame_times.clear()
         self._stats_frame_count = 0
+        self.profiler.reset()
 
     def pause(self) -> None:
         """Align with OpenTUI pause(): set control state and stop the render loop."""
@@ -612,6 +714,20 @@ class Renderer:
         if not enabled:
             self._frame_times.clear()
 
+    def set_profiling(self, enabled: bool) -> None:
+        """Enable the per-phase frame profiler (see get_stats()["profile"], export_profile).
+        While the debug overlay is shown the profiler stays on; the setting applies once it is hidden."""
+        self._profiling_requested = enabled
+        if self.debug_overlay["enabled"]:
+            return
+        self.profiler.enabled = enabled
+        if not enabled:
+            self.profiler.reset()
+
+    def export_profile(self, path: str, format: str = "json") -> None:
+        """Write retained profiler frames to path as "json" or "chrome" (trace event format)."""
+        self.profiler.export(path, format)
+
     # --- Background, debug overlay, cursor, terminal title (align OpenTUI) ---
     def set_background_color(self, color: Any) -> None:
         try:
@@ -624,31 +740,99 @@ class Renderer:
         self.request_render()
 
     def toggle_debug_overlay(self) -> None:
-        self.debug_overlay["enabled"] = not self.debug_overlay["enabled"]
-        if self.debug_overlay["enabled"] and not self.memory_snapshot_interval:
-            self.memory_snapshot_interval = 3000
-        self.events.emit(CliRenderEvents.DEBUG_OVERLAY_TOGGLE, self.debug_overlay["enabled"])
+        self._set_debug_overlay_enabled(not self.debug_overlay["enabled"])
         self.request_render()
 
     def configure_debug_overlay(self, enabled: bool | None = None, corner: int | None = None) -> None:
-        if enabled is not None:
-            self.debug_overlay["enabled"] = enabled
         if corner is not None:
-            self.debug_overlay["corner"] = corner
+            self.debug_overlay["corner"] = DebugOverlayCorner(corner)
+        if enabled is not None and enabled != self.debug_overlay["enabled"]:
+            self._set_debug_overlay_enabled(enabled)
         self.request_render()
 
+    def _set_debug_overlay_enabled(self, enabled: bool) -> None:
+        """The overlay reads phase timings from the profiler, so it is switched on while the overlay is shown."""
+        self.debug_overlay["enabled"] = enabled
+        if enabled:
+            if self._debug_overlay_view is None:
+                self._debug_overlay_view = DebugOverlay()
+            self.profiler.enabled = True
+            if not self.memory_snapshot_interval:
+                self.memory_snapshot_interval = 3000
+            if self._last_memory_snapshot is None:
+                self._emit_memory_snapshot()
+        elif not self._profiling_requested:
+            self.profiler.enabled = False
+            self.profiler.reset()
+        self.events.emit(CliRenderEvents.DEBUG_OVERLAY_TOGGLE, enabled)
+
     def set_terminal_title(self, title: str) -> None:
         sys.stdout.write(f"\x1b]0;{title}\x07")
         sys.stdout.flush()
 
-    def dump_hit_grid(self) -> None:
-        pass
-
-    def dump_buffers(self, timestamp: int | None = None) -> None:
-        pass
-
-    def dump_stdout_buffer(self, timestamp: int | None = None) -> None:
-        pass
+    # --- Dumps for offline analysis (align OpenTUI dumpHitGrid / dumpBuffers / dumpStdoutBuffer) ---
+    @staticmethod
+    def _dump_path(directory: str, name: str, timestamp: int | None) -> str:
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{name}_{timestamp}.txt")
+
+    def dump_hit_grid(self, directory: str = "buffer_dump", timestamp: int | None = None) -> str:
+        """Write which renderable hit_test() resolves for every cell; one symbol per renderable plus a legend.
+        Returns the file path."""
+        symbols = "123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+        legend: dict[int, tuple[str, Renderable]] = {}
+        rows = []
+        for y in range(self.height):
+            row = []
+            for x in range(self.width):
+                hit = self.hit_test(x, y)
+                if hit is None:
+                    row.append(".")
+                    continue
+                entry = legend.get(id(hit))
+                if entry is None:
+                    entry = legend[id(hit)] = (symbols[len(legend) % len(symbols)], hit)
+                row.append(entry[0])
+            rows.append("".join(row))
+        path = self._dump_path(directory, "hit_grid", timestamp)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"Hit Grid ({self.width}x{self.height}):\n")
+            f.write("\n".join(rows))
+            f.write("\n\nLegend (. = no hit):\n")
+            for symbol, r in legend.values():
+                f.write(f"{symbol} {renderable_label(r)}\n")
+        return path
+
+    def dump_buffers(self, timestamp: int | None = None, directory: str = "buffer_dump") -> list[str]:
+        """Write the front (current) and back (next) buffer characters and the last stdout output.
+        Returns the file paths."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        paths = []
+        for name, buf in (("current", self.front_buffer), ("next", self.back_buffer)):
+            path = self._dump_path(directory, f"{name}_buffer", timestamp)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"{name} Buffer ({buf.width}x{buf.height}):\nCharacters:\n")
+                for y in range(buf.height):
+                    f.write("".join((c.char[:1] or " ") if c is not None else " " for c in (buf.get_cell(x, y) for x in range(buf.width))))
+                    f.write("\n")
+            paths.append(path)
+        paths.append(self.dump_stdout_buffer(timestamp, directory))
+        return paths
+
+    def dump_stdout_buffer(self, timestamp: int | None = None, directory: str = "buffer_dump") -> str:
+        """Write the ANSI output of the last rendered frame. Returns the file path."""
+        if timestamp is None:
+            timestamp = int(time.time() * 1000)
+        path = self._dump_path(directory, "stdout_buffer", timestamp)
+        out = self._last_output
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"Stdout Buffer Output (timestamp: {timestamp}):\nLast Rendered ANSI Output:\n================\n")
+            f.write(out.encode("unicode_escape").decode("ascii") if out else "(no output rendered yet)")
+            f.write(f"\n================\nBuffer size: {len(out.encode('utf-8', errors='replace'))} bytes\n")
+        return path
 
     def set_cursor_position(self, x: int, y: int, visible: bool = True) -> None:
         from pytui.core.ansi import ANSI
@@ -717,6 +901,8 @@ class Renderer:
                 self.root.remove_all()
         except Exception:
             pass
+        if self._memory_tracing_started:
+            self.set_memory_tracing(0)
         if self._on_destroy:
             try:
                 self._on_destroy()
@@ -761,12 +947,52 @@ class Renderer:
     def get_lifecycle_passes(self) -> set:
         return set(self._lifecycle_passes)
 
-    def focus_renderable(self, renderable: Renderable) -> None:
+    def focus_renderable(self, renderable: Renderable | None) -> None:
+        current = self._current_focused_renderable
+        if current is not None and current is not renderable:
+            # Remember it so blurring the new focus hands keys back instead of dropping them.
+            self._drop_focus_history(current, renderable)
+            self._focus_history.append(weakref.ref(current))
         self._current_focused_renderable = renderable
 
+    def _drop_focus_history(self, *renderables: Renderable | None) -> None:
+        """Remove renderables and collected entries from the focus history."""
+        kept = []
+        for ref in self._focus_history:
+            r = ref()
+            if r is not None and all(r is not other for other in renderables):
+                kept.append(ref)
+        self._focus_history = kept
+
+    def blur_renderable(self, renderable: Renderable) -> None:
+        """renderable lost focus (or was destroyed): restore the most recent earlier focus that is still
+        focused (or None)."""
+        self._drop_focus_history(renderable)
+        if self._current_focused_renderable is not renderable:
+            return
+        while self._focus_history:
+            previous = self._focus_history.pop()()
+            if getattr(previous, "focused", False):
+                self._current_focused_renderable = previous
+                return
+        self._current_focused_renderable = None
+
     def set_memory_snapshot_interval(self, interval: int) -> None:
         self.memory_snapshot_interval = interval
 
+    def set_memory_tracing(self, top_n: int, frames: int = 1) -> None:
+        """Report the top_n tracemalloc allocation sites in memory:snapshot ("topAllocators").
+        Starts tracemalloc (frames deep) if needed; top_n=0 stops it again if it was started here."""
+        import tracemalloc
+
+        self._memory_top_allocators = max(0, top_n)
+        if top_n > 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._memory_tracing_started = True
+        elif top_n <= 0 and self._memory_tracing_started:
+            tracemalloc.stop()
+            self._memory_tracing_started = False
+
     def clear_palette_cache(self) -> None:
         pass
 
@@ -775,18 +1001,20 @@ class Renderer:
         return None
 
     def _emit_memory_snapshot(self) -> None:
-        """Emit memory:snapshot event with heapUsed/heapTotal/arrayBuffers (align OpenTUI)."""
-        try:
-            import resource
-            ru = resource.getrusage(resource.RUSAGE_SELF)
-            heap_used = ru.ru_maxrss * 1024  # Linux/macOS: KB -> bytes
-        except Exception:
-            heap_used = 0
-        self.events.emit("memory:snapshot", {"heapUsed": heap_used, "heapTotal": 0, "arrayBuffers": 0})
+        """Emit memory:snapshot (align OpenTUI heapUsed/heapTotal/arrayBuffers; see pytui.core.memory)."""
+        snapshot = memory_snapshot(self._memory_top_allocators)
+        self._last_memory_snapshot = snapshot
+        self.events.emit("memory:snapshot", snapshot)
 
     def _cleanup(self) -> None:
         if getattr(self, "_stdin_buffer", None) is not None:
             self._stdin_buffer.clear()
+        record_path = os.environ.get("PYTUI_RECORD_INPUT")
+        if record_path and self._input_recorder is not None:
+            try:
+                self._input_recorder.stop().save(record_path)
+            except OSError:
+                pass
         if self._input_stream is not None and self._input_saved_attrs is not None:
             try:
                 import termios
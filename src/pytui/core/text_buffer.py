@@ -2,9 +2,13 @@
 # TextBuffer, TextChunk, createTextBuffer (TextBuffer.create), setText, append, getPlainText, setStyledText,
 # setDefaultFg/Bg/Attributes, resetDefaults, getLineCount, length, byteSize, getTextRange, clear, reset, destroy.
 # PyTUI: pure Python implementation (no native); OpenTUI uses zig + lib.
+# Text is stored as a list of lines with their start offsets, so append() only touches the last line and the
+# new ones (length / byte size are updated from the appended chunk) and lines can be read by index. epoch changes
+# whenever the text is replaced rather than appended to; views use it to keep per-line caches across appends.
 
 from __future__ import annotations
 
+import bisect
 from typing import Any
 
 from pytui.core.types import WidthMethod
@@ -14,6 +18,10 @@ def _chunk_to_plain(chunk: dict[str, Any]) -> str:
     return chunk.get("text", "")
 
 
+def _utf8_len(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
 class TextBuffer:
     """Text buffer for styled/plain text. Aligns OpenTUI TextBuffer (API only; pure Python)."""
 
@@ -21,7 +29,10 @@ class TextBuffer:
         self._width_method = width_method
         self._length = 0
         self._byte_size = 0
-        self._text = ""
+        self._lines: list[str] = [""]
+        self._line_starts: list[int] = [0]
+        self._text: str | None = ""  # joined text cache
+        self._epoch = 0
         self._destroyed = False
 
     @classmethod
@@ -33,29 +44,54 @@ class TextBuffer:
         if self._destroyed:
             raise RuntimeError("TextBuffer is destroyed")
 
-    def set_text(self, text: str) -> None:
-        self._guard()
+    def _replace(self, text: str) -> None:
+        lines = text.split("\n")
+        starts = [0] * len(lines)
+        pos = 0
+        for i, line in enumerate(lines):
+            starts[i] = pos
+            pos += len(line) + 1
+        self._lines = lines
+        self._line_starts = starts
         self._text = text
         self._length = len(text)
-        self._byte_size = len(text.encode("utf-8"))
+        self._byte_size = _utf8_len(text)
+        self._epoch += 1
+
+    def set_text(self, text: str) -> None:
+        self._guard()
+        self._replace(text)
 
     def append(self, text: str) -> None:
+        """Append text (CRLF normalized to LF); cost is proportional to text and the current last line."""
         self._guard()
         if not text:
             return
-        # Normalize CRLF to LF
+        lines = self._lines
+        if text[0] == "\n" and lines[-1].endswith("\r"):
+            # CRLF split across two appends
+            lines[-1] = lines[-1][:-1]
+            self._length -= 1
+            self._byte_size -= 1
         text = text.replace("\r\n", "\n")
-        self._text += text
-        self._length = len(self._text)
-        self._byte_size = len(self._text.encode("utf-8"))
+        parts = text.split("\n")
+        lines[-1] += parts[0]
+        if len(parts) > 1:
+            starts = self._line_starts
+            pos = starts[-1] + len(lines[-1]) + 1
+            for part in parts[1:]:
+                starts.append(pos)
+                lines.append(part)
+                pos += len(part) + 1
+        self._length += len(text)
+        self._byte_size += _utf8_len(text)
+        self._text = None
 
     def set_styled_text(self, styled_text: Any) -> None:
         """Set content from StyledText (chunks with text). Aligns OpenTUI setStyledText."""
         self._guard()
         chunks = getattr(styled_text, "chunks", styled_text) if not isinstance(styled_text, list) else styled_text
-        self._text = "".join(_chunk_to_plain(c) for c in chunks)
-        self._length = len(self._text)
-        self._byte_size = len(self._text.encode("utf-8"))
+        self._replace("".join(_chunk_to_plain(c) for c in chunks))
 
     def set_default_fg(self, fg: Any | None) -> None:
         self._guard()
@@ -75,9 +111,32 @@ class TextBuffer:
 
     def get_line_count(self) -> int:
         self._guard()
-        if not self._text:
-            return 1
-        return self._text.count("\n") + 1
+        return len(self._lines)
+
+    def get_line(self, index: int) -> str:
+        """Logical line index (0-based, without its newline)."""
+        self._guard()
+        return self._lines[index]
+
+    def get_lines(self, start: int = 0, end: int | None = None) -> list[str]:
+        """Logical lines [start, end)."""
+        self._guard()
+        return self._lines[start:end]
+
+    def get_line_start(self, index: int) -> int:
+        """Character offset of the first character of line index."""
+        self._guard()
+        return self._line_starts[index]
+
+    def get_line_starts(self) -> list[int]:
+        """Start offset of every logical line (a copy)."""
+        self._guard()
+        return list(self._line_starts)
+
+    @property
+    def epoch(self) -> int:
+        """Bumped when the text is replaced (set_text, set_styled_text, clear, reset); unchanged by append."""
+        return self._epoch
 
     @property
     def length(self) -> int:
@@ -91,6 +150,8 @@ class TextBuffer:
 
     def get_plain_text(self) -> str:
         self._guard()
+        if self._text is None:
+            self._text = "\n".join(self._lines)
         return self._text
 
     def get_text_range(self, start_offset: int, end_offset: int) -> str:
@@ -99,22 +160,27 @@ class TextBuffer:
             return ""
         if self._byte_size == 0:
             return ""
-        return self._text[start_offset:end_offset]
+        if self._text is not None:
+            return self._text[start_offset:end_offset]
+        starts = self._line_starts
+        first = max(0, bisect.bisect_right(starts, max(0, start_offset)) - 1)
+        last = max(first, bisect.bisect_right(starts, end_offset) - 1)
+        joined = "\n".join(self._lines[first : last + 1])
+        base = starts[first]
+        return joined[max(0, start_offset - base) : end_offset - base]
 
     def clear(self) -> None:
         self._guard()
-        self._text = ""
-        self._length = 0
-        self._byte_size = 0
+        self._replace("")
 
     def reset(self) -> None:
         self._guard()
-        self._text = ""
-        self._length = 0
-        self._byte_size = 0
+        self._replace("")
 
     def destroy(self) -> None:
         if self._destroyed:
             return
         self._destroyed = True
+        self._lines = [""]
+        self._line_starts = [0]
         self._text = ""
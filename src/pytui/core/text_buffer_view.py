@@ -1,7 +1,8 @@
 # pytui.core.text_buffer_view - Aligns with OpenTUI packages/core/src/text-buffer-view.ts
 # TextBufferView.create(textBuffer), setSelection, updateSelection, resetSelection, getSelection,
 # hasSelection, setWrapWidth, setViewportSize, lineInfo, getPlainText, getSelectedText, destroy.
-# PyTUI: pure Python stub (no native); OpenTUI uses zig + lib.
+# PyTUI: pure Python stub (no native); OpenTUI uses zig + lib. Line widths are cached per TextBuffer epoch, so
+# after an append only the last known line and the new ones are measured.
 
 from __future__ import annotations
 
@@ -23,6 +24,9 @@ class TextBufferView:
         self._wrap_mode: str = "none"  # "none" | "char" | "word"
         self._viewport_width = 0
         self._viewport_height = 0
+        self._widths_epoch = -1
+        self._line_widths: list[int] = []
+        self._max_line_width = 0
 
     @classmethod
     def create(cls, text_buffer: TextBuffer) -> "TextBufferView":
@@ -77,27 +81,41 @@ class TextBufferView:
         self._viewport_width = width
         self._viewport_height = height
 
+    def _update_line_widths(self) -> list[int]:
+        tb = self._text_buffer
+        widths = self._line_widths
+        if tb.epoch != self._widths_epoch:
+            self._widths_epoch = tb.epoch
+            widths.clear()
+            self._max_line_width = 0
+        first = max(0, len(widths) - 1)
+        del widths[first:]
+        fresh = [len(line) for line in tb.get_lines(first)]
+        widths.extend(fresh)
+        if fresh:
+            self._max_line_width = max(self._max_line_width, max(fresh))
+        return widths
+
     @property
     def line_info(self) -> LineInfo:
         self._guard()
-        text = self._text_buffer.get_plain_text()
-        lines = text.split("\n") if text else [""]
-        line_starts: list[int] = []
-        line_widths: list[int] = []
-        pos = 0
-        for line in lines:
-            line_starts.append(pos)
-            line_widths.append(len(line))
-            pos += len(line) + 1
-        max_w = max(line_widths) if line_widths else 0
+        widths = self._update_line_widths()
+        n = len(widths)
         return {
-            "line_starts": line_starts,
-            "line_widths": line_widths,
-            "max_line_width": max_w,
-            "line_sources": list(range(len(lines))),
-            "line_wraps": [0] * len(lines),
+            "line_starts": self._text_buffer.get_line_starts(),
+            "line_widths": list(widths),
+            "max_line_width": self._max_line_width,
+            "line_sources": list(range(n)),
+            "line_wraps": [0] * n,
         }
 
+    @property
+    def max_line_width(self) -> int:
+        """Widest logical line (incremental across appends)."""
+        self._guard()
+        self._update_line_widths()
+        return self._max_line_width
+
     def get_plain_text(self) -> str:
         self._guard()
         return self._text_buffer.get_plain_text()
@@ -112,8 +130,7 @@ class TextBufferView:
 
     def get_virtual_line_count(self) -> int:
         self._guard()
-        info = self.line_info
-        return len(info["line_starts"])
+        return self._text_buffer.get_line_count()
 
     def destroy(self) -> None:
         if self._destroyed:
@@ -58,6 +58,7 @@ from pytui.lib.parse_keypress import (
     ParsedKey,
     non_alphanumeric_keys,
     parse_keypress,
+    parse_keypress_cached,
 )
 from pytui.lib.scroll_acceleration import LinearScrollAccel, MacOSScrollAccel, ScrollAcceleration
 from pytui.lib.stdin_buffer import StdinBuffer
@@ -112,7 +113,7 @@ from pytui.lib.tree_sitter import (
 )
 
 # --- Data-paths, extmarks, terminal-palette (OpenTUI order) ---
-from pytui.lib.extmarks import Extmark, ExtmarksStore
+from pytui.lib.extmarks import Extmark, ExtmarksController, ExtmarksStore
 from pytui.lib.terminal_palette import (
     TerminalPalette,
     create_terminal_palette,
@@ -155,13 +156,24 @@ from pytui.lib.extmarks_history import ExtmarksHistory, ExtmarksSnapshot
 from pytui.lib.key_handler import InternalKeyHandler, KeyEvent, KeyHandler, PasteEvent
 from pytui.lib.keymapping import (
     KeyBinding,
+    KeymapRegistry,
     build_key_bindings_map,
     get_key_binding_key,
     merge_key_aliases,
     merge_key_bindings,
     key_binding_to_string,
 )
+from pytui.lib.mapped_file import MappedFile
+from pytui.lib.markdown_blocks import (
+    InlineSpan,
+    ListItem,
+    MarkdownBlock,
+    parse_inline,
+    parse_markdown_blocks,
+    reparse_markdown_blocks,
+)
 from pytui.lib.objects_in_viewport import get_objects_in_viewport
+from pytui.lib.search import SearchIndex, compile_search_pattern
 from pytui.lib.output_capture import Capture, CapturedOutput, CapturedWritableStream
 from pytui.lib.queue import ProcessQueue
 from pytui.lib.renderable_validations import (
@@ -225,6 +237,7 @@ __all__ = [
     "ParsedKey",
     "non_alphanumeric_keys",
     "parse_keypress",
+    "parse_keypress_cached",
     # 7. scroll-acceleration
     "LinearScrollAccel",
     "MacOSScrollAccel",
@@ -292,6 +305,7 @@ __all__ = [
     "get_data_paths",
     # 17. extmarks
     "Extmark",
+    "ExtmarksController",
     "ExtmarksStore",
     # 18. terminal-palette
     "TerminalPalette",
@@ -330,12 +344,22 @@ __all__ = [
     "ExtmarksHistory",
     "ExtmarksSnapshot",
     "KeyBinding",
+    "KeymapRegistry",
     "build_key_bindings_map",
     "get_key_binding_key",
     "merge_key_aliases",
     "merge_key_bindings",
     "key_binding_to_string",
+    "MappedFile",
+    "InlineSpan",
+    "ListItem",
+    "MarkdownBlock",
+    "parse_inline",
+    "parse_markdown_blocks",
+    "reparse_markdown_blocks",
     "get_objects_in_viewport",
+    "SearchIndex",
+    "compile_search_pattern",
     "Capture",
     "CapturedOutput",
     "CapturedWritableStream",
@@ -1,11 +1,19 @@
 # pytui.lib.extmarks - Aligns with OpenTUI lib/extmarks.ts
-# Extmark, ExtmarksStore (add, remove, get, get_in_range, clear). ExtmarksController not migrated (edit-buffer specific).
+# Extmark, ExtmarksStore (add, remove, get, get_in_range, get_all, clear, adjust_for_insertion/deletion,
+# snapshot/restore), ExtmarksController (keeps a store in step with an EditBuffer; undo/redo via ExtmarksHistory).
+# PyTUI: marks live in a treap ordered by start, each node carrying the max end of its subtree and a pending
+# shift for its children. Overlap queries prune on max end (O(log n + k)); an edit splits the tree at the edit
+# offset and shifts everything after it with one pending add (O(log n)), touching individually only the marks
+# that span or fall inside the edited range.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import random
+from dataclasses import asdict, dataclass
 from typing import Any
 
+from pytui.lib.extmarks_history import ExtmarksHistory, ExtmarksSnapshot
+
 
 @dataclass
 class Extmark:
@@ -21,12 +29,103 @@ class Extmark:
     type_id: int = 0
 
 
+class _Node:
+    __slots__ = ("mark", "prio", "left", "right", "parent", "max_end", "shift")
+
+    def __init__(self, mark: Extmark, prio: float) -> None:
+        self.mark = mark
+        self.prio = prio
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.parent: _Node | None = None
+        self.max_end = mark.end
+        self.shift = 0  # pending for the children; the node's own mark is current
+
+
+def _apply(t: _Node, delta: int) -> None:
+    t.mark.start += delta
+    t.mark.end += delta
+    t.max_end += delta
+    t.shift += delta
+
+
+def _push(t: _Node) -> None:
+    if t.shift:
+        if t.left is not None:
+            _apply(t.left, t.shift)
+        if t.right is not None:
+            _apply(t.right, t.shift)
+        t.shift = 0
+
+
+def _pull(t: _Node) -> None:
+    m = t.mark.end
+    if t.left is not None:
+        t.left.parent = t
+        m = max(m, t.left.max_end)
+    if t.right is not None:
+        t.right.parent = t
+        m = max(m, t.right.max_end)
+    t.max_end = m
+
+
+def _split(t: _Node | None, key: int) -> tuple[_Node | None, _Node | None]:
+    """(marks with start < key, the rest)."""
+    if t is None:
+        return None, None
+    _push(t)
+    if t.mark.start < key:
+        lo, hi = _split(t.right, key)
+        t.right = lo
+        _pull(t)
+        return t, hi
+    lo, hi = _split(t.left, key)
+    t.left = hi
+    _pull(t)
+    return lo, t
+
+
+def _merge(a: _Node | None, b: _Node | None) -> _Node | None:
+    """Join two trees where every start in a is <= every start in b."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        _push(a)
+        a.right = _merge(a.right, b)
+        _pull(a)
+        return a
+    _push(b)
+    b.left = _merge(a, b.left)
+    _pull(b)
+    return b
+
+
+def _in_order(t: _Node | None, out: list[_Node]) -> None:
+    if t is not None:
+        _push(t)
+        _in_order(t.left, out)
+        out.append(t)
+        _in_order(t.right, out)
+
+
 class ExtmarksStore:
-    """Store extmarks by id; query by range. Aligns with OpenTUI extmarks store (add/remove/get/get_in_range/clear)."""
+    """Store extmarks by id; query by range. Aligns with OpenTUI extmarks store (add/remove/get/get_in_range/clear).
+
+    Marks follow text edits through adjust_for_insertion / adjust_for_deletion (or an ExtmarksController).
+    An Extmark returned by a query is current until the next adjustment; look it up again afterwards.
+    """
 
     def __init__(self) -> None:
-        self._marks: dict[int, Extmark] = {}
+        self._nodes: dict[int, _Node] = {}
+        self._root: _Node | None = None
         self._next_id = 1
+        self._rng = random.Random(0x5EED)
+
+    @property
+    def next_id(self) -> int:
+        return self._next_id
 
     def add(
         self,
@@ -42,38 +141,282 @@ class ExtmarksStore:
         """Add an extmark; return id. Aligns with OpenTUI add()."""
         eid = self._next_id
         self._next_id += 1
-        self._marks[eid] = Extmark(
-            id=eid,
-            start=start,
-            end=end,
-            virtual=virtual,
-            style_id=style_id,
-            priority=priority,
-            data=data,
-            type_id=type_id,
+        self._insert(
+            Extmark(
+                id=eid,
+                start=start,
+                end=end,
+                virtual=virtual,
+                style_id=style_id,
+                priority=priority,
+                data=data,
+                type_id=type_id,
+            )
         )
         return eid
 
+    def _insert(self, mark: Extmark) -> None:
+        node = _Node(mark, self._rng.random())
+        self._nodes[mark.id] = node
+        # Descend while the priorities stay above the new node's, then split only the subtree it takes over.
+        parent: _Node | None = None
+        t = self._root
+        while t is not None and t.prio > node.prio:
+            _push(t)
+            parent = t
+            t = t.left if mark.start < t.mark.start else t.right
+        node.left, node.right = _split(t, mark.start)
+        _pull(node)
+        if parent is None:
+            self._set_root(node)
+            return
+        if mark.start < parent.mark.start:
+            parent.left = node
+        else:
+            parent.right = node
+        node.parent = parent
+        while parent is not None and parent.max_end < node.max_end:
+            parent.max_end = node.max_end
+            parent = parent.parent
+
+    def _set_root(self, root: _Node | None) -> None:
+        if root is not None:
+            root.parent = None
+        self._root = root
+
+    def _flush_path(self, node: _Node) -> list[_Node]:
+        """Apply pending shifts from the root down to node; return its ancestors, nearest first."""
+        ancestors: list[_Node] = []
+        p = node.parent
+        while p is not None:
+            ancestors.append(p)
+            p = p.parent
+        for a in reversed(ancestors):
+            _push(a)
+        return ancestors
+
     def remove(self, eid: int) -> bool:
         """Remove extmark by id. Aligns with OpenTUI remove()."""
-        if eid in self._marks:
-            del self._marks[eid]
+        node = self._nodes.pop(eid, None)
+        if node is None:
+            return False
+        ancestors = self._flush_path(node)
+        _push(node)
+        child = _merge(node.left, node.right)
+        parent = node.parent
+        if parent is None:
+            self._set_root(child)
             return True
-        return False
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        if child is not None:
+            child.parent = parent
+        for a in ancestors:
+            _pull(a)
+        return True
 
     def get(self, eid: int) -> Extmark | None:
         """Get extmark by id."""
-        return self._marks.get(eid)
+        node = self._nodes.get(eid)
+        if node is None:
+            return None
+        self._flush_path(node)
+        return node.mark
 
     def get_in_range(self, start: int, end: int) -> list[Extmark]:
         """Return extmarks overlapping [start, end), sorted by priority desc, start asc. Aligns with OpenTUI get_in_range()."""
-        out = [m for m in self._marks.values() if m.start < end and m.end > start]
-        out.sort(key=lambda m: (-(m.priority or 0), m.start))
+        out: list[Extmark] = []
+
+        def visit(t: _Node | None) -> None:
+            if t is None or t.max_end <= start:
+                return
+            _push(t)
+            visit(t.left)
+            if t.mark.start < end:
+                if t.mark.end > start:
+                    out.append(t.mark)
+                visit(t.right)
+
+        visit(self._root)
+        out.sort(key=lambda m: -(m.priority or 0))  # stable: start order is kept within a priority
         return out
 
+    def get_all(self) -> list[Extmark]:
+        """All extmarks ordered by start. Aligns with OpenTUI getAll()."""
+        nodes: list[_Node] = []
+        _in_order(self._root, nodes)
+        return [n.mark for n in nodes]
+
+    # --- edits ---
+
+    def adjust_for_insertion(self, offset: int, length: int) -> list[Extmark]:
+        """Text of length was inserted at offset: marks at or after it move, marks spanning it grow.
+
+        Returns copies (before the edit) of the marks that grew. Aligns with OpenTUI adjustExtmarksAfterInsertion.
+        """
+        if length <= 0 or self._root is None:
+            return []
+        lo, hi = _split(self._root, offset)
+        if hi is not None:
+            _apply(hi, length)
+        touched: list[Extmark] = []
+
+        def grow(t: _Node | None) -> None:
+            if t is None or t.max_end <= offset:
+                return
+            _push(t)
+            if t.mark.end > offset:
+                touched.append(Extmark(**asdict(t.mark)))
+                t.mark.end += length
+            grow(t.left)
+            grow(t.right)
+            _pull(t)
+
+        grow(lo)
+        self._set_root(_merge(lo, hi))
+        return touched
+
+    def adjust_for_deletion(self, offset: int, length: int) -> list[Extmark]:
+        """Text [offset, offset + length) was deleted: later marks move back, marks inside it are removed and
+        marks overlapping it shrink.
+
+        Returns copies (before the edit) of the removed and shrunk marks, so an undo can restore them.
+        Aligns with OpenTUI adjustExtmarksAfterDeletion.
+        """
+        if length <= 0 or self._root is None:
+            return []
+        stop = offset + length
+        lo, rest = _split(self._root, offset)
+        mid, hi = _split(rest, stop)
+        if hi is not None:
+            _apply(hi, -length)
+        touched: list[Extmark] = []
+        kept: _Node | None = None
+        inside: list[_Node] = []
+        _in_order(mid, inside)
+        for node in inside:
+            m = node.mark
+            touched.append(Extmark(**asdict(m)))
+            if m.end <= stop:
+                del self._nodes[m.id]
+                continue
+            m.start = offset
+            m.end = max(offset, m.end - length)
+            node.left = node.right = None
+            node.max_end = m.end
+            kept = _merge(kept, node)
+
+        def shrink(t: _Node | None) -> None:
+            if t is None or t.max_end <= offset:
+                return
+            _push(t)
+            if t.mark.end > offset:
+                touched.append(Extmark(**asdict(t.mark)))
+                t.mark.end -= min(t.mark.end, stop) - offset
+            shrink(t.left)
+            shrink(t.right)
+            _pull(t)
+
+        shrink(lo)
+        self._set_root(_merge(_merge(lo, kept), hi))
+        return touched
+
+    # --- snapshots (ExtmarksHistory) ---
+
+    def snapshot(self) -> ExtmarksSnapshot:
+        """All marks as an ExtmarksHistory snapshot."""
+        return {"extmarks": {m.id: asdict(m) for m in self.get_all()}, "nextId": self._next_id}
+
+    def restore(self, snapshot: ExtmarksSnapshot) -> None:
+        """Replace every mark with the snapshot's. Aligns with OpenTUI restoreSnapshot."""
+        self.clear()
+        self.restore_marks(snapshot)
+        self._next_id = snapshot.get("nextId", self._next_id)
+
+    def restore_marks(self, snapshot: ExtmarksSnapshot) -> None:
+        """Put the snapshot's marks back (replacing marks with the same id); other marks are kept."""
+        for eid, d in snapshot.get("extmarks", {}).items():
+            self.remove(int(eid))
+            self._insert(
+                Extmark(
+                    id=int(d.get("id", eid)),
+                    start=d["start"],
+                    end=d["end"],
+                    virtual=d.get("virtual", False),
+                    style_id=d.get("style_id", d.get("styleId")),
+                    priority=d.get("priority"),
+                    data=d.get("data"),
+                    type_id=d.get("type_id", d.get("typeId", 0)),
+                )
+            )
+        self._next_id = max(self._next_id, snapshot.get("nextId", 1))
+
     def clear(self) -> None:
         """Clear all extmarks."""
-        self._marks.clear()
+        self._nodes.clear()
+        self._root = None
 
     def __len__(self) -> int:
-        return len(self._marks)
+        return len(self._nodes)
+
+
+class ExtmarksController:
+    """Keep an ExtmarksStore in step with an EditBuffer (subset of OpenTUI ExtmarksController).
+
+    Every buffer edit shifts the marks. Edits record only the marks they removed or shrank in the
+    ExtmarksHistory; undo() / redo() replay the text change through the buffer and put those marks back.
+    Offsets are the buffer's character offsets.
+    """
+
+    def __init__(self, edit_buffer: Any, store: ExtmarksStore | None = None, history: ExtmarksHistory | None = None) -> None:
+        self.edit_buffer = edit_buffer
+        self.store = store if store is not None else ExtmarksStore()
+        self.history = history if history is not None else ExtmarksHistory()
+        self._touched: list[Extmark] | None = None  # collects marks touched during undo/redo
+        edit_buffer.on_edit(self._on_edit)
+
+    def _on_edit(self, start: int, removed: str, inserted: str) -> None:
+        touched: list[Extmark] = []
+        if removed:
+            touched += self.store.adjust_for_deletion(start, len(removed))
+        if inserted:
+            touched += self.store.adjust_for_insertion(start, len(inserted))
+        if self._touched is not None:
+            self._touched += touched
+        else:
+            self.history.save_snapshot(_marks_dict(touched), self.store.next_id)
+
+    def _replay(self, op: Any, pop: Any, push: Any) -> bool:
+        self._touched = []
+        try:
+            if not op():
+                return False
+        finally:
+            touched, self._touched = self._touched, None
+        snapshot = pop()
+        if snapshot is not None:
+            push({"extmarks": _marks_dict(touched), "nextId": self.store.next_id})
+            self.store.restore_marks(snapshot)
+        return True
+
+    def undo(self) -> bool:
+        """Undo the last buffer edit and restore the marks it removed or shrank."""
+        return self._replay(self.edit_buffer.undo, self.history.undo, self.history.push_redo)
+
+    def redo(self) -> bool:
+        return self._replay(self.edit_buffer.redo, self.history.redo, self.history.push_undo)
+
+    def destroy(self) -> None:
+        self.edit_buffer.off_edit(self._on_edit)
+        self.history.clear()
+
+
+def _marks_dict(marks: list[Extmark]) -> dict[int, Any]:
+    # The first copy of a mark is its state before the edit.
+    out: dict[int, Any] = {}
+    for m in marks:
+        if m.id not in out:
+            out[m.id] = asdict(m)
+    return out
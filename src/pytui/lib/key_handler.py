@@ -5,11 +5,13 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Mapping
 from typing import Any, Callable
 
 from pyee import EventEmitter
 
-from pytui.lib.parse_keypress import parse_keypress
+from pytui.lib.keymapping import KeymapRegistry
+from pytui.lib.parse_keypress import parse_keypress_cached
 
 _LOG = logging.getLogger(__name__)
 
@@ -17,7 +19,7 @@ _LOG = logging.getLogger(__name__)
 class KeyEvent:
     """Key event with preventDefault/stopPropagation. Aligns OpenTUI KeyEvent (wraps ParsedKey)."""
 
-    def __init__(self, parsed: dict[str, Any]) -> None:
+    def __init__(self, parsed: Mapping[str, Any]) -> None:
         self._parsed = parsed
         self._default_prevented = False
         self._propagation_stopped = False
@@ -165,7 +167,7 @@ class KeyHandler(EventEmitter):
 
     def process_input(self, data: str | bytes) -> bool:
         """Parse input and emit keypress/keyrelease. Returns True if key was emitted. Aligns OpenTUI processInput()."""
-        parsed = parse_keypress(data, {"use_kitty_keyboard": self.use_kitty_keyboard})
+        parsed = parse_keypress_cached(data, self.use_kitty_keyboard)
         if parsed is None:
             return False
         try:
@@ -190,11 +192,19 @@ class KeyHandler(EventEmitter):
 
 
 class InternalKeyHandler(KeyHandler):
-    """Used by renderer: global handlers run first, then internal (renderable) handlers. preventDefault prevents internal. Aligns OpenTUI InternalKeyHandler."""
+    """Used by renderer: global handlers run first, then internal (renderable) handlers.
+    preventDefault prevents internal. Aligns OpenTUI InternalKeyHandler.
+
+    Between the two, keypresses go through keymaps (KeymapRegistry) along the scope chain of
+    focus_provider() (the focused renderable), so focusable widgets do not each need a global listener.
+    """
 
     def __init__(self, use_kitty_keyboard: bool = False) -> None:
         super().__init__(use_kitty_keyboard)
-        self._internal_handlers: dict[str, set[Callable[..., None]]] = {}
+        # Copy-on-write tuples: emitting iterates them without copying, (un)registering replaces them.
+        self._internal_handlers: dict[str, tuple[Callable[..., None], ...]] = {}
+        self.keymaps = KeymapRegistry()
+        self.focus_provider: Callable[[], Any] | None = None
 
     def emit(self, event: str, *args: Any) -> bool:
         if event not in ("keypress", "keyrelease", "paste"):
@@ -204,10 +214,9 @@ class InternalKeyHandler(KeyHandler):
     def _emit_with_priority(self, event: str, *args: Any) -> bool:
         has_global = False
         raw = getattr(self, "_events", {}).get(event)
-        if raw is None:
-            raw = ()
-        listeners = list(raw) if not hasattr(raw, "keys") else list(raw.keys())
-        if listeners:
+        if raw:
+            # Snapshot: a handler may remove listeners (e.g. blur on Escape) while we iterate.
+            listeners = tuple(raw.keys()) if hasattr(raw, "keys") else tuple(raw)
             has_global = True
             for fn in listeners:
                 try:
@@ -216,8 +225,16 @@ class InternalKeyHandler(KeyHandler):
                     _LOG.exception("[KeyHandler] Error in global %s handler: %s", event, e)
                 if args and getattr(args[0], "propagation_stopped", False):
                     return has_global
-        internal_set = self._internal_handlers.get(event)
-        internal_list = list(internal_set) if internal_set else []
+        if event == "keypress" and args:
+            ev = args[0]
+            if not (getattr(ev, "default_prevented", False) or getattr(ev, "propagation_stopped", False)):
+                focused = self.focus_provider() if self.focus_provider is not None else None
+                try:
+                    if self.keymaps.dispatch(ev, focused):
+                        return True
+                except Exception as e:
+                    _LOG.exception("[KeyHandler] Error in keymap %s handler: %s", event, e)
+        internal_list = self._internal_handlers.get(event, ())
         has_internal = bool(internal_list)
         if internal_list and args:
             ev = args[0]
@@ -234,12 +251,12 @@ class InternalKeyHandler(KeyHandler):
 
     def on_internal(self, event: str, handler: Callable[..., None]) -> None:
         """Register internal (renderable) handler. Aligns OpenTUI onInternal()."""
-        if event not in self._internal_handlers:
-            self._internal_handlers[event] = set()
-        self._internal_handlers[event].add(handler)
+        handlers = self._internal_handlers.get(event, ())
+        if handler not in handlers:
+            self._internal_handlers[event] = (*handlers, handler)
 
     def off_internal(self, event: str, handler: Callable[..., None]) -> None:
         """Unregister internal handler. Aligns OpenTUI offInternal()."""
-        s = self._internal_handlers.get(event)
-        if s:
-            s.discard(handler)
+        handlers = self._internal_handlers.get(event)
+        if handlers and handler in handlers:
+            self._internal_handlers[event] = tuple(h for h in handlers if h != handler)
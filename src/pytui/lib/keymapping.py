@@ -1,6 +1,9 @@
 # pytui.lib.keymapping - Aligns with OpenTUI lib/keymapping.ts
 # KeyBinding type, merge_key_bindings, get_key_binding_key, build_key_bindings_map, key_binding_to_string.
+# KeymapRegistry: bindings compiled per focus scope; key dispatch walks the focused renderable's scope chain.
 
+import weakref
+from collections.abc import Callable
 from typing import Any, TypedDict
 
 # Action is string; KeyBinding is generic over action name
@@ -84,3 +87,96 @@ def key_binding_to_string(binding: KeyBinding) -> str:
         parts.append("super")
     parts.append(binding["name"])
     return "+".join(parts)
+
+
+class _Scope:
+    __slots__ = ("bindings", "on_action", "fallback")
+
+    def __init__(
+        self,
+        bindings: dict[str, str],
+        on_action: Callable[[str, Any], Any] | None,
+        fallback: Callable[[Any], Any] | None,
+    ) -> None:
+        self.bindings = bindings
+        self.on_action = on_action
+        self.fallback = fallback
+
+
+class KeymapRegistry:
+    """Key bindings compiled per focus scope (a renderable, or None for app-wide bindings).
+
+    bind() compiles bindings into a name:ctrl:shift:meta:super -> action dict. dispatch() walks the focused
+    renderable's parent chain and then the global scope: a matching binding calls on_action(action, key)
+    (return False to let the key continue); a scope without a match calls its fallback(key), which stops
+    the key by returning True or calling prevent_default/stop_propagation. Scopes are held weakly.
+    """
+
+    def __init__(self, aliases: KeyAliasMap | None = None) -> None:
+        self._aliases = merge_key_aliases(default_key_aliases, aliases or {})
+        self._scopes: weakref.WeakKeyDictionary[Any, _Scope] = weakref.WeakKeyDictionary()
+        self._global: _Scope | None = None
+
+    def bind(
+        self,
+        scope: Any,
+        bindings: list[KeyBinding] | None = None,
+        on_action: Callable[[str, Any], Any] | None = None,
+        fallback: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Register (or replace) the bindings of scope."""
+        entry = _Scope(build_key_bindings_map(bindings or [], self._aliases), on_action, fallback)
+        if scope is None:
+            self._global = entry
+        else:
+            self._scopes[scope] = entry
+
+    def unbind(self, scope: Any) -> None:
+        if scope is None:
+            self._global = None
+        else:
+            self._scopes.pop(scope, None)
+
+    def is_bound(self, scope: Any) -> bool:
+        return self._global is not None if scope is None else scope in self._scopes
+
+    def key_id(self, key: Any) -> str:
+        """Binding key for a KeyEvent / ParsedKey, with aliases applied."""
+        name = (key.get("name") or "").strip().lower()
+        return get_key_binding_key(
+            {
+                "name": self._aliases.get(name, name),
+                "ctrl": key.get("ctrl", False),
+                "shift": key.get("shift", False),
+                "meta": key.get("meta", False),
+                "super": key.get("super", False),
+            }
+        )
+
+    def action_for(self, scope: Any, key: Any) -> str | None:
+        entry = self._global if scope is None else self._scopes.get(scope)
+        return entry.bindings.get(self.key_id(key)) if entry is not None else None
+
+    def dispatch(self, key: Any, focused: Any = None) -> bool:
+        """Deliver key along focused -> parents -> global scope; True once a scope handled it."""
+        if not self._scopes and self._global is None:
+            return False
+        kid: str | None = None
+        node = focused
+        while True:
+            entry = self._global if node is None else self._scopes.get(node)
+            if entry is not None:
+                if entry.bindings:
+                    if kid is None:
+                        kid = self.key_id(key)
+                    action = entry.bindings.get(kid)
+                    if action is not None and entry.on_action is not None and entry.on_action(action, key) is not False:
+                        return True
+                if entry.fallback is not None:
+                    if entry.fallback(key) is True:
+                        return True
+                    if getattr(key, "default_prevented", False) or getattr(key, "propagation_stopped", False):
+                        return True
+            if node is None:
+                return False
+            node = getattr(node, "parent", None)
@@ -0,0 +1,288 @@
+# pytui.lib.mapped_file - Read-only memory-mapped text file with a sparse line index (PyTUI extension; no OpenTUI
+# counterpart). The index keeps the byte offset of every `stride`-th line start and is built on a daemon thread
+# with numpy newline scans over the mapping, so a multi-GB file is usable immediately: lines past the indexed
+# prefix are located by scanning forward from the last checkpoint. Only the lines asked for are decoded.
+# The index state is only written under _index_lock, so index() called while the daemon thread runs waits for it
+# instead of scanning a second time; tail_start() finds the last lines from EOF without any index.
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+import re
+import threading
+from array import array
+from collections.abc import Callable
+
+import numpy as np
+
+_NL = 10
+DEFAULT_STRIDE = 128
+DEFAULT_CHUNK = 4 << 20
+# Longest part of a single line that is decoded (the rest is not shown).
+MAX_LINE_BYTES = 64 << 10
+
+
+class MappedFile:
+    """mmap-backed file with a sparse line-offset index. Lines are 0-based; a trailing newline does not start a line.
+
+    index() / start_indexing() build the index (synchronously or on a daemon thread); every read works
+    before it finishes. on_progress() is called from the indexing thread after each scanned chunk.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        stride: int = DEFAULT_STRIDE,
+        encoding: str = "utf-8",
+        chunk_size: int = DEFAULT_CHUNK,
+        on_progress: Callable[[], None] | None = None,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.stride = max(1, stride)
+        self.encoding = encoding
+        self.chunk_size = max(4096, chunk_size)
+        self.on_progress = on_progress
+        self._fh = open(self.path, "rb")
+        self.size = os.fstat(self._fh.fileno()).st_size
+        self._mm: mmap.mmap | None = (
+            mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if self.size > 0 else None
+        )
+        self._ends_with_nl = self._mm is not None and self._mm[self.size - 1] == _NL
+        self._checkpoints = array("q", [0])  # byte offset of line k * stride
+        self._newlines = 0  # newlines in [0, _indexed_to)
+        self._indexed_to = 0
+        self._thread: threading.Thread | None = None
+        self._index_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        if self._mm is None:
+            self._done.set()
+
+    # --- index ---
+
+    def start_indexing(self) -> None:
+        """Build the index on a daemon thread."""
+        if self._thread is None and not self._done.is_set():
+            self._thread = threading.Thread(target=self.index, name="pytui-mapped-file-index", daemon=True)
+            self._thread.start()
+
+    def index(self) -> None:
+        """Scan the whole file and record a checkpoint every stride lines.
+
+        Safe to call while start_indexing()'s thread runs: it then waits for that scan to finish.
+        """
+        with self._index_lock:
+            self._index_locked()
+
+    def _index_locked(self) -> None:
+        mm = self._mm
+        stride = self.stride
+        pos = self._indexed_to
+        line = self._newlines
+        while mm is not None and pos < self.size and not self._stop.is_set():
+            end = min(self.size, pos + self.chunk_size)
+            chunk = np.frombuffer(mm, dtype=np.uint8, count=end - pos, offset=pos)
+            nl = np.flatnonzero(chunk == _NL)
+            # Newline i starts line (line + i + 1); keep those that are multiples of stride.
+            first = (-(line + 1)) % stride
+            self._checkpoints.extend((nl[first::stride] + (pos + 1)).tolist())
+            line += len(nl)
+            del chunk, nl  # release the buffer export so close() can unmap
+            self._newlines = line
+            self._indexed_to = pos = end
+            if self.on_progress is not None:
+                self.on_progress()
+        if pos >= self.size:
+            self._done.set()
+
+    def wait_indexed(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
+    @property
+    def indexed(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the file indexed (1.0 when done)."""
+        return 1.0 if self.size == 0 else self._indexed_to / self.size
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines; while indexing this is the count found so far (at least 1 for a non-empty file)."""
+        if self._mm is None:
+            return 0
+        if not self._done.is_set():
+            return max(1, self._newlines)
+        return self._newlines + (0 if self._ends_with_nl else 1)
+
+    # --- lookup ---
+
+    def _count_newlines(self, start: int, end: int) -> int:
+        if self._mm is None or end <= start:
+            return 0
+        total = 0
+        while start < end:
+            stop = min(end, start + self.chunk_size)
+            chunk = np.frombuffer(self._mm, dtype=np.uint8, count=stop - start, offset=start)
+            total += int(np.count_nonzero(chunk == _NL))
+            del chunk
+            start = stop
+        return total
+
+    def _skip_lines(self, pos: int, count: int) -> int | None:
+        """Offset of the line count lines after the one starting at pos, or None past EOF."""
+        mm = self._mm
+        assert mm is not None
+        if count > self.stride:
+            # Far past the indexed prefix: count newlines per chunk instead of one find() per line.
+            while count > self.stride and pos < self.size:
+                stop = min(self.size, pos + self.chunk_size)
+                chunk = np.frombuffer(mm, dtype=np.uint8, count=stop - pos, offset=pos)
+                nl = np.flatnonzero(chunk == _NL)
+                del chunk
+                if len(nl) >= count:
+                    return int(nl[count - 1]) + pos + 1 if int(nl[count - 1]) + pos + 1 < self.size else None
+                count -= len(nl)
+                pos = stop
+            if pos >= self.size:
+                return None
+        for _ in range(count):
+            nl_at = mm.find(b"\n", pos)
+            if nl_at == -1:
+                return None
+            pos = nl_at + 1
+        return pos if pos < self.size else None
+
+    def line_start(self, line: int) -> int | None:
+        """Byte offset where line starts, or None if the file has fewer lines."""
+        if self._mm is None or line < 0:
+            return None
+        k = min(line // self.stride, len(self._checkpoints) - 1)
+        return self._skip_lines(self._checkpoints[k], line - k * self.stride)
+
+    def line_of_offset(self, offset: int) -> int:
+        """Line containing byte offset."""
+        offset = max(0, min(offset, self.size))
+        k = max(0, bisect.bisect_right(self._checkpoints, offset) - 1)
+        cp = self._checkpoints[k]
+        return k * self.stride + self._count_newlines(cp, offset)
+
+    def _line_end(self, start: int) -> int:
+        assert self._mm is not None
+        nl_at = self._mm.find(b"\n", start)
+        return self.size if nl_at == -1 else nl_at
+
+    def _decode(self, start: int, end: int, max_bytes: int) -> str:
+        assert self._mm is not None
+        raw = self._mm[start : min(end, start + max_bytes)]
+        if raw.endswith(b"\r"):
+            raw = raw[:-1]
+        return raw.decode(self.encoding, errors="replace")
+
+    def tail_start(self, count: int) -> int:
+        """Byte offset of the count-th line from the end (0 if the file is shorter); needs no index."""
+        if self._mm is None:
+            return 0
+        pos = self.size - (1 if self._ends_with_nl else 0)
+        for _ in range(max(1, count)):
+            pos = self._mm.rfind(b"\n", 0, pos)
+            if pos == -1:
+                return 0
+        return pos + 1
+
+    def prev_line_start(self, offset: int) -> int | None:
+        """Start of the line before the one starting at offset, or None at the first line."""
+        if self._mm is None or offset <= 0:
+            return None
+        return self._mm.rfind(b"\n", 0, offset - 1) + 1
+
+    def next_line_start(self, offset: int) -> int | None:
+        """Start of the line after the one starting at offset, or None at the last line."""
+        if self._mm is None:
+            return None
+        pos = self._line_end(offset) + 1
+        return pos if pos < self.size else None
+
+    def read_lines(self, first: int, count: int, max_bytes: int = MAX_LINE_BYTES) -> list[str]:
+        """Decode up to count lines starting at line first (CR before LF stripped, long lines cut at max_bytes)."""
+        return self.read_lines_at(self.line_start(first), count, max_bytes)
+
+    def read_lines_at(self, pos: int | None, count: int, max_bytes: int = MAX_LINE_BYTES) -> list[str]:
+        """Like read_lines, from the line starting at byte offset pos."""
+        out: list[str] = []
+        while pos is not None and pos < self.size and len(out) < count:
+            end = self._line_end(pos)
+            out.append(self._decode(pos, end, max_bytes))
+            pos = end + 1
+        return out
+
+    def read_line(self, line: int, max_bytes: int = MAX_LINE_BYTES) -> str | None:
+        lines = self.read_lines(line, 1, max_bytes)
+        return lines[0] if lines else None
+
+    # --- search ---
+
+    def _snap_to_line_end(self, offset: int) -> int:
+        if offset >= self.size:
+            return self.size
+        return min(self.size, self._line_end(offset) + 1)
+
+    def find(self, pattern: re.Pattern[bytes], start: int = 0, backward: bool = False) -> tuple[int, int] | None:
+        """(start, end) byte range of the first match at or after start (backward: the last one before start).
+
+        The file is searched in line-aligned chunks, so matches never span more than one chunk; patterns
+        should not match across newlines.
+        """
+        mm = self._mm
+        if mm is None:
+            return None
+        if not backward:
+            pos = max(0, start)
+            while pos < self.size:
+                end = self._snap_to_line_end(pos + self.chunk_size)
+                m = pattern.search(mm, pos, end)
+                while m is not None and m.end() == m.start() and m.start() < end:
+                    m = pattern.search(mm, m.start() + 1, end)  # skip empty matches
+                if m is not None:
+                    return m.start(), m.end()
+                pos = end
+            return None
+        limit = min(start, self.size)
+        while limit > 0:
+            lo = max(0, limit - self.chunk_size)
+            if lo > 0:
+                lo = self._snap_to_line_end(lo)
+                if lo >= limit:
+                    lo = max(0, limit - self.chunk_size)
+                    lo = 0 if lo == 0 else mm.rfind(b"\n", 0, lo) + 1
+            # Search to the end of limit's line so matches starting before limit are complete.
+            hi = self._snap_to_line_end(limit) if limit < self.size else self.size
+            last = None
+            for m in pattern.finditer(mm, lo, hi):
+                if m.start() >= limit:
+                    break
+                if m.end() > m.start():
+                    last = m
+            if last is not None:
+                return last.start(), last.end()
+            limit = lo
+        return None
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._fh.close()
+
+    def __enter__(self) -> MappedFile:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -0,0 +1,266 @@
+# pytui.lib.markdown_blocks - Block-level markdown parser used by MarkdownRenderable.
+# Headings (ATX), paragraphs, fenced code, bullet/ordered lists, block quotes, pipe tables,
+# thematic breaks, plus inline emphasis / code / strike / links. Blocks carry source offsets so an
+# appended or edited document is re-parsed only from around the block containing the first change.
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})\s*([^`\s]*)")
+_HEADING_RE = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_HR_RE = re.compile(r"^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_QUOTE_RE = re.compile(r"^ {0,3}> ?(.*)$")
+_LIST_RE = re.compile(r"^(\s*)([-*+]|\d{1,9}[.)])[ \t]+(.*)$")
+_TABLE_SEP_RE = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+
+
+@dataclass
+class ListItem:
+    """One list item: nesting level (indent // 2), marker ("-", "1." ...) and item text."""
+    level: int
+    marker: str
+    text: str
+
+
+@dataclass
+class MarkdownBlock:
+    """One block of a markdown document.
+
+    kind: "heading" | "paragraph" | "code" | "list" | "quote" | "table" | "hr".
+    raw is the block's source (lines joined by newline); start/end are char offsets of raw in the
+    document. text is the inner text of heading/paragraph/quote and the body of code blocks.
+    """
+    kind: str
+    raw: str
+    start: int
+    end: int
+    text: str = ""
+    level: int = 0
+    lang: str = ""
+    closed: bool = True
+    items: list[ListItem] = field(default_factory=list)
+    rows: list[list[str]] = field(default_factory=list)
+    align: list[str] = field(default_factory=list)
+
+    def same_source(self, other: MarkdownBlock) -> bool:
+        return self.kind == other.kind and self.raw == other.raw
+
+
+def _split_row(line: str) -> list[str]:
+    s = line.strip()
+    if s.startswith("|"):
+        s = s[1:]
+    if s.endswith("|") and not s.endswith("\\|"):
+        s = s[:-1]
+    return [c.strip() for c in s.split("|")]
+
+
+def _starts_block(line: str, next_line: str | None) -> bool:
+    """True if line would start a non-paragraph block (so it interrupts a paragraph)."""
+    if _FENCE_RE.match(line) or _HEADING_RE.match(line) or _HR_RE.match(line):
+        return True
+    if _QUOTE_RE.match(line) or _LIST_RE.match(line):
+        return True
+    return "|" in line and next_line is not None and bool(_TABLE_SEP_RE.match(next_line)) and "-" in next_line
+
+
+def parse_markdown_blocks(text: str, start: int = 0) -> list[MarkdownBlock]:
+    """Parse text[start:] (start must be at a line start) into blocks with document offsets."""
+    lines = text[start:].split("\n")
+    offsets: list[int] = []
+    pos = start
+    for line in lines:
+        offsets.append(pos)
+        pos += len(line) + 1
+    n = len(lines)
+    blocks: list[MarkdownBlock] = []
+
+    def make(kind: str, i0: int, i1: int, **kw) -> MarkdownBlock:
+        raw = "\n".join(lines[i0:i1])
+        return MarkdownBlock(kind=kind, raw=raw, start=offsets[i0], end=offsets[i0] + len(raw), **kw)
+
+    i = 0
+    while i < n:
+        line = lines[i]
+        if not line.strip():
+            i += 1
+            continue
+        m = _FENCE_RE.match(line)
+        if m:
+            fence = m.group(1)
+            j = i + 1
+            closed = False
+            while j < n:
+                s = lines[j].strip()
+                if s.startswith(fence[0] * len(fence)) and not s.strip(fence[0]):
+                    closed = True
+                    break
+                j += 1
+            body = "\n".join(lines[i + 1 : j])
+            blocks.append(make("code", i, j + 1 if closed else n, text=body, lang=m.group(2), closed=closed))
+            i = j + 1 if closed else n
+            continue
+        m = _HEADING_RE.match(line)
+        if m:
+            blocks.append(make("heading", i, i + 1, text=(m.group(2) or "").strip(), level=len(m.group(1))))
+            i += 1
+            continue
+        if _HR_RE.match(line):
+            blocks.append(make("hr", i, i + 1))
+            i += 1
+            continue
+        if _QUOTE_RE.match(line):
+            j = i
+            inner: list[str] = []
+            while j < n and lines[j].strip():
+                qm = _QUOTE_RE.match(lines[j])
+                if qm is None:
+                    break
+                inner.append(qm.group(1))
+                j += 1
+            blocks.append(make("quote", i, j, text="\n".join(inner)))
+            i = j
+            continue
+        if _LIST_RE.match(line):
+            j = i
+            items: list[ListItem] = []
+            while j < n:
+                cur = lines[j]
+                lm = _LIST_RE.match(cur)
+                if lm:
+                    items.append(ListItem(level=len(lm.group(1).expandtabs(4)) // 2, marker=lm.group(2), text=lm.group(3)))
+                elif cur.strip() and cur[:1] in (" ", "\t") and items:
+                    items[-1].text += " " + cur.strip()
+                elif not cur.strip() and j + 1 < n and _LIST_RE.match(lines[j + 1]):
+                    pass
+                else:
+                    break
+                j += 1
+            blocks.append(make("list", i, j, items=items))
+            i = j
+            continue
+        if "|" in line and i + 1 < n and "-" in lines[i + 1] and _TABLE_SEP_RE.match(lines[i + 1]):
+            align = []
+            for cell in _split_row(lines[i + 1]):
+                left, right = cell.startswith(":"), cell.endswith(":")
+                align.append("center" if left and right else "right" if right else "left")
+            rows = [_split_row(line)]
+            j = i + 2
+            while j < n and lines[j].strip() and "|" in lines[j]:
+                rows.append(_split_row(lines[j]))
+                j += 1
+            blocks.append(make("table", i, j, rows=rows, align=align))
+            i = j
+            continue
+        j = i + 1
+        while j < n and lines[j].strip() and not _starts_block(lines[j], lines[j + 1] if j + 1 < n else None):
+            j += 1
+        blocks.append(make("paragraph", i, j, text="\n".join(s.strip() for s in lines[i:j])))
+        i = j
+    return blocks
+
+
+def reparse_markdown_blocks(
+    old_text: str, old_blocks: list[MarkdownBlock], new_text: str
+) -> tuple[list[MarkdownBlock], int]:
+    """Re-parse new_text reusing old_blocks before the first change.
+
+    Returns (blocks, first) where blocks[:first] are the identical objects from old_blocks. Parsing
+    resumes one block before the block containing the first changed character, since a block can
+    absorb the lines that follow it (paragraph / list / quote / table continuation). When content was
+    only appended that is the last two blocks, so streaming costs O(tail) per update.
+    """
+    if new_text.startswith(old_text):
+        prefix = len(old_text)
+    else:
+        lo, hi = 0, min(len(old_text), len(new_text))
+        while lo < hi:  # longest common prefix by bisection (slice compares run in C)
+            mid = (lo + hi + 1) // 2
+            if old_text[:mid] == new_text[:mid]:
+                lo = mid
+            else:
+                hi = mid - 1
+        prefix = lo
+    starts = [b.start for b in old_blocks]
+    k = bisect_right(starts, prefix) - 2
+    if k <= 0:
+        # The change is in or before the first two blocks (possibly in leading blank lines before
+        # old_blocks[0].start, which a resume there would skip): nothing to reuse.
+        return parse_markdown_blocks(new_text), 0
+    resume = old_blocks[k].start
+    return old_blocks[:k] + parse_markdown_blocks(new_text, resume), k
+
+
+@dataclass
+class InlineSpan:
+    """Inline run of a paragraph/heading/list item with its emphasis flags."""
+    text: str
+    bold: bool = False
+    italic: bool = False
+    code: bool = False
+    strikethrough: bool = False
+    href: str | None = None
+
+
+_INLINE_RE = re.compile(
+    r"(?P<code>`+)(?P<code_text>.+?)(?P=code)"
+    r"|\*\*(?P<b1>.+?)\*\*"
+    r"|(?<!\w)__(?P<b2>.+?)__(?!\w)"
+    r"|~~(?P<strike>.+?)~~"
+    r"|\*(?!\s)(?P<i1>.+?)(?<!\s)\*"
+    r"|(?<!\w)_(?!\s)(?P<i2>.+?)(?<!\s)_(?!\w)"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<href>[^)\s]+)\)"
+)
+
+
+def parse_inline(text: str, conceal: bool = True, _style: InlineSpan | None = None) -> list[InlineSpan]:
+    """Split text into InlineSpans. With conceal=False the markdown markers stay visible (styled)."""
+    base = _style or InlineSpan("")
+    out: list[InlineSpan] = []
+
+    def emit(s: str, **flags) -> None:
+        if s:
+            out.append(
+                InlineSpan(
+                    s,
+                    bold=flags.get("bold", base.bold),
+                    italic=flags.get("italic", base.italic),
+                    code=flags.get("code", base.code),
+                    strikethrough=flags.get("strikethrough", base.strikethrough),
+                    href=flags.get("href", base.href),
+                )
+            )
+
+    pos = 0
+    for m in _INLINE_RE.finditer(text):
+        emit(text[pos : m.start()])
+        pos = m.end()
+        g = m.groupdict()
+        if g["code"] is not None:
+            emit(g["code_text"] if conceal else m.group(0), code=True)
+            continue
+        if g["link_text"] is not None:
+            style = InlineSpan("", base.bold, base.italic, base.code, base.strikethrough, g["href"])
+            out.extend(parse_inline(g["link_text"], conceal, style))
+            if not conceal:
+                emit(f"({g['href']})", href=g["href"])
+            continue
+        if g["b1"] is not None or g["b2"] is not None:
+            inner, marker = (g["b1"], "**") if g["b1"] is not None else (g["b2"], "__")
+            style = InlineSpan("", True, base.italic, base.code, base.strikethrough, base.href)
+        elif g["strike"] is not None:
+            inner, marker = g["strike"], "~~"
+            style = InlineSpan("", base.bold, base.italic, base.code, True, base.href)
+        else:
+            inner, marker = (g["i1"], "*") if g["i1"] is not None else (g["i2"], "_")
+            style = InlineSpan("", base.bold, True, base.code, base.strikethrough, base.href)
+        if not conceal:
+            emit(marker, bold=style.bold, italic=style.italic, strikethrough=style.strikethrough)
+        out.extend(parse_inline(inner, conceal, style))
+        if not conceal:
+            emit(marker, bold=style.bold, italic=style.italic, strikethrough=style.strikethrough)
+    emit(text[pos:])
+    return out
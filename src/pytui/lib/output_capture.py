@@ -1,14 +1,25 @@
 # pytui.lib.output_capture - Aligns with OpenTUI lib/output.capture.ts
 # Capture (write/claim_output), CapturedWritableStream.
+# Output is kept as a deque of raw pieces (str, or bytes decoded lazily on claim), bounded by max_bytes
+# with an overflow policy ("drop-oldest" or "spill" to a temp file). With coalesce=True, 'write' events
+# are batched into one per stream per flush_events() call (e.g. once per renderer frame); output waiting
+# for the next flush is bounded by the same max_bytes and policy.
+
+from __future__ import annotations
 
 import io
 import os
 import sys
-from typing import Literal
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Literal
 
 from pyee import EventEmitter
 
 StreamName = Literal["stdout", "stderr"]
+OverflowPolicy = Literal["drop-oldest", "spill"]
 
 
 class CapturedOutput(dict):
@@ -17,31 +28,207 @@ class CapturedOutput(dict):
     output: str
 
 
+def _join(pieces: Sequence[str | bytes]) -> str:
+    """Concatenate pieces; consecutive bytes pieces are joined before decoding (split UTF-8 safe)."""
+    if len(pieces) == 1 and isinstance(pieces[0], str):
+        return pieces[0]
+    out: list[str] = []
+    raw: list[bytes] = []
+    for piece in pieces:
+        if isinstance(piece, bytes):
+            raw.append(piece)
+            continue
+        if raw:
+            out.append(b"".join(raw).decode("utf-8", errors="replace"))
+            raw = []
+        out.append(piece)
+    if raw:
+        out.append(b"".join(raw).decode("utf-8", errors="replace"))
+    return "".join(out)
+
+
 class Capture(EventEmitter):
-    """Collects written output; write(stream, data), claim_output(). Aligns with OpenTUI Capture."""
+    """Collects written output; write(stream, data), claim_output(). Aligns with OpenTUI Capture.
+
+    max_bytes bounds the retained output (str pieces count characters, bytes pieces count bytes). When
+    it is exceeded, overflow="drop-oldest" discards the oldest output (see dropped) and
+    overflow="spill" moves it to an anonymous temp file that claim_output reads back. Writes are
+    thread-safe. In coalesce mode output not yet flushed as 'write' events obeys the same limit: the
+    oldest pending output is dropped from the events or spilled and read back by flush_events().
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        overflow: OverflowPolicy = "drop-oldest",
+        coalesce: bool = False,
+    ) -> None:
         super().__init__()
-        self._output: list[dict] = []
+        if overflow not in ("drop-oldest", "spill"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self.max_bytes = max_bytes
+        self.overflow = overflow
+        self.coalesce = coalesce
+        self._lock = threading.Lock()
+        self._pieces: deque[str | bytes] = deque()
+        self._size = 0  # retained in memory
+        self._chunks = 0
+        self._dropped = 0
+        self._spill: Any = None
+        self._spilled = 0
+        self._pending: deque[tuple[StreamName, str | bytes]] = deque()
+        self._pending_size = 0
+        self._pending_spill: dict[StreamName, Any] = {}
+        self._renderer: Any = None
 
     @property
     def size(self) -> int:
         """Number of captured chunks. Aligns with OpenTUI get size()."""
-        return len(self._output)
+        return self._chunks
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Output retained in memory plus spilled to disk."""
+        return self._size + self._spilled
+
+    @property
+    def dropped(self) -> int:
+        """Output discarded by the drop-oldest policy since the last claim."""
+        return self._dropped
 
-    def write(self, stream: StreamName, data: str) -> None:
-        """Append a chunk and emit 'write'. Aligns with OpenTUI write()."""
-        self._output.append({"stream": stream, "output": data})
-        self.emit("write", stream, data)
+    def write(self, stream: StreamName, data: str | bytes) -> None:
+        """Append a chunk and emit 'write' (or queue it for flush_events when coalescing).
+        Aligns with OpenTUI write(). bytes are stored as-is and decoded on claim."""
+        if not data:
+            return
+        first = False
+        with self._lock:
+            self._pieces.append(data)
+            self._size += len(data)
+            self._chunks += 1
+            if self.max_bytes is not None and self._size > self.max_bytes:
+                self._enforce_limit()
+            if self.coalesce:
+                first = not self._pending and not self._pending_spill
+                self._pending.append((stream, data))
+                self._pending_size += len(data)
+                if self.max_bytes is not None and self._pending_size > self.max_bytes:
+                    self._enforce_pending_limit()
+        if not self.coalesce:
+            self.emit("write", stream, data if isinstance(data, str) else _join([data]))
+        elif first and self._renderer is not None:
+            self._renderer.schedule_render()
+
+    def _enforce_limit(self) -> None:
+        limit = self.max_bytes or 0
+        pieces = self._pieces
+        if self.overflow == "spill":
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile()
+            while self._size > limit and pieces:
+                piece = pieces.popleft()
+                self._size -= len(piece)
+                raw = piece.encode("utf-8") if isinstance(piece, str) else piece
+                self._spill.write(raw)
+                self._spilled += len(raw)
+            return
+        while self._size > limit and pieces:
+            excess = self._size - limit
+            head = pieces[0]
+            if len(head) <= excess:
+                pieces.popleft()
+                self._size -= len(head)
+                self._dropped += len(head)
+            else:
+                pieces[0] = head[excess:]
+                self._size -= excess
+                self._dropped += excess
+
+    def _enforce_pending_limit(self) -> None:
+        limit = self.max_bytes or 0
+        pending = self._pending
+        while self._pending_size > limit and pending:
+            stream, head = pending[0]
+            excess = self._pending_size - limit
+            if self.overflow == "spill" or len(head) <= excess:
+                pending.popleft()
+                self._pending_size -= len(head)
+                if self.overflow == "spill":
+                    spill = self._pending_spill.get(stream)
+                    if spill is None:
+                        spill = self._pending_spill[stream] = tempfile.TemporaryFile()
+                    spill.write(head.encode("utf-8") if isinstance(head, str) else head)
+            else:
+                pending[0] = (stream, head[excess:])
+                self._pending_size -= excess
+
+    def flush_events(self) -> None:
+        """Emit one 'write' event per stream for everything written since the last flush (coalesce mode)."""
+        with self._lock:
+            pending, self._pending = self._pending, deque()
+            spills, self._pending_spill = self._pending_spill, {}
+            self._pending_size = 0
+        by_stream: dict[StreamName, list[str | bytes]] = {}
+        for stream, spill in spills.items():
+            spill.seek(0)
+            by_stream[stream] = [spill.read()]
+            spill.close()
+        for stream, piece in pending:
+            by_stream.setdefault(stream, []).append(piece)
+        for stream, pieces in by_stream.items():
+            self.emit("write", stream, _join(pieces))
+
+    def attach(self, renderer: Any) -> None:
+        """Coalesce 'write' events into one flush per renderer frame."""
+        self.coalesce = True
+        self._renderer = renderer
+        renderer.set_frame_callback(self._on_frame)
+
+    def detach(self) -> None:
+        if self._renderer is not None:
+            self._renderer.remove_frame_callback(self._on_frame)
+            self._renderer = None
+        self.flush_events()
+
+    def _on_frame(self, _delta_ms: float) -> None:
+        if self._pending or self._pending_spill:
+            self.flush_events()
 
     def claim_output(self) -> str:
-        """Return concatenated output and clear. Aligns with OpenTUI claimOutput()."""
-        out = "".join(chunk["output"] for chunk in self._output)
-        self._output.clear()
-        return out
+        """Return concatenated output and clear. Aligns with OpenTUI claimOutput().
+
+        The buffers are swapped out under the lock, so writers never wait on the join; a single
+        captured str chunk is returned without copying.
+        """
+        with self._lock:
+            pieces = self._pieces
+            spill = self._spill
+            self._reset()
+        if spill is None:
+            return _join(pieces) if pieces else ""
+        spill.seek(0)
+        head = spill.read()
+        spill.close()
+        return _join([head, *pieces])
+
+    def _reset(self) -> None:
+        self._pieces = deque()
+        self._size = 0
+        self._chunks = 0
+        self._dropped = 0
+        self._spill = None
+        self._spilled = 0
 
     def _clear(self) -> None:
-        self._output.clear()
+        with self._lock:
+            if self._spill is not None:
+                self._spill.close()
+            self._reset()
+            for spill in self._pending_spill.values():
+                spill.close()
+            self._pending = deque()
+            self._pending_spill = {}
+            self._pending_size = 0
 
 
 class CapturedWritableStream(io.TextIOBase):
@@ -59,10 +246,8 @@ class CapturedWritableStream(io.TextIOBase):
             self.columns = 80
             self.rows = 24
 
-    def write(self, data: str) -> int:
-        """Forward to capture.write(stream, data). Aligns with OpenTUI _write()."""
-        if isinstance(data, bytes):
-            data = data.decode("utf-8", errors="replace")
+    def write(self, data: str | bytes) -> int:
+        """Forward to capture.write(stream, data); bytes are passed through undecoded. Aligns with OpenTUI _write()."""
         self._capture.write(self._stream, data)
         return len(data)
 
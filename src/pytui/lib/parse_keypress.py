@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import re
-from typing import Literal, TypedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Literal, TypedDict
 
 KeyEventType = Literal["press", "repeat", "release"]
 
@@ -67,6 +69,53 @@ def _is_ctrl_key(code: str) -> bool:
     return code in _CTRL_CODES
 
 
+_MOUSE_SGR_RE = re.compile(r"^\x1b\[<\d+;\d+;\d+[Mm]$")
+_WINDOW_SIZE_RE = re.compile(r"^\x1b\[\d+;\d+;\d+t$")
+_CURSOR_POS_RE = re.compile(r"^\x1b\[\d+;\d+R$")
+_DEVICE_ATTRS_RE = re.compile(r"^\x1b\[\?[\d;]+c$")
+_MODE_REPORT_RE = re.compile(r"^\x1b\[\?[\d;]+\$y$")
+_OSC_RESPONSE_RE = re.compile(r"^\x1b\][\d;].*(\x1b\\|\x07)$")
+_KITTY_CSI_U_RE = re.compile(r"^\x1b\[\d+;\d+u$")
+
+# Results are shared read-only mappings: a fast-path table for printable/control characters and common
+# CSI/SS3 keys (identical with and without kitty keyboard), plus a bounded FIFO cache keyed by
+# (sequence, use_kitty_keyboard). Long sequences (pastes, terminal responses) are not cached.
+_CACHE_MAX = 1024
+_MAX_CACHED_LEN = 32
+_cache: dict[tuple[str, bool], Mapping[str, Any] | None] = {}
+_FAST: dict[str, Mapping[str, Any]] = {}
+
+
+def _decode(s: str | bytes | None) -> str:
+    if isinstance(s, bytes):
+        if len(s) == 1 and s[0] > 127:
+            return "\x1b" + chr(s[0] - 128)
+        return s.decode("utf-8", errors="replace")
+    return str(s) if s is not None else ""
+
+
+def parse_keypress_cached(s: str | bytes = "", use_kitty_keyboard: bool = False) -> Mapping[str, Any] | None:
+    """Like parse_keypress, but returns a read-only ParsedKey shared by every call with the same input.
+    Used by KeyHandler on the input path; key repeat and replayed input hit the cache."""
+    if not isinstance(s, str):
+        s = _decode(s)
+    hit = _FAST.get(s)
+    if hit is not None:
+        return hit
+    key = (s, bool(use_kitty_keyboard))
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+    parsed = _parse_keypress(s, key[1])
+    result = MappingProxyType(parsed) if parsed is not None else None
+    if len(s) <= _MAX_CACHED_LEN:
+        if len(_cache) >= _CACHE_MAX:
+            _cache.pop(next(iter(_cache), None), None)  # type: ignore[arg-type]
+        _cache[key] = result
+    return result
+
+
 def parse_keypress(
     s: str | bytes = "",
     options: dict | None = None,
@@ -74,32 +123,28 @@ def parse_keypress(
     """Parse key sequence to ParsedKey. Aligns OpenTUI parseKeypress(). Returns None for mouse/terminal responses/paste markers."""
     opts = options or {}
     use_kitty = opts.get("use_kitty_keyboard", opts.get("useKittyKeyboard", False))
+    parsed = parse_keypress_cached(s, use_kitty)
+    return dict(parsed) if parsed is not None else None  # type: ignore[return-value]
 
-    if isinstance(s, bytes):
-        if len(s) == 1 and s[0] > 127:
-            s = "\x1b" + chr(s[0] - 128)
-        else:
-            s = s.decode("utf-8", errors="replace")
-    else:
-        s = str(s) if s is not None else ""
 
+def _parse_keypress(s: str, use_kitty: bool) -> ParsedKey | None:
     # Filter mouse
-    if re.match(r"^\x1b\[<\d+;\d+;\d+[Mm]$", s):
+    if _MOUSE_SGR_RE.match(s):
         return None
     if s.startswith("\x1b[M") and len(s) >= 6:
         return None
     # Filter terminal responses
-    if re.match(r"^\x1b\[\d+;\d+;\d+t$", s):
+    if _WINDOW_SIZE_RE.match(s):
         return None
-    if re.match(r"^\x1b\[\d+;\d+R$", s):
+    if _CURSOR_POS_RE.match(s):
         return None
-    if re.match(r"^\x1b\[\?[\d;]+c$", s):
+    if _DEVICE_ATTRS_RE.match(s):
         return None
-    if re.match(r"^\x1b\[\?[\d;]+\$y$", s):
+    if _MODE_REPORT_RE.match(s):
         return None
     if s in ("\x1b[I", "\x1b[O"):
         return None
-    if re.match(r"^\x1b\][\d;].*(\x1b\\|\x07)$", s):
+    if _OSC_RESPONSE_RE.match(s):
         return None
     if s in ("\x1b[200~", "\x1b[201~"):
         return None
@@ -118,7 +163,7 @@ def parse_keypress(
     }
 
     # Kitty CSI u: ESC [ code ; modifier u (always parse when format matches)
-    if re.match(r"^\x1b\[\d+;\d+u$", s):
+    if _KITTY_CSI_U_RE.match(s):
         kitty = _parse_kitty_keyboard(s)
         if kitty is not None:
             return kitty
@@ -312,3 +357,23 @@ def _parse_kitty_keyboard(s: str) -> ParsedKey | None:
         key["name"] = "unknown"
         key["char"] = ""
     return key
+
+
+def _build_fast_table() -> None:
+    seqs = [chr(c) for c in range(0x80)]
+    for final in "ABCDEFH":
+        seqs.append("\x1b[" + final)
+        seqs.append("\x1bO" + final)
+        seqs.extend(f"\x1b[1;{mod}{final}" for mod in range(2, 9))
+    for code in (1, 2, 3, 4, 5, 6, 15, 17, 18, 19, 20, 21, 23, 24):
+        seqs.append(f"\x1b[{code}~")
+        seqs.extend(f"\x1b[{code};{mod}~" for mod in range(2, 9))
+    seqs.extend(("\x1bOP", "\x1bOQ", "\x1bOR", "\x1bOS", "\x1b[Z"))
+    for seq in seqs:
+        parsed = _parse_keypress(seq, False)
+        # Only sequences the kitty protocol parses the same way (kitty keys end in "u").
+        if parsed is not None and parsed == _parse_keypress(seq, True):
+            _FAST[seq] = MappingProxyType(parsed)
+
+
+_build_fast_table()
@@ -59,11 +59,11 @@ class MouseParser:
         m = _SGR_MOUSE.match(view)
         if not m:
             return None, 0
-        consumed = len(m.group(0))
-        btn = int(m.group(1))
-        x = int(m.group(2)) - 1
-        y = int(m.group(3)) - 1
-        press_release = m.group(4) == b"m"
+        event = self._sgr_event(int(m.group(1)), int(m.group(2)) - 1, int(m.group(3)) - 1, m.group(4) == b"m")
+        return event, m.end()
+
+    def _sgr_event(self, btn: int, x: int, y: int, press_release: bool) -> RawMouseEvent:
+        """Event for an SGR report with button code btn at 0-based (x, y); press_release for the 'm' final."""
         button = btn & 3
         is_scroll = (btn & 64) != 0
         is_motion = (btn & 32) != 0
@@ -93,14 +93,18 @@ class MouseParser:
                 self._mouse_buttons_pressed.add(button)
             elif event["type"] == "up":
                 self._mouse_buttons_pressed.clear()
-        return event, consumed
+        return event
 
     def _parse_basic(self, view: bytes) -> tuple[RawMouseEvent | None, int]:
         if not view.startswith(_BASIC_MOUSE_PREFIX) or len(view) < 6:
             return None, 0
-        button_byte = view[3] - 32
-        x = view[4] - 33
-        y = view[5] - 33
+        return self._basic_event(view[3], view[4], view[5]), 6
+
+    def _basic_event(self, b: int, cx: int, cy: int) -> RawMouseEvent:
+        """Event for an X10 report ESC [ M b cx cy (values offset by 32)."""
+        button_byte = b - 32
+        x = cx - 33
+        y = cy - 33
         button = button_byte & 3
         is_scroll = (button_byte & 64) != 0
         modifiers = {
@@ -125,4 +129,4 @@ class MouseParser:
                 "y": y,
                 "modifiers": modifiers,
             }
-        return ev, 6
+        return ev
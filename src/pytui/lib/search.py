@@ -0,0 +1,471 @@
+# pytui.lib.search - Background regex search over text buffers (PyTUI extension; no OpenTUI counterpart).
+# SearchIndex compiles the pattern once and scans the lines on a worker thread, slicing them from the source a
+# block at a time and searching chunks of about chunk_chars characters (one regex pass each, so the GIL is given
+# back between chunks and frames keep rendering). Finished chunks are queued with the generation they were
+# started in; poll() applies the current ones on the caller's (render) thread and emits "matches", so listeners
+# never run concurrently with the UI. Any edit bumps the generation, so slices taken around an edit are dropped.
+# Edits mark only the touched lines dirty: existing results are shifted, and just those lines are rescanned.
+# Sources: TextBuffer (appends are detected from the line count, replacements from epoch), EditBuffer (via
+# on_edit), ConsoleBuffer (keys are sequence numbers; evicted lines are dropped), or a plain list of lines.
+#
+#   index = SearchIndex(text_buffer, "error", case_sensitive=False)
+#   renderer.set_frame_callback(lambda dt: index.poll())
+#   index.on("matches", lambda hits: ...)     # [(line, start_col, end_col), ...]
+
+from __future__ import annotations
+
+import bisect
+import queue
+import re
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from pyee import EventEmitter
+
+Match = tuple[int, int, int]  # (line, start_col, end_col)
+
+DEFAULT_CHUNK_CHARS = 64 << 10
+# Lines sliced from the source per step of the worker.
+_BLOCK_LINES = 4096
+
+
+def compile_search_pattern(
+    pattern: str | re.Pattern[str], regex: bool = False, case_sensitive: bool = True
+) -> re.Pattern[str]:
+    """Compile a search query once: literal text unless regex, ^/$ anchored per line."""
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    flags = re.MULTILINE | (0 if case_sensitive else re.IGNORECASE)
+    return re.compile(pattern if regex else re.escape(pattern), flags)
+
+
+def scan_lines(
+    pattern: re.Pattern[str], lines: list[str], base: int = 0, chunk_chars: int = DEFAULT_CHUNK_CHARS
+) -> Iterator[tuple[int, int, list[int], list[list[tuple[int, int]]]]]:
+    """Yield (first, end, keys, hits) per chunk of lines: hits[i] are the (start_col, end_col) of line keys[i].
+
+    Lines are searched joined by newlines, one regex pass per chunk; a match is clipped to the line it starts
+    on and empty matches are skipped.
+    """
+    n = len(lines)
+    i = 0
+    while i < n:
+        j = i
+        size = 0
+        starts: list[int] = []
+        while j < n and (size < chunk_chars or j == i):
+            starts.append(size)
+            size += len(lines[j]) + 1
+            j += 1
+        text = "\n".join(lines[i:j])
+        keys: list[int] = []
+        hits: list[list[tuple[int, int]]] = []
+        for m in pattern.finditer(text):
+            s, e = m.span()
+            if s == e:
+                continue
+            li = bisect.bisect_right(starts, s) - 1
+            line_start = starts[li]
+            e = min(e, line_start + len(lines[i + li]))
+            if e <= s:
+                continue  # match starts at the newline
+            key = base + i + li
+            if keys and keys[-1] == key:
+                hits[-1].append((s - line_start, e - line_start))
+            else:
+                keys.append(key)
+                hits.append([(s - line_start, e - line_start)])
+        yield base + i, base + j, keys, hits
+        i = j
+
+
+# --- sources ---
+
+
+class LinesSource:
+    """A list of lines searched as-is; call SearchIndex.notify_edit after changing it."""
+
+    def __init__(self, lines: list[str]) -> None:
+        self._lines = lines
+
+    def first_line(self) -> int:
+        return 0
+
+    def end_line(self) -> int:
+        return len(self._lines)
+
+    def lines(self, start: int, end: int) -> list[str]:
+        return self._lines[start:end]
+
+    def attach(self, index: SearchIndex) -> None:
+        pass
+
+    def detach(self) -> None:
+        pass
+
+    def sync(self, index: SearchIndex) -> None:
+        pass
+
+
+class TextBufferSource(LinesSource):
+    """TextBuffer: appended lines are scanned as they arrive; set_text / clear rescans everything."""
+
+    def __init__(self, buffer: Any) -> None:
+        self._buffer = buffer
+        self._epoch = buffer.epoch
+        self._count = buffer.get_line_count()
+        self._length = buffer.length
+
+    def end_line(self) -> int:
+        return self._buffer.get_line_count()
+
+    def lines(self, start: int, end: int) -> list[str]:
+        return self._buffer.get_lines(start, end)
+
+    def sync(self, index: SearchIndex) -> None:
+        b = self._buffer
+        epoch, count, length = b.epoch, b.get_line_count(), b.length
+        if epoch != self._epoch:
+            index.rescan()
+        elif length != self._length:
+            # Appends only touch the old last line and add new ones.
+            index.notify_edit(self._count - 1, self._count, count)
+        self._epoch, self._count, self._length = epoch, count, length
+
+
+class EditBufferSource(LinesSource):
+    """EditBuffer: keeps its own line list in step with on_edit, so rescans never split the whole text."""
+
+    def __init__(self, buffer: Any) -> None:
+        self._buffer = buffer
+        super().__init__(buffer.text.split("\n"))
+        self._index: SearchIndex | None = None
+
+    def attach(self, index: SearchIndex) -> None:
+        self._index = index
+        self._buffer.on_edit(self._on_edit)
+
+    def detach(self) -> None:
+        self._buffer.off_edit(self._on_edit)
+        self._index = None
+
+    def _on_edit(self, start: int, removed: str, inserted: str) -> None:
+        text = self._buffer.text
+        first = text.count("\n", 0, start)
+        old_end = first + removed.count("\n") + 1
+        new_end = first + inserted.count("\n") + 1
+        line_start = text.rfind("\n", 0, start) + 1
+        line_end = text.find("\n", start + len(inserted))
+        self._lines[first:old_end] = text[line_start : len(text) if line_end == -1 else line_end].split("\n")
+        if self._index is not None:
+            self._index.notify_edit(first, old_end, new_end)
+
+
+class ConsoleBufferSource(LinesSource):
+    """ConsoleBuffer: line keys are sequence numbers (ConsoleBuffer.seq_range); evicted lines are dropped."""
+
+    def __init__(self, buffer: Any) -> None:
+        self._buffer = buffer
+        self._start, self._end = buffer.seq_range()
+        self._tail = self._last_text()
+
+    def _last_text(self) -> str | None:
+        last = self._buffer.get_lines_by_seq(self._end - 1, self._end)
+        return last[0][0] if last and last[0] is not None else None
+
+    def first_line(self) -> int:
+        return self._buffer.seq_range()[0]
+
+    def end_line(self) -> int:
+        return self._buffer.seq_range()[1]
+
+    def lines(self, start: int, end: int) -> list[str]:
+        return [line[0] if line is not None else "" for line in self._buffer.get_lines_by_seq(start, end)]
+
+    def sync(self, index: SearchIndex) -> None:
+        start, end = self._buffer.seq_range()
+        if start > self._start:
+            index.drop_before(start)
+        prev_end = self._end
+        self._start, self._end = start, end
+        if end > prev_end:
+            # Rescan the previous last line too (it may have been open); keys are seqs, so nothing shifts.
+            first = max(start, prev_end - 1)
+            index.notify_edit(first, max(first, prev_end), end)
+        elif end > start:
+            tail = self._last_text()
+            if tail != self._tail:
+                index.notify_edit(end - 1, end, end)  # open line continued by write()
+        self._tail = self._last_text()
+
+
+def make_source(obj: Any) -> LinesSource:
+    """Pick the source adapter for obj (TextBuffer, EditBuffer, ConsoleBuffer or a list of lines)."""
+    if isinstance(obj, LinesSource):
+        return obj
+    if isinstance(obj, list):
+        return LinesSource(obj)
+    if hasattr(obj, "on_edit"):
+        return EditBufferSource(obj)
+    if hasattr(obj, "seq_range"):
+        return ConsoleBufferSource(obj)
+    if hasattr(obj, "epoch"):
+        return TextBufferSource(obj)
+    raise TypeError(f"cannot search {type(obj).__name__}")
+
+
+# --- index ---
+
+
+class SearchIndex(EventEmitter):
+    """Incremental regex search over a buffer, scanned on a worker thread.
+
+    Events (emitted from poll()): "matches" (list of (line, start_col, end_col) just found), "invalidate"
+    (first, old_end, new_end: results for lines [first, old_end) were dropped and later ones shifted by
+    new_end - old_end), "cleared" (pattern changed or full rescan) and "done" (no dirty lines left).
+    With background=False poll() scans synchronously instead (tests, small buffers).
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        pattern: str | re.Pattern[str] | None = None,
+        *,
+        regex: bool = False,
+        case_sensitive: bool = True,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        background: bool = True,
+    ) -> None:
+        super().__init__()
+        self._source = make_source(source)
+        self.chunk_chars = max(1024, chunk_chars)
+        self.background = background
+        self._pattern: re.Pattern[str] | None = None
+        self._keys: list[int] = []  # sorted lines with matches
+        self._hits: list[list[tuple[int, int]]] = []
+        self._dirty: list[list[int]] = []  # sorted disjoint [start, end) line ranges awaiting a scan
+        self._gen = 0
+        self._results: queue.SimpleQueue[tuple[int, int, int, list[int], list[list[tuple[int, int]]]]] = (
+            queue.SimpleQueue()
+        )
+        self._submitted = False  # dirty ranges have been handed to a scan
+        self._scanning = False
+        self._source.attach(self)
+        if pattern is not None:
+            self.set_pattern(pattern, regex=regex, case_sensitive=case_sensitive)
+
+    # --- query ---
+
+    @property
+    def pattern(self) -> re.Pattern[str] | None:
+        return self._pattern
+
+    def set_pattern(
+        self, pattern: str | re.Pattern[str] | None, regex: bool = False, case_sensitive: bool = True
+    ) -> None:
+        """Replace the query (search-as-you-type): cancel the running scan and start over; None/"" clears."""
+        self._pattern = compile_search_pattern(pattern, regex, case_sensitive) if pattern else None
+        self.rescan()
+
+    def rescan(self) -> None:
+        """Drop all results and scan the whole source again."""
+        self._keys = []
+        self._hits = []
+        self._dirty = []
+        first, end = self._source.first_line(), self._source.end_line()
+        if self._pattern is not None and end > first:
+            self._dirty = [[first, end]]
+        self._restart()
+        self.emit("cleared")
+
+    # --- edits ---
+
+    def notify_edit(self, first: int, old_end: int, new_end: int) -> None:
+        """Lines [first, old_end) were replaced by [first, new_end): shift results and rescan just those lines."""
+        delta = new_end - old_end
+        keys = self._keys
+        i = bisect.bisect_left(keys, first)
+        j = bisect.bisect_left(keys, old_end)
+        if delta:
+            keys[i:] = [k + delta for k in keys[j:]]
+        else:
+            del keys[i:j]
+        del self._hits[i:j]
+        dirty: list[list[int]] = []
+        for a, b in self._dirty:
+            if a < first:
+                dirty.append([a, min(b, first)])
+            if b > old_end:
+                dirty.append([max(a, old_end) + delta, b + delta])
+        if self._pattern is not None and new_end > first:
+            dirty.append([first, new_end])
+        self._dirty = _merge(dirty)
+        self._restart()
+        self.emit("invalidate", first, old_end, new_end)
+
+    def drop_before(self, line: int) -> None:
+        """Forget results and pending work for lines < line (evicted from the source)."""
+        i = bisect.bisect_left(self._keys, line)
+        del self._keys[:i]
+        del self._hits[:i]
+        self._dirty = [[max(a, line), b] for a, b in self._dirty if b > line]
+
+    # --- scanning ---
+
+    def _restart(self) -> None:
+        # Bumping the generation makes the running worker stop and its queued chunks stale; the dirty ranges
+        # (which still include every chunk not yet applied) are resubmitted on the next poll.
+        self._gen += 1
+        self._submitted = False
+
+    def _submit(self) -> None:
+        self._submitted = True
+        if not self._dirty or self._pattern is None:
+            return
+        self._scanning = True
+        args = (self._gen, self._pattern, [tuple(r) for r in self._dirty])
+        if not self.background:
+            self._run(*args)
+            return
+        threading.Thread(target=self._run, args=args, name="pytui-search", daemon=True).start()
+
+    def _run(self, gen: int, pattern: re.Pattern[str], ranges: list[tuple[int, int]]) -> None:
+        source = self._source
+        for a, b in ranges:
+            while a < b:
+                lines = source.lines(a, min(b, a + _BLOCK_LINES))
+                if not lines:
+                    break
+                for first, end, keys, hits in scan_lines(pattern, lines, a, self.chunk_chars):
+                    if gen != self._gen:
+                        return
+                    self._results.put((gen, first, end, keys, hits))
+                    if self.background:
+                        time.sleep(0)  # let the render thread run between chunks
+                a += len(lines)
+
+    def poll(self) -> int:
+        """Pick up source changes and apply finished chunks; returns the number of new matches."""
+        self._source.sync(self)
+        if not self._submitted:
+            self._submit()
+        found: list[Match] = []
+        while True:
+            try:
+                gen, first, end, keys, hits = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if gen != self._gen:
+                continue
+            self._apply(first, end, keys, hits)
+            for key, ranges in zip(keys, hits):
+                found.extend((key, s, e) for s, e in ranges)
+        if found:
+            self.emit("matches", found)
+        if self._scanning and not self._dirty:
+            self._scanning = False
+            self.emit("done")
+        return len(found)
+
+    def _apply(self, first: int, end: int, keys: list[int], hits: list[list[tuple[int, int]]]) -> None:
+        i = bisect.bisect_left(self._keys, first)
+        j = bisect.bisect_left(self._keys, end)
+        self._keys[i:j] = keys
+        self._hits[i:j] = hits
+        dirty: list[list[int]] = []
+        for a, b in self._dirty:
+            if a < first:
+                dirty.append([a, min(b, first)])
+            if b > end:
+                dirty.append([max(a, end), b])
+        self._dirty = dirty
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Poll until no dirty lines are left (for scripts and tests); False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self.poll()
+            if not self._dirty:
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+
+    @property
+    def scanning(self) -> bool:
+        """True while lines are still waiting to be scanned."""
+        return bool(self._dirty)
+
+    @property
+    def pending_lines(self) -> int:
+        return sum(b - a for a, b in self._dirty)
+
+    # --- results ---
+
+    @property
+    def match_count(self) -> int:
+        return sum(len(h) for h in self._hits)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines with at least one match."""
+        return len(self._keys)
+
+    def matches(self) -> list[Match]:
+        return self.matches_in_lines(0, None)
+
+    def matches_in_lines(self, start: int, end: int | None = None) -> list[Match]:
+        """Matches on lines [start, end), in order (e.g. the visible rows)."""
+        keys = self._keys
+        i = bisect.bisect_left(keys, start)
+        j = len(keys) if end is None else bisect.bisect_left(keys, end)
+        return [(keys[k], s, e) for k in range(i, j) for s, e in self._hits[k]]
+
+    def line_matches(self, line: int) -> list[tuple[int, int]]:
+        i = bisect.bisect_left(self._keys, line)
+        return list(self._hits[i]) if i < len(self._keys) and self._keys[i] == line else []
+
+    def next_match(self, line: int, col: int = -1) -> Match | None:
+        """First match after (line, col); None when there is none (yet)."""
+        i = bisect.bisect_left(self._keys, line)
+        if i < len(self._keys) and self._keys[i] == line:
+            for s, e in self._hits[i]:
+                if s > col:
+                    return line, s, e
+            i += 1
+        if i < len(self._keys):
+            s, e = self._hits[i][0]
+            return self._keys[i], s, e
+        return None
+
+    def prev_match(self, line: int, col: int) -> Match | None:
+        """Last match starting before (line, col)."""
+        i = bisect.bisect_right(self._keys, line) - 1
+        if i >= 0 and self._keys[i] == line:
+            for s, e in reversed(self._hits[i]):
+                if s < col:
+                    return line, s, e
+            i -= 1
+        if i >= 0:
+            s, e = self._hits[i][-1]
+            return self._keys[i], s, e
+        return None
+
+    def close(self) -> None:
+        """Stop scanning and detach from the source."""
+        self._gen += 1
+        self._dirty = []
+        self._source.detach()
+        self.remove_all_listeners()
+
+
+def _merge(ranges: list[list[int]]) -> list[list[int]]:
+    out: list[list[int]] = []
+    for a, b in sorted(r for r in ranges if r[1] > r[0]):
+        if out and a <= out[-1][1]:
+            out[-1][1] = max(out[-1][1], b)
+        else:
+            out.append([a, b])
+    return out
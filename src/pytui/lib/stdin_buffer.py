@@ -1,10 +1,16 @@
 # pytui.lib.stdin_buffer - Aligns with OpenTUI lib/stdin-buffer.ts
 # StdinBuffer: process(data), flush(), clear(), getBuffer(), destroy(); emit 'data', 'paste'; timeout flush.
+# The timeout flush is a deadline: with use_timer=False (Renderer) the owner's loop calls check_timeout()
+# each tick, so no thread is started per incomplete sequence and every 'data' event stays on that thread.
+# Tokenizing is a single pass over offsets (ESC, CSI, OSC, DCS, APC, SS3, bracketed paste): terminators are
+# found with str.find / compiled-regex search from where the previous chunk stopped, so long pastes, string
+# sequences split over many reads and mouse report streams cost O(n) instead of O(n^2).
 
 from __future__ import annotations
 
 import re
 import threading
+import time
 from typing import Literal
 
 from pyee import EventEmitter
@@ -13,102 +19,128 @@ ESC = "\x1b"
 BRACKETED_PASTE_START = "\x1b[200~"
 BRACKETED_PASTE_END = "\x1b[201~"
 
+_ST = ESC + "\\"
+_CSI_FINAL = re.compile(r"[\x40-\x7e]")
+_SGR_PARAMS = re.compile(r"\d+;\d+;\d+")
+# Introducers of sequences terminated by ST (OSC also accepts BEL).
+_STRING_KINDS = "]P_"
+
+
+def _scan_sequence(buf: str, i: int, resume: int = 0) -> int:
+    """End offset (exclusive) of the escape sequence at buf[i] == ESC, or -1 if it is incomplete.
+
+    resume is where a previous scan of the same sequence stopped; terminator searches continue from there.
+    """
+    n = len(buf)
+    if i + 1 >= n:
+        return -1
+    kind = buf[i + 1]
+    start = max(i + 2, resume)
+    if kind == "[":
+        if i + 2 < n and buf[i + 2] == "M":
+            # X10 mouse: ESC [ M + 3 bytes
+            return i + 6 if i + 6 <= n else -1
+        sgr = i + 2 < n and buf[i + 2] == "<"
+        m = _CSI_FINAL.search(buf, start)
+        while m is not None:
+            j = m.start()
+            # SGR mouse only ends on M/m once it has its three numeric parameters.
+            if not (sgr and buf[j] in "Mm" and _SGR_PARAMS.fullmatch(buf, i + 3, j) is None):
+                return j + 1
+            m = _CSI_FINAL.search(buf, j + 1)
+        return -1
+    if kind in _STRING_KINDS:
+        st = buf.find(_ST, max(i + 2, start - 1))
+        end = st + 2 if st != -1 else -1
+        if kind == "]":
+            bel = buf.find("\x07", start, end if end != -1 else n)
+            if bel != -1:
+                end = bel + 1
+        return end
+    if kind == "O":
+        # SS3: ESC O + one character
+        return i + 3 if i + 3 <= n else -1
+    return i + 2
+
+
+def _tokenize(buf: str, pos: int = 0, resume: int = 0) -> tuple[list[str], int, int, bool]:
+    """Split buf[pos:] into complete sequences in one pass.
+
+    Returns (sequences, rest, resume, paste). Without paste, buf[rest:] is an incomplete escape sequence
+    (rest == len(buf) when there is none) whose terminator scan continues from resume. With paste=True
+    tokenizing stopped at a bracketed paste start and buf[rest:] is paste content.
+    """
+    out: list[str] = []
+    n = len(buf)
+    paste_at = buf.find(BRACKETED_PASTE_START, pos)
+    while pos < n:
+        esc = buf.find(ESC, pos)
+        if esc == -1:
+            out.extend(buf[pos:])
+            break
+        if esc > pos:
+            out.extend(buf[pos:esc])
+        end = _scan_sequence(buf, esc, resume)
+        resume = 0
+        # A paste start inside (or after the unfinished) sequence wins: e.g. a pending lone ESC, or ESC O,
+        # followed by ESC [200~ is not one ESC ESC / SS3 sequence.
+        if paste_at > esc and (end == -1 or paste_at < end):
+            head, rest, _, _ = _tokenize(buf[:paste_at], esc)
+            out.extend(head)
+            if rest < paste_at:
+                out.append(buf[rest:paste_at])  # unfinished sequence before the paste, as a timeout flush would
+            return out, paste_at + len(BRACKETED_PASTE_START), 0, True
+        if end == -1:
+            return out, esc, n, False
+        seq = buf[esc:end]
+        if seq == BRACKETED_PASTE_START:
+            return out, end, 0, True
+        out.append(seq)
+        pos = end
+    return out, n, 0, False
+
 
 def _is_complete_sequence(data: str) -> Literal["complete", "incomplete", "not-escape"]:
     """Check if string is a complete escape sequence. Aligns OpenTUI isCompleteSequence."""
     if not data.startswith(ESC):
         return "not-escape"
-    if len(data) == 1:
-        return "incomplete"
-    after = data[1:]
-    if after.startswith("["):
-        if after.startswith("[M"):
-            return "complete" if len(data) >= 6 else "incomplete"
-        return _is_complete_csi(data)
-    if after.startswith("]"):
-        return "complete" if (ESC + "\\" in data or "\x07" in data) else "incomplete"
-    if after.startswith("P"):
-        return "complete" if (ESC + "\\" in data) else "incomplete"
-    if after.startswith("_"):
-        return "complete" if (ESC + "\\" in data) else "incomplete"
-    if after.startswith("O"):
-        return "complete" if len(after) >= 2 else "incomplete"
-    if len(after) == 1:
-        return "complete"
-    return "complete"
-
-
-def _is_complete_csi(data: str) -> Literal["complete", "incomplete"]:
-    """CSI: ESC [ ... ends with 0x40-0x7E."""
-    if not data.startswith(ESC + "["):
-        return "complete"
-    if len(data) < 3:
-        return "incomplete"
-    payload = data[2:]
-    last_code = ord(payload[-1])
-    if 0x40 <= last_code <= 0x7E:
-        if payload.startswith("O"):
-            # SS3: ESC O + single letter (need 2 chars after ESC)
-            return "complete" if len(payload) >= 2 else "incomplete"
-        if payload.startswith("<") and (payload.endswith("M") or payload.endswith("m")):
-            if re.match(r"^<\d+;\d+;\d+[Mm]$", payload):
-                return "complete"
-            parts = payload[1:-1].split(";")
-            if len(parts) == 3 and all(p.isdigit() for p in parts):
-                return "complete"
-            return "incomplete"
-        return "complete"
-    return "incomplete"
+    return "incomplete" if _scan_sequence(data, 0) == -1 else "complete"
 
 
 def _extract_complete_sequences(buffer: str) -> tuple[list[str], str]:
     """Split buffer into complete sequences and remainder. Aligns OpenTUI extractCompleteSequences."""
-    sequences: list[str] = []
-    pos = 0
-    while pos < len(buffer):
-        remaining = buffer[pos:]
-        if remaining.startswith(ESC):
-            seq_end = 1
-            while seq_end <= len(remaining):
-                candidate = remaining[:seq_end]
-                status = _is_complete_sequence(candidate)
-                if status == "complete":
-                    sequences.append(candidate)
-                    pos += seq_end
-                    break
-                if status == "incomplete":
-                    seq_end += 1
-                else:
-                    sequences.append(candidate)
-                    pos += seq_end
-                    break
-            else:
-                return sequences, remaining
-        else:
-            sequences.append(remaining[0])
-            pos += 1
-    return sequences, ""
+    seqs, rest, _, _ = _tokenize(buffer)
+    return seqs, buffer[rest:]
 
 
 class StdinBuffer(EventEmitter):
-    """Buffer stdin and emit complete sequences via 'data'; bracketed paste via 'paste'. Aligns OpenTUI StdinBuffer."""
+    """Buffer stdin and emit complete sequences via 'data'; bracketed paste via 'paste'. Aligns OpenTUI StdinBuffer.
+
+    Each process() call tokenizes its input once and then emits the resulting batch of sequences.
+    options: timeout (ms, lone ESC), timeout_incomplete (ms, other incomplete sequences), use_timer
+    (default True: flush from a threading.Timer; False: the caller polls check_timeout()).
+    """
 
     def __init__(self, options: dict | None = None) -> None:
         super().__init__()
         opts = options or {}
         self._timeout_ms = opts.get("timeout", 10)
         self._timeout_incomplete_ms = opts.get("timeout_incomplete", 2000)
-        self._buffer = ""
+        self._use_timer = opts.get("use_timer", True)
+        self._deadline: float | None = None
+        # Incomplete trailing sequence, kept as chunks: an OSC/DCS/APC split over many reads is only joined
+        # once its terminator has arrived.
+        self._pending: list[str] = []
+        self._pending_resume = 0
         self._paste_mode = False
-        self._paste_buffer = ""
+        self._paste_chunks: list[str] = []
+        self._paste_tail = ""
         self._timeout_handle: threading.Timer | None = None
 
     def process(self, data: str | bytes) -> None:
         """Feed input; emit 'data' for each complete sequence, 'paste' for bracketed paste. Aligns OpenTUI process()."""
         # Clear any pending timeout first (align OpenTUI) so timer cannot fire and flush partial buffer while we append.
-        if self._timeout_handle:
-            self._timeout_handle.cancel()
-            self._timeout_handle = None
+        self._cancel_timeout()
         if isinstance(data, bytes):
             if len(data) == 1 and data[0] > 127:
                 s = ESC + chr(data[0] - 128)
@@ -116,55 +148,93 @@ class StdinBuffer(EventEmitter):
                 s = data.decode("utf-8", errors="replace")
         else:
             s = data
-        if not s and not self._buffer:
+        if not s and not self._pending:
             self.emit("data", "")  # type: ignore[arg-type]
             return
-        self._buffer += s
-        if self._paste_mode:
-            self._paste_buffer += self._buffer
-            self._buffer = ""
-            idx = self._paste_buffer.find(BRACKETED_PASTE_END)
-            if idx != -1:
-                content = self._paste_buffer[:idx]
-                rest = self._paste_buffer[idx + len(BRACKETED_PASTE_END) :]
-                self._paste_mode = False
-                self._paste_buffer = ""
-                self.emit("paste", content)  # type: ignore[arg-type]
-                if rest:
-                    self.process(rest)
-            return
-        start_idx = self._buffer.find(BRACKETED_PASTE_START)
-        if start_idx != -1:
-            before = self._buffer[:start_idx]
-            seqs, _ = _extract_complete_sequences(before)
+        while s:
+            if self._paste_mode:
+                rest = self._feed_paste(s)
+                if rest is None:
+                    return
+                s = rest
+                continue
+            pending = self._pending
+            resume = 0
+            if pending:
+                if self._awaiting_string_terminator(s):
+                    pending.append(s)
+                    self._pending_resume += len(s)
+                    break
+                resume = self._pending_resume
+                s = "".join(pending) + s
+                pending.clear()
+            seqs, rest, resume, paste = _tokenize(s, 0, resume)
             for seq in seqs:
                 self.emit("data", seq)  # type: ignore[arg-type]
-            self._buffer = self._buffer[start_idx + len(BRACKETED_PASTE_START) :]
-            self._paste_mode = True
-            self._paste_buffer = self._buffer
-            self._buffer = ""
-            idx = self._paste_buffer.find(BRACKETED_PASTE_END)
-            if idx != -1:
-                content = self._paste_buffer[:idx]
-                rest = self._paste_buffer[idx + len(BRACKETED_PASTE_END) :]
-                self._paste_mode = False
-                self._paste_buffer = ""
-                self.emit("paste", content)  # type: ignore[arg-type]
-                if rest:
-                    self.process(rest)
-            return
-        seqs, remainder = _extract_complete_sequences(self._buffer)
-        self._buffer = remainder
-        for seq in seqs:
-            self.emit("data", seq)  # type: ignore[arg-type]
-        if self._buffer:
+            if paste:
+                self._paste_mode = True
+                s = s[rest:]
+                if not s:
+                    return
+                continue
+            if rest < len(s):
+                self._pending = [s[rest:]]
+                self._pending_resume = resume - rest
+            break
+        if self._pending:
             self._schedule_flush()
 
+    def _awaiting_string_terminator(self, s: str) -> bool:
+        """True if the pending sequence is an OSC/DCS/APC and s does not complete it (no join needed)."""
+        head = self._pending[0]
+        if len(head) < 2 or head[1] not in _STRING_KINDS:
+            return False
+        probe = self._pending[-1][-1:] + s[:1]  # ST split across chunks
+        if _ST in probe or s.find(_ST) != -1:
+            return False
+        lookback = len(BRACKETED_PASTE_START) - 1
+        if BRACKETED_PASTE_START in "".join(self._pending[-lookback:])[-lookback:] + s:
+            return False  # the paste start cuts the sequence short (see _tokenize)
+        return not (head[1] == "]" and "\x07" in s)
+
+    def _feed_paste(self, s: str) -> str | None:
+        """Add s to the paste; on the end marker emit 'paste' and return the text after it, else None."""
+        tail = self._paste_tail
+        idx = (tail + s).find(BRACKETED_PASTE_END)
+        if idx == -1:
+            self._paste_chunks.append(s)
+            self._paste_tail = (tail + s)[-(len(BRACKETED_PASTE_END) - 1) :]
+            return None
+        cut = idx - len(tail)  # marker offset in s; negative if it started in an earlier chunk
+        joined = "".join(self._paste_chunks)
+        content = joined + s[:cut] if cut >= 0 else joined[: len(joined) + cut]
+        self._paste_mode = False
+        self._paste_chunks = []
+        self._paste_tail = ""
+        self.emit("paste", content)  # type: ignore[arg-type]
+        return s[cut + len(BRACKETED_PASTE_END) :]
+
+    @property
+    def deadline(self) -> float | None:
+        """time.monotonic() at which the pending incomplete sequence is flushed, or None."""
+        return self._deadline
+
+    def check_timeout(self, now: float | None = None) -> bool:
+        """Flush and emit the pending sequence if its deadline has passed; returns True if it did."""
+        if self._deadline is None or (time.monotonic() if now is None else now) < self._deadline:
+            return False
+        for seq in self.flush():
+            self.emit("data", seq)  # type: ignore[arg-type]
+        return True
+
     def _schedule_flush(self) -> None:
         """Schedule flush after timeout. Single ESC: short timeout; incomplete CSI (\x1b[, \x1b[1;...): long timeout."""
+        ms = self._timeout_ms if self._pending == [ESC] else self._timeout_incomplete_ms
+        self._deadline = time.monotonic() + ms / 1000.0
+        if not self._use_timer:
+            return
         if self._timeout_handle:
             self._timeout_handle.cancel()
-        ms = self._timeout_ms if self._buffer == ESC else self._timeout_incomplete_ms
         def _run() -> None:
             self._timeout_handle = None
             flushed = self.flush()
@@ -174,29 +244,34 @@ class StdinBuffer(EventEmitter):
         self._timeout_handle.daemon = True
         self._timeout_handle.start()
 
-    def flush(self) -> list[str]:
-        """Flush buffer and return pending as list. Aligns OpenTUI flush()."""
+    def _cancel_timeout(self) -> None:
+        self._deadline = None
         if self._timeout_handle:
             self._timeout_handle.cancel()
             self._timeout_handle = None
-        if not self._buffer:
+
+    def flush(self) -> list[str]:
+        """Flush buffer and return pending as list. Aligns OpenTUI flush()."""
+        self._cancel_timeout()
+        if not self._pending:
             return []
-        out = [self._buffer]
-        self._buffer = ""
+        out = ["".join(self._pending)]
+        self._pending = []
+        self._pending_resume = 0
         return out
 
     def clear(self) -> None:
         """Clear buffer and paste state. Aligns OpenTUI clear()."""
-        if self._timeout_handle:
-            self._timeout_handle.cancel()
-            self._timeout_handle = None
-        self._buffer = ""
+        self._cancel_timeout()
+        self._pending = []
+        self._pending_resume = 0
         self._paste_mode = False
-        self._paste_buffer = ""
+        self._paste_chunks = []
+        self._paste_tail = ""
 
     def get_buffer(self) -> str:
         """Return current buffer. Aligns OpenTUI getBuffer()."""
-        return self._buffer
+        return "".join(self._pending)
 
     def destroy(self) -> None:
         """Aligns OpenTUI destroy()."""
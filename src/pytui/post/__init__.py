@@ -1,7 +1,11 @@
 # pytui.post - 后处理与滤镜扩展点
 
 from pytui.post.filters import (
+    FILTERS,
+    ColorPlanes,
+    FilterPipeline,
     apply_ascii_art,
+    apply_blur,
     apply_blur_placeholder,
     apply_dim,
     apply_grayscale,
@@ -9,10 +13,16 @@ from pytui.post.filters import (
     apply_noise,
     apply_scanlines,
     apply_sepia,
+    read_color_planes,
+    write_color_planes,
 )
 
 __all__ = [
+    "FILTERS",
+    "ColorPlanes",
+    "FilterPipeline",
     "apply_ascii_art",
+    "apply_blur",
     "apply_blur_placeholder",
     "apply_dim",
     "apply_grayscale",
@@ -20,4 +30,6 @@ __all__ = [
     "apply_noise",
     "apply_scanlines",
     "apply_sepia",
+    "read_color_planes",
+    "write_color_planes",
 ]
@@ -1,105 +1,336 @@
 # pytui.post.filters - Aligns with OpenTUI packages/core/src/post/filters.ts
 # applyDim, applyBlur, applyGrayscale, applySepia, applyInvert, applyScanlines, applyNoise, applyAsciiArt.
+# Filters work on the fg/bg colour planes of the buffer as NumPy arrays: planes are read once, every
+# filter transforms them vectorized, and only cells whose colour/char changed are written back (as shallow
+# copies: a Cell object may be shared, e.g. by fill_rect, so cells are never mutated in place).
+# FilterPipeline composes several filters into a single read/write pass (usable as a post-process fn).
 
 
 from __future__ import annotations
 
-import random
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 if TYPE_CHECKING:
     from pytui.core.buffer import Cell, OptimizedBuffer
 
+_SEPIA = (
+    (0.393, 0.769, 0.189),
+    (0.349, 0.686, 0.168),
+    (0.272, 0.534, 0.131),
+)
+_rng = np.random.default_rng()
+_get_fg = attrgetter("fg")
+_get_bg = attrgetter("bg")
+
 
 def _cell_with_fg_bg(
     cell: Cell,
     fg: tuple[int, int, int, int],
     bg: tuple[int, int, int, int],
+    char: str | None = None,
 ) -> Cell:
-    """返回与 cell 相同属性但 fg/bg 替换的新 Cell。"""
-    from pytui.core.buffer import Cell
-
-    return Cell(
-        char=cell.char,
-        fg=fg,
-        bg=bg,
-        bold=cell.bold,
-        italic=cell.italic,
-        underline=cell.underline,
-        strikethrough=cell.strikethrough,
-        dim=cell.dim,
-        reverse=cell.reverse,
-        blink=cell.blink,
-    )
+    """返回与 cell 相同属性但 fg/bg（及可选 char）替换的新 Cell。
+
+    浅拷贝 __dict__，比逐字段构造 Cell 快数倍。
+    """
+    attrs = cell.__dict__.copy()
+    attrs["fg"] = fg
+    attrs["bg"] = bg
+    if char is not None:
+        attrs["char"] = char
+    new = object.__new__(type(cell))
+    new.__dict__ = attrs
+    return new
+
+
+def _color_tuples(rows: np.ndarray) -> list[tuple[int, int, int, int]]:
+    """(n, 4) int RGBA rows -> list of tuples; one tuple per distinct colour (a UI has few), shared by its cells."""
+    keys = (rows[:, 0] << 24) | (rows[:, 1] << 16) | (rows[:, 2] << 8) | rows[:, 3]
+    distinct, inverse = np.unique(keys, return_inverse=True)
+    colors = [((k >> 24) & 255, (k >> 16) & 255, (k >> 8) & 255, k & 255) for k in distinct.tolist()]
+    return [colors[i] for i in inverse.tolist()]
+
+
+def _plane(cells: list[Cell], get: Callable[[Cell], tuple[int, int, int, int]], h: int, w: int) -> np.ndarray:
+    flat = np.fromiter(chain.from_iterable(map(get, cells)), dtype=np.float64, count=4 * len(cells))
+    return flat.reshape(h, w, 4)
+
+
+class ColorPlanes:
+    """Colour planes of a buffer region.
+
+    fg / bg are float64 arrays of shape (height, width, 4) holding integer-valued RGBA; chars is None
+    until a filter replaces characters (then an object array of shape (height, width)). x / y are the
+    region's offset in the buffer.
+    """
+
+    __slots__ = ("x", "y", "fg", "bg", "chars", "_cells", "_fg0", "_bg0")
+
+    def __init__(self, x: int, y: int, cells: list[Cell], fg: np.ndarray, bg: np.ndarray) -> None:
+        self.x = x
+        self.y = y
+        self.fg = fg
+        self.bg = bg
+        self.chars: np.ndarray | None = None
+        self._cells = cells
+        self._fg0 = fg.astype(np.int64)
+        self._bg0 = bg.astype(np.int64)
+
+    @property
+    def height(self) -> int:
+        return self.fg.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.fg.shape[1]
+
+    def char_plane(self) -> np.ndarray:
+        """Object array of the region's chars (created on first use)."""
+        if self.chars is None:
+            chars = np.empty(len(self._cells), dtype=object)
+            chars[:] = [c.char for c in self._cells]
+            self.chars = chars.reshape(self.height, self.width)
+        return self.chars
+
+
+def read_color_planes(
+    buffer: OptimizedBuffer,
+    rect: tuple[int, int, int, int] | None = None,
+) -> ColorPlanes:
+    """Read fg/bg of buffer (or rect=(x, y, width, height), clipped to the buffer) into ColorPlanes."""
+    x0, y0, x1, y1 = 0, 0, buffer.width, buffer.height
+    if rect is not None:
+        rx, ry, rw, rh = rect
+        x0, y0 = max(0, rx), max(0, ry)
+        x1, y1 = min(buffer.width, rx + rw), min(buffer.height, ry + rh)
+    w, h = max(0, x1 - x0), max(0, y1 - y0)
+    if buffer.cells is not None:
+        cells = buffer.cells[y0 : y0 + h, x0 : x0 + w].ravel().tolist()
+    else:
+        cells = [buffer.get_cell(x, y) for y in range(y0, y0 + h) for x in range(x0, x0 + w)]
+    return ColorPlanes(x0, y0, cells, _plane(cells, _get_fg, h, w), _plane(cells, _get_bg, h, w))
+
+
+def write_color_planes(buffer: OptimizedBuffer, planes: ColorPlanes) -> None:
+    """Write planes back to buffer. Only cells whose fg/bg/char changed get a new Cell."""
+    if planes.width == 0 or planes.height == 0:
+        return
+    fg = np.clip(planes.fg, 0, 255).astype(np.int64)
+    bg = np.clip(planes.bg, 0, 255).astype(np.int64)
+    changed = (fg != planes._fg0).any(axis=2) | (bg != planes._bg0).any(axis=2)
+    if planes.chars is not None:
+        old_chars = np.empty(len(planes._cells), dtype=object)
+        old_chars[:] = [c.char for c in planes._cells]
+        old_chars = old_chars.reshape(planes.height, planes.width)
+        changed |= (planes.chars != old_chars).astype(bool)
+    ys, xs = np.nonzero(changed)
+    if len(ys) == 0:
+        return
+    src = planes._cells
+    index = (ys * planes.width + xs).tolist()
+    fg_rows = _color_tuples(fg[ys, xs])
+    bg_rows = _color_tuples(bg[ys, xs])
+    if planes.chars is not None:
+        chars = planes.chars[ys, xs].tolist()
+        new_cells = [_cell_with_fg_bg(src[i], f, b, ch) for i, f, b, ch in zip(index, fg_rows, bg_rows, chars)]
+    else:
+        new_cells = [_cell_with_fg_bg(src[i], f, b) for i, f, b in zip(index, fg_rows, bg_rows)]
+    if buffer.cells is not None:
+        out = np.empty(len(new_cells), dtype=object)
+        out[:] = new_cells
+        buffer.cells[ys + planes.y, xs + planes.x] = out
+        return
+    for y, x, cell in zip(ys.tolist(), xs.tolist(), new_cells):
+        buffer._set_cell_raw(planes.x + x, planes.y + y, cell)
+
+
+# --- Plane transforms (in place on ColorPlanes; results truncated to int like the per-cell originals) ---
+def _luminance(plane: np.ndarray) -> np.ndarray:
+    # Same evaluation order as the scalar formula so truncation matches exactly.
+    return 0.299 * plane[..., 0] + 0.587 * plane[..., 1] + 0.114 * plane[..., 2]
+
+
+def dim_planes(planes: ColorPlanes, alpha: float = 0.5) -> None:
+    """Blend fg/bg with opaque black: rgb * alpha, a * alpha + 255 * (1 - alpha)."""
+    if alpha >= 1.0:
+        return
+    a = max(0.0, alpha)
+    for plane in (planes.fg, planes.bg):
+        plane[..., :3] = np.trunc(plane[..., :3] * a)
+        plane[..., 3] = np.trunc(plane[..., 3] * a + 255 * (1 - a))
+
+
+def grayscale_planes(planes: ColorPlanes) -> None:
+    """RGB -> luminance 0.299*R + 0.587*G + 0.114*B; alpha unchanged."""
+    for plane in (planes.fg, planes.bg):
+        lum = np.clip(np.trunc(_luminance(plane)), 0, 255)
+        plane[..., :3] = lum[..., None]
+
+
+def sepia_planes(planes: ColorPlanes) -> None:
+    """Sepia tone matrix on RGB; alpha unchanged."""
+    for plane in (planes.fg, planes.bg):
+        r, g, b = plane[..., 0].copy(), plane[..., 1].copy(), plane[..., 2].copy()
+        for i, (kr, kg, kb) in enumerate(_SEPIA):
+            plane[..., i] = np.minimum(255, np.trunc(r * kr + g * kg + b * kb))
+
+
+def invert_planes(planes: ColorPlanes) -> None:
+    """RGB -> 255 - component; alpha unchanged."""
+    for plane in (planes.fg, planes.bg):
+        plane[..., :3] = 255 - plane[..., :3]
+
+
+def scanlines_planes(planes: ColorPlanes, strength: float = 0.8, step: int = 2) -> None:
+    """Scale RGB by strength on every step-th buffer row (row 0, step, 2*step ...)."""
+    step = max(1, int(step))
+    first = (-planes.y) % step
+    for plane in (planes.fg, planes.bg):
+        rows = plane[first::step, :, :3]
+        plane[first::step, :, :3] = np.clip(np.trunc(rows * strength), 0, 255)
+
+
+def noise_planes(planes: ColorPlanes, strength: float = 0.1) -> None:
+    """Add uniform noise in about ±strength*255 to RGB and clamp."""
+    scale = max(0.0, min(1.0, strength)) * 255
+    if scale == 0:
+        return
+    for plane in (planes.fg, planes.bg):
+        noise = np.trunc(_rng.uniform(-scale, scale, size=plane.shape[:2] + (3,)))
+        plane[..., :3] = np.clip(plane[..., :3] + noise, 0, 255)
+
+
+def ascii_art_planes(planes: ColorPlanes, ramp: str = " .:-=+*#%@") -> None:
+    """Replace chars by ramp characters indexed by background luminance."""
+    n = len(ramp)
+    if n == 0:
+        return
+    lum = _luminance(planes.bg)
+    idx = np.minimum(n - 1, (lum / 255.0 * n).astype(np.int64))
+    ramp_chars = np.array(list(ramp), dtype=object)
+    planes.chars = ramp_chars[idx]
+
+
+def _box_blur_axis(plane: np.ndarray, radius: int, axis: int) -> np.ndarray:
+    """Mean over a window of 2*radius+1 along axis, edge-normalized (prefix sums: O(1) per cell)."""
+    n = plane.shape[axis]
+    csum = np.cumsum(plane, axis=axis)
+    zero_shape = list(plane.shape)
+    zero_shape[axis] = 1
+    csum = np.concatenate([np.zeros(zero_shape), csum], axis=axis)
+    i = np.arange(n)
+    lo = np.clip(i - radius, 0, n)
+    hi = np.clip(i + radius + 1, 0, n)
+    total = np.take(csum, hi, axis=axis) - np.take(csum, lo, axis=axis)
+    count_shape = [1] * plane.ndim
+    count_shape[axis] = n
+    return total / (hi - lo).reshape(count_shape)
+
+
+def blur_planes(planes: ColorPlanes, radius: int = 1) -> None:
+    """Separable box blur of fg/bg RGB (horizontal then vertical pass); chars and alpha unchanged."""
+    radius = int(radius)
+    if radius <= 0 or planes.width == 0 or planes.height == 0:
+        return
+    for plane in (planes.fg, planes.bg):
+        rgb = _box_blur_axis(plane[..., :3], radius, axis=1)
+        rgb = _box_blur_axis(rgb, radius, axis=0)
+        plane[..., :3] = np.clip(np.trunc(rgb + 1e-9), 0, 255)
+
+
+PlaneFilter = Callable[..., None]
+
+FILTERS: dict[str, PlaneFilter] = {
+    "dim": dim_planes,
+    "grayscale": grayscale_planes,
+    "sepia": sepia_planes,
+    "invert": invert_planes,
+    "scanlines": scanlines_planes,
+    "noise": noise_planes,
+    "ascii_art": ascii_art_planes,
+    "blur": blur_planes,
+}
+
+
+class FilterPipeline:
+    """Several filters applied in one read/transform/write pass over the buffer.
+
+    Usage:
+        pipeline = FilterPipeline().add("dim", alpha=0.4).add("blur", radius=1)
+        renderer.add_post_process_fn(pipeline)
+
+    Steps are names from FILTERS or callables taking (planes, **kwargs). rect=(x, y, width, height)
+    limits the pass to a region (e.g. the backdrop behind a modal); None means the whole buffer.
+    """
+
+    def __init__(
+        self,
+        steps: list[tuple[str | PlaneFilter, dict[str, Any]]] | None = None,
+        rect: tuple[int, int, int, int] | None = None,
+    ) -> None:
+        self.steps: list[tuple[PlaneFilter, dict[str, Any]]] = []
+        self.rect = rect
+        for step, kwargs in steps or []:
+            self.add(step, **kwargs)
+
+    def add(self, step: str | PlaneFilter, **kwargs: Any) -> FilterPipeline:
+        if isinstance(step, str):
+            if step not in FILTERS:
+                raise ValueError(f"Unknown filter: {step!r}")
+            step = FILTERS[step]
+        self.steps.append((step, kwargs))
+        return self
+
+    def clear(self) -> None:
+        self.steps.clear()
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def apply(self, buffer: OptimizedBuffer) -> None:
+        if not self.steps:
+            return
+        planes = read_color_planes(buffer, self.rect)
+        for fn, kwargs in self.steps:
+            fn(planes, **kwargs)
+        write_color_planes(buffer, planes)
+
+    def __call__(self, buffer: OptimizedBuffer, delta_time: float = 0.0) -> None:
+        """Post-process fn signature (buffer, delta_time)."""
+        self.apply(buffer)
+
+
+def _apply(buffer: OptimizedBuffer, fn: PlaneFilter, **kwargs: Any) -> None:
+    planes = read_color_planes(buffer)
+    fn(planes, **kwargs)
+    write_color_planes(buffer, planes)
 
 
 def apply_dim(buffer: OptimizedBuffer, alpha: float = 0.5) -> None:
     """对 buffer 整体做 dim（按 alpha 与黑色混合）。alpha=1 不变，alpha=0 全黑。"""
     if alpha >= 1.0:
         return
-    from pytui.core.buffer import OptimizedBuffer
-
-    black = (0, 0, 0, 255)
-    for y in range(buffer.height):
-        for x in range(buffer.width):
-            cell = buffer.get_cell(x, y)
-            if cell is None:
-                continue
-            fg = OptimizedBuffer.blend_color(cell.fg, black, alpha)
-            bg = OptimizedBuffer.blend_color(cell.bg, black, alpha)
-            buffer.set_cell(x, y, _cell_with_fg_bg(cell, fg, bg))
+    _apply(buffer, dim_planes, alpha=alpha)
 
 
 def apply_grayscale(buffer: OptimizedBuffer) -> None:
     """将 buffer 前景/背景转为灰度（亮度 0.299*R + 0.587*G + 0.114*B）。"""
-    for y in range(buffer.height):
-        for x in range(buffer.width):
-            cell = buffer.get_cell(x, y)
-            if cell is None:
-                continue
-            r, g, b, a = cell.fg
-            lum = int(0.299 * r + 0.587 * g + 0.114 * b)
-            lum = max(0, min(255, lum))
-            fg = (lum, lum, lum, a)
-            r, g, b, a = cell.bg
-            lum = int(0.299 * r + 0.587 * g + 0.114 * b)
-            lum = max(0, min(255, lum))
-            bg = (lum, lum, lum, a)
-            buffer.set_cell(x, y, _cell_with_fg_bg(cell, fg, bg))
+    _apply(buffer, grayscale_planes)
 
 
 def apply_sepia(buffer: OptimizedBuffer) -> None:
     """对 buffer 应用棕褐色调（sepia）。"""
-    for y in range(buffer.height):
-        for x in range(buffer.width):
-            cell = buffer.get_cell(x, y)
-            if cell is None:
-                continue
-            r, g, b, a = cell.fg
-            nr = min(255, int(r * 0.393 + g * 0.769 + b * 0.189))
-            ng = min(255, int(r * 0.349 + g * 0.686 + b * 0.168))
-            nb = min(255, int(r * 0.272 + g * 0.534 + b * 0.131))
-            fg = (nr, ng, nb, a)
-            r, g, b, a = cell.bg
-            nr = min(255, int(r * 0.393 + g * 0.769 + b * 0.189))
-            ng = min(255, int(r * 0.349 + g * 0.686 + b * 0.168))
-            nb = min(255, int(r * 0.272 + g * 0.534 + b * 0.131))
-            bg = (nr, ng, nb, a)
-            buffer.set_cell(x, y, _cell_with_fg_bg(cell, fg, bg))
+    _apply(buffer, sepia_planes)
 
 
 def apply_invert(buffer: OptimizedBuffer) -> None:
     """反转 buffer 前景/背景 RGB（255 - 分量），Alpha 不变。"""
-    for y in range(buffer.height):
-        for x in range(buffer.width):
-            cell = buffer.get_cell(x, y)
-            if cell is None:
-                continue
-            r, g, b, a = cell.fg
-            fg = (255 - r, 255 - g, 255 - b, a)
-            r, g, b, a = cell.bg
-            bg = (255 - r, 255 - g, 255 - b, a)
-            buffer.set_cell(x, y, _cell_with_fg_bg(cell, fg, bg))
+    _apply(buffer, invert_planes)
 
 
 def apply_scanlines(
@@ -108,57 +339,12 @@ def apply_scanlines(
     step: int = 2,
 ) -> None:
     """每隔 step 行按 strength 变暗（扫描线效果）。strength=1 不变，strength=0 全黑。"""
-    for y in range(0, buffer.height, step):
-        for x in range(buffer.width):
-            cell = buffer.get_cell(x, y)
-            if cell is None:
-                continue
-            r, g, b, a = cell.fg
-            fg = (
-                max(0, min(255, int(r * strength))),
-                max(0, min(255, int(g * strength))),
-                max(0, min(255, int(b * strength))),
-                a,
-            )
-            r, g, b, a = cell.bg
-            bg = (
-                max(0, min(255, int(r * strength))),
-                max(0, min(255, int(g * strength))),
-                max(0, min(255, int(b * strength))),
-                a,
-            )
-            buffer.set_cell(x, y, _cell_with_fg_bg(cell, fg, bg))
+    _apply(buffer, scanlines_planes, strength=strength, step=step)
 
 
 def apply_noise(buffer: OptimizedBuffer, strength: float = 0.1) -> None:
     """对前景/背景 RGB 加随机扰动并钳位。strength 对应约 ±strength*255 的扰动。"""
-    scale = max(0.0, min(1.0, strength)) * 255
-    for y in range(buffer.height):
-        for x in range(buffer.width):
-            cell = buffer.get_cell(x, y)
-            if cell is None:
-                continue
-            r, g, b, a = cell.fg
-            noise_r = int((random.random() - 0.5) * 2 * scale)
-            noise_g = int((random.random() - 0.5) * 2 * scale)
-            noise_b = int((random.random() - 0.5) * 2 * scale)
-            fg = (
-                max(0, min(255, r + noise_r)),
-                max(0, min(255, g + noise_g)),
-                max(0, min(255, b + noise_b)),
-                a,
-            )
-            r, g, b, a = cell.bg
-            noise_r = int((random.random() - 0.5) * 2 * scale)
-            noise_g = int((random.random() - 0.5) * 2 * scale)
-            noise_b = int((random.random() - 0.5) * 2 * scale)
-            bg = (
-                max(0, min(255, r + noise_r)),
-                max(0, min(255, g + noise_g)),
-                max(0, min(255, b + noise_b)),
-                a,
-            )
-            buffer.set_cell(x, y, _cell_with_fg_bg(cell, fg, bg))
+    _apply(buffer, noise_planes, strength=strength)
 
 
 def apply_ascii_art(
@@ -166,35 +352,18 @@ def apply_ascii_art(
     ramp: str = " .:-=+*#%@",
 ) -> None:
     """按背景亮度将字符替换为 ramp 中字符（亮度越高字符越“亮”）。"""
-    from pytui.core.buffer import Cell
+    if not ramp:
+        return
+    _apply(buffer, ascii_art_planes, ramp=ramp)
+
 
-    ramp_len = len(ramp)
-    if ramp_len == 0:
+def apply_blur(buffer: OptimizedBuffer, radius: int = 1) -> None:
+    """对前景/背景 RGB 做可分离 box blur（半径 radius），字符不变。"""
+    if int(radius) <= 0:
         return
-    for y in range(buffer.height):
-        for x in range(buffer.width):
-            cell = buffer.get_cell(x, y)
-            if cell is None:
-                continue
-            r, g, b, _ = cell.bg
-            lum = 0.299 * r + 0.587 * g + 0.114 * b
-            idx = min(ramp_len - 1, int(lum / 255.0 * ramp_len))
-            ch = ramp[idx]
-            new_cell = Cell(
-                char=ch,
-                fg=cell.fg,
-                bg=cell.bg,
-                bold=cell.bold,
-                italic=cell.italic,
-                underline=cell.underline,
-                strikethrough=cell.strikethrough,
-                dim=cell.dim,
-                reverse=cell.reverse,
-                blink=cell.blink,
-            )
-            buffer.set_cell(x, y, new_cell)
+    _apply(buffer, blur_planes, radius=radius)
 
 
 def apply_blur_placeholder(buffer: OptimizedBuffer, _radius: int = 1) -> None:
-    """占位：blur 效果暂未实现，不修改 buffer。"""
-    pass
+    """兼容旧名：等同 apply_blur(buffer, _radius)。"""
+    apply_blur(buffer, _radius)
@@ -7,13 +7,17 @@ from pytui.react.catalogue import (
     extend,
     get_component_catalogue,
 )
-from pytui.react.component import Component
+from pytui.react.component import Component, PureComponent, memo, shallow_equal
 from pytui.react.error_boundary import ErrorBoundary
 from pytui.react.hooks import (
+    Ref,
+    useCallback,
     useEffect,
     useEvent,
     useKeyboard,
+    useMemo,
     useOnResize,
+    useRef,
     useRenderer,
     useResize,
     useState,
@@ -36,13 +40,20 @@ __all__ = [
     "flush_sync",
     "get_component_catalogue",
     "get_next_id",
+    "Ref",
     "h",
+    "memo",
+    "PureComponent",
     "reconcile",
+    "shallow_equal",
     "use_app_context",
+    "useCallback",
     "useEffect",
     "useEvent",
     "useKeyboard",
+    "useMemo",
     "useOnResize",
+    "useRef",
     "useRenderer",
     "useResize",
     "useState",
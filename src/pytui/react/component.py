@@ -1,16 +1,18 @@
-# pytui.react.component - 声明式组件基类
+# pytui.react.component - 声明式组件基类；PureComponent / memo（props 浅比较跳过重渲染）
 
 from __future__ import annotations
 
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from pytui.react.scheduler import schedule_update
+
 if TYPE_CHECKING:
     from pytui.core.renderer import RenderContext
 
 
 class Component:
-    """声明式组件基类：props、state、set_state、update() 触发重渲染。"""
+    """声明式组件基类：props、state、set_state（批量、下一帧重渲染）、update()（立即重渲染）。"""
 
     def __init__(self, ctx: RenderContext, props: dict[str, Any] | None = None) -> None:
         self.ctx = ctx
@@ -19,12 +21,16 @@ class Component:
         self._on_update: list[Callable[[], None]] | None = None  # reconciler 注册的回调
 
     def set_state(self, partial: dict[str, Any] | None = None, *, updater: callable | None = None) -> None:
-        """更新 state 并触发重渲染。"""
+        """更新 state 并排队重渲染（同一帧内多次调用只渲染一次；flush_sync 可立即执行）。"""
         if updater is not None:
             self.state = {**self.state, **updater(self.state)}
         elif partial is not None:
             self.state = {**self.state, **partial}
-        self.update()
+        self.schedule_update()
+
+    def schedule_update(self) -> None:
+        """排队重渲染：由 scheduler 在下一帧（或 flush_sync）统一执行，父组件优先。"""
+        schedule_update(self)
 
     def update(self) -> None:
         """通知 reconciler 需要重渲染（由 set_state 或外部调用）。"""
@@ -32,6 +38,61 @@ class Component:
             for cb in self._on_update:
                 cb()
 
+    def should_component_update(self, next_props: dict[str, Any]) -> bool:
+        """父组件重渲染时由 reconciler 调用；返回 False 则跳过 render()，复用已有 renderables。
+        组件自身有待处理的 state 更新时不会调用（总是重渲染）。"""
+        return True
+
     def render(self) -> Any:
         """子类实现：返回虚拟节点树（由 create_element / h 构建）。"""
         raise NotImplementedError("Component.render() must be overridden")
+
+
+def shallow_equal(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """props 浅比较：键集合相同且每个值 is 相同或 ==（比较出错视为不同）。"""
+    if a is b:
+        return True
+    if len(a) != len(b):
+        return False
+    for k, v in a.items():
+        if k not in b:
+            return False
+        w = b[k]
+        if v is w:
+            continue
+        try:
+            if not bool(v == w):
+                return False
+        except Exception:
+            return False
+    return True
+
+
+class PureComponent(Component):
+    """props 浅比较相等时跳过重渲染的组件（对齐 React.PureComponent）。"""
+
+    def should_component_update(self, next_props: dict[str, Any]) -> bool:
+        return not shallow_equal(self.props, next_props)
+
+
+def memo(
+    component: type[Component],
+    are_props_equal: Callable[[dict[str, Any], dict[str, Any]], bool] | None = None,
+) -> type[Component]:
+    """memo(Component, are_props_equal?) -> 子类：are_props_equal(prev, next)（默认 shallow_equal）为 True 时
+    跳过重渲染（对齐 React.memo）。"""
+    equal = are_props_equal or shallow_equal
+
+    def should_component_update(self: Component, next_props: dict[str, Any]) -> bool:
+        return not equal(self.props, next_props)
+
+    return type(
+        component.__name__,
+        (component,),
+        {
+            "should_component_update": should_component_update,
+            "__module__": component.__module__,
+            "__qualname__": component.__qualname__,
+            "__doc__": component.__doc__,
+        },
+    )
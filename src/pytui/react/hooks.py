@@ -1,4 +1,5 @@
-# pytui.react.hooks - useState, useEffect, useKeyboard, useOnResize, useTerminalDimensions, useTimeline (align OpenTUI hooks)
+# pytui.react.hooks - useState, useEffect, useMemo, useCallback, useRef, useKeyboard, useOnResize,
+# useTerminalDimensions, useTimeline (align OpenTUI hooks)
 
 from __future__ import annotations
 
@@ -18,45 +19,153 @@ def _get_component() -> Any:
 
 def useState(initial: Any) -> tuple[Any, Callable[[Any], None]]:  # noqa: N802
     """useState(initial) -> [value, set_value]。按调用顺序与组件 state 列表对应。
-    set_value 支持函数式更新：set_value(lambda prev: new) 可避免闭包陈旧值。"""
+    set_value 支持函数式更新：set_value(lambda prev: new) 可避免闭包陈旧值。
+    set_value 只排队重渲染（下一帧批量执行，值不变时跳过）；需要立即生效时用 flush_sync。"""
     comp = _get_component()
-    if not hasattr(comp, "_hook_state_list"):
-        comp._hook_state_list = []
+    idx = _next_hook_index(comp)
+    if idx >= len(getattr(comp, "_hook_state_list", None) or []):
+        _hook_slot(comp, "_hook_state_list", idx)[idx] = initial
+
+    value = comp._hook_state_list[idx]
+
+    def set_value(new_val: Any) -> None:
+        prev = comp._hook_state_list[idx]
+        value = new_val(prev) if callable(new_val) else new_val
+        comp._hook_state_list[idx] = value
+        if value is not prev:
+            comp.schedule_update()
+
+    return value, set_value
+
+
+_SCALARS = (int, float, complex, str, bytes, bool, type(None), tuple, frozenset)
+
+
+def _same_dep(a: Any, b: Any) -> bool:
+    """Object.is-like comparison: identity, or equal immutable scalars of the same type."""
+    return a is b or (type(a) is type(b) and isinstance(a, _SCALARS) and a == b)
+
+
+def _deps_changed(prev: list[Any] | None, deps: list[Any] | None) -> bool:
+    if prev is None or deps is None or len(prev) != len(deps):
+        return True
+    return any(not _same_dep(a, b) for a, b in zip(prev, deps))
+
+
+def _next_hook_index(comp: Any) -> int:
     if not hasattr(comp, "_hook_index"):
         comp._hook_index = 0
     idx = comp._hook_index
     comp._hook_index += 1
-    if idx >= len(comp._hook_state_list):
-        comp._hook_state_list.append(initial)
+    return idx
 
-    value = comp._hook_state_list[idx]
 
-    def set_value(new_val: Any) -> None:
-        if callable(new_val):
-            comp._hook_state_list[idx] = new_val(comp._hook_state_list[idx])
-        else:
-            comp._hook_state_list[idx] = new_val
-        comp.update()
+def _hook_slot(comp: Any, attr: str, idx: int) -> list[Any]:
+    slots = getattr(comp, attr, None)
+    if slots is None:
+        slots = []
+        setattr(comp, attr, slots)
+    while idx >= len(slots):
+        slots.append(None)
+    return slots
 
-    return value, set_value
+
+class _EffectHook:
+    """One useEffect slot: committed deps and cleanup, plus the effect queued by the last render."""
+
+    __slots__ = ("effect", "deps", "next_deps", "cleanup", "pending")
+
+    def __init__(self) -> None:
+        self.effect: Callable[[], Any] | None = None
+        self.deps: list[Any] | None = None
+        self.next_deps: list[Any] | None = None
+        self.cleanup: Callable[[], None] | None = None
+        self.pending = False
+
+    def __getitem__(self, i: int) -> Any:
+        # Backward compat with the former (effect, deps) tuples.
+        return (self.effect, self.deps)[i]
 
 
 def useEffect(  # noqa: N802
     effect: Callable[[], Callable[[], None] | None],
     deps: list[Any] | None = None,
 ) -> None:
-    """useEffect(effect, deps?)：在 render 提交后执行 effect；deps 变化时重新执行（简易：每次 render 后执行）。"""
+    """useEffect(effect, deps?)：render 提交后执行 effect。deps=None 每次提交都执行；deps=[] 只在挂载时执行；
+    否则仅当 deps 中某项变化（Object.is 语义）时执行。effect 返回的 cleanup 在下次执行前及卸载时调用。"""
     comp = _get_component()
-    if not hasattr(comp, "_effect_list"):
-        comp._effect_list = []
-    if not hasattr(comp, "_hook_index"):
-        comp._hook_index = 0
-    idx = comp._hook_index
-    comp._hook_index += 1
-    # 存储 (effect, deps) 供 reconciler 在 commit 阶段执行
-    while idx >= len(comp._effect_list):
-        comp._effect_list.append(None)
-    comp._effect_list[idx] = (effect, deps)
+    idx = _next_hook_index(comp)
+    slots = _hook_slot(comp, "_effect_list", idx)
+    hook = slots[idx]
+    if not isinstance(hook, _EffectHook):
+        hook = _EffectHook()
+        slots[idx] = hook
+    elif not _deps_changed(hook.deps, deps):
+        return
+    hook.effect = effect
+    hook.next_deps = list(deps) if deps is not None else None
+    hook.pending = True
+
+
+def run_effects(comp: Any) -> None:
+    """Commit phase (called by the reconciler after mount/update): run effects queued by render."""
+    for hook in getattr(comp, "_effect_list", None) or []:
+        if not isinstance(hook, _EffectHook) or not hook.pending:
+            continue
+        hook.pending = False
+        if hook.cleanup is not None:
+            cleanup, hook.cleanup = hook.cleanup, None
+            cleanup()
+        hook.deps = hook.next_deps
+        result = hook.effect() if hook.effect is not None else None
+        hook.cleanup = result if callable(result) else None
+
+
+def run_cleanups(comp: Any) -> None:
+    """Unmount: call every pending cleanup returned by comp's effects."""
+    for hook in getattr(comp, "_effect_list", None) or []:
+        if isinstance(hook, _EffectHook) and hook.cleanup is not None:
+            cleanup, hook.cleanup = hook.cleanup, None
+            cleanup()
+
+
+def useMemo(factory: Callable[[], Any], deps: list[Any] | None = None) -> Any:  # noqa: N802
+    """useMemo(factory, deps?) -> value。deps 不变时返回上次的值（deps=None 每次重新计算）。"""
+    comp = _get_component()
+    idx = _next_hook_index(comp)
+    slots = _hook_slot(comp, "_memo_list", idx)
+    entry = slots[idx]
+    if entry is None or _deps_changed(entry[0], deps):
+        entry = (list(deps) if deps is not None else None, factory())
+        slots[idx] = entry
+    return entry[1]
+
+
+def useCallback(fn: Callable[..., Any], deps: list[Any] | None = None) -> Callable[..., Any]:  # noqa: N802
+    """useCallback(fn, deps?) -> fn。deps 不变时返回同一个函数引用（= useMemo(lambda: fn, deps)）。"""
+    return useMemo(lambda: fn, deps)
+
+
+class Ref:
+    """Mutable container returned by useRef; .current persists across renders."""
+
+    __slots__ = ("current",)
+
+    def __init__(self, current: Any = None) -> None:
+        self.current = current
+
+    def __repr__(self) -> str:
+        return f"Ref({self.current!r})"
+
+
+def useRef(initial: Any = None) -> Ref:  # noqa: N802
+    """useRef(initial?) -> Ref。同一组件的每次 render 返回同一个 Ref；修改 .current 不触发重渲染。"""
+    comp = _get_component()
+    idx = _next_hook_index(comp)
+    slots = _hook_slot(comp, "_ref_list", idx)
+    if slots[idx] is None:
+        slots[idx] = Ref(initial)
+    return slots[idx]
 
 
 def useRenderer(ctx: Any | None = None) -> Any:  # noqa: N802
@@ -179,7 +288,7 @@ def useTimeline(options: dict[str, Any] | Any | None = None) -> Any:  # noqa: N8
     from pytui.core.animation import engine
     from pytui.core.animation import Timeline
     opts = options if isinstance(options, dict) else {}
-    timeline = Timeline(opts)
+    timeline = useMemo(lambda: Timeline(opts), [])
 
     def setup() -> None:
         if not opts.get("autoplay", True):
@@ -1,4 +1,6 @@
 # pytui.react.reconciler - 树 diff、挂载/更新/卸载 (aligns OpenTUI host-config + reconciler)
+# Updates are diffed against the previous tree: children match by type + key (or position), matched
+# renderables are patched via _apply_props and moved, only unmatched ones are mounted/unmounted.
 
 from __future__ import annotations
 
@@ -10,23 +12,24 @@ from pytui.react import hooks as hooks_module
 from pytui.react.catalogue import TEXT_NODE_KEYS, get_component_catalogue
 from pytui.react.component import Component
 from pytui.react.error_boundary import ErrorBoundary
+from pytui.react.scheduler import cancel_update, flush_updates, is_update_pending
 from pytui.react.text_components import TextChunkRenderable
 from pytui.react.utils_id import get_next_id
 
 # 声明式 onXxx：挂载时从 props 剥离并绑定到 Renderable 事件
 EVENT_PROPS = ("onInput", "onChange", "onSelect", "onSelectionChanged", "onScroll")
+_EVENT_NAMES = {
+    "onInput": "input",
+    "onChange": "change",
+    "onSelect": "select",
+    "onSelectionChanged": "selection_changed",
+    "onScroll": "scroll",
+}
 
 
 def _bind_event_props(renderable: Renderable, props: dict) -> None:
     """将 props 中的 onXxx 绑定到对应组件的 emit 事件。"""
-    event_map = [
-        ("onInput", "input"),
-        ("onChange", "change"),
-        ("onSelect", "select"),
-        ("onSelectionChanged", "selection_changed"),
-        ("onScroll", "scroll"),
-    ]
-    for prop_name, event_name in event_map:
+    for prop_name, event_name in _EVENT_NAMES.items():
         cb = props.get(prop_name)
         if callable(cb):
             renderable.on(event_name, cb)
@@ -72,6 +75,31 @@ def _apply_props(renderable: Renderable, props: dict) -> None:
             setattr(renderable, k, v)
 
 
+def _normalize_tree(tree: Any) -> dict:
+    if isinstance(tree, list):
+        return {"type": "box", "props": {}, "children": tree}
+    if not isinstance(tree, dict):
+        return {"type": "box", "props": {}, "children": []}
+    return tree
+
+
+def _render_component(comp: Component) -> dict:
+    """Run comp.render() with hooks bound to comp; ErrorBoundary renders its fallback on error."""
+    prev = hooks_module._current_component
+    hooks_module._current_component = comp
+    comp._hook_index = 0
+    try:
+        tree = comp.render()
+    except Exception as e:
+        if not isinstance(comp, ErrorBoundary):
+            raise
+        comp.set_error(e)
+        tree = comp.render()
+    finally:
+        hooks_module._current_component = prev
+    return _normalize_tree(tree)
+
+
 def _mount(
     element: dict,
     parent: Renderable,
@@ -86,6 +114,9 @@ def _mount(
 
     if _is_component_type(type_):
         comp = type_(parent.ctx, props)
+        comp._react_depth = host_context.get("depth", 0)
+        host_context = {**host_context, "depth": comp._react_depth + 1}
+        comp._react_host_context = host_context
 
         # 注册更新回调：重渲染该组件的输出
         def on_update() -> None:
@@ -100,9 +131,6 @@ def _mount(
         comp._hook_index = 0
         try:
             tree = comp.render()
-            for item in getattr(comp, "_effect_list", []) or []:
-                if item and item[0]:
-                    item[0]()
         except Exception as e:
             if isinstance(comp, ErrorBoundary):
                 comp.set_error(e)
@@ -112,27 +140,20 @@ def _mount(
         finally:
             hooks_module._current_component = prev
 
-        if not isinstance(tree, dict):
-            tree = {"type": "box", "props": {}, "children": []}
-        if isinstance(tree, list):
-            tree = {"type": "box", "props": {}, "children": tree}
-
+        tree = _normalize_tree(tree)
         next_idx = index if index is not None else len(parent.children)
         try:
             inst, count = _mount(tree, parent, next_idx, host_context)
         except Exception as e:
             if isinstance(comp, ErrorBoundary):
                 comp.set_error(e)
-                tree = comp.render()
-                if not isinstance(tree, dict):
-                    tree = {"type": "box", "props": {}, "children": []}
-                if isinstance(tree, list):
-                    tree = {"type": "box", "props": {}, "children": tree}
+                tree = _normalize_tree(comp.render())
                 inst, count = _mount(tree, parent, next_idx, host_context)
             else:
                 raise
         child_insts = [(tree, inst)]
         comp._react_child_insts = child_insts
+        hooks_module.run_effects(comp)
         return (("component", comp, child_insts), count)
 
     # Host
@@ -171,8 +192,10 @@ def _unmount(inst: Any, parent: Renderable) -> None:
     elif isinstance(inst, tuple) and len(inst) == 3 and inst[0] == "component":
         _, comp, child_insts = inst
         comp._on_update = []
+        cancel_update(comp)
         for _, c in child_insts:
             _unmount(c, parent)
+        hooks_module.run_cleanups(comp)
 
 
 def _get_renderables(inst: Any) -> list[Renderable]:
@@ -187,50 +210,262 @@ def _get_renderables(inst: Any) -> list[Renderable]:
     return []
 
 
-def _update_component_output(comp: Component, parent: Renderable, old_child_insts: list[tuple[Any, Any]]) -> None:
-    """用 comp.render() 的新树替换旧输出。"""
-    # 先按树结构卸载旧输出（会调用 blur() 等，避免 keypress 等监听器累积）
-    for _, inst in old_child_insts:
+# --- Diff / patch ---
+# Props that never reach a renderable as attributes when patching.
+_NON_ATTR_PROPS = frozenset({"key", "id", "children"})
+# Props handled by Renderable._apply_layout_options (plain setattr would clobber computed layout).
+_LAYOUT_PROPS = frozenset({
+    "flex_direction", "align_items", "justify_content", "gap", "flex_grow", "flex_shrink", "flex_basis",
+    "width", "height", "min_width", "min_height", "max_width", "max_height", "margin", "margin_left",
+    "margin_top", "margin_right", "margin_bottom", "padding", "padding_left", "padding_top",
+    "padding_right", "padding_bottom", "position", "left", "top", "right", "bottom",
+})
+_MISSING = object()
+
+
+def _element_key(element: Any, index: int) -> tuple[str, Any]:
+    """Child identity: explicit props["key"], else position among siblings."""
+    if isinstance(element, dict) and "__text" not in element:
+        key = (element.get("props") or {}).get("key")
+        if key is not None:
+            return ("key", key)
+    return ("index", index)
+
+
+def _can_patch(old_el: Any, new_el: Any) -> bool:
+    """Same type and key; text-node spans (props baked at creation) must also have equal props."""
+    if not isinstance(old_el, dict) or not isinstance(new_el, dict) or "__text" in old_el:
+        return False
+    if old_el.get("type") != new_el.get("type"):
+        return False
+    old_props, new_props = old_el.get("props") or {}, new_el.get("props") or {}
+    if old_props.get("key") != new_props.get("key"):
+        return False
+    if new_el["type"] in TEXT_NODE_KEYS:
+        return old_props == new_props
+    return True
+
+
+def _changed_props(old_props: dict, new_props: dict) -> dict:
+    changed = {}
+    for k, v in new_props.items():
+        if k in _NON_ATTR_PROPS:
+            continue
+        old = old_props.get(k, _MISSING)
+        if old is v:
+            continue
+        try:
+            same = old == v
+        except Exception:
+            same = False
+        if same is not True:
+            changed[k] = v
+    return changed
+
+
+def _set_prop(renderable: Renderable, k: str, v: Any) -> bool:
+    """Apply one prop like _apply_props; False if the renderable has no settable attribute for it."""
+    if hasattr(renderable, f"set_{k}"):
+        getattr(renderable, f"set_{k}")(v)
+        return True
+    if not hasattr(renderable, k):
+        return False
+    try:
+        setattr(renderable, k, v)
+    except AttributeError:
+        return False
+    return True
+
+
+def _patch_host_props(r: Renderable, old_el: dict, new_el: dict) -> bool:
+    """Apply changed props to r; False when one can only be set at construction (caller replaces r).
+
+    Removed onXxx handlers are detached and a removed focused blurs; any other removed prop has no
+    known default to reset to, so r is replaced as well.
+    """
+    old_props = old_el.get("props") or {}
+    new_props = new_el.get("props") or {}
+    changed = _changed_props(old_props, new_props)
+    children = new_el.get("children") or []
+    removed = {k for k in old_props.keys() - new_props.keys() if k not in _NON_ATTR_PROPS}
+    if "content" not in new_props and children and isinstance(children[0], str):
+        old_children = old_el.get("children") or []
+        if "content" in removed or not old_children or old_children[0] != children[0]:
+            changed["content"] = children[0]
+            removed.discard("content")
+    if removed - _EVENT_NAMES.keys() - {"focused"}:
+        return False
+    for prop_name in removed & _EVENT_NAMES.keys():
+        cb = old_props[prop_name]
+        if callable(cb):
+            try:
+                r.remove_listener(_EVENT_NAMES[prop_name], cb)
+            except KeyError:
+                pass
+    if "focused" in removed and getattr(r, "focused", False) and callable(getattr(r, "blur", None)):
+        r.blur()
+    if not changed:
+        return True
+    layout = {k: v for k, v in changed.items() if k in _LAYOUT_PROPS}
+    if layout:
+        r._apply_layout_options(layout)
+        r.request_render()
+    for prop_name, event_name in _EVENT_NAMES.items():
+        if prop_name not in changed:
+            continue
+        old_cb = old_props.get(prop_name)
+        if callable(old_cb):
+            try:
+                r.remove_listener(event_name, old_cb)
+            except KeyError:
+                pass
+        if callable(changed[prop_name]):
+            r.on(event_name, changed[prop_name])
+    if "focused" in changed:
+        if changed["focused"] is True and callable(getattr(r, "focus", None)):
+            r.focus()
+        elif not changed["focused"] and getattr(r, "focused", False) and callable(getattr(r, "blur", None)):
+            r.blur()
+    for k, v in changed.items():
+        if k in _LAYOUT_PROPS or k in _EVENT_NAMES or k == "focused":
+            continue
+        if not _set_prop(r, k, v):
+            return False
+    return True
+
+
+def _patch(old_el: dict, inst: Any, new_el: dict, parent: Renderable, host_context: dict) -> Any:
+    """Update inst (matched by _can_patch) in place to new_el; returns the instance, or None when a
+    changed prop cannot be patched and the host must be replaced."""
+    if isinstance(inst, tuple) and len(inst) == 3 and inst[0] == "component":
+        _, comp, child_insts = inst
+        props = new_el.get("props") or {}
+        # Bailout (memo / PureComponent): unchanged props and no own pending update keep the subtree.
+        bail = not is_update_pending(comp) and not comp.should_component_update(props)
+        comp.props = props
+        if not bail:
+            _update_component_output(comp, parent, child_insts)
+        return inst
+    _, r = inst
+    if not _patch_host_props(r, old_el, new_el):
+        return None
+    type_ = new_el["type"]
+    r._react_children = _reconcile_children(
+        r,
+        getattr(r, "_react_children", []),
+        new_el.get("children") or [],
+        _get_child_host_context(host_context, type_),
+        allow_text=type_ == "text",
+    )
+    return (new_el, r)
+
+
+def _place(parent: Renderable, r: Renderable, pos: int) -> None:
+    """Ensure r sits at parent.children[pos] (positions before pos are already settled)."""
+    if pos < len(parent.children) and parent.children[pos] is r:
+        return
+    parent.add(r, pos)
+
+
+def _reconcile_children(
+    parent: Renderable,
+    old_pairs: list[tuple[Any, Any]],
+    new_children: list[Any],
+    host_context: dict,
+    allow_text: bool = False,
+) -> list[tuple[Any, Any]]:
+    """Diff old (element, instance) pairs against new child elements under parent.
+
+    Children are matched by key (or position when unkeyed); matches are patched in place, moved when
+    their order changed, and only unmatched ones are mounted / unmounted.
+    """
+    entries = [el for el in new_children if isinstance(el, dict) or (allow_text and isinstance(el, str))]
+    old_by_key: dict[tuple[str, Any], tuple[Any, Any]] = {}
+    for i, pair in enumerate(old_pairs):
+        old_by_key[_element_key(pair[0], i)] = pair
+    plan = [(el, old_by_key.pop(_element_key(el, i), None)) for i, el in enumerate(entries)]
+    for _, inst in old_by_key.values():
         _unmount(inst, parent)
 
-    # 旧输出已从 parent 移除，取当前 children 长度作为挂载起点
-    start_idx = len(parent.children)
+    new_pairs: list[tuple[Any, Any]] = []
+    pos = 0
+    for el, old in plan:
+        if isinstance(el, str):
+            if old is not None and isinstance(old[0], dict) and "__text" in old[0]:
+                chunk = old[1]
+                if chunk._text != el:
+                    chunk._text = el
+                    chunk.request_render()
+                _place(parent, chunk, pos)
+            else:
+                if old is not None:
+                    _unmount(old[1], parent)
+                chunk = TextChunkRenderable(parent.ctx, el)
+                parent.add(chunk, pos)
+            new_pairs.append(({"__text": el}, chunk))
+            pos += 1
+            continue
+        inst = _patch(old[0], old[1], el, parent, host_context) if old and _can_patch(old[0], el) else None
+        if inst is not None:
+            for r in _get_renderables(inst):
+                _place(parent, r, pos)
+                pos += 1
+        else:
+            if old is not None:
+                _unmount(old[1], parent)
+            inst, count = _mount(el, parent, pos, host_context)
+            pos += count
+        new_pairs.append((el, inst))
+    return new_pairs
+
+
+def _reconcile_one(old_el: Any, old_inst: Any, new_el: dict, parent: Renderable, host_context: dict) -> Any:
+    """Patch old_inst to new_el when possible, else replace it at the same position."""
+    if old_inst is not None and _can_patch(old_el, new_el):
+        inst = _patch(old_el, old_inst, new_el, parent, host_context)
+        if inst is not None:
+            return inst
+    index = None
+    if old_inst is not None:
+        rs = _get_renderables(old_inst)
+        if rs and rs[0] in parent.children:
+            index = parent.children.index(rs[0])
+        _unmount(old_inst, parent)
+    inst, _ = _mount(new_el, parent, index, host_context)
+    return inst
 
-    prev = hooks_module._current_component
-    hooks_module._current_component = comp
-    comp._hook_index = 0
-    try:
-        tree = comp.render()
-    finally:
-        hooks_module._current_component = prev
 
-    if not isinstance(tree, dict):
-        tree = {"type": "box", "props": {}, "children": []}
-    # 挂载整棵树（如 box）到 parent，而不是只挂载 tree 的子节点，否则会丢失 Box 导致布局错乱、Input 无尺寸
-    inst, cnt = _mount(tree, parent, start_idx)
-    comp._react_child_insts = [(tree, inst)]
+def _update_component_output(comp: Component, parent: Renderable, old_child_insts: list[tuple[Any, Any]]) -> None:
+    """Re-render comp and patch its previous output in place (old_child_insts is updated)."""
+    cancel_update(comp)
+    host_context = getattr(comp, "_react_host_context", None) or {"is_inside_text": False}
+    tree = _render_component(comp)
+    old_tree, old_inst = old_child_insts[0] if old_child_insts else (None, None)
+    try:
+        inst = _reconcile_one(old_tree, old_inst, tree, parent, host_context)
+    except Exception as e:
+        if not isinstance(comp, ErrorBoundary):
+            raise
+        comp.set_error(e)
+        if old_inst is not None:
+            _unmount(old_inst, parent)
+        tree = _render_component(comp)
+        inst, _ = _mount(tree, parent, None, host_context)
+    old_child_insts[:] = [(tree, inst)]
+    comp._react_child_insts = old_child_insts
+    hooks_module.run_effects(comp)
     if hasattr(parent.ctx, "renderer") and parent.ctx.renderer:
         parent.ctx.renderer.schedule_render()
 
 
 def reconcile(elements: Any, container: Renderable) -> None:
-    """将虚拟节点树挂载/更新到 container。elements 可为单节点或列表。"""
+    """将虚拟节点树挂载/更新到 container。elements 可为单节点或列表；按 type/key 与上次结果 diff。"""
     if elements is None:
         elements = []
     if isinstance(elements, dict):
         elements = [elements]
     old = getattr(container, "_react_children", None) or []
-    # 先卸载旧的
-    for _, inst in old:
-        _unmount(inst, container)
-    container._react_children = []
-    # 再挂载新的
-    idx = 0
-    for el in elements:
-        if isinstance(el, dict):
-            inst, cnt = _mount(el, container, idx)
-            container._react_children.append((el, inst))
-            idx += cnt
+    container._react_children = _reconcile_children(container, old, list(elements), {"is_inside_text": False})
 
 
 def create_reconciler(ctx: Any) -> Callable[[Any, Renderable], None]:
@@ -269,18 +504,17 @@ def create_root(renderer: Any) -> Any:
     def render(node: Any) -> None:
         nonlocal _react_children
         wrapped = h(ErrorBoundary, {"children": node})
-        for _, inst in _react_children:
-            _unmount(inst, root_container)
-        _react_children = []
-        inst, _cnt = _mount(wrapped, root_container, None, {"is_inside_text": False})
-        _react_children.append((wrapped, inst))
+        old_el, old_inst = _react_children[0] if _react_children else (None, None)
+        inst = _reconcile_one(old_el, old_inst, wrapped, root_container, {"is_inside_text": False})
+        _react_children = [(wrapped, inst)]
         if hasattr(renderer, "schedule_render"):
             renderer.schedule_render()
 
-    return type("Root", (), {"render": render, "unmount": cleanup})()
+    return type("Root", (), {"render": staticmethod(render), "unmount": staticmethod(cleanup)})()
 
 
 def flush_sync(fn: Callable[[], None] | None = None) -> None:
-    """Flush synchronous work. Aligns OpenTUI flushSync. No-op in custom reconciler; optional fn()."""
+    """Run fn() (optional), then re-render every queued component now. Aligns OpenTUI flushSync."""
     if fn is not None:
         fn()
+    flush_updates()
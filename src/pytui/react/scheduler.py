@@ -0,0 +1,73 @@
+# pytui.react.scheduler - Batched component updates (aligns React's update queue / batchedUpdates)
+# State setters enqueue their component instead of re-rendering immediately; the queue is flushed
+# once per renderer frame (via set_frame_callback, which the loop runs after input and before layout, so
+# updates made by key handlers render in the same frame) or on demand by flush_sync, parents first.
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Any
+
+_lock = threading.RLock()
+_queue: dict[int, Any] = {}
+_attached: weakref.WeakSet = weakref.WeakSet()
+# Updates scheduled while flushing (e.g. by effects) get further passes, bounded to avoid loops.
+_MAX_PASSES = 50
+
+
+def schedule_update(comp: Any) -> None:
+    """Mark comp dirty; it is re-rendered by the next flush (at most once per flush)."""
+    with _lock:
+        _queue[id(comp)] = comp
+    renderer = getattr(getattr(comp, "ctx", None), "renderer", None)
+    if renderer is None:
+        return
+    if renderer not in _attached and callable(getattr(renderer, "set_frame_callback", None)):
+        renderer.set_frame_callback(_on_frame)
+        _attached.add(renderer)
+    schedule_render = getattr(renderer, "schedule_render", None)
+    if callable(schedule_render):
+        schedule_render()
+
+
+def cancel_update(comp: Any) -> None:
+    """Drop a pending update (comp was just re-rendered or unmounted)."""
+    with _lock:
+        _queue.pop(id(comp), None)
+
+
+def is_update_pending(comp: Any) -> bool:
+    with _lock:
+        return id(comp) in _queue
+
+
+def has_pending_updates() -> bool:
+    with _lock:
+        return bool(_queue)
+
+
+def flush_updates() -> int:
+    """Re-render queued components, shallowest first; returns how many were re-rendered.
+
+    A component re-rendered as part of its parent's update is removed from the queue by the
+    reconciler, so each dirty subtree renders once.
+    """
+    count = 0
+    for _ in range(_MAX_PASSES):
+        with _lock:
+            if not _queue:
+                break
+            batch = sorted(_queue.values(), key=lambda c: getattr(c, "_react_depth", 0))
+        for comp in batch:
+            with _lock:
+                if _queue.pop(id(comp), None) is None:
+                    continue
+            comp.update()
+            count += 1
+    return count
+
+
+def _on_frame(_delta_ms: float) -> None:
+    if _queue:
+        flush_updates()
@@ -1,5 +1,6 @@
 # pytui.testing - 无 TTY 测试设施：TestRenderer、Mock 输入、快照
 
+from pytui.testing.input_trace import InputRecorder, InputTrace, record_input, replay_trace
 from pytui.testing.mock_keys import create_mock_keys
 from pytui.testing.mock_mouse import create_mock_mouse
 from pytui.testing.snapshot import assert_buffer_snapshot, buffer_snapshot_lines
@@ -12,4 +13,8 @@ __all__ = [
     "create_mock_mouse",
     "buffer_snapshot_lines",
     "assert_buffer_snapshot",
+    "InputTrace",
+    "InputRecorder",
+    "record_input",
+    "replay_trace",
 ]
@@ -0,0 +1,317 @@
+# pytui.testing.input_trace - Record raw stdin from a live Renderer and replay it into a headless one.
+# A trace is a compact binary file: magic + JSON header line (terminal size), then one record per input chunk
+# or resize as varints (delta µs since the previous record, tag) followed by the payload. Replay feeds the
+# chunks through Renderer.feed_raw_input (mouse reports first, then StdinBuffer, like the terminal path) at
+# the recorded pace, accelerated or as fast as possible, renders after each one and reports input-to-frame
+# latency percentiles:
+#
+#   PYTUI_RECORD_INPUT=session.ptrc python app.py                  # record a live session
+#   python -m pytui.testing.input_trace session.ptrc --app myapp:build --speed max
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import json
+import math
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pytui.core.renderer import Renderer
+
+MAGIC = b"PYTUI-TRACE\n"
+VERSION = 1
+
+# Record tags (low bit); for input the payload length is stored in the remaining bits.
+_TAG_INPUT = 0
+_TAG_RESIZE = 1
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("truncated input trace")
+        b = data[pos]
+        pos += 1
+        value |= (b & 0x7F) << shift
+        if b < 0x80:
+            return value, pos
+        shift += 7
+
+
+@dataclass
+class TraceEvent:
+    """One recorded record: time offset from the start of the trace (µs) and raw bytes or a new size."""
+
+    t_us: int
+    data: bytes = b""
+    size: tuple[int, int] | None = None
+
+
+@dataclass
+class InputTrace:
+    """Recorded input session: initial terminal size and the events in arrival order."""
+
+    width: int = 80
+    height: int = 24
+    events: list[TraceEvent] = field(default_factory=list)
+
+    @property
+    def duration_us(self) -> int:
+        return self.events[-1].t_us if self.events else 0
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps({"version": VERSION, "width": self.width, "height": self.height}).encode()
+        out = bytearray(MAGIC + header + b"\n")
+        prev = 0
+        for ev in self.events:
+            _write_varint(out, max(0, ev.t_us - prev))
+            prev = ev.t_us
+            if ev.size is not None:
+                _write_varint(out, _TAG_RESIZE)
+                _write_varint(out, ev.size[0])
+                _write_varint(out, ev.size[1])
+            else:
+                _write_varint(out, (len(ev.data) << 1) | _TAG_INPUT)
+                out += ev.data
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> InputTrace:
+        if not data.startswith(MAGIC):
+            raise ValueError("not a pytui input trace")
+        nl = data.index(b"\n", len(MAGIC))
+        header = json.loads(data[len(MAGIC) : nl])
+        if header.get("version") != VERSION:
+            raise ValueError(f"unsupported input trace version: {header.get('version')}")
+        trace = cls(int(header["width"]), int(header["height"]))
+        pos = nl + 1
+        t = 0
+        while pos < len(data):
+            delta, pos = _read_varint(data, pos)
+            tag, pos = _read_varint(data, pos)
+            t += delta
+            if tag & 1 == _TAG_RESIZE:
+                w, pos = _read_varint(data, pos)
+                h, pos = _read_varint(data, pos)
+                trace.events.append(TraceEvent(t, size=(w, h)))
+            else:
+                n = tag >> 1
+                if pos + n > len(data):
+                    raise ValueError("truncated input trace")
+                trace.events.append(TraceEvent(t, data[pos : pos + n]))
+                pos += n
+        return trace
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> InputTrace:
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class InputRecorder:
+    """Capture the raw stdin chunks (and resizes) a Renderer reads, with arrival timestamps."""
+
+    def __init__(self, renderer: Renderer) -> None:
+        self._renderer = renderer
+        self.trace = InputTrace(renderer.width, renderer.height)
+        self._t0: int | None = None
+
+    def start(self) -> InputRecorder:
+        r = self._renderer
+        self.trace = InputTrace(r.width, r.height)
+        self._t0 = time.perf_counter_ns()
+        r._input_recorder = self
+        r.events.on("resize", self._on_resize)
+        return self
+
+    def stop(self) -> InputTrace:
+        r = self._renderer
+        if r._input_recorder is self:
+            r._input_recorder = None
+        r.events.remove_listener("resize", self._on_resize)
+        return self.trace
+
+    def record(self, data: bytes) -> None:
+        if self._t0 is not None and data:
+            self.trace.events.append(TraceEvent(self._elapsed_us(), bytes(data)))
+
+    def save(self, path: str | Path) -> None:
+        self.trace.save(path)
+
+    def _elapsed_us(self) -> int:
+        return (time.perf_counter_ns() - (self._t0 or 0)) // 1000
+
+    def _on_resize(self, width: int, height: int) -> None:
+        if self._t0 is not None:
+            self.trace.events.append(TraceEvent(self._elapsed_us(), size=(width, height)))
+
+    def __enter__(self) -> InputRecorder:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def record_input(renderer: Renderer) -> InputRecorder:
+    """Start recording renderer's raw input; stop() returns the InputTrace."""
+    return InputRecorder(renderer).start()
+
+
+class _NullWriter:
+    """stdout stand-in for replayed frames."""
+
+    def write(self, data: str) -> int:
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+def replay_trace(
+    trace: InputTrace,
+    renderer: Renderer | None = None,
+    speed: float = 1.0,
+    setup: Callable[[Renderer], Any] | None = None,
+) -> dict:
+    """Feed trace into renderer (default: a headless test renderer of the recorded size) and measure latency.
+
+    speed scales the recorded gaps (2.0 = twice as fast); 0 or math.inf replays as fast as possible, where
+    StdinBuffer timeouts (lone ESC) still fire when the recorded gap to the next chunk exceeds them. setup(r)
+    builds the UI before the first event. Latency is measured from an input's (scheduled) arrival to the end
+    of the first frame rendered after it, so at finite speed it includes time spent queued behind a slow frame.
+    Inputs that never lead to a frame are counted in "unrendered". Frame callbacks run before each frame check,
+    as in the render loop, so React state updates are flushed.
+    """
+    from pytui.benchmark.headless import percentile
+
+    if renderer is None:
+        from pytui.testing.test_renderer import create_test_renderer
+
+        renderer = create_test_renderer(trace.width, trace.height)
+    if setup is not None:
+        setup(renderer)
+    scale = 0.0 if speed <= 0 or math.isinf(speed) else 1.0 / speed
+    stdin = renderer._stdin_buffer
+    latencies: list[float] = []
+    waiting: list[int] = []
+    unrendered = frames = 0
+    events = trace.events
+    last_tick = time.time()
+
+    def settle() -> None:
+        # Run the loop's per-frame step (frame callbacks flush e.g. React updates), then render if the
+        # pending inputs changed anything; drop them once nothing is left buffered.
+        nonlocal unrendered, frames, last_tick
+        now = time.time()
+        renderer._tick(now, (now - last_tick) * 1000.0)
+        last_tick = now
+        if renderer._render_scheduled or renderer._should_render():
+            renderer._render_frame()
+            renderer._render_scheduled = False
+            frames += 1
+            done = time.perf_counter_ns()
+            latencies.extend((done - t) / 1e6 for t in waiting)
+            waiting.clear()
+        elif not stdin.get_buffer():
+            unrendered += len(waiting)
+            waiting.clear()
+
+    with contextlib.redirect_stdout(_NullWriter()):  # type: ignore[type-var]
+        renderer._render_frame()
+        start = time.perf_counter_ns()
+        for i, ev in enumerate(events):
+            due = start + int(ev.t_us * 1000 * scale)
+            while True:
+                now = time.perf_counter_ns()
+                if now >= due:
+                    break
+                if waiting and stdin.check_timeout():
+                    settle()
+                time.sleep(min((due - now) / 1e9, 0.001))
+            arrival = due if scale else time.perf_counter_ns()
+            if ev.size is not None:
+                terminal = renderer.terminal
+                if hasattr(terminal, "resize"):
+                    terminal.resize(*ev.size)
+                renderer._check_resize()
+            else:
+                renderer.feed_raw_input(ev.data)
+            if not scale and stdin.deadline is not None:
+                gap_us = events[i + 1].t_us - ev.t_us if i + 1 < len(events) else math.inf
+                if gap_us * 1000 >= (stdin.deadline - time.monotonic()) * 1e9:
+                    stdin.check_timeout(stdin.deadline)
+            waiting.append(arrival)
+            settle()
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+    unrendered += len(waiting)
+    latencies.sort()
+    n = len(latencies)
+    return {
+        "inputs": len(events),
+        "frames": frames,
+        "unrendered": unrendered,
+        "speed": speed,
+        "recorded_s": trace.duration_us / 1e6,
+        "elapsed_s": elapsed,
+        "mean_ms": sum(latencies) / n if n else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p90_ms": percentile(latencies, 90),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": latencies[-1] if n else 0.0,
+    }
+
+
+# --- CLI ---
+
+def _load_setup(spec: str) -> Callable[[Renderer], Any]:
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name or "setup")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="pytui-replay", description="Replay a recorded pytui input trace headlessly.")
+    parser.add_argument("trace", help="Trace file (record with PYTUI_RECORD_INPUT=path)")
+    parser.add_argument("--app", default=None, help="module:function called with the renderer to build the UI")
+    parser.add_argument("--speed", default="1", help="Pace multiplier, or 'max' (default 1 = recorded pace)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    speed = math.inf if args.speed == "max" else float(args.speed)
+    report = replay_trace(InputTrace.load(args.trace), speed=speed, setup=_load_setup(args.app) if args.app else None)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"{report['inputs']} inputs, {report['frames']} frames ({report['unrendered']} inputs without a frame) "
+            f"in {report['elapsed_s']:.3f}s (recorded {report['recorded_s']:.3f}s)\n"
+            f"input->frame ms  p50 {report['p50_ms']:.3f}  p90 {report['p90_ms']:.3f}  "
+            f"p99 {report['p99_ms']:.3f}  max {report['max_ms']:.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
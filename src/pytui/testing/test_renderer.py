@@ -28,6 +28,11 @@ class MockTerminal:
     def height(self) -> int:
         return self._height
 
+    def resize(self, width: int, height: int) -> None:
+        """改变桩终端尺寸；renderer 下次 _check_resize 时生效。"""
+        self._width = max(1, width)
+        self._height = max(1, height)
+
     def enter_alternate_screen(self) -> None:
         pass
 
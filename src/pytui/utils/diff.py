@@ -1,9 +1,11 @@
 # pytui.utils.diff - line-based text diff
 # Aligns with OpenTUI parsePatch: hunks with oldStart/newStart and per-line +/-/space.
 
+import mmap
 import re
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Optional
 
 # (tag, line): tag is " " (unchanged), "+" (added), "-" (removed)
 DiffLine = tuple[str, str]
@@ -11,10 +13,18 @@ DiffLine = tuple[str, str]
 
 @dataclass
 class DiffHunk:
-    """Single hunk: @@ -old_start,old_count +new_start,new_count @@"""
+    """Single hunk: @@ -old_start,old_count +new_start,new_count @@
+
+    byte_offset/byte_length locate the hunk (header included) in the source stream when it came from
+    StreamingPatchParser; byte_offset is -1 otherwise.
+    """
     old_start: int
     new_start: int
     lines: list[DiffLine] = field(default_factory=list)
+    old_count: int = 0
+    new_count: int = 0
+    byte_offset: int = -1
+    byte_length: int = 0
 
 
 @dataclass
@@ -23,15 +33,29 @@ class ParsedPatch:
     hunks: list[DiffHunk] = field(default_factory=list)
 
 
-def parse_patch(diff_text: str) -> tuple[Optional[ParsedPatch], Optional[str]]:
+@dataclass
+class FilePatch:
+    """One file section of a multi-file unified diff (diff --git / --- / +++ headers and its hunks)."""
+    old_file: str | None = None
+    new_file: str | None = None
+    header: list[str] = field(default_factory=list)
+    hunks: list[DiffHunk] = field(default_factory=list)
+    byte_offset: int = 0
+    byte_length: int = 0
+
+
+# @@ -oldStart[,oldCount] +newStart[,newCount] @@
+_HUNK_HEADER_RE = re.compile(r"^@@\s+-(\d+)(?:,(\d+))?\s+\+(\d+)(?:,(\d+))?\s+@@")
+
+
+def parse_patch(diff_text: str) -> tuple[ParsedPatch | None, str | None]:
     """Parse unified diff into hunks with line numbers. Returns (patch, None) or (None, error_message). Aligns with OpenTUI parsePatch."""
     if not (diff_text or "").strip():
         return ParsedPatch(), None
     text = (diff_text or "").strip()
     lines = text.splitlines()
     hunks: list[DiffHunk] = []
-    # @@ -oldStart[,oldCount] +newStart[,newCount] @@
-    hunk_re = re.compile(r"^@@\s+-(\d+)(?:,(\d+))?\s+\+(\d+)(?:,(\d+))?\s+@@")
+    hunk_re = _HUNK_HEADER_RE
     i = 0
     while i < len(lines):
         raw = lines[i]
@@ -60,7 +84,15 @@ def parse_patch(diff_text: str) -> tuple[Optional[ParsedPatch], Optional[str]]:
                     i += 1
                 else:
                     break
-            hunks.append(DiffHunk(old_start=old_start, new_start=new_start, lines=hunk_lines))
+            hunks.append(
+                DiffHunk(
+                    old_start=old_start,
+                    new_start=new_start,
+                    lines=hunk_lines,
+                    old_count=int(m.group(2)) if m.group(2) is not None else 1,
+                    new_count=int(m.group(4)) if m.group(4) is not None else 1,
+                )
+            )
             continue
         i += 1
     if not hunks:
@@ -68,8 +100,187 @@ def parse_patch(diff_text: str) -> tuple[Optional[ParsedPatch], Optional[str]]:
     return ParsedPatch(hunks=hunks), None
 
 
+class StreamingPatchParser:
+    """Incremental multi-file unified diff parser.
+
+    feed() accepts str or bytes chunks of any size (e.g. reads from a subprocess pipe) and returns the
+    (file, hunk) pairs completed so far; a hunk is complete as soon as its old/new line counts are
+    satisfied, so callers can render the first hunks before the rest of the patch arrives.
+    Offsets are byte offsets into the stream (str chunks count as their encoded bytes). With
+    keep_lines=False only headers, counts and offsets are kept, which is enough to index a patch
+    far larger than memory and load single hunks later with read_hunk().
+    """
+
+    def __init__(self, keep_lines: bool = True, encoding: str = "utf-8") -> None:
+        self.keep_lines = keep_lines
+        self.encoding = encoding
+        self.files: list[FilePatch] = []
+        self._pending = bytearray()
+        self._offset = 0  # stream offset of _pending[0]
+        self._file: FilePatch | None = None
+        self._hunk: DiffHunk | None = None
+        self._old_left = 0
+        self._new_left = 0
+        self._closed = False
+
+    @property
+    def bytes_consumed(self) -> int:
+        return self._offset
+
+    def feed(self, chunk: str | bytes) -> list[tuple[FilePatch, DiffHunk]]:
+        if self._closed:
+            raise ValueError("StreamingPatchParser is closed")
+        if isinstance(chunk, str):
+            chunk = chunk.encode(self.encoding)
+        out: list[tuple[FilePatch, DiffHunk]] = []
+        pending = self._pending
+        pending += chunk
+        start = 0
+        while True:
+            nl = pending.find(b"\n", start)
+            if nl < 0:
+                break
+            self._process_line(bytes(pending[start : nl + 1]), self._offset + start, out)
+            start = nl + 1
+        if start:
+            del pending[:start]
+            self._offset += start
+        return out
+
+    def close(self) -> list[tuple[FilePatch, DiffHunk]]:
+        """Flush a trailing line without newline and any unterminated hunk."""
+        out: list[tuple[FilePatch, DiffHunk]] = []
+        if self._closed:
+            return out
+        if self._pending:
+            n = len(self._pending)
+            self._process_line(bytes(self._pending), self._offset, out)
+            self._offset += n
+            self._pending.clear()
+        self._finish_hunk(out)
+        self._closed = True
+        return out
+
+    def _finish_hunk(self, out: list[tuple[FilePatch, DiffHunk]]) -> None:
+        if self._hunk is not None and self._file is not None:
+            out.append((self._file, self._hunk))
+        self._hunk = None
+
+    def _start_file(self, offset: int) -> FilePatch:
+        f = FilePatch(byte_offset=offset)
+        self.files.append(f)
+        self._file = f
+        return f
+
+    def _process_line(self, raw: bytes, offset: int, out: list[tuple[FilePatch, DiffHunk]]) -> None:
+        line = raw.decode(self.encoding, errors="replace").rstrip("\r\n")
+        hunk = self._hunk
+        if hunk is not None:
+            fc = line[:1]
+            if fc == "\\":
+                hunk.byte_length += len(raw)
+                self._extend_file(offset + len(raw))
+                return
+            if fc in (" ", "") and (self._old_left > 0 or self._new_left > 0):
+                tag = " "
+                self._old_left -= 1
+                self._new_left -= 1
+            elif fc == "-" and self._old_left > 0:
+                tag = "-"
+                self._old_left -= 1
+            elif fc == "+" and self._new_left > 0:
+                tag = "+"
+                self._new_left -= 1
+            else:
+                tag = ""
+            if tag:
+                if self.keep_lines:
+                    hunk.lines.append((tag, line[1:]))
+                hunk.byte_length += len(raw)
+                self._extend_file(offset + len(raw))
+                if self._old_left <= 0 and self._new_left <= 0:
+                    self._finish_hunk(out)
+                return
+            self._finish_hunk(out)
+        if line.startswith("@@"):
+            m = _HUNK_HEADER_RE.match(line)
+            if m:
+                f = self._file if self._file is not None else self._start_file(offset)
+                old_count = int(m.group(2)) if m.group(2) is not None else 1
+                new_count = int(m.group(4)) if m.group(4) is not None else 1
+                self._hunk = DiffHunk(
+                    old_start=int(m.group(1)),
+                    new_start=int(m.group(3)),
+                    old_count=old_count,
+                    new_count=new_count,
+                    byte_offset=offset,
+                    byte_length=len(raw),
+                )
+                f.hunks.append(self._hunk)
+                self._old_left, self._new_left = old_count, new_count
+                self._extend_file(offset + len(raw))
+                if old_count == 0 and new_count == 0:
+                    self._finish_hunk(out)
+                return
+        if line.startswith("diff "):
+            self._start_file(offset).header.append(line)
+        elif line.startswith("--- "):
+            f = self._file
+            if f is None or f.hunks or f.old_file is not None:
+                f = self._start_file(offset)
+            f.old_file = line[4:].split("\t")[0]
+        elif line.startswith("+++ ") and self._file is not None and self._file.new_file is None:
+            self._file.new_file = line[4:].split("\t")[0]
+        elif self._file is not None and not self._file.hunks and line:
+            self._file.header.append(line)
+        else:
+            return
+        self._extend_file(offset + len(raw))
+
+    def _extend_file(self, end: int) -> None:
+        if self._file is not None:
+            self._file.byte_length = end - self._file.byte_offset
+
+
+def iter_patch(
+    chunks: Iterable[str | bytes], keep_lines: bool = True
+) -> Iterator[tuple[FilePatch, DiffHunk]]:
+    """Yield (file, hunk) pairs from an iterable of diff chunks as soon as each hunk is complete."""
+    parser = StreamingPatchParser(keep_lines=keep_lines)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def index_patch_file(path: str, chunk_size: int = 1 << 20) -> list[FilePatch]:
+    """Scan a patch file in chunks and return its files/hunks with byte offsets but no line content."""
+    parser = StreamingPatchParser(keep_lines=False)
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    parser.close()
+    return parser.files
+
+
+def read_hunk(source: bytes | bytearray | memoryview | mmap.mmap, hunk: DiffHunk) -> DiffHunk:
+    """Load one indexed hunk's lines from source (bytes or an mmap of the patch) using its byte offsets."""
+    if hunk.byte_offset < 0:
+        return hunk
+    parser = StreamingPatchParser()
+    parser.feed(bytes(source[hunk.byte_offset : hunk.byte_offset + hunk.byte_length]))
+    parser.close()
+    for f in parser.files:
+        for h in f.hunks:
+            h.byte_offset = hunk.byte_offset
+            return h
+    return DiffHunk(old_start=hunk.old_start, new_start=hunk.new_start, byte_offset=hunk.byte_offset)
+
+
 # (tag, content, old_line_num or None, new_line_num or None)
-UnifiedLine = tuple[str, str, Optional[int], Optional[int]]
+UnifiedLine = tuple[str, str, int | None, int | None]
 
 
 def flattened_unified_lines(patch: ParsedPatch) -> list[UnifiedLine]:
@@ -95,7 +306,7 @@ def flattened_unified_lines(patch: ParsedPatch) -> list[UnifiedLine]:
 class LogicalLine:
     """One line in split view. Aligns with OpenTUI LogicalLine."""
     content: str
-    line_num: Optional[int] = None
+    line_num: int | None = None
     hide_line_number: bool = False
     type: str = "context"  # "context" | "add" | "remove" | "empty"
 
@@ -145,6 +356,197 @@ def build_split_logical_lines(patch: ParsedPatch) -> tuple[list[LogicalLine], li
     return left_lines, right_lines
 
 
+# (text, token_type) style run, as returned by pytui.lib.tree_sitter.highlight
+StyleRun = tuple[str, str]
+
+
+def wrap_text(text: str, width: int, wrap_mode: str) -> list[str]:
+    """Break one logical line into visual rows. wrap_mode none -> one row; word/char -> break at width."""
+    if width <= 0 or wrap_mode == "none":
+        return [text] if text else [""]
+    if len(text) <= width:
+        return [text] if text else [""]
+    return [text[i : i + width] for i in range(0, len(text), width)]
+
+
+def _slice_runs(runs: list[StyleRun], start: int, end: int) -> list[StyleRun]:
+    """Cut [start, end) out of a line's style runs, splitting runs at the boundaries."""
+    out: list[StyleRun] = []
+    pos = 0
+    for text, token_type in runs:
+        run_end = pos + len(text)
+        if run_end > start and pos < end:
+            out.append((text[max(0, start - pos) : min(len(text), end - pos)], token_type))
+        if run_end >= end:
+            break
+        pos = run_end
+    return out
+
+
+@dataclass(slots=True)
+class DiffRow:
+    """One visual row of a diff view: a wrapped segment of a logical line.
+
+    tag is " "/"+"/"-" in unified rows and "context"/"add"/"remove"/"empty" in split rows.
+    line_num is only set on the first segment; start is the segment's column in the logical line.
+    """
+    tag: str
+    text: str
+    line_num: int | None = None
+    line_index: int = 0
+    start: int = 0
+
+
+class DiffRowModel:
+    """Precomputed visual rows for a diff view, built once per patch / width / wrap mode.
+
+    rows holds the unified rows, or the left column in split view (right_rows then holds the right
+    column, same length). line_starts[i] is the first visual row of logical line i, so scroll
+    offsets map to lines with a bisect and rendering only touches the visible slice.
+    Style runs are computed lazily per logical line through highlight and cached.
+    """
+
+    def __init__(
+        self,
+        rows: list[DiffRow],
+        line_starts: list[int],
+        contents: list[str],
+        line_number_width: int = 0,
+        right_rows: list[DiffRow] | None = None,
+        right_contents: list[str] | None = None,
+        highlight: Callable[[str], list[StyleRun]] | None = None,
+    ) -> None:
+        self.rows = rows
+        self.right_rows = right_rows
+        self.line_starts = line_starts
+        self.line_number_width = line_number_width
+        self._contents = contents
+        self._right_contents = right_contents
+        self._highlight = highlight
+        self._runs_cache: dict[tuple[bool, int], list[StyleRun]] = {}
+        self.content_width = 0  # unified content width, or the left column's in split view
+        self.right_width = 0  # right column's content width in split view
+
+    def extend_unified(self, lines: list[UnifiedLine], wrap_mode: str) -> None:
+        """Append unified lines (e.g. hunks that arrived from a stream) without rebuilding earlier rows."""
+        rows, line_starts, contents = self.rows, self.line_starts, self._contents
+        for tag, content, old_num, new_num in lines:
+            idx = len(line_starts)
+            line_starts.append(len(rows))
+            contents.append(content)
+            display_num = new_num if new_num is not None else old_num
+            _wrap_rows(rows, tag, content, display_num, idx, self.content_width, wrap_mode)
+
+    def extend_split(self, left_lines: list[LogicalLine], right_lines: list[LogicalLine], wrap_mode: str) -> None:
+        """Append paired split-view lines without rebuilding earlier rows; the shorter side is padded."""
+        left_rows, right_rows, line_starts = self.rows, self.right_rows, self.line_starts
+        assert right_rows is not None and self._right_contents is not None
+        for ll, rl in zip(left_lines, right_lines):
+            idx = len(line_starts)
+            line_starts.append(len(left_rows))
+            self._contents.append(ll.content)
+            self._right_contents.append(rl.content)
+            left_num = None if ll.hide_line_number else ll.line_num
+            right_num = None if rl.hide_line_number else rl.line_num
+            n_left = _wrap_rows(left_rows, ll.type, ll.content, left_num, idx, self.content_width, wrap_mode)
+            n_right = _wrap_rows(right_rows, rl.type, rl.content, right_num, idx, self.right_width, wrap_mode)
+            for _ in range(n_left, n_right):
+                left_rows.append(DiffRow(ll.type, "", None, idx))
+            for _ in range(n_right, n_left):
+                right_rows.append(DiffRow(rl.type, "", None, idx))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def is_split(self) -> bool:
+        return self.right_rows is not None
+
+    def visible_range(self, scroll_top: int, height: int) -> range:
+        """Row indices visible in a viewport of height rows starting at scroll_top."""
+        start = max(0, min(scroll_top, len(self.rows)))
+        return range(start, min(len(self.rows), start + max(0, height)))
+
+    def row_for_line(self, line_index: int) -> int:
+        """First visual row of logical line line_index (clamped)."""
+        if not self.line_starts:
+            return 0
+        return self.line_starts[max(0, min(line_index, len(self.line_starts) - 1))]
+
+    def line_for_row(self, row: int) -> int:
+        """Logical line index that visual row belongs to."""
+        return max(0, bisect_right(self.line_starts, row) - 1)
+
+    def style_runs(self, row: DiffRow, right: bool = False) -> list[StyleRun] | None:
+        """Highlight runs for row's segment, or None when the model has no highlighter."""
+        if self._highlight is None or not row.text:
+            return None
+        contents = self._right_contents if right else self._contents
+        if contents is None:
+            return None
+        key = (right, row.line_index)
+        runs = self._runs_cache.get(key)
+        if runs is None:
+            runs = self._highlight(contents[row.line_index])
+            self._runs_cache[key] = runs
+        return _slice_runs(runs, row.start, row.start + len(row.text))
+
+
+def _wrap_rows(
+    out: list[DiffRow], tag: str, content: str, line_num: int | None, line_index: int, width: int, wrap_mode: str
+) -> int:
+    """Append content's wrapped rows to out; returns the number of rows added."""
+    parts = wrap_text(content, width, wrap_mode)
+    start = 0
+    for wi, part in enumerate(parts):
+        out.append(DiffRow(tag, part, line_num if wi == 0 else None, line_index, start))
+        start += len(part)
+    return len(parts)
+
+
+def unified_line_number_width(lines: list[UnifiedLine], width: int) -> int:
+    """Width of the line-number column for a unified view of the given total width."""
+    if not lines:
+        return 0
+    max_num = max(
+        (ln for _, _, old_n, new_n in lines for ln in (old_n, new_n) if ln is not None),
+        default=len(lines),
+    )
+    return min(len(str(max_num)) + 1, max(0, (width - 3) // 4))
+
+
+def build_unified_row_model(
+    lines: list[UnifiedLine],
+    width: int,
+    wrap_mode: str = "none",
+    show_line_numbers: bool = True,
+    highlight: Callable[[str], list[StyleRun]] | None = None,
+) -> DiffRowModel:
+    """Wrap unified lines into visual rows for a view of the given total width."""
+    line_w = unified_line_number_width(lines, width) if show_line_numbers else 0
+    content_width = max(1, width - 2 - line_w)  # "+ " / "- " / "  " sign, then line numbers
+    model = DiffRowModel([], [], [], line_number_width=line_w, highlight=highlight)
+    model.content_width = content_width
+    model.extend_unified(lines, wrap_mode)
+    return model
+
+
+def build_split_row_model(
+    left_lines: list["LogicalLine"],
+    right_lines: list["LogicalLine"],
+    left_width: int,
+    right_width: int,
+    wrap_mode: str = "none",
+    line_number_width: int = 3,
+) -> DiffRowModel:
+    """Wrap paired split-view lines into aligned left/right visual rows; the shorter side is padded."""
+    model = DiffRowModel([], [], [], line_number_width=line_number_width, right_rows=[], right_contents=[])
+    model.content_width = left_width
+    model.right_width = right_width
+    model.extend_split(left_lines, right_lines, wrap_mode)
+    return model
+
+
 def parse_unified_diff(diff_text: str) -> list[DiffLine]:
     """Parse unified diff string into list of (tag, line_content). Fallback when parse_patch not used."""
     out: list[DiffLine] = []
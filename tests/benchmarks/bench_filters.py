@@ -0,0 +1,73 @@
+# tests.benchmarks.bench_filters - post.filters 颜色平面滤镜性能基线
+
+import random
+
+import pytest
+
+pytest.importorskip("pytui.post.filters")
+
+_PALETTE = [(255, 255, 255, 255), (200, 80, 80, 255), (30, 30, 40, 255), (90, 200, 120, 255), (0, 0, 0, 0)]
+
+
+def _filled_buffer(width: int = 200, height: int = 60):
+    from pytui.core.buffer import Cell, OptimizedBuffer
+
+    buf = OptimizedBuffer(width, height, use_native=False)
+    rng = random.Random(0)
+    for y in range(height):
+        for x in range(width):
+            buf.set_cell(x, y, Cell(char="x", fg=rng.choice(_PALETTE), bg=_PALETTE[2 + y % 3]))
+    return buf
+
+
+def _per_cell(buffer, color_fn) -> None:
+    """逐格 get_cell/set_cell 的参考实现（颜色平面化之前的做法），作为对照基线。"""
+    from dataclasses import replace
+
+    for y in range(buffer.height):
+        for x in range(buffer.width):
+            cell = buffer.get_cell(x, y)
+            if cell is None:
+                continue
+            buffer.set_cell(x, y, replace(cell, fg=color_fn(cell.fg), bg=color_fn(cell.bg)))
+
+
+def _invert_color(c):
+    r, g, b, a = c
+    return (255 - r, 255 - g, 255 - b, a)
+
+
+def _dim_color(c):
+    from pytui.core.buffer import OptimizedBuffer
+
+    return OptimizedBuffer.blend_color(c, (0, 0, 0, 255), 0.5)
+
+
+class TestBenchFilters:
+    """apply_invert / apply_dim / apply_grayscale 200x60 基准，与逐格参考实现对照。"""
+
+    def test_invert_200x60(self, benchmark):
+        from pytui.post.filters import apply_invert
+
+        buf = _filled_buffer()
+        benchmark(apply_invert, buf)
+
+    def test_invert_per_cell_200x60(self, benchmark):
+        buf = _filled_buffer()
+        benchmark(_per_cell, buf, _invert_color)
+
+    def test_dim_200x60(self, benchmark):
+        from pytui.post.filters import apply_dim
+
+        buf = _filled_buffer()
+        benchmark(apply_dim, buf, 0.5)
+
+    def test_dim_per_cell_200x60(self, benchmark):
+        buf = _filled_buffer()
+        benchmark(_per_cell, buf, _dim_color)
+
+    def test_grayscale_200x60(self, benchmark):
+        from pytui.post.filters import apply_grayscale
+
+        buf = _filled_buffer()
+        benchmark(apply_grayscale, buf)
@@ -0,0 +1,68 @@
+# tests.unit.benchmark.test_headless - headless benchmark suite: stats, baseline compare, scenario smoke runs
+
+import json
+
+import pytest
+
+pytest.importorskip("pytui.benchmark.headless")
+
+
+class TestHeadlessBenchmark:
+    def test_percentile_nearest_rank(self):
+        from pytui.benchmark.headless import percentile
+
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 90) == 90.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+    def test_run_scenario_reports_timings_and_bytes(self):
+        import sys
+
+        from pytui.benchmark.headless import Scenario, run_scenario
+
+        calls = []
+
+        def setup():
+            def step():
+                calls.append(1)
+                sys.stdout.write("ab")
+
+            return step
+
+        result = run_scenario(Scenario("t", "micro", setup, 5), warmup=2, trace_allocations=False)
+        assert len(calls) == 7
+        assert result["iterations"] == 5
+        assert result["bytes_per_iter"] == 2
+        assert 0 <= result["min_ms"] <= result["p50_ms"] <= result["p99_ms"] <= result["max_ms"]
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        from pytui.benchmark.headless import compare
+
+        baseline = {"results": [{"name": "a", "p50_ms": 1.0, "p90_ms": 2.0, "bytes_per_iter": 100}]}
+        ok = [{"name": "a", "p50_ms": 1.2, "p90_ms": 2.0, "bytes_per_iter": 100}, {"name": "new", "p50_ms": 9.0}]
+        assert compare(ok, baseline, threshold=0.25) == []
+        bad = [{"name": "a", "p50_ms": 1.5, "p90_ms": 2.0, "bytes_per_iter": 200}]
+        regs = compare(bad, baseline, threshold=0.25)
+        assert [(r["metric"], r["ratio"]) for r in regs] == [("p50_ms", 1.5), ("bytes_per_iter", 2.0)]
+
+    @pytest.mark.parametrize("name", ["buffer.fill_rect", "frame.diff_sparse", "post.pipeline", "react.update"])
+    def test_scenarios_smoke(self, name):
+        from pytui.benchmark.headless import SCENARIOS, run_scenario
+
+        result = run_scenario(SCENARIOS[name], iterations=1, warmup=1, trace_allocations=False)
+        assert result["name"] == name and result["p50_ms"] > 0
+
+    def test_main_saves_and_checks_baseline(self, tmp_path, capsys):
+        from pytui.benchmark.headless import main
+
+        base = tmp_path / "base.json"
+        assert main(["-k", "buffer.fill_rect", "--scale", "0.02", "--no-alloc", "--save-baseline", str(base)]) == 0
+        data = json.loads(base.read_text())
+        assert [r["name"] for r in data["results"]] == ["buffer.fill_rect"]
+        data["results"][0]["p50_ms"] = data["results"][0]["p90_ms"] = 1e-6
+        base.write_text(json.dumps(data))
+        assert main(["-k", "buffer.fill_rect", "--scale", "0.02", "--no-alloc", "--baseline", str(base)]) == 1
+        assert "REGRESSION buffer.fill_rect" in capsys.readouterr().out
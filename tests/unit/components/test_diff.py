@@ -50,6 +50,26 @@ class TestDiffComponent:
         assert d.old_text == "a"
         assert d.new_text == "b"
 
+    def test_text_setters_rebuild_rows(self, mock_context, buffer_40x20):
+        from pytui.components.diff import Diff
+
+        d = Diff(mock_context, {"old_text": "a", "new_text": "a\nb", "width": 40, "height": 5})
+        d.x, d.y, d.width, d.height = 0, 0, 40, 5
+        d.render_self(buffer_40x20)
+        assert d._row_model is not None
+        d.new_text = "a\nzzz"
+        assert d._row_model is None
+        buffer_40x20.clear()
+        d.render_self(buffer_40x20)
+        text = "".join(buffer_40x20.get_cell(x, y).char for y in range(5) for x in range(40))
+        assert "zzz" in text and "b" not in text.replace(" ", "")
+        assert not text.startswith("+")
+        d.old_text = "zzz"
+        buffer_40x20.clear()
+        d.render_self(buffer_40x20)
+        text = "".join(buffer_40x20.get_cell(x, y).char for y in range(5) for x in range(40))
+        assert text.startswith("+")
+
     def test_openTUI_color_options_and_defaults(self, mock_context):
         from pytui.components.diff import Diff
 
@@ -156,3 +176,108 @@ class TestDiffComponent:
         d.destroy_recursively()
         assert getattr(d, "_parse_error", None) is None
         assert getattr(d, "_parsed_patch", None) is None
+
+    def test_row_model_cached_until_width_or_diff_changes(self, mock_context, buffer_40x20):
+        from pytui.components.diff import Diff
+
+        d = Diff(mock_context, {"diff": "@@ -1,2 +1,2 @@\n line1\n-line2\n+new2"})
+        d.x, d.y, d.width, d.height = 0, 0, 40, 5
+        d.render_self(buffer_40x20)
+        model = d._row_model
+        assert model is not None
+        d.render_self(buffer_40x20)
+        assert d._row_model is model
+        d.width = 30
+        d.render_self(buffer_40x20)
+        assert d._row_model is not model
+        model = d._row_model
+        d.wrap_mode = "char"
+        assert d._row_model is None
+        d.diff = "@@ -1 +1 @@\n-a\n+b"
+        d.render_self(buffer_40x20)
+        assert d._row_model is not model
+
+    def test_scroll_top_renders_only_visible_slice(self, mock_context, buffer_40x20):
+        from pytui.components.diff import Diff
+
+        body = "\n".join(f" line{i}" for i in range(1, 101))
+        d = Diff(mock_context, {"diff": f"@@ -1,100 +1,100 @@\n{body}", "show_line_numbers": False})
+        d.x, d.y, d.width, d.height = 0, 0, 40, 3
+        assert d.visual_row_count == 100
+        d.scroll_top = 50
+        d.render_self(buffer_40x20)
+        row0 = "".join(buffer_40x20.get_cell(x, 0).char for x in range(2, 8))
+        assert row0 == "line51"
+        d.scroll_top = 1000
+        assert d.scroll_top == 97
+        d.scroll_to_line(9)
+        assert d.scroll_top == 9
+        d.scroll_by(-20)
+        assert d.scroll_top == 0
+
+    def test_append_diff_renders_hunks_as_they_arrive(self, mock_context, buffer_40x20):
+        from pytui.components.diff import Diff
+
+        d = Diff(mock_context, {"show_line_numbers": False})
+        d.x, d.y, d.width, d.height = 0, 0, 40, 5
+        d.append_diff(b"--- a/f\n+++ b/f\n@@ -1 +1 @@\n-old\n+ne")
+        assert d.is_streaming
+        d.render_self(buffer_40x20)
+        assert d.visual_row_count == 0
+        d.append_diff(b"w\n@@ -7 +7 @@\n-x\n")
+        d.render_self(buffer_40x20)
+        model = d._row_model
+        assert d.visual_row_count == 2
+        d.append_diff("+y\n")
+        assert d._row_model is model
+        assert d.visual_row_count == 4
+        d.end_diff()
+        assert not d.is_streaming
+        assert d.diff.endswith("+y\n")
+        d.render_self(buffer_40x20)
+        assert "".join(buffer_40x20.get_cell(x, 1).char for x in range(2, 5)) == "new"
+
+    def test_append_diff_extends_split_model(self, mock_context):
+        from pytui.components.diff import Diff
+
+        d = Diff(mock_context, {"view": "split", "wrap_mode": "char"})
+        d.x, d.y, d.width, d.height = 0, 0, 40, 5
+        d.append_diff("--- a/f\n+++ b/f\n@@ -1,2 +1,2 @@\n-old\n+new and a much longer line that wraps\n x\n")
+        d.append_diff("@@ -9 +9,2 @@\n-a\n+b\n+c\n")
+        model = d._get_row_model()
+        assert model.is_split
+        d.append_diff("@@ -20 +21 @@\n-q\n+r\n@@ -30 +31 @@\n s\n")
+        d.end_diff()
+        assert d._row_model is model
+        rows, right_rows, starts = list(model.rows), list(model.right_rows), list(model.line_starts)
+        d._invalidate_rows()
+        rebuilt = d._get_row_model()
+        assert (rows, right_rows, starts) == (rebuilt.rows, rebuilt.right_rows, rebuilt.line_starts)
+
+    def test_append_diff_widens_line_numbers_in_place(self, mock_context):
+        from pytui.components.diff import Diff
+
+        d = Diff(mock_context, {})
+        d.x, d.y, d.width, d.height = 0, 0, 40, 5
+        d.append_diff("--- a/f\n+++ b/f\n@@ -1 +1 @@\n-a\n+b\n")
+        d.append_diff("@@ -5 +5 @@\n-c\n")
+        model = d._get_row_model()
+        width = model.line_number_width
+        d.append_diff("+d\n@@ -1000 +1000 @@\n-e\n+f\n")
+        d.end_diff()
+        assert d._row_model is model
+        assert model.line_number_width > width
+        streamed = list(model.rows), model.line_number_width, model.content_width
+        d._invalidate_rows()
+        rebuilt = d._get_row_model()
+        assert streamed == (rebuilt.rows, rebuilt.line_number_width, rebuilt.content_width)
+
+    def test_end_diff_without_hunks_falls_back(self, mock_context):
+        from pytui.components.diff import Diff
+
+        d = Diff(mock_context, {})
+        d.append_diff("+a\n-b\n")
+        d.end_diff()
+        assert d._parsed_patch is None
+        assert d._parse_error is None
+        assert d.diff == "+a\n-b\n"
@@ -0,0 +1,98 @@
+# tests/unit/components/test_file_viewer.py - FileViewer: visible window, goto_line, incremental search, highlighting
+
+import pytest
+
+pytest.importorskip("pytui.components.file_viewer")
+
+
+def _row(buf, y, n):
+    return "".join(buf.get_cell(x, y).char for x in range(n))
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("".join(f"{i:04d} {'ERROR' if i % 50 == 0 else 'info'}\tdone\n" for i in range(1000)))
+    return path
+
+
+def _viewer(ctx, path, **options):
+    from pytui.components.file_viewer import FileViewer
+
+    v = FileViewer(ctx, {"path": str(path), "width": 40, "height": 5, "stride": 16, **options})
+    v.x, v.y, v.width, v.height = 0, 0, 20, 5
+    return v
+
+
+class TestFileViewer:
+    def test_renders_visible_window_and_goto_line(self, mock_context, log_path, buffer_40x20):
+        v = _viewer(mock_context, log_path)
+        v.file.wait_indexed(5)
+        assert v.indexing_done and v.line_count == 1000
+        v.render_self(buffer_40x20)
+        assert _row(buffer_40x20, 0, 18) == "0000 ERROR    done"
+        assert _row(buffer_40x20, 1, 9) == "0001 info"
+        v.goto_line(700)
+        v.render_self(buffer_40x20)
+        assert _row(buffer_40x20, 0, 4) == "0700"
+        v.goto_line(5000)
+        assert v.top_line == 995
+        v.destroy()
+        assert v.file is None
+
+    def test_end_shows_last_screen_without_indexing(self, mock_context, log_path, buffer_40x20):
+        v = _viewer(mock_context, log_path, background_index=False)
+        v.focus()
+        v._on_key_action("last-line", None)
+        assert not v.file.indexed
+        v.render_self(buffer_40x20)
+        assert [_row(buffer_40x20, y, 4) for y in range(5)] == ["0995", "0996", "0997", "0998", "0999"]
+        v._on_key_action("line-down", None)
+        v.scroll_by(-2)
+        v.render_self(buffer_40x20)
+        assert _row(buffer_40x20, 0, 4) == "0993"
+        assert v.search_next() is None and v.search("ERROR", backward=True) == 950
+        assert v.top_line == 948
+        v.goto_line(10**6)
+        v.file.index()
+        assert v.top_line == 995
+        v.destroy()
+
+    def test_tabs_expand_and_horizontal_scroll(self, mock_context, log_path, buffer_40x20):
+        v = _viewer(mock_context, log_path, tab_width=2)
+        v.goto_line(1)
+        v.scroll_x = 5
+        v.render_self(buffer_40x20)
+        assert _row(buffer_40x20, 0, 10) == "info  done"
+        v.destroy()
+
+    def test_incremental_search_and_next_prev(self, mock_context, log_path, buffer_40x20):
+        v = _viewer(mock_context, log_path, background_index=False)
+        assert v.search("ERR") == 0
+        assert v.search("ERROR") == 0  # refining keeps the position
+        assert v.search_next() == 50
+        assert v.search_next() == 100
+        assert v.search_prev() == 50
+        assert v.search("0450 e", case_sensitive=False) == 450
+        assert 450 in range(v.top_line, v.top_line + 5)
+        v.render_self(buffer_40x20)
+        row = 450 - v.top_line
+        assert _row(buffer_40x20, row, 4) == "0450"
+        assert buffer_40x20.get_cell(0, row).bg == v._search_bg
+        assert buffer_40x20.get_cell(6, row).bg != v._search_bg
+        assert v.search(r"\d+ ERROR", regex=True, backward=True) == 400
+        v.destroy()
+
+    def test_per_line_highlighter_uses_code_theme(self, mock_context, log_path, buffer_40x20):
+        from pytui.core.syntax_style import get_theme_scope_colors
+
+        def hl(line):
+            head, _, rest = line.partition(" ")
+            return [(head, "number"), (" " + rest, "plain")]
+
+        v = _viewer(mock_context, log_path, highlighter=hl)
+        v.render_self(buffer_40x20)
+        theme = get_theme_scope_colors("default")
+        assert buffer_40x20.get_cell(0, 0).fg == theme["number"]
+        assert 0 in v._highlights and 5 not in v._highlights
+        v.destroy()
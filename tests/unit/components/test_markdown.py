@@ -54,3 +54,65 @@ class TestMarkdownRenderable:
         m.request_render = lambda: None
         m.clear_cache()
         assert len(m.get_children()) == 1
+
+    def test_blocks_map_to_text_and_code_children(self, mock_context):
+        from pytui.components.code import Code
+        from pytui.components.markdown import MarkdownRenderable
+        from pytui.components.text import Text
+
+        m = MarkdownRenderable(mock_context, {"content": "# T\n\npara\n\n```py\nx = 1\n```"})
+        children = m.get_children()
+        assert [b.kind for b in m.blocks] == ["heading", "paragraph", "code"]
+        assert isinstance(children[0], Text) and isinstance(children[1], Text)
+        assert isinstance(children[2], Code)
+        assert children[2].content == "x = 1"
+        assert children[2].filetype == "py"
+
+    def test_streaming_append_reuses_unchanged_children(self, mock_context):
+        from pytui.components.markdown import MarkdownRenderable
+
+        m = MarkdownRenderable(mock_context, {"content": "# Title\n\nfirst\n\nsecond", "streaming": True})
+        heading, first, second = m.get_children()
+        m.append(" part")
+        assert m.get_children()[0] is heading
+        assert m.get_children()[1] is first
+        assert m.get_children()[2] is second
+        assert "".join(s.text for s in second.content) == "second part"
+        m.append("\n\n```python\nprint(1)")
+        children = m.get_children()
+        assert children[:3] == [heading, first, second]
+        code = children[3]
+        assert code.streaming is True
+        m.append("\nprint(2)")
+        assert m.get_children()[3] is code
+        assert code.content == "print(1)\nprint(2)"
+
+    def test_append_only_measures_changed_tail(self, mock_context):
+        from pytui.components.markdown import MarkdownRenderable
+
+        m = MarkdownRenderable(mock_context, {"content": "\n\n".join(f"para {i}" for i in range(50))})
+        m.request_render = lambda: None
+        measured = []
+        block_rows = m._block_rows
+        m._block_rows = lambda block, child, width: measured.append(block) or block_rows(block, child, width)
+        heights = []
+        m.layout_node.set_height = heights.append
+        m.append(" more words")
+        m.append("\n\nnew tail")
+        assert len(measured) <= 3
+        expected = sum(block_rows(b, c, m._measured_width) for b, c in zip(m.blocks, m.get_children()))
+        assert heights[-1] == expected + len(m.blocks) - 1
+
+    def test_rendered_output(self):
+        from pytui.components.markdown import MarkdownRenderable
+        from pytui.testing.test_renderer import create_test_renderer
+
+        r = create_test_renderer(30, 10)
+        m = MarkdownRenderable(r.context, {"content": "# Head\n\n- **a**\n- b"})
+        r.root.add(m)
+        r.render_once()
+        rows = [
+            "".join(r.front_buffer.get_cell(x, y).char for x in range(30)).rstrip() for y in range(4)
+        ]
+        assert rows == ["Head", "", "• a", "• b"]
+        assert r.front_buffer.get_cell(2, 2).bold
@@ -258,3 +258,46 @@ class TestTextWordWrapping:
         assert buffer_40x20.get_cell(0, 0).char == "F"
         # Empty logical line yields no visual row; "Third" is on next row
         assert buffer_40x20.get_cell(0, 1).char == "T"
+
+
+class TestTextAppend:
+    def test_append_extends_plain_content(self, mock_context):
+        t = _create_text(mock_context, content="Hello")
+        calls = []
+        t.request_render = lambda: calls.append(1)
+        t.append(" World\nnext")
+        assert t.content == "Hello World\nnext"
+        assert t.line_count == 2 and calls
+
+    def test_append_to_styled_content_adds_span(self, mock_context):
+        from pytui.components.text_node import Span
+
+        t = _create_text(mock_context, content=[Span(text="a", fg=(255, 0, 0, 255))])
+        t.append("b")
+        assert t.plain_text == "ab" and isinstance(t.content, list)
+
+    def test_append_rewraps_only_the_tail(self, mock_context, buffer_40x20):
+        t = _create_text(mock_context, content="aa bb cc\ndd", width=5, height=10)
+        t.x, t.y, t.width, t.height = 0, 0, 5, 10
+        t.render_self(buffer_40x20)
+        first = t._wrap_cache[0]
+        t.append(" ee ff\ngg")
+        t.render_self(buffer_40x20)
+        assert t._wrap_cache[0] is first
+        assert t._wrap_cache[1:] == [["dd ee", "ff"], ["gg"]]
+        assert t.virtual_line_count == 5
+        t.wrap_mode = "char"
+        t.render_self(buffer_40x20)
+        assert t._wrap_cache[0] is not first
+
+    def test_follow_tail_renders_last_screen(self, mock_context, buffer_10x5):
+        t = _create_text(mock_context, content="", width=10, height=2, follow_tail=True)
+        t.x, t.y, t.width, t.height = 0, 0, 10, 2
+        for i in range(100):
+            t.append(f"line {i}\n")
+        t.append("tail")
+        t.render_self(buffer_10x5)
+        assert "".join(buffer_10x5.get_cell(x, 0).char for x in range(7)) == "line 99"
+        assert "".join(buffer_10x5.get_cell(x, 1).char for x in range(4)) == "tail"
+        assert sum(rows is not None for rows in t._wrap_cache) == 2
+
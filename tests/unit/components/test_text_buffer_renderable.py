@@ -81,6 +81,26 @@ class TestTextBufferRenderable:
         assert buffer_10x5.get_cell(1, 1).char == "y"
         assert buffer_10x5.get_cell(2, 1).char == "e"
 
+    def test_append_follow_tail_sticks_to_bottom(self, mock_context, buffer_10x5):
+        from pytui.components.text_buffer_renderable import TextBufferRenderable
+
+        r = TextBufferRenderable(mock_context, {"width": 10, "height": 2, "follow_tail": True})
+        r.x, r.y, r.width, r.height = 0, 0, 10, 2
+        for i in range(5):
+            r.append(f"l{i}\n")
+        r.render_self(buffer_10x5)
+        assert r.scroll_y == 4
+        assert buffer_10x5.get_cell(1, 0).char == "4"
+        r.scroll_y = 1  # scrolling up detaches
+        r.append("l5\n")
+        r.render_self(buffer_10x5)
+        assert r.scroll_y == 1
+        r.scroll_y = 100  # back at the bottom re-attaches
+        r.append("l6\n")
+        r.render_self(buffer_10x5)
+        assert r.scroll_y == r.line_count - 2
+        assert r.scroll_height == 8
+
     def test_destroy(self, mock_context):
         from pytui.components.text_buffer_renderable import TextBufferRenderable
 
@@ -116,6 +116,122 @@ class TestTimeline:
         parent.update(10)
         assert child.current_time == 15
 
+    def test_alternate_loop_and_once_removal(self):
+        from pytui.core.animation import Timeline
+
+        obj = {"x": 0}
+        loops = []
+        t = Timeline({"autoplay": False, "duration": 10000})
+        t.add(obj, {"x": 100, "duration": 100, "loop": 2, "alternate": True, "on_loop": lambda: loops.append(1)})
+        t.play()
+        t.update(50)
+        assert obj["x"] == pytest.approx(50)
+        t.update(75)
+        assert obj["x"] == pytest.approx(75)
+        assert loops == [1]
+        t.update(100)
+        assert obj["x"] == pytest.approx(0)
+        t.once(obj, {"x": 10, "duration": 0})
+        t.update(1)
+        assert obj["x"] == 10
+        assert len(t.items) == 1
+
+    def test_finished_items_leave_pending(self):
+        from pytui.core.animation import Timeline
+
+        objs = [{"v": 0} for _ in range(3)]
+        t = Timeline({"autoplay": False, "duration": 1000})
+        for i, o in enumerate(objs):
+            t.add(o, {"v": 1, "duration": 100 * (i + 1)})
+        t.call(lambda: None, 0)
+        t.play()
+        t.update(150)
+        assert len(t._pending) == 2
+        t.restart()
+        assert len(t._pending) == 4
+
+    def test_update_coalesces_render_requests(self, mock_context):
+        from pytui.core.animation import Timeline
+        from pytui.core.renderable import Renderable
+
+        class Bar(Renderable):
+            def __init__(self, ctx):
+                super().__init__(ctx)
+                self._value = 0.0
+
+            @property
+            def value(self):
+                return self._value
+
+            @value.setter
+            def value(self, v):
+                self._value = v
+                self.request_render()
+
+            def render_self(self, buffer):
+                pass
+
+        calls = []
+        mock_context.renderer.schedule_render = lambda: calls.append(1)
+        root = Bar(mock_context)
+        bars = [Bar(mock_context) for _ in range(20)]
+        for b in bars:
+            root.add(b)
+        t = Timeline({"autoplay": False})
+        t.add(bars, {"value": 10, "duration": 100})
+        t.play()
+        calls.clear()
+        t.update(50)
+        assert calls == [1]
+        assert all(b.value == pytest.approx(5) for b in bars)
+
+
+class TestTimelineEngine:
+    def test_update_only_active_timelines(self):
+        from pytui.core.animation import Timeline, TimelineEngine
+
+        eng = TimelineEngine()
+        playing = Timeline({"autoplay": False})
+        paused = Timeline({"autoplay": False})
+        eng.register(playing)
+        eng.register(paused)
+        assert eng.active_count == 0
+        playing.play()
+        assert eng.active_count == 1
+        eng.update(10)
+        assert playing.current_time == 10
+        assert paused.current_time == 0
+        playing.pause()
+        assert eng.active_count == 0
+        eng.update(10)
+        assert playing.current_time == 10
+
+    def test_sync_after_register_activates_paused_timeline(self):
+        from pytui.core.animation import Timeline, TimelineEngine
+
+        eng = TimelineEngine()
+        parent = Timeline({"autoplay": False, "duration": 1000})
+        child = Timeline({"autoplay": False, "duration": 100})
+        eng.register(parent)
+        assert eng.active_count == 0
+        parent.sync(child, 0)
+        assert eng.active_count == 1
+        eng.update(10)
+        assert child.current_time > 0
+
+    def test_completed_timeline_leaves_active_set(self):
+        from pytui.core.animation import Timeline, TimelineEngine
+
+        eng = TimelineEngine()
+        t = Timeline({"duration": 100})
+        eng.register(t)
+        assert eng.active_count == 1
+        eng.update(100)
+        assert t.is_complete
+        assert eng.active_count == 0
+        eng.unregister(t)
+        assert t not in eng._timelines
+
 
 class TestEasing:
     def test_linear(self):
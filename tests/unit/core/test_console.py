@@ -57,6 +57,86 @@ class TestConsoleBuffer:
         buf.clear()
         assert buf.lines == []
 
+    def test_ring_evicts_oldest_and_get_lines_slices(self):
+        from pytui.core.console import ConsoleBuffer
+
+        buf = ConsoleBuffer(max_lines=4)
+        buf.append("\n".join(str(i) for i in range(10)))
+        assert len(buf) == 4
+        assert buf.lines == [("6", "log"), ("7", "log"), ("8", "log"), ("9", "log")]
+        assert buf.get_lines(1, 2) == [("7", "log"), ("8", "log")]
+        assert buf.get_lines(3, 10) == [("9", "log")]
+        buf.max_lines = 2
+        assert buf.lines == [("8", "log"), ("9", "log")]
+
+    def test_seq_range_and_get_lines_by_seq(self):
+        from pytui.core.console import ConsoleBuffer
+
+        buf = ConsoleBuffer(max_lines=3)
+        buf.append("a\nb\nc\nd\ne")
+        assert buf.seq_range() == (2, 5)
+        assert buf.get_lines_by_seq(1, 4) == [None, ("c", "log"), ("d", "log")]
+        assert buf.get_lines_by_seq(4, 9) == [("e", "log")]
+
+    def test_write_joins_partial_lines(self):
+        from pytui.core.console import ConsoleBuffer
+
+        buf = ConsoleBuffer()
+        buf.write("hel")
+        assert buf.lines == [("hel", "log")]
+        buf.write("lo\nwor")
+        buf.write("ld\n")
+        buf.write("\n")
+        buf.write("e", level="error")
+        buf.write("x")
+        assert buf.lines == [("hello", "log"), ("world", "log"), ("", "log"), ("e", "error"), ("x", "log")]
+
+    def test_level_filter_index_follows_appends_and_eviction(self):
+        from pytui.core.console import ConsoleBuffer
+
+        buf = ConsoleBuffer(max_lines=5)
+        for i in range(4):
+            buf.append(f"l{i}")
+            buf.append(f"e{i}", level="error")
+        assert buf.line_count(["error"]) == 3
+        assert buf.get_lines(0, 10, {"error"}) == [("e1", "error"), ("e2", "error"), ("e3", "error")]
+        buf.append("e4", level="error")
+        assert buf.get_lines(1, 2, {"error"}) == [("e3", "error"), ("e4", "error")]
+        buf.clear()
+        assert buf.line_count(["error"]) == 0
+
+    def test_level_filter_index_compacts_after_long_eviction(self):
+        from pytui.core.console import ConsoleBuffer
+
+        buf = ConsoleBuffer(max_lines=10)
+        for i in range(1000):
+            buf.append(f"l{i}", level="error" if i % 3 == 0 else "log")
+            if i % 7 == 0:
+                assert buf.line_count({"error"}) == sum(1 for t, lv in buf.lines if lv == "error")
+        errors = [line for line in buf.lines if line[1] == "error"]
+        assert buf.get_lines(0, 10, {"error"}) == errors
+        assert buf.get_lines(1, 2, {"error"}) == errors[1:3]
+        assert len(buf._indexes[frozenset({"error"})].seqs) <= 2 * len(errors) + 1
+
+    def test_concurrent_writes_are_safe(self):
+        import threading
+
+        from pytui.core.console import ConsoleBuffer
+
+        buf = ConsoleBuffer(max_lines=100)
+
+        def spam(n):
+            for i in range(500):
+                buf.append(f"{n}:{i}")
+
+        threads = [threading.Thread(target=spam, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(buf) == 100
+        assert all(line is not None for line in buf.lines)
+
 
 class TestConsoleOverlay:
     def test_render_self_shows_buffer_lines(self, buffer_10x5):
@@ -115,6 +195,24 @@ class TestConsoleOverlay:
         overlay.set_scroll(100)
         assert overlay.scroll_y == max(0, len(buf.lines) - overlay.height)  # 0 when lines <= height
 
+    def test_level_filter_renders_matching_lines(self, buffer_10x5):
+        from pytui.core.console import ConsoleBuffer, ConsoleOverlay
+
+        buf = ConsoleBuffer()
+        buf.append("a\nb")
+        buf.append("E1", level="error")
+        buf.append("c")
+        ctx = _mock_ctx(10, 5)
+        overlay = ConsoleOverlay(ctx, {"buffer": buf, "width": 10, "height": 5, "levels": ["error"]})
+        overlay.x, overlay.y = 0, 0
+        overlay.width, overlay.height = 10, 5
+        overlay.render_self(buffer_10x5)
+        assert buffer_10x5.get_cell(0, 0).char == "E"
+        assert buffer_10x5.get_cell(0, 1).char == " "
+        overlay.set_levels(None)
+        overlay.render_self(buffer_10x5)
+        assert buffer_10x5.get_cell(0, 0).char == "a"
+
 
 class TestCaptureStdout:
     def test_capture_stdout_writes_to_buffer(self):
@@ -154,6 +252,15 @@ class TestCaptureStdout:
         levels = [line[1] for line in buf.lines]
         assert "error" in levels
 
+    def test_capture_stdout_print_lines_have_no_blank_separators(self):
+        from pytui.core.console import ConsoleBuffer, capture_stdout
+
+        buf = ConsoleBuffer()
+        with capture_stdout(buf, also_stdout=False):
+            print("a")
+            print("b", "c")
+        assert buf.lines == [("a", "log"), ("b c", "log")]
+
 
 def _mock_ctx(width: int, height: int):
     from unittest.mock import MagicMock
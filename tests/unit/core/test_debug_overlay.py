@@ -0,0 +1,126 @@
+# tests.unit.core.test_debug_overlay - Renderer debug overlay panel, profiler hand-off and dump methods
+
+import contextlib
+import io
+import os
+
+import pytest
+
+pytest.importorskip("pytui.core.debug_overlay")
+
+
+def _frame(r):
+    with contextlib.redirect_stdout(io.StringIO()):
+        r._render_frame()
+
+
+def _row(buf, y):
+    return "".join(buf.get_cell(x, y).char for x in range(buf.width))
+
+
+class TestSparkline:
+    def test_scales_to_max_and_keeps_last_values(self):
+        from pytui.core.debug_overlay import sparkline
+
+        assert sparkline([], 5) == ""
+        assert sparkline([0.0, 1.0, 2.0], 5) == "▁▅█"
+        assert len(sparkline([1.0] * 50, 10)) == 10
+
+
+class TestDebugOverlay:
+    def test_toggle_draws_panel_in_corner(self):
+        from pytui.core.renderer import Renderer
+        from pytui.core.types import DebugOverlayCorner
+
+        r = Renderer(width=60, height=10, target_fps=0)
+        r.configure_debug_overlay(enabled=True, corner=DebugOverlayCorner.top_left)
+        _frame(r)
+        _frame(r)
+        front = r.front_buffer
+        assert _row(front, 0).startswith(" FPS")
+        assert any("nodes 1" in _row(front, y) for y in range(front.height))
+        r.configure_debug_overlay(corner=DebugOverlayCorner.bottom_right)
+        _frame(r)
+        assert "FPS" in _row(r.front_buffer, r.front_buffer.height - 6)[-36:]
+
+    def test_overlay_enables_profiler_and_restores_it(self):
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=40, height=8, target_fps=0)
+        r.toggle_debug_overlay()
+        assert r.profiler.enabled and r._last_memory_snapshot is not None
+        _frame(r)
+        assert len(r.profiler.frames) == 1
+        r.toggle_debug_overlay()
+        assert not r.profiler.enabled and r.profiler.frames == []
+
+        r.set_profiling(True)
+        r.toggle_debug_overlay()
+        r.toggle_debug_overlay()
+        assert r.profiler.enabled
+
+    def test_overlay_draw_is_excluded_from_frame_total(self):
+        from pytui.core.profiler import FrameProfiler
+
+        p = FrameProfiler(enabled=True)
+        p.add("post", 0, 1_000_000)
+        p.exclude(1_000_000, 3_000_000)
+        p.add("diff", 3_000_000, 4_000_000)
+        assert p.end_frame()["total_ms"] == pytest.approx(2.0)
+
+
+    def test_node_count_is_cached_until_tree_changes(self):
+        from pytui.components.box import Box
+        from pytui.core.debug_overlay import RECOUNT_FRAMES
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=40, height=8, target_fps=0)
+        r.toggle_debug_overlay()
+        _frame(r)
+        overlay = r._debug_overlay_view
+        assert overlay.renderable_count == 1
+        overlay.renderable_count = -1
+        _frame(r)
+        assert overlay.renderable_count == -1  # no tree walk
+        r.root.add(Box(r.context, {"width": 2, "height": 1}))
+        _frame(r)
+        assert overlay.renderable_count == 2
+        overlay.renderable_count = -1
+        for _ in range(RECOUNT_FRAMES):
+            _frame(r)
+        assert overlay.renderable_count == 2
+
+    def test_overlay_cost_is_recorded_for_frame_times(self):
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=40, height=8, target_fps=0)
+        _frame(r)
+        assert r._overlay_ms == 0.0
+        r.toggle_debug_overlay()
+        _frame(r)
+        assert r._overlay_ms > 0.0
+
+class TestDumps:
+    def test_dump_buffers_and_stdout(self, tmp_path):
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=8, height=2, target_fps=0)
+        _frame(r)
+        paths = r.dump_buffers(123, directory=str(tmp_path))
+        assert [os.path.basename(p) for p in paths] == ["current_buffer_123.txt", "next_buffer_123.txt", "stdout_buffer_123.txt"]
+        text = open(paths[2], encoding="utf-8").read()
+        assert "\\x1b[" in text and "\x1b" not in text
+
+    def test_dump_hit_grid_labels_renderables(self, tmp_path):
+        from pytui.components.box import Box
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=6, height=3, target_fps=0)
+        child = Box(r.context, {"id": "btn", "position": "absolute", "left": 0, "top": 0, "width": 2, "height": 1})
+        r.root.add(child)
+        _frame(r)
+        path = r.dump_hit_grid(directory=str(tmp_path))
+        text = open(path, encoding="utf-8").read()
+        lines = text.splitlines()
+        assert lines[1].startswith("11")
+        assert "1 Box#btn" in text
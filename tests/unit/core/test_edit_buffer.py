@@ -202,3 +202,23 @@ class TestEditBuffer:
         assert buf.line_col_to_pos(1, 0) == 2
         assert buf.line_col_to_pos(1, 2) == 4
         assert buf.line_col_to_pos(2, 0) == 5
+
+    def test_on_edit_reports_every_change(self):
+        from pytui.core.edit_buffer import EditBuffer
+
+        buf = EditBuffer("abc")
+        edits = []
+
+        def listener(*e):
+            edits.append(e)
+
+        buf.on_edit(listener)
+        buf.insert(1, "XY")
+        buf.delete(0, 2)
+        buf.undo()
+        buf.redo()
+        buf.set_text("z")
+        assert edits == [(1, "", "XY"), (0, "aX", ""), (0, "", "aX"), (0, "aX", ""), (0, "Ybc", "z")]
+        buf.off_edit(listener)
+        buf.clear()
+        assert len(edits) == 5
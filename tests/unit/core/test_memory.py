@@ -0,0 +1,57 @@
+# tests.unit.core.test_memory - memory:snapshot telemetry: RSS, GC stats, live buffers / renderables, tracemalloc
+
+import gc
+import sys
+
+import pytest
+
+pytest.importorskip("pytui.core.memory")
+
+
+class TestMemorySnapshot:
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc/self/statm is Linux-only")
+    def test_current_rss_is_reported(self):
+        from pytui.core.memory import memory_snapshot
+
+        snap = memory_snapshot()
+        assert snap["rss"] > 0 and snap["heapUsed"] == snap["rss"]
+        assert snap["heapTotal"] >= snap["rss"] // 2
+        assert len(snap["gc"]["counts"]) == 3 and snap["topAllocators"] == []
+
+    def test_live_buffers_and_renderables_are_counted_weakly(self):
+        from pytui.components.box import Box
+        from pytui.core.buffer import OptimizedBuffer
+        from pytui.core.memory import buffer_stats, memory_snapshot
+
+        gc.collect()
+        before = memory_snapshot()
+        buf = OptimizedBuffer(10, 4, use_native=False)
+        box = Box(None, {"width": 2, "height": 2})
+        after = memory_snapshot()
+        assert after["buffers"]["count"] == before["buffers"]["count"] + 1
+        assert after["arrayBuffers"] > before["arrayBuffers"]
+        assert after["renderables"] == before["renderables"] + 1
+        buf.destroy()
+        assert buffer_stats()["count"] == before["buffers"]["count"]
+        del buf, box
+        gc.collect()
+        assert memory_snapshot()["renderables"] == before["renderables"]
+
+    def test_renderer_memory_tracing_reports_top_allocators(self):
+        import tracemalloc
+
+        from pytui.core.renderer import Renderer
+
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already active")
+        r = Renderer(width=10, height=3, target_fps=0)
+        snaps = []
+        r.events.on("memory:snapshot", snaps.append)
+        r.set_memory_tracing(5)
+        blob = [bytearray(50_000) for _ in range(4)]
+        r._emit_memory_snapshot()
+        assert snaps[-1]["topAllocators"] and "traced" in snaps[-1]["pythonHeap"]
+        assert r._last_memory_snapshot is snaps[-1]
+        r.set_memory_tracing(0)
+        assert not tracemalloc.is_tracing()
+        del blob
@@ -38,3 +38,40 @@ class TestMouseHandler:
         h.clear()
         rest = h.feed(b"0;1;1M")
         assert rest == b"0;1;1M"
+
+    def test_non_mouse_escape_sequences_pass_through(self):
+        from pytui.core.mouse import MouseHandler
+
+        h = MouseHandler()
+        assert h.feed(b"\x1b[A") == b"\x1b[A"
+        assert h.feed(b"\x1b") == b"\x1b"
+
+    def test_report_split_across_feeds(self):
+        from pytui.core.mouse import MouseHandler
+
+        h = MouseHandler()
+        events = []
+        h.on("mouse", events.append)
+        assert h.feed(b"x\x1b[<0;10") == b"x"
+        assert h.feed(b";5M\x1b[M ") == b""
+        assert h.feed(b"!!") == b""
+        assert [(e["type"], e["x"], e["y"]) for e in events] == [("down", 9, 4), ("down", 0, 0)]
+
+    def test_coalesce_motion_keeps_button_and_scroll_order(self):
+        from pytui.core.mouse import MouseHandler
+
+        h = MouseHandler(coalesce=True)
+        events = []
+        h.on("mouse", events.append)
+        moves = b"".join(b"\x1b[<35;%d;1M" % x for x in range(1, 6))
+        drags = b"".join(b"\x1b[<32;%d;2M" % x for x in range(1, 4))
+        h.feed(moves + b"\x1b[<0;5;2M" + drags + b"\x1b[<64;3;2M" + b"\x1b[<32;9;9M" + b"\x1b[<0;9;9m")
+        assert [(e["type"], e["x"]) for e in events] == [
+            ("move", 4),
+            ("down", 4),
+            ("drag", 2),
+            ("scroll", 2),
+            ("drag", 8),
+            ("up", 8),
+        ]
+        assert h.dropped == 6
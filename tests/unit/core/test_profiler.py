@@ -0,0 +1,102 @@
+# tests.unit.core.test_profiler - FrameProfiler phases, attribution, export; Renderer profiling integration
+
+import contextlib
+import io
+import json
+
+import pytest
+
+pytest.importorskip("pytui.core.profiler")
+
+
+class TestFrameProfiler:
+    def test_end_frame_aggregates_phases_and_top_renderables(self):
+        from pytui.core.profiler import FrameProfiler
+
+        p = FrameProfiler(enabled=True, top_n=2)
+        p.add("layout", 1_000_000, 3_000_000)
+        p.add("render", 3_000_000, 4_000_000)
+        p.add("render", 4_000_000, 4_500_000)
+        for label, ns in (("a", 100), ("b", 300), ("c", 200)):
+            r = type("Box", (), {"id": label})()
+            p.add_renderable(r, ns)
+        p.add_bytes(42)
+        frame = p.end_frame()
+        assert frame["phases"]["layout"] == pytest.approx(2.0)
+        assert frame["phases"]["render"] == pytest.approx(1.5)
+        assert frame["total_ms"] == pytest.approx(3.5)
+        assert [label for label, _ in frame["renderables"]] == ["Box#b", "Box#c"]
+        assert p.end_frame() is None
+        summary = p.summary()
+        assert summary["frames"] == 1 and summary["bytesPerFrame"] == 42
+
+    def test_frames_are_bounded_and_chrome_trace_has_phase_events(self):
+        from pytui.core.profiler import FrameProfiler
+
+        p = FrameProfiler(enabled=True, max_frames=3)
+        for i in range(5):
+            p.add("diff", i * 10, i * 10 + 5)
+            p.end_frame()
+        assert [f["frame"] for f in p.frames] == [2, 3, 4]
+        trace = p.to_chrome_trace()
+        names = [e["name"] for e in trace["traceEvents"]]
+        assert names.count("diff") == 3 and "frame 4" in names
+        assert all(e["ph"] == "X" for e in trace["traceEvents"])
+        with pytest.raises(ValueError):
+            p.export("unused", format="xml")
+
+
+class TestRendererProfiling:
+    def _frame(self, r):
+        with contextlib.redirect_stdout(io.StringIO()):
+            r._render_frame()
+
+    def test_disabled_by_default_records_nothing(self):
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=10, height=3, target_fps=0)
+        self._frame(r)
+        assert r.profiler.frames == []
+        assert "profile" not in r.get_stats()
+
+    def test_loop_iterations_without_render_are_discarded(self):
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=10, height=3, target_fps=0, profile=True)
+        self._frame(r)
+        iterations = []
+
+        def tick(_delta_ms):
+            iterations.append(len(iterations))
+            if len(iterations) == 50:
+                r.root.request_render()
+            elif len(iterations) == 51:
+                r.running = False
+
+        r.set_frame_callback(tick)
+        r.running = True
+        with contextlib.redirect_stdout(io.StringIO()):
+            r._run_loop()
+        last = r.profiler.frames[-1]
+        callbacks = [s for s in last["_spans"] if s[0] == "callbacks"]
+        assert len(callbacks) == 1
+        assert r.profiler._spans == []
+
+    def test_profiled_frame_reports_phases_bytes_and_renderables(self, tmp_path):
+        from pytui.components.text import Text
+        from pytui.core.renderer import Renderer
+
+        r = Renderer(width=10, height=3, target_fps=0, profile=True)
+        r.root.add(Text(r.context, {"id": "msg", "content": "hello", "width": 10, "height": 1}))
+        self._frame(r)
+        frame = r.profiler.frames[-1]
+        assert frame["bytes"] > 0
+        assert frame["phases"]["layout"] > 0 and frame["phases"]["render"] > 0 and frame["phases"]["diff"] > 0
+        assert "Text#msg" in [label for label, _ in frame["renderables"]]
+        profile = r.get_stats()["profile"]
+        assert profile["frames"] == 1 and profile["bytesPerFrame"] == frame["bytes"]
+        path = tmp_path / "trace.json"
+        r.export_profile(str(path), format="chrome")
+        assert json.loads(path.read_text())["traceEvents"]
+        r.set_profiling(False)
+        assert r.profiler.frames == []
@@ -41,6 +41,31 @@ class TestRenderable:
         r.request_render()
         assert r._dirty
 
+    def test_batch_render_requests_coalesces(self, mock_context):
+        from pytui.core.renderable import Renderable, batch_render_requests
+
+        class Dummy(Renderable):
+            def render_self(self, buffer):
+                pass
+
+        calls = []
+        mock_context.renderer.schedule_render = lambda: calls.append(1)
+        root = Dummy(mock_context)
+        kids = [Dummy(mock_context) for _ in range(5)]
+        for k in kids:
+            root.add(k)
+        root._dirty = False
+        calls.clear()
+        with batch_render_requests():
+            with batch_render_requests():
+                for k in kids:
+                    k.request_render()
+                    k.request_render()
+            assert calls == []
+            assert not root._dirty
+        assert calls == [1]
+        assert root._dirty
+
     def test_calculate_layout_recursive(self, mock_context):
         from pytui.core.renderable import Renderable
         from pytui.core.buffer import OptimizedBuffer
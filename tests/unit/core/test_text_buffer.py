@@ -169,6 +169,32 @@ class TestTextBuffer:
         assert buffer.get_text_range(0, 0) == ""
         assert buffer.get_text_range(5, 3) == ""
 
+    def test_append_tracks_lines_and_byte_size_incrementally(self, buffer):
+        buffer.set_text("ab")
+        buffer.append("c\n世界\r")
+        buffer.append("\nlast")
+        assert buffer.get_plain_text() == "abc\n世界\nlast"
+        assert buffer.byte_size == len("abc\n世界\nlast".encode("utf-8"))
+        assert buffer.length == 11
+        assert buffer.get_line_count() == 3
+        assert buffer.get_lines(1) == ["世界", "last"]
+        assert buffer.get_line(2) == "last" and buffer.get_line_start(2) == 7
+
+    def test_text_range_after_append_without_join(self, buffer):
+        buffer.append("one\ntwo")
+        buffer.append("\nthree")
+        assert buffer._text is None
+        assert buffer.get_text_range(2, 9) == "e\ntwo\nt"
+        assert buffer.get_text_range(8, 100) == "three"
+
+    def test_epoch_changes_on_replace_not_append(self, buffer):
+        buffer.set_text("a")
+        epoch = buffer.epoch
+        buffer.append("b\nc")
+        assert buffer.epoch == epoch
+        buffer.clear()
+        assert buffer.epoch != epoch and buffer.get_line_count() == 1
+
     def test_destroy_twice_no_op(self, buffer):
         buffer.destroy()
         buffer.destroy()
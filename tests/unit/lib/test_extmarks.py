@@ -33,3 +33,133 @@ def test_extmarks_store_clear():
     store.add(10, 15)
     store.clear()
     assert len(store) == 0
+
+
+def _ref_insert(marks, offset, length):
+    for m in marks.values():
+        if m[0] >= offset:
+            m[0] += length
+            m[1] += length
+        elif m[1] > offset:
+            m[1] += length
+
+
+def _ref_delete(marks, offset, length):
+    stop = offset + length
+    for eid, m in list(marks.items()):
+        if m[0] >= stop:
+            m[0] -= length
+            m[1] -= length
+        elif m[0] >= offset and m[1] <= stop:
+            del marks[eid]
+        elif m[0] < offset < m[1]:
+            m[1] -= min(m[1], stop) - offset
+        elif m[0] >= offset:
+            m[0], m[1] = offset, max(offset, m[1] - length)
+
+
+def test_extmarks_store_matches_reference_under_edits():
+    import random
+
+    rng = random.Random(3)
+    store = ExtmarksStore()
+    ref = {}
+    for step in range(1500):
+        r = rng.random()
+        if r < 0.35:
+            a = rng.randrange(200)
+            b = a + rng.randrange(0, 12)
+            ref[store.add(a, b, priority=rng.choice([None, 1, 2]))] = [a, b]
+        elif r < 0.45 and ref:
+            eid = rng.choice(list(ref))
+            assert store.remove(eid)
+            del ref[eid]
+        elif r < 0.7:
+            offset, length = rng.randrange(220), rng.randrange(1, 6)
+            store.adjust_for_insertion(offset, length)
+            _ref_insert(ref, offset, length)
+        else:
+            offset, length = rng.randrange(220), rng.randrange(1, 9)
+            store.adjust_for_deletion(offset, length)
+            _ref_delete(ref, offset, length)
+        assert len(store) == len(ref)
+        if step % 10 == 0:
+            for eid, (a, b) in ref.items():
+                m = store.get(eid)
+                assert (m.start, m.end) == (a, b)
+        q0 = rng.randrange(230)
+        q1 = q0 + rng.randrange(1, 30)
+        got = store.get_in_range(q0, q1)
+        assert sorted(m.id for m in got) == sorted(e for e, (a, b) in ref.items() if a < q1 and b > q0)
+        assert [(-(m.priority or 0), m.start) for m in got] == sorted((-(m.priority or 0), m.start) for m in got)
+    assert [m.start for m in store.get_all()] == sorted(a for a, _ in ref.values())
+
+
+def test_extmarks_store_snapshot_restore():
+    store = ExtmarksStore()
+    store.add(0, 5, style_id=2)
+    eid = store.add(10, 12, data={"k": 1})
+    snap = store.snapshot()
+    store.adjust_for_deletion(0, 11)
+    assert len(store) == 1 and store.get(eid).start == 0
+    store.restore(snap)
+    assert [(m.id, m.start, m.end, m.style_id) for m in store.get_all()] == [(1, 0, 5, 2), (2, 10, 12, None)]
+    assert store.add(1, 2) == 3
+
+
+def test_extmarks_controller_follows_edit_buffer_with_undo_redo():
+    from pytui.core.edit_buffer import EditBuffer
+    from pytui.lib.extmarks import ExtmarksController
+
+    buf = EditBuffer("hello world")
+    ctl = ExtmarksController(buf)
+    word = ctl.store.add(6, 11, style_id=1)
+    hello = ctl.store.add(0, 5)
+    buf.insert(0, ">> ")
+    assert (ctl.store.get(word).start, ctl.store.get(word).end) == (9, 14)
+    buf.delete(3, 9)  # removes "hello " and the mark on it
+    assert ctl.store.get(hello) is None
+    assert buf.text[ctl.store.get(word).start : ctl.store.get(word).end] == "world"
+    assert ctl.undo()
+    assert buf.text == ">> hello world"
+    assert (ctl.store.get(hello).start, ctl.store.get(hello).end) == (3, 8)
+    assert ctl.redo()
+    assert ctl.store.get(hello) is None
+    assert ctl.undo() and ctl.undo()
+    assert buf.text == "hello world"
+    assert [(m.start, m.end) for m in ctl.store.get_all()] == [(0, 5), (6, 11)]
+    assert not ctl.undo()
+    ctl.destroy()
+    buf.insert(0, "x")
+    assert ctl.store.get(hello).start == 0
+
+
+def test_extmarks_controller_undo_all_restores_marks():
+    import random
+
+    from pytui.core.edit_buffer import EditBuffer
+    from pytui.lib.extmarks import ExtmarksController
+
+    rng = random.Random(11)
+    buf = EditBuffer("".join(rng.choice("ab \n") for _ in range(120)))
+    ctl = ExtmarksController(buf)
+    for _ in range(40):
+        a = rng.randrange(120)
+        ctl.store.add(a, a + rng.randrange(0, 10))
+    initial = [(m.id, m.start, m.end) for m in ctl.store.get_all()]
+    edits = 0
+    for _ in range(60):
+        n = len(buf.text)
+        if rng.random() < 0.5:
+            buf.insert(rng.randint(0, n), "xy"[: rng.randint(1, 2)])
+        else:
+            start = rng.randrange(n)
+            buf.delete(start, start + rng.randint(1, 8))
+        edits += 1
+    after = sorted((m.id, m.start, m.end) for m in ctl.store.get_all())
+    for _ in range(edits):
+        assert ctl.undo()
+    assert sorted((m.id, m.start, m.end) for m in ctl.store.get_all()) == sorted(initial)
+    for _ in range(edits):
+        assert ctl.redo()
+    assert sorted((m.id, m.start, m.end) for m in ctl.store.get_all()) == after
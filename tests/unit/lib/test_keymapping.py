@@ -82,3 +82,120 @@ def test_key_binding_to_string():
     assert key_binding_to_string({"name": "y", "ctrl": True, "shift": True, "action": "copy"}) == "ctrl+shift+y"
     assert key_binding_to_string({"name": "s", "meta": True, "action": "save"}) == "meta+s"
     assert key_binding_to_string({"name": "z", "super": True, "action": "undo"}) == "super+z"
+
+
+class _Node:
+    def __init__(self, parent=None):
+        self.parent = parent
+
+
+def _key(name, **mods):
+    from pytui.lib.key_handler import KeyEvent
+
+    return KeyEvent({"name": name, **mods})
+
+
+def test_keymap_registry_dispatches_along_scope_chain():
+    from pytui.lib.keymapping import KeymapRegistry
+
+    reg = KeymapRegistry()
+    root = _Node()
+    panel = _Node(root)
+    leaf = _Node(panel)
+    calls = []
+    reg.bind(panel, [{"name": "j", "action": "down"}], lambda a, k: calls.append(("panel", a)))
+    reg.bind(None, [{"name": "q", "ctrl": True, "action": "quit"}], lambda a, k: calls.append(("app", a)))
+    assert reg.dispatch(_key("j"), leaf) is True
+    assert reg.dispatch(_key("q", ctrl=True), leaf) is True
+    assert reg.dispatch(_key("q"), leaf) is False
+    assert calls == [("panel", "down"), ("app", "quit")]
+    assert reg.action_for(panel, _key("enter")) is None
+
+
+def test_keymap_registry_aliases_fallback_and_weak_scopes():
+    import gc
+
+    from pytui.lib.keymapping import KeymapRegistry
+
+    reg = KeymapRegistry()
+    node = _Node()
+    seen = []
+    reg.bind(node, [{"name": "enter", "action": "submit"}], lambda a, k: False, fallback=lambda k: seen.append(k.name))
+    assert reg.action_for(node, _key("return")) == "submit"
+    assert reg.dispatch(_key("return"), node) is False
+    assert seen == ["return"]
+    del node
+    gc.collect()
+    assert not reg._scopes
+
+
+def test_renderer_routes_keys_to_focused_widget_only():
+    from pytui.components.select import Select
+    from pytui.core.renderer import Renderer
+
+    r = Renderer(width=20, height=6, target_fps=0)
+    opts = {"options": [{"name": n} for n in "abc"]}
+    a, b = Select(r.context, opts), Select(r.context, opts)
+    r.root.add(a)
+    r.root.add(b)
+    a.focus()
+    b.focus()
+    assert r.current_focused_renderable is b
+    r.feed_input("j")
+    assert b._selected_index == 1 and a._selected_index == 0
+    assert r.keyboard.listeners("keypress") == [r._on_keypress]
+    b.blur()
+    assert r.current_focused_renderable is a
+    r.feed_input("j")
+    assert a._selected_index == 1
+    a.blur()
+    assert r.current_focused_renderable is None
+
+
+def test_focused_option_routes_keys_after_focus_call():
+    from pytui.components.select import Select
+    from pytui.core.renderer import Renderer
+
+    r = Renderer(width=20, height=6, target_fps=0)
+    s = Select(r.context, {"options": [{"name": n} for n in "abc"], "focused": True})
+    r.root.add(s)
+    s.focus()  # what the reconciler does for focused=True
+    assert r.current_focused_renderable is s
+    r.feed_input("\x1b[B")
+    assert s._selected_index == 1
+
+
+def test_reconciler_focused_select_receives_keys():
+    from pytui.core.renderer import Renderer
+    from pytui.react import h
+    from pytui.react.reconciler import reconcile
+
+    r = Renderer(width=20, height=6, target_fps=0)
+    reconcile(h("select", {"options": [{"name": n} for n in "abc"], "focused": True}), r.root)
+    s = r.root.children[0]
+    r.feed_input("\x1b[B")
+    assert s._selected_index == 1
+
+
+def test_focus_history_is_weak_and_dropped_on_destroy():
+    import gc
+    import weakref
+
+    from pytui.components.box import Box
+    from pytui.components.input import Input
+    from pytui.core.renderer import Renderer
+
+    r = Renderer(width=20, height=6, target_fps=0)
+    field, a, b = Input(r.context, {}), Box(r.context, {}), Box(r.context, {})
+    field.focus()
+    a.focus()
+    b.focus()
+    assert [ref() for ref in r._focus_history] == [field, a]
+    field.destroy()
+    assert [ref() for ref in r._focus_history] == [a]
+    gone = weakref.ref(a)
+    del a
+    gc.collect()
+    assert gone() is None
+    b.blur()
+    assert r.current_focused_renderable is None
@@ -0,0 +1,105 @@
+# tests/unit/lib/test_mapped_file.py - mmap line index: reads before / after indexing, offsets, chunked search
+
+import re
+
+import pytest
+
+pytest.importorskip("pytui.lib.mapped_file")
+
+LINES = [f"line {i} {'ERROR' if i % 97 == 0 else 'ok'}" for i in range(3000)]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("\n".join(LINES) + "\n")
+    return path
+
+
+class TestMappedFile:
+    def test_reads_before_and_after_indexing(self, log_path):
+        from pytui.lib.mapped_file import MappedFile
+
+        with MappedFile(log_path, stride=8, chunk_size=4096) as f:
+            assert not f.indexed
+            assert f.read_lines(2995, 10) == LINES[2995:]
+            assert f.read_line(1234) == LINES[1234]
+            f.index()
+            assert f.indexed and f.line_count == 3000 and f.progress == 1.0
+            for n in (0, 7, 8, 9, 2047, 2999):
+                assert f.read_line(n) == LINES[n]
+            assert f.read_line(3000) is None
+            assert f.line_of_offset(f.line_start(500) + 3) == 500
+
+    def test_concurrent_index_calls_scan_once(self, tmp_path):
+        import threading
+
+        from pytui.lib.mapped_file import MappedFile
+
+        lines = [f"row {i}" for i in range(200000)]
+        path = tmp_path / "big.log"
+        path.write_text("\n".join(lines) + "\n")
+        with MappedFile(path, stride=64, chunk_size=4096) as ref:
+            ref.index()
+            expected = list(ref._checkpoints)
+        with MappedFile(path, stride=64, chunk_size=4096) as f:
+            f.start_indexing()
+            others = [threading.Thread(target=f.index) for _ in range(3)]
+            for t in others:
+                t.start()
+            f.index()
+            for t in others:
+                t.join()
+            assert f.indexed and f.line_count == 200000
+            assert list(f._checkpoints) == expected
+            for n in (0, 63, 64, 65, 123456, 199999):
+                assert f.read_line(n) == lines[n]
+
+    def test_tail_and_line_steps_need_no_index(self, tmp_path, log_path):
+        from pytui.lib.mapped_file import MappedFile
+
+        with MappedFile(log_path, stride=8, chunk_size=4096) as f:
+            tail = f.tail_start(5)
+            assert f.read_lines_at(tail, 10) == LINES[-5:]
+            assert f.read_lines_at(f.prev_line_start(tail), 1) == LINES[-6:-5]
+            assert f.read_lines_at(f.next_line_start(tail), 1) == LINES[-4:-3]
+            assert f.next_line_start(f.tail_start(1)) is None
+            assert f.prev_line_start(0) is None
+            assert not f.indexed
+        path = tmp_path / "short.txt"
+        path.write_bytes(b"a\nb")
+        with MappedFile(path) as f:
+            assert f.tail_start(1) == 2 and f.tail_start(5) == 0
+
+    def test_background_index_and_crlf(self, tmp_path):
+        from pytui.lib.mapped_file import MappedFile
+
+        path = tmp_path / "crlf.txt"
+        path.write_bytes(b"a\r\nb\r\nno newline")
+        with MappedFile(path, stride=1) as f:
+            f.start_indexing()
+            assert f.wait_indexed(5)
+            assert f.line_count == 3
+            assert f.read_lines(0, 5) == ["a", "b", "no newline"]
+
+    def test_empty_file(self, tmp_path):
+        from pytui.lib.mapped_file import MappedFile
+
+        path = tmp_path / "empty"
+        path.write_bytes(b"")
+        with MappedFile(path) as f:
+            assert f.indexed and f.line_count == 0 and f.read_lines(0, 3) == []
+            assert f.find(re.compile(b"x")) is None
+
+    def test_find_forward_and_backward_across_chunks(self, log_path):
+        from pytui.lib.mapped_file import MappedFile
+
+        with MappedFile(log_path, stride=16, chunk_size=4096) as f:
+            pat = re.compile(rb"ERROR")
+            start, _ = f.find(pat, f.line_start(98))
+            assert f.line_of_offset(start) == 194
+            start, _ = f.find(pat, f.line_start(194), backward=True)
+            assert f.line_of_offset(start) == 97
+            start, _ = f.find(pat, f.size, backward=True)
+            assert f.line_of_offset(start) == 2910
+            assert f.find(re.compile(rb"missing"), 0) is None
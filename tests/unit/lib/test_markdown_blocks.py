@@ -0,0 +1,116 @@
+# tests/unit/lib/test_markdown_blocks.py
+
+import pytest
+
+pytest.importorskip("pytui.lib.markdown_blocks")
+
+
+DOC = """# Title
+
+First paragraph
+continues here.
+
+- one
+- two
+  1. nested
+
+> quoted
+
+| a | b |
+|:-:|--:|
+| 1 | 2 |
+
+***
+
+```python
+x = 1
+```
+"""
+
+
+class TestParseMarkdownBlocks:
+    def test_block_kinds_and_fields(self):
+        from pytui.lib.markdown_blocks import parse_markdown_blocks
+
+        blocks = parse_markdown_blocks(DOC)
+        assert [b.kind for b in blocks] == ["heading", "paragraph", "list", "quote", "table", "hr", "code"]
+        heading, para, lst, quote, table, _, code = blocks
+        assert heading.level == 1 and heading.text == "Title"
+        assert para.text == "First paragraph\ncontinues here."
+        assert [(i.level, i.marker, i.text) for i in lst.items] == [(0, "-", "one"), (0, "-", "two"), (1, "1.", "nested")]
+        assert quote.text == "quoted"
+        assert table.rows == [["a", "b"], ["1", "2"]]
+        assert table.align == ["center", "right"]
+        assert code.lang == "python" and code.text == "x = 1" and code.closed
+        for b in blocks:
+            assert DOC[b.start : b.end] == b.raw
+
+    def test_unclosed_fence_runs_to_end(self):
+        from pytui.lib.markdown_blocks import parse_markdown_blocks
+
+        blocks = parse_markdown_blocks("text\n\n```js\nlet a\n# not a heading")
+        assert blocks[-1].kind == "code"
+        assert not blocks[-1].closed
+        assert blocks[-1].text == "let a\n# not a heading"
+
+    def test_reparse_keeps_stable_prefix_blocks(self):
+        from pytui.lib.markdown_blocks import parse_markdown_blocks, reparse_markdown_blocks
+
+        old = "# A\n\npara one\n\n- x\n- y"
+        old_blocks = parse_markdown_blocks(old)
+        new = old + "\n- z"
+        blocks, first = reparse_markdown_blocks(old, old_blocks, new)
+        assert first == 1
+        assert blocks[0] is old_blocks[0]
+        assert [b.kind for b in blocks] == ["heading", "paragraph", "list"]
+        assert [i.text for i in blocks[-1].items] == ["x", "y", "z"]
+
+    def test_streaming_matches_full_parse(self):
+        from pytui.lib.markdown_blocks import parse_markdown_blocks, reparse_markdown_blocks
+
+        text, blocks = "", []
+        for i in range(0, len(DOC), 3):
+            new = DOC[: i + 3]
+            blocks, _ = reparse_markdown_blocks(text, blocks, new)
+            text = new
+        full = parse_markdown_blocks(DOC)
+        assert [(b.kind, b.raw, b.start) for b in blocks] == [(b.kind, b.raw, b.start) for b in full]
+
+    def test_reparse_after_edit_in_middle(self):
+        from pytui.lib.markdown_blocks import parse_markdown_blocks, reparse_markdown_blocks
+
+        old_blocks = parse_markdown_blocks(DOC)
+        new = DOC.replace("continues here.", "continues here.\n\n## Sub")
+        blocks, first = reparse_markdown_blocks(DOC, old_blocks, new)
+        assert first <= 1
+        assert [(b.kind, b.raw) for b in blocks] == [(b.kind, b.raw) for b in parse_markdown_blocks(new)]
+
+    def test_reparse_edit_before_first_block(self):
+        from pytui.lib.markdown_blocks import parse_markdown_blocks, reparse_markdown_blocks
+
+        for old, new in (("\nhello", "# Title\nhello"), ("\n\nhello\n\nworld", "a\n\nhello\n\nworld")):
+            blocks, first = reparse_markdown_blocks(old, parse_markdown_blocks(old), new)
+            assert first == 0
+            assert [(b.kind, b.raw, b.start) for b in blocks] == [
+                (b.kind, b.raw, b.start) for b in parse_markdown_blocks(new)
+            ]
+
+
+class TestParseInline:
+    def test_emphasis_code_and_links(self):
+        from pytui.lib.markdown_blocks import parse_inline
+
+        spans = parse_inline("a **b _c_** `d` ~~e~~ [f](http://x)")
+        assert "".join(s.text for s in spans) == "a b c d e f"
+        by_text = {s.text: s for s in spans}
+        assert by_text["b "].bold and not by_text["b "].italic
+        assert by_text["c"].bold and by_text["c"].italic
+        assert by_text["d"].code
+        assert by_text["e"].strikethrough
+        assert by_text["f"].href == "http://x"
+
+    def test_conceal_false_keeps_markers(self):
+        from pytui.lib.markdown_blocks import parse_inline
+
+        spans = parse_inline("**b** and `c`", conceal=False)
+        assert "".join(s.text for s in spans) == "**b** and `c`"
@@ -44,3 +44,93 @@ def test_captured_writable_stream_get_color_depth():
     c = Capture()
     s = CapturedWritableStream("stdout", c)
     assert s.getColorDepth() == 8
+
+
+def test_capture_drop_oldest_bounds_memory():
+    c = Capture(max_bytes=8)
+    c.write("stdout", "0123")
+    c.write("stdout", "4567")
+    c.write("stdout", "89ab")
+    assert c.buffered_bytes == 8
+    assert c.dropped == 4
+    assert c.claim_output() == "456789ab"
+    assert c.buffered_bytes == 0 and c.dropped == 0
+
+
+def test_capture_spill_keeps_everything():
+    c = Capture(max_bytes=4, overflow="spill")
+    for part in ("héllo ", "wor", "ld"):
+        c.write("stdout", part)
+    assert c.buffered_bytes >= len("héllo world")
+    assert c.claim_output() == "héllo world"
+    c.write("stdout", "again")
+    assert c.claim_output() == "again"
+
+
+def test_capture_rejects_unknown_overflow_policy():
+    with pytest.raises(ValueError):
+        Capture(overflow="ignore")
+
+
+def test_capture_coalesces_write_events():
+    c = Capture(coalesce=True)
+    events = []
+    c.on("write", lambda s, d: events.append((s, d)))
+    c.write("stdout", "a")
+    c.write("stdout", "b")
+    c.write("stderr", "e")
+    assert events == []
+    c.flush_events()
+    assert events == [("stdout", "ab"), ("stderr", "e")]
+    c.flush_events()
+    assert len(events) == 2
+    assert c.claim_output() == "abe"
+
+
+def test_capture_pending_events_obey_max_bytes():
+    c = Capture(max_bytes=8, coalesce=True)
+    events = []
+    c.on("write", lambda s, d: events.append((s, d)))
+    for _ in range(1000):
+        c.write("stdout", "0123")
+    assert c._pending_size == 8 and len(c._pending) == 2
+    c.flush_events()
+    assert events == [("stdout", "01230123")]
+
+    c = Capture(max_bytes=4, overflow="spill", coalesce=True)
+    events = []
+    c.on("write", lambda s, d: events.append((s, d)))
+    for part in ("héllo ", "wor", "ld"):
+        c.write("stdout", part)
+    c.write("stderr", "e")
+    assert c._pending_size <= 4
+    c.flush_events()
+    assert events == [("stdout", "héllo world"), ("stderr", "e")]
+
+
+def test_capture_attach_flushes_once_per_frame():
+    from pytui.core.renderer import Renderer
+
+    r = Renderer(width=10, height=2, target_fps=0)
+    c = Capture()
+    events = []
+    c.on("write", lambda s, d: events.append(d))
+    c.attach(r)
+    c.write("stdout", "x")
+    c.write("stdout", "y")
+    assert events == [] and r._render_scheduled
+    for cb in list(r._frame_callbacks):
+        cb(16.0)
+    assert events == ["xy"]
+    c.detach()
+    assert c._on_frame not in r._frame_callbacks
+
+
+def test_captured_writable_stream_decodes_bytes_lazily():
+    c = Capture()
+    s = CapturedWritableStream("stdout", c)
+    raw = "é✓".encode()
+    s.write(raw[:1])
+    s.write(raw[1:])
+    s.write(" ok")
+    assert c.claim_output() == "é✓ ok"
@@ -154,3 +154,34 @@ class TestNonAlphanumericKeys:
         assert "f1" in non_alphanumeric_keys
         assert "home" in non_alphanumeric_keys
         assert "end" in non_alphanumeric_keys
+
+
+class TestParseKeypressCache:
+    def test_cached_results_are_shared_and_read_only(self):
+        from pytui.lib.parse_keypress import parse_keypress_cached
+
+        a = parse_keypress_cached("\x1b[1;5C")
+        assert a is parse_keypress_cached("\x1b[1;5C")
+        assert a["name"] == "right" and a["ctrl"] is True
+        with pytest.raises(TypeError):
+            a["name"] = "left"  # type: ignore[index]
+        assert parse_keypress_cached(b"j") is parse_keypress_cached("j")
+
+    def test_public_parse_returns_fresh_dicts(self):
+        first = parse_keypress("j")
+        first["name"] = "mutated"
+        assert parse_keypress("j")["name"] == "j"
+
+    def test_cache_is_keyed_by_kitty_mode_and_bounded(self):
+        import sys
+
+        mod = sys.modules["pytui.lib.parse_keypress"]
+
+        seq = "\x1b[97u"
+        assert mod.parse_keypress_cached(seq, True)["source"] == "kitty"
+        assert mod.parse_keypress_cached(seq, False) is not mod.parse_keypress_cached(seq, True)
+        for i in range(mod._CACHE_MAX + 10):
+            mod.parse_keypress_cached(f"\x1b[{i};2~x")
+        assert len(mod._cache) <= mod._CACHE_MAX
+        mod.parse_keypress_cached("x" * (mod._MAX_CACHED_LEN + 1))
+        assert ("x" * (mod._MAX_CACHED_LEN + 1), False) not in mod._cache
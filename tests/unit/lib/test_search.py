@@ -0,0 +1,167 @@
+# tests/unit/lib/test_search.py - SearchIndex: chunked background scan, streamed matches, incremental rescans
+
+import random
+import re
+
+import pytest
+
+pytest.importorskip("pytui.lib.search")
+
+
+def _expected(lines, pattern, base=0):
+    rx = re.compile(pattern)
+    return [(base + n, m.start(), m.end()) for n, line in enumerate(lines) for m in rx.finditer(line) if m.end() > m.start()]
+
+
+class TestScanLines:
+    def test_chunks_map_matches_back_to_lines(self):
+        from pytui.lib.search import compile_search_pattern, scan_lines
+
+        lines = [f"row {i} " + ("err err" if i % 5 == 0 else "ok") for i in range(500)]
+        pattern = compile_search_pattern("err")
+        chunks = list(scan_lines(pattern, lines, base=10, chunk_chars=1024))
+        assert len(chunks) > 1
+        assert chunks[0][0] == 10 and chunks[-1][1] == 510
+        found = [(k, s, e) for _, _, keys, hits in chunks for k, h in zip(keys, hits) for s, e in h]
+        assert found == _expected(lines, "err", base=10)
+
+    def test_matches_are_clipped_to_their_line(self):
+        from pytui.lib.search import compile_search_pattern, scan_lines
+
+        pattern = compile_search_pattern(r"b\s+c|^$|x$", regex=True)
+        (_, _, keys, hits), = scan_lines(pattern, ["ab", "c", "", "x"])
+        assert keys == [0, 3]
+        assert hits == [[(1, 2)], [(0, 1)]]
+
+    def test_case_insensitive_literal(self):
+        from pytui.lib.search import compile_search_pattern
+
+        assert compile_search_pattern("A.b", case_sensitive=False).findall("a.B axb") == ["a.B"]
+
+
+class TestSearchIndex:
+    def test_background_scan_streams_matches(self):
+        from pytui.core.text_buffer import TextBuffer
+        from pytui.lib.search import SearchIndex
+
+        lines = [f"{i:05d} " + ("ERROR disk" if i % 7 == 0 else "fine") for i in range(20000)]
+        tb = TextBuffer()
+        tb.set_text("\n".join(lines))
+        batches = []
+        done = []
+        index = SearchIndex(tb, "error", case_sensitive=False, chunk_chars=4096)
+        index.on("matches", batches.append)
+        index.on("done", lambda: done.append(True))
+        assert index.wait(10)
+        assert len(batches) > 1 and done == [True]
+        assert [m for b in batches for m in b] == _expected(lines, "ERROR")
+        assert index.match_count == len(range(0, 20000, 7))
+        assert index.matches_in_lines(7, 15) == [(7, 6, 11), (14, 6, 11)]
+        assert index.next_match(7, 6) == (14, 6, 11)
+        assert index.prev_match(7, 6) == (0, 6, 11)
+        index.close()
+
+    def test_set_pattern_restarts(self):
+        from pytui.lib.search import SearchIndex
+
+        index = SearchIndex(["foo bar", "bar"], "foo", background=False)
+        index.wait(1)
+        assert index.matches() == [(0, 0, 3)]
+        cleared = []
+        index.on("cleared", lambda: cleared.append(True))
+        index.set_pattern("bar")
+        index.wait(1)
+        assert cleared == [True]
+        assert index.matches() == [(0, 4, 7), (1, 0, 3)]
+        index.set_pattern("")
+        index.poll()
+        assert index.matches() == [] and not index.scanning
+
+    def test_text_buffer_append_rescans_only_new_lines(self):
+        from pytui.core.text_buffer import TextBuffer
+        from pytui.lib.search import SearchIndex
+
+        tb = TextBuffer()
+        tb.set_text("x1\nab")
+        index = SearchIndex(tb, "x", background=False)
+        index.wait(1)
+        assert index.matches() == [(0, 0, 1)]
+        tb.append("x\nx3")
+        index.poll()
+        assert index.pending_lines == 0
+        assert index.matches() == [(0, 0, 1), (1, 2, 3), (2, 0, 1)]
+        tb.set_text("no hits")
+        index.wait(1)
+        assert index.matches() == []
+
+    def test_edit_buffer_edits_match_full_rescan(self):
+        from pytui.core.edit_buffer import EditBuffer
+        from pytui.lib.search import SearchIndex
+
+        rng = random.Random(7)
+        eb = EditBuffer("\n".join(f"l{i} ab" for i in range(200)))
+        index = SearchIndex(eb, "ab", background=False)
+        index.wait(1)
+        invalidated = []
+        index.on("invalidate", lambda *args: invalidated.append(args))
+        for _ in range(150):
+            n = len(eb.text)
+            r = rng.random()
+            if r < 0.45:
+                eb.insert(rng.randint(0, n), rng.choice(["a", "b", "ab", "\n", "x\nab", "ab\n\n"]))
+            elif r < 0.85 and n:
+                start = rng.randint(0, n - 1)
+                eb.delete(start, start + rng.randint(1, 6))
+            else:
+                eb.undo()
+            index.poll()
+            assert index.matches() == _expected(eb.text.split("\n"), "ab")
+        assert invalidated and all(first <= old_end for first, old_end, _ in invalidated)
+        eb.set_text("ab")
+        index.poll()
+        assert index.matches() == [(0, 0, 2)]
+        index.close()
+        eb.insert(0, "ab")
+        assert index.matches() == [(0, 0, 2)]
+
+    def test_edit_during_background_scan(self):
+        from pytui.core.edit_buffer import EditBuffer
+        from pytui.lib.search import SearchIndex
+
+        eb = EditBuffer("\n".join("needle" if i % 3 == 0 else "hay" for i in range(30000)))
+        index = SearchIndex(eb, "needle", chunk_chars=1024)
+        index.poll()
+        eb.insert(0, "needle\n")
+        eb.delete(len(eb.text) - 3, len(eb.text))
+        assert index.wait(10)
+        assert index.matches() == _expected(eb.text.split("\n"), "needle")
+
+    def test_console_buffer_tail_and_eviction(self):
+        from pytui.core.console import ConsoleBuffer
+        from pytui.lib.search import SearchIndex
+
+        cb = ConsoleBuffer(max_lines=4)
+        cb.append("warn: a\nok")
+        index = SearchIndex(cb, "warn", background=False)
+        index.wait(1)
+        assert index.matches() == [(0, 0, 4)]
+        cb.write("warn")
+        cb.write(" more warn")
+        index.poll()
+        assert index.matches() == [(0, 0, 4), (2, 0, 4), (2, 10, 14)]
+        cb.append("warn\nx\ny")
+        index.poll()
+        assert cb.seq_range() == (2, 6)
+        assert index.matches() == [(2, 0, 4), (2, 10, 14), (3, 0, 4)]
+
+    def test_console_buffer_wraps_between_polls(self):
+        from pytui.core.console import ConsoleBuffer
+        from pytui.lib.search import SearchIndex
+
+        cb = ConsoleBuffer(max_lines=3)
+        cb.append("hit")
+        index = SearchIndex(cb, "hit", background=False)
+        index.wait(1)
+        cb.append("a\nb\nhit\nc\nhit")
+        index.poll()
+        assert index.matches() == [(3, 0, 3), (5, 0, 3)]
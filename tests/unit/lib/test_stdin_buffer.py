@@ -115,6 +115,30 @@ class TestStdinBufferPartialEscapeSequences:
         assert emitted[0] == "\x1b[<35"
 
 
+    def test_deadline_mode_flushes_only_from_check_timeout(self):
+        import threading
+
+        b = StdinBuffer({"timeout": 10, "timeout_incomplete": 15, "use_timer": False})
+        out: list[str] = []
+        b.on("data", out.append)
+        threads = threading.active_count()
+        process_input(b, "\x1b[<35")
+        assert threading.active_count() == threads and b.deadline is not None
+        assert b.check_timeout(b.deadline - 0.001) is False
+        time.sleep(0.02)
+        assert out == []
+        assert b.check_timeout() is True
+        assert out == ["\x1b[<35"] and b.deadline is None
+
+    def test_lone_escape_uses_short_timeout(self):
+        b = StdinBuffer({"timeout": 10, "timeout_incomplete": 2000, "use_timer": False})
+        process_input(b, "\x1b")
+        short = b.deadline
+        process_input(b, "[")
+        assert b.deadline - short > 1.0
+        process_input(b, "A")
+        assert b.deadline is None
+
 class TestStdinBufferFlushAndClear:
     def test_flush_returns_pending(self, buffer, emitted):
         process_input(buffer, "\x1b[")
@@ -154,3 +178,59 @@ class TestStdinBufferBracketedPaste:
         process_input(buffer, "ab\x1b[200~x\x1b[201~")
         assert emitted == ["a", "b"]
         assert pasted == ["x"]
+
+    def test_escape_before_paste_in_one_read(self, buffer, emitted):
+        pasted: list[str] = []
+        buffer.on("paste", lambda s: pasted.append(s))
+        process_input(buffer, "\x1b\x1b[200~rm -rf x\r\x1b[201~")
+        assert emitted == ["\x1b"]
+        assert pasted == ["rm -rf x\r"]
+
+    def test_pending_escape_then_paste(self, buffer, emitted):
+        pasted: list[str] = []
+        buffer.on("paste", lambda s: pasted.append(s))
+        process_input(buffer, "\x1b")
+        assert emitted == []
+        process_input(buffer, "\x1b[200~rm -rf x\r\x1b[201~")
+        assert emitted == ["\x1b"]
+        assert pasted == ["rm -rf x\r"]
+
+    def test_paste_end_marker_split_across_chunks(self, buffer, emitted):
+        pasted: list[str] = []
+        buffer.on("paste", lambda s: pasted.append(s))
+        for chunk in ("\x1b[20", "0~ab", "c\x1b[2", "01", "~z"):
+            process_input(buffer, chunk)
+        assert pasted == ["abc"]
+        assert emitted == ["z"]
+
+    def test_large_paste_in_many_chunks(self, buffer, emitted):
+        pasted: list[str] = []
+        buffer.on("paste", lambda s: pasted.append(s))
+        process_input(buffer, "\x1b[200~")
+        for _ in range(2000):
+            process_input(buffer, "0123456789")
+        process_input(buffer, "\x1b[201~\x1b[A")
+        assert len(pasted[0]) == 20000
+        assert emitted == ["\x1b[A"]
+
+
+class TestStdinBufferTokenizer:
+    def test_string_sequences_split_across_chunks(self, buffer, emitted):
+        process_input(buffer, "\x1b]52;c;")
+        for _ in range(100):
+            process_input(buffer, "QUJD")
+        assert emitted == []
+        process_input(buffer, "\x1b")
+        process_input(buffer, "\\x")
+        assert emitted == ["\x1b]52;c;" + "QUJD" * 100 + "\x1b\\", "x"]
+        assert buffer.get_buffer() == ""
+
+    def test_osc_bel_dcs_apc_and_x10_mouse(self, buffer, emitted):
+        process_input(buffer, "\x1b]0;t\x07\x1bP1$r0m\x1b\\\x1b_Gi=1\x1b\\\x1b[M !!a")
+        assert emitted == ["\x1b]0;t\x07", "\x1bP1$r0m\x1b\\", "\x1b_Gi=1\x1b\\", "\x1b[M !!", "a"]
+
+    def test_mouse_stream_in_one_chunk(self, buffer, emitted):
+        process_input(buffer, "\x1b[<35;20;5M" * 1000 + "\x1b[<0;1")
+        assert len(emitted) == 1000 and buffer.get_buffer() == "\x1b[<0;1"
+        process_input(buffer, ";2m")
+        assert emitted[-1] == "\x1b[<0;1;2m"
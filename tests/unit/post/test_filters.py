@@ -119,3 +119,75 @@ class TestFilters:
         assert c0.char == " "
         assert c1.char == "."
         assert c2.char == "#"
+
+    def test_apply_blur_averages_colors_keeps_chars(self, buffer_10x5):
+        from pytui.core.buffer import Cell
+        from pytui.post.filters import apply_blur
+
+        buf = buffer_10x5
+        buf.fill_rect(0, 0, 10, 5, Cell(char="a", bg=(0, 0, 0, 255)))
+        buf.set_cell(5, 2, Cell(char="Z", bg=(90, 90, 90, 255)))
+        apply_blur(buf, radius=1)
+        assert buf.get_cell(5, 2).bg == (10, 10, 10, 255)
+        assert buf.get_cell(4, 1).bg == (10, 10, 10, 255)
+        assert buf.get_cell(3, 2).bg == (0, 0, 0, 255)
+        assert buf.get_cell(5, 2).char == "Z"
+        # Edge cells average only in-bounds neighbours
+        buf.set_cell(0, 0, Cell(char="e", bg=(40, 40, 40, 255)))
+        apply_blur(buf, radius=1)
+        assert buf.get_cell(0, 0).bg[0] == 10
+
+    def test_unchanged_cells_are_not_replaced(self, buffer_10x5):
+        from pytui.core.buffer import Cell
+        from pytui.post.filters import apply_scanlines
+
+        buf = buffer_10x5
+        buf.set_cell(0, 1, Cell(char="K", fg=(200, 200, 200, 255)))
+        before = buf.get_cell(0, 1)
+        apply_scanlines(buf, strength=0.5, step=2)
+        assert buf.get_cell(0, 1) is before
+
+    def test_pipeline_matches_sequential_filters(self, buffer_10x5):
+        from pytui.core.buffer import Cell, OptimizedBuffer
+        from pytui.post.filters import FilterPipeline, apply_dim, apply_invert, apply_sepia
+
+        def fill(buf):
+            for y in range(buf.height):
+                for x in range(buf.width):
+                    buf.set_cell(x, y, Cell(char="p", fg=(x * 25, y * 50, 77, 255), bg=(y * 9, 200, x * 3, 128)))
+
+        a = buffer_10x5
+        b = OptimizedBuffer(10, 5, use_native=False)
+        fill(a)
+        fill(b)
+        apply_sepia(a)
+        apply_invert(a)
+        apply_dim(a, alpha=0.3)
+        FilterPipeline().add("sepia").add("invert").add("dim", alpha=0.3)(b, 0.016)
+        for y in range(5):
+            for x in range(10):
+                assert a.get_cell(x, y).fg == b.get_cell(x, y).fg
+                assert a.get_cell(x, y).bg == b.get_cell(x, y).bg
+
+    def test_pipeline_rect_and_post_process_registration(self):
+        from pytui.core.buffer import Cell
+        from pytui.post.filters import FilterPipeline
+        from pytui.testing.test_renderer import create_test_renderer
+
+        renderer = create_test_renderer(10, 5)
+        pipeline = FilterPipeline([("dim", {"alpha": 0.0})], rect=(2, 1, 3, 2))
+        renderer.add_post_process_fn(pipeline)
+        buf = renderer.back_buffer
+        buf.fill_rect(0, 0, 10, 5, Cell(char="x", fg=(100, 100, 100, 255)))
+        pipeline(buf, 0.0)
+        assert buf.get_cell(2, 1).fg == (0, 0, 0, 255)
+        assert buf.get_cell(4, 2).fg == (0, 0, 0, 255)
+        assert buf.get_cell(1, 1).fg == (100, 100, 100, 255)
+        assert buf.get_cell(5, 2).fg == (100, 100, 100, 255)
+        assert pipeline in renderer.post_process_fns
+
+    def test_pipeline_unknown_filter(self):
+        from pytui.post.filters import FilterPipeline
+
+        with pytest.raises(ValueError):
+            FilterPipeline().add("nope")
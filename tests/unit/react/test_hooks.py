@@ -116,6 +116,38 @@ class TestHooks:
             hooks_module._current_component = None
         assert "True" in out.get("props", {}).get("content", "")
 
+    def test_key_update_renders_in_the_same_frame(self):
+        import contextlib
+        import io
+        import os
+
+        from pytui.core.renderer import Renderer
+        from pytui.react import Component, create_root, h, useKeyboard, useState
+
+        class Counter(Component):
+            def render(self):
+                n, set_n = useState(0)
+                useKeyboard(lambda key: set_n(lambda v: v + 1) if key.get("name") == "j" else None)
+                return h("text", {"content": f"n={n}", "width": 10, "height": 1})
+
+        r = Renderer(width=20, height=5, target_fps=0)
+        create_root(r).render(h(Counter, {}))
+        with contextlib.redirect_stdout(io.StringIO()):
+            r._render_frame()
+        rfd, wfd = os.pipe()
+        os.write(wfd, b"j")
+        r._input_stream = open(rfd, "rb", buffering=0)
+        r.set_frame_callback(lambda _delta_ms: setattr(r, "running", False))
+        r.running = True
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                r._run_loop()
+        finally:
+            r._input_stream.close()
+            r._input_stream = None
+            os.close(wfd)
+        assert "".join(r.front_buffer.get_cell(x, 0).char for x in range(3)) == "n=1"
+
     def test_useResize_returns_size_and_updates_on_resize_event(self):
         from pytui.react import Component, useResize, h
         from pytui.react.reconciler import reconcile
@@ -255,3 +287,150 @@ class TestHooks:
         assert getattr(timeline, "current_time", 0) == 0.0
         engine.update(1.0)
         assert 0.9 <= getattr(timeline, "current_time", 0) <= 1.1
+
+    def test_use_effect_deps_and_cleanup(self):
+        from pytui.core.renderer import Renderer
+        from pytui.react import Component, flush_sync, h, reconcile, useEffect, useState
+
+        log = []
+
+        class C(Component):
+            def render(self):
+                a, set_a = useState(0)
+                b, set_b = useState(0)
+                self._set_a, self._set_b = set_a, set_b
+
+                def effect():
+                    log.append(f"run{a}")
+                    return lambda: log.append(f"clean{a}")
+
+                useEffect(effect, [a])
+                useEffect(lambda: log.append("every"))
+                return {"type": "text", "props": {"content": f"{a}{b}", "width": 5, "height": 1}, "children": []}
+
+        r = Renderer(width=20, height=5, target_fps=0)
+        reconcile(h(C, {}), r.root)
+        comp = r.root._react_children[0][1][1]
+        assert log == ["run0", "every"]
+        log.clear()
+        flush_sync(lambda: comp._set_b(1))  # deps [a] unchanged
+        assert log == ["every"]
+        log.clear()
+        flush_sync(lambda: comp._set_a(1))
+        assert log == ["clean0", "run1", "every"]
+        log.clear()
+        reconcile(None, r.root)
+        assert log == ["clean1"]
+
+    def test_use_memo_use_callback_use_ref_stable_across_renders(self):
+        from pytui.core.renderer import Renderer
+        from pytui.react import Component, flush_sync, h, reconcile, useCallback, useMemo, useRef, useState
+
+        computed = []
+        seen = []
+
+        class C(Component):
+            def render(self):
+                n, set_n = useState(0)
+                other, set_other = useState(0)
+                self._set_n, self._set_other = set_n, set_other
+                doubled = useMemo(lambda: computed.append(n) or n * 2, [n])
+                cb = useCallback(lambda: n, [n])
+                ref = useRef(0)
+                ref.current += 1
+                seen.append((doubled, cb, ref))
+                return {"type": "text", "props": {"content": str(doubled), "width": 5, "height": 1}, "children": []}
+
+        r = Renderer(width=20, height=5, target_fps=0)
+        reconcile(h(C, {}), r.root)
+        comp = r.root._react_children[0][1][1]
+        flush_sync(lambda: comp._set_other(1))
+        assert computed == [0]
+        assert seen[0][1] is seen[1][1]
+        flush_sync(lambda: comp._set_n(3))
+        assert computed == [0, 3]
+        assert seen[2][0] == 6 and seen[2][1]() == 3
+        assert seen[0][2] is seen[2][2] and seen[2][2].current == 3
+
+
+class TestScheduledUpdates:
+    def _mount(self, root_cls):
+        from pytui.core.renderer import Renderer
+        from pytui.react import h, reconcile
+        from pytui.react.scheduler import flush_updates
+
+        flush_updates()
+        r = Renderer(width=20, height=5, target_fps=0)
+        reconcile(h(root_cls, {}), r.root)
+        return r
+
+    def test_setters_batch_into_one_render(self):
+        from pytui.react import Component, flush_sync, useState
+
+        renders = []
+
+        class C(Component):
+            def render(self):
+                a, set_a = useState(0)
+                b, set_b = useState(0)
+                self._set_a, self._set_b = set_a, set_b
+                renders.append((a, b))
+                return {"type": "text", "props": {"content": f"{a}{b}", "width": 5, "height": 1}, "children": []}
+
+        r = self._mount(C)
+        comp = r.root._react_children[0][1][1]
+        comp._set_a(1)
+        comp._set_b(2)
+        comp._set_a(lambda prev: prev + 1)
+        assert renders == [(0, 0)]
+        flush_sync()
+        assert renders == [(0, 0), (2, 2)]
+        assert r.root.children[0].content == "22"
+        comp._set_a(2)  # unchanged value: no re-render
+        flush_sync()
+        assert len(renders) == 2
+
+    def test_frame_callback_flushes_parent_first_once(self):
+        from pytui.react import Component, h, useState
+
+        log = []
+
+        class Child(Component):
+            def render(self):
+                v, set_v = useState(0)
+                self.props["sink"].append(set_v)
+                log.append("child")
+                return {"type": "text", "props": {"content": str(v), "width": 5, "height": 1}, "children": []}
+
+        class Parent(Component):
+            def render(self):
+                n, set_n = useState(0)
+                self._set_n = set_n
+                self._child_setters = []
+                log.append("parent")
+                return h("box", {"width": 20, "height": 5}, h(Child, {"sink": self._child_setters}))
+
+        r = self._mount(Parent)
+        parent = r.root._react_children[0][1][1]
+        child_set = parent._child_setters[0]
+        log.clear()
+        child_set(5)
+        parent._set_n(1)
+        assert r._render_scheduled
+        for cb in list(r._frame_callbacks):
+            cb(16.0)
+        assert log == ["parent", "child"]
+
+    def test_flush_sync_runs_fn_then_flushes(self):
+        from pytui.react import Component, flush_sync, useState
+
+        class C(Component):
+            def render(self):
+                v, set_v = useState("a")
+                self._set_v = set_v
+                return {"type": "text", "props": {"content": v, "width": 5, "height": 1}, "children": []}
+
+        r = self._mount(C)
+        comp = r.root._react_children[0][1][1]
+        flush_sync(lambda: comp._set_v("b"))
+        assert r.root.children[0].content == "b"
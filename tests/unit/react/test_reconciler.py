@@ -166,33 +166,167 @@ class TestReconciler:
         blur_spy.assert_called_once()
         assert host not in parent.children
 
-    def test_update_component_output_unmounts_old_children_on_state_update(self, mock_context):
-        """组件 setState 重渲染时 _update_component_output 会先卸载旧子节点（调用 _unmount）。"""
-        from pytui.react import get_component_catalogue
-        if get_component_catalogue().get("box") is None:
-            pytest.skip("box not in catalogue (optional component)")
+    def test_state_update_patches_instead_of_remounting(self, mock_context):
+        """setState 重渲染时复用已有 Renderable（保留焦点），只更新变化的 props。"""
         from pytui.core.renderer import Renderer
-        from pytui.react import Component, useState, h, reconcile
+        from pytui.react import Component, flush_sync, useState, h, reconcile
 
         class C(Component):
             def render(self):
                 s, set_s = useState(0)
-                if not hasattr(self, "_setter"):
-                    self._setter = set_s
-                return h("box", {"width": 40, "height": 20}, h("input", {"width": 10, "height": 1}))
+                self._setter = set_s
+                return h(
+                    "box",
+                    {"width": 40, "height": 20},
+                    h("input", {"width": 10, "height": 1, "focused": True}),
+                    h("text", {"content": f"n={s}", "width": 10, "height": 1}),
+                )
 
         r = Renderer(width=40, height=20, target_fps=0)
         reconcile(h(C, {}), r.root)
         comp = r.root._react_children[0][1][1]
-        old_child_insts = list(comp._react_child_insts)
-
-        with patch("pytui.react.reconciler._unmount", wraps=lambda *a: None) as mock_unmount:
+        box = r.root.children[0]
+        inp, text = box.children
+        with patch("pytui.react.reconciler._unmount") as mock_unmount:
             comp._setter(1)
+            flush_sync()
+        mock_unmount.assert_not_called()
+        assert r.root.children == [box]
+        assert box.children[0] is inp and box.children[1] is text
+        assert inp.focused
+        assert text.content == "n=1"
+
+    def test_keyed_children_move_without_recreating(self, mock_context):
+        from pytui.core.renderer import Renderer
+        from pytui.react import h, reconcile
+
+        def rows(keys):
+            return h("box", {"width": 20, "height": 10}, [h("text", {"key": k, "content": k, "height": 1}) for k in keys])
+
+        r = Renderer(width=20, height=10, target_fps=0)
+        reconcile(rows(["a", "b", "c"]), r.root)
+        box = r.root.children[0]
+        a, b, c = box.children
+        reconcile(rows(["c", "a", "d"]), r.root)
+        assert r.root.children[0] is box
+        assert box.children[0] is c and box.children[1] is a
+        assert box.children[2] not in (a, b, c)
+        assert box.children[2].content == "d"
+        assert b.parent is None
+        assert [e.layout_node for e in box.children] == box.layout_node.children
+
+    def test_type_change_replaces_in_place(self, mock_context):
+        from pytui.core.renderer import Renderer
+        from pytui.react import h, reconcile
+
+        r = Renderer(width=20, height=10, target_fps=0)
+        reconcile([h("text", {"content": "1", "height": 1}), h("text", {"content": "2", "height": 1})], r.root)
+        first, second = r.root.children
+        reconcile([h("input", {"width": 5, "height": 1}), h("text", {"content": "3", "height": 1})], r.root)
+        assert r.root.children[0].__class__.__name__ == "Input"
+        assert r.root.children[1] is second
+        assert second.content == "3"
+        assert first.parent is None
+
+    def test_event_prop_rebinds_on_patch(self, mock_context):
+        from pytui.core.renderer import Renderer
+        from pytui.react import h, reconcile
+
+        r = Renderer(width=40, height=20, target_fps=0)
+        calls = []
+        props = {"options": ["a", "b"], "selected": 0, "width": 10, "height": 2}
+        reconcile(h("select", {**props, "onSelect": lambda *a: calls.append("old")}), r.root)
+        sel = r.root.children[0]
+        reconcile(h("select", {**props, "onSelect": lambda *a: calls.append("new")}), r.root)
+        assert r.root.children[0] is sel
+        sel.select_next()
+        assert calls == ["new"]
+
+    def test_removed_props_detach_handlers_or_replace_host(self, mock_context):
+        from pytui.core.renderer import Renderer
+        from pytui.react import h, reconcile
+
+        r = Renderer(width=40, height=20, target_fps=0)
+        calls = []
+        props = {"options": ["a", "b", "c"], "selected": 0, "width": 10, "height": 2}
+        reconcile(h("select", {**props, "focused": True, "onSelect": lambda *a: calls.append("x")}), r.root)
+        sel = r.root.children[0]
+        reconcile(h("select", props), r.root)
+        assert r.root.children[0] is sel
+        assert not sel.focused and r.current_focused_renderable is None
+        sel.select_next()
+        assert calls == []
 
-        mock_unmount.assert_called()
-        # 应使用旧的 old_child_insts 调用 _unmount(inst, parent)
-        calls = [c for c in mock_unmount.call_args_list if len(c[0]) >= 2]
-        assert len(calls) >= 1
-        # 第一次调用应为 (old_inst, parent)
-        first_inst = calls[0][0][0]
-        assert first_inst is old_child_insts[0][1]
+        reconcile(h("text", {"content": "A", "fg": "#ff0000", "width": 10, "height": 1}), r.root)
+        text = r.root.children[0]
+        reconcile(h("text", {"content": "A", "width": 10, "height": 1}), r.root)
+        plain = r.root.children[0]
+        assert plain is not text and text.parent is None
+        assert plain.fg == (255, 255, 255, 255)
+
+    def test_create_root_render_patches(self, mock_context):
+        from pytui.core.renderer import Renderer
+        from pytui.react import create_root, h
+
+        r = Renderer(width=20, height=5, target_fps=0)
+        root = create_root(r)
+        root.render(h("text", {"content": "A", "width": 10, "height": 1}))
+        text = r.root.children[0]
+        root.render(h("text", {"content": "B", "width": 10, "height": 1}))
+        assert r.root.children == [text]
+        assert text.content == "B"
+        root.unmount()
+        assert r.root.children == []
+
+    def test_memo_and_pure_component_skip_render_for_equal_props(self, mock_context):
+        from pytui.core.renderer import Renderer
+        from pytui.react import Component, PureComponent, flush_sync, h, memo, reconcile, useState
+
+        renders = []
+
+        class Label(Component):
+            def render(self):
+                renders.append(("label", self.props["text"]))
+                return h("text", {"content": self.props["text"], "width": 10, "height": 1})
+
+        memo_label = memo(Label)
+
+        class Counter(PureComponent):
+            def render(self):
+                n, set_n = useState(0)
+                self._set_n = set_n
+                renders.append(("counter", n))
+                return h("text", {"content": f"{self.props['title']}{n}", "width": 10, "height": 1})
+
+        class App(Component):
+            def render(self):
+                tick, set_tick = useState(0)
+                label, set_label = useState("a")
+                self._set_tick, self._set_label = set_tick, set_label
+                return h(
+                    "box",
+                    {"width": 20, "height": 4},
+                    h(memo_label, {"text": label}),
+                    h(Counter, {"title": "c"}),
+                    h("text", {"content": str(tick), "width": 5, "height": 1}),
+                )
+
+        r = Renderer(width=20, height=5, target_fps=0)
+        reconcile(h(App, {}), r.root)
+        app = r.root._react_children[0][1][1]
+        box = r.root.children[0]
+        label_text = box.children[0]
+        assert memo_label.__name__ == "Label"
+        renders.clear()
+        flush_sync(lambda: app._set_tick(1))
+        assert renders == []
+        assert box.children[0] is label_text
+        assert box.children[2].content == "1"
+        flush_sync(lambda: app._set_label("b"))
+        assert renders == [("label", "b")]
+        assert box.children[0] is label_text and label_text.content == "b"
+        renders.clear()
+        counter = box._react_children[1][1][1]
+        flush_sync(lambda: (counter._set_n(1), app._set_tick(2)))  # own state change still renders
+        assert renders == [("counter", 1)]
+        assert box.children[1].content == "c1"
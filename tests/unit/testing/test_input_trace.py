@@ -0,0 +1,118 @@
+# tests/unit/testing/test_input_trace.py - input recording, compact trace format and headless replay latency
+
+import pytest
+
+pytest.importorskip("pytui.testing.input_trace")
+
+
+def _trace(*events):
+    from pytui.testing.input_trace import InputTrace, TraceEvent
+
+    return InputTrace(20, 5, [TraceEvent(t, d) if isinstance(d, bytes) else TraceEvent(t, size=d) for t, d in events])
+
+
+class TestInputTraceFormat:
+    def test_round_trip(self, tmp_path):
+        from pytui.testing.input_trace import InputTrace
+
+        trace = _trace((0, b"a"), (1500, b"\x1b[<0;3;2M"), (400_000, (30, 8)), (400_200, b"x" * 300))
+        path = tmp_path / "s.ptrc"
+        trace.save(path)
+        loaded = InputTrace.load(path)
+        assert (loaded.width, loaded.height) == (20, 5)
+        assert loaded.events == trace.events
+        assert loaded.duration_us == 400_200
+        body = path.read_bytes().split(b"\n", 2)[2]
+        assert len(body) <= sum(len(e.data) + 5 for e in trace.events)  # varint delta + tag per record
+
+    def test_rejects_foreign_and_truncated_data(self):
+        from pytui.testing.input_trace import InputTrace
+
+        with pytest.raises(ValueError):
+            InputTrace.from_bytes(b"garbage")
+        data = _trace((0, b"hello")).to_bytes()
+        with pytest.raises(ValueError):
+            InputTrace.from_bytes(data[:-2])
+
+
+class TestInputRecorder:
+    def test_records_raw_chunks_and_resizes(self):
+        from pytui.testing.input_trace import record_input
+        from pytui.testing.test_renderer import create_test_renderer
+
+        r = create_test_renderer(20, 5)
+        rec = record_input(r)
+        rec.record(b"ab")
+        r.terminal.resize(30, 6)
+        r._check_resize()
+        trace = rec.stop()
+        assert r._input_recorder is None
+        assert [e.data for e in trace.events] == [b"ab", b""]
+        assert trace.events[1].size == (30, 6)
+        assert trace.events[0].t_us <= trace.events[1].t_us
+
+
+class TestReplay:
+    def test_max_speed_replay_reports_latency(self):
+        from pytui.components.input import Input
+        from pytui.testing.input_trace import replay_trace
+
+        def setup(r):
+            inp = Input(r.context, {"id": "in", "width": 10, "height": 1})
+            r.root.add(inp)
+            inp.focus()
+
+        trace = _trace((0, b"h"), (10_000, b"i"), (20_000, b"\x1b[D"), (30_000, b"\x1b[999;1;1x"))
+        report = replay_trace(trace, speed=float("inf"), setup=setup)
+        assert report["inputs"] == 4
+        assert report["frames"] >= 3
+        assert report["frames"] + report["unrendered"] >= 3
+        assert 0 < report["p50_ms"] <= report["p99_ms"] <= report["max_ms"]
+
+    def test_replay_flushes_react_updates(self):
+        from pytui.react import Component, create_root, h, useKeyboard, useState
+        from pytui.testing.input_trace import replay_trace
+        from pytui.testing.test_renderer import create_test_renderer
+
+        class Counter(Component):
+            def render(self):
+                n, set_n = useState(0)
+                useKeyboard(lambda key: set_n(lambda v: v + 1) if key.get("name") == "j" else None)
+                return h("text", {"content": f"n={n}", "width": 10, "height": 1})
+
+        r = create_test_renderer(20, 5)
+        trace = _trace((0, b"j"), (10_000, b"j"), (20_000, b"j"))
+        report = replay_trace(trace, renderer=r, speed=0, setup=lambda r: create_root(r).render(h(Counter, {})))
+        assert r.root.children[0].content == "n=3"
+        assert report["frames"] == 3 and report["unrendered"] == 0
+        assert "".join(r.front_buffer.get_cell(x, 0).char for x in range(3)) == "n=3"
+
+    def test_lone_escape_flushes_on_recorded_gap(self):
+        from pytui.testing.input_trace import replay_trace
+        from pytui.testing.test_renderer import create_test_renderer
+
+        r = create_test_renderer(20, 5)
+        seen = []
+        r.keyboard.on("keypress", lambda k: seen.append(k["name"]))
+        replay_trace(_trace((0, b"\x1b"), (2_000_000, b"q")), renderer=r, speed=0)
+        assert seen == ["escape", "q"]
+
+    def test_recorded_pace_is_scaled(self):
+        import time
+
+        from pytui.testing.input_trace import replay_trace
+
+        t0 = time.perf_counter()
+        report = replay_trace(_trace((0, b"a"), (200_000, b"b")), speed=4.0)
+        assert time.perf_counter() - t0 >= 0.045
+        assert report["elapsed_s"] >= 0.045 and report["recorded_s"] == pytest.approx(0.2)
+
+    def test_feed_raw_input_routes_mouse_reports(self):
+        from pytui.testing.test_renderer import create_test_renderer
+
+        r = create_test_renderer(20, 5, use_mouse=True)
+        mouse, keys = [], []
+        r._mouse_handler.on("mouse", mouse.append)
+        r.keyboard.on("keypress", lambda k: keys.append(k["name"]))
+        r.feed_raw_input(b"\x1b[<0;3;2Mz")
+        assert len(mouse) == 1 and keys == ["z"]
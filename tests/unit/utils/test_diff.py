@@ -75,3 +75,108 @@ class TestDiff:
         patch, err = parse_patch("+only\n-no @@")
         assert patch is None
         assert err == "No valid hunks found"
+
+    def test_unified_row_model_wraps_and_indexes_lines(self):
+        from pytui.utils.diff import build_unified_row_model
+
+        lines = [(" ", "abcdefgh", 1, 1), ("+", "xy", None, 2), ("-", "", 2, None)]
+        model = build_unified_row_model(lines, width=8, wrap_mode="char", show_line_numbers=False)
+        # content width = 8 - 2 (sign) = 6 -> "abcdef", "gh"
+        assert [r.text for r in model.rows] == ["abcdef", "gh", "xy", ""]
+        assert model.line_starts == [0, 2, 3]
+        assert model.rows[0].line_num == 1 and model.rows[1].line_num is None
+        assert model.rows[1].start == 6
+        assert model.line_for_row(1) == 0
+        assert model.line_for_row(2) == 1
+        assert model.row_for_line(2) == 3
+        assert list(model.visible_range(1, 2)) == [1, 2]
+        assert list(model.visible_range(3, 10)) == [3]
+
+    def test_row_model_style_runs_are_sliced_per_segment(self):
+        from pytui.utils.diff import build_unified_row_model
+
+        calls = []
+
+        def highlight(text):
+            calls.append(text)
+            return [(text[:3], "keyword"), (text[3:], "plain")]
+
+        model = build_unified_row_model([("+", "defabc", None, 1)], width=6, wrap_mode="char",
+                                        show_line_numbers=False, highlight=highlight)
+        assert [r.text for r in model.rows] == ["defa", "bc"]
+        assert model.style_runs(model.rows[0]) == [("def", "keyword"), ("a", "plain")]
+        assert model.style_runs(model.rows[1]) == [("bc", "plain")]
+        assert calls == ["defabc"]
+
+    def test_split_row_model_pads_shorter_side(self):
+        from pytui.utils.diff import build_split_logical_lines, build_split_row_model, parse_patch
+
+        patch, _ = parse_patch("@@ -1,1 +1,1 @@\n-short\n+a much longer replacement line")
+        left, right = build_split_logical_lines(patch)
+        model = build_split_row_model(left, right, left_width=10, right_width=10, wrap_mode="char")
+        assert model.is_split
+        assert len(model.rows) == len(model.right_rows) == 3
+        assert model.rows[0].text == "short" and model.rows[1].text == ""
+        assert model.rows[1].tag == "remove"
+        assert model.right_rows[0].line_num == 1 and model.right_rows[1].line_num is None
+
+    def test_streaming_parser_multi_file_offsets(self):
+        from pytui.utils.diff import StreamingPatchParser
+
+        patch = (
+            "diff --git a/x.py b/x.py\n"
+            "--- a/x.py\n"
+            "+++ b/x.py\n"
+            "@@ -1,2 +1,2 @@\n"
+            " keep\n"
+            "--- removed dashes\n"
+            "+new\n"
+            "diff --git a/y.py b/y.py\n"
+            "--- a/y.py\n"
+            "+++ b/y.py\n"
+            "@@ -5 +5,2 @@\n"
+            " ctx\n"
+            "+added\n"
+        )
+        data = patch.encode()
+        parser = StreamingPatchParser()
+        done = []
+        for i in range(0, len(data), 7):
+            done.extend(parser.feed(data[i : i + 7]))
+        done.extend(parser.close())
+        assert len(parser.files) == 2
+        x, y = parser.files
+        assert (x.old_file, x.new_file) == ("a/x.py", "b/x.py")
+        assert (y.old_file, y.new_file) == ("a/y.py", "b/y.py")
+        assert [h for _, h in done] == x.hunks + y.hunks
+        assert x.hunks[0].lines == [(" ", "keep"), ("-", "-- removed dashes"), ("+", "new")]
+        assert y.hunks[0].lines == [(" ", "ctx"), ("+", "added")]
+        assert data[x.byte_offset:].startswith(b"diff --git a/x.py")
+        assert data[y.hunks[0].byte_offset:].startswith(b"@@ -5 +5,2 @@")
+        assert x.byte_offset + x.byte_length == y.byte_offset
+        assert y.byte_offset + y.byte_length == len(data)
+
+    def test_streaming_parser_emits_hunk_when_counts_satisfied(self):
+        from pytui.utils.diff import StreamingPatchParser
+
+        parser = StreamingPatchParser()
+        assert parser.feed("@@ -1 +1 @@\n-a\n") == []
+        done = parser.feed("+b\n@@ -9 +9 @@\n-c")
+        assert len(done) == 1 and done[0][1].lines == [("-", "a"), ("+", "b")]
+        assert len(parser.close()) == 1
+
+    def test_index_patch_file_and_read_hunk(self, tmp_path):
+        import mmap
+
+        from pytui.utils.diff import index_patch_file, read_hunk
+
+        path = tmp_path / "big.patch"
+        path.write_text("--- a\n+++ b\n@@ -1 +1 @@\n-x\n+y\n@@ -10,2 +10 @@\n z\n-w\n")
+        files = index_patch_file(str(path), chunk_size=5)
+        assert len(files) == 1
+        hunks = files[0].hunks
+        assert [h.lines for h in hunks] == [[], []]
+        with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            second = read_hunk(mm, hunks[1])
+        assert second.old_start == 10
+        assert second.lines == [(" ", "z"), ("-", "w")]